@@ -52,4 +52,6 @@ import networkx.algorithms.tree
 
 from networkx.algorithms.bipartite import projected_graph,project,is_bipartite
 from networkx.algorithms.isomorphism import is_isomorphic,could_be_isomorphic,\
-    fast_could_be_isomorphic,faster_could_be_isomorphic
+    fast_could_be_isomorphic,faster_could_be_isomorphic,\
+    weisfeiler_lehman_graph_hash,canonical_labeling,canonical_certificate,\
+    isomorphism_classes
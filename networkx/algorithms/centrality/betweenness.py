@@ -10,6 +10,7 @@ Betweenness centrality measures.
 import heapq
 import networkx as nx
 import random
+from networkx.utils import parallel_map, split_chunks, effective_n_jobs
 __author__ = """Aric Hagberg (hagberg@lanl.gov)"""
 
 __all__ = ['betweenness_centrality',
@@ -18,7 +19,7 @@ __all__ = ['betweenness_centrality',
 
 def betweenness_centrality(G, k=None, normalized=True, weight=None, 
                            endpoints=False, 
-                           seed=None):
+                           seed=None, n_jobs=None, executor=None):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
     Betweenness centrality of a node `v` is the sum of the
@@ -56,6 +57,15 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     endpoints : bool, optional  
       If True include the endpoints in the shortest path counts.
 
+    n_jobs : int or None, optional (default=None)
+      Number of processes used to compute the single-source
+      contributions.  None or 1 computes them in this process and
+      -1 uses all CPUs.
+
+    executor : object with a map() method, optional
+      An existing process pool, e.g. a multiprocessing.Pool, to use
+      instead of creating a new one.
+
     Returns
     -------
     nodes : dictionary
@@ -79,6 +89,11 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     Zero edge weights can produce an infinite number of equal length 
     paths between pairs of nodes.
 
+    The contributions of the sources are independent, so with n_jobs
+    or executor the sources are split into chunks that are processed
+    in separate processes and the partial sums are added up.  The graph
+    is pickled and sent to every worker.
+
     References
     ----------
     .. [1]  A Faster Algorithm for Betweenness Centrality.
@@ -94,23 +109,16 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
        International Journal of Bifurcation and Chaos 17(7):2303-2318, 2007.
        http://www.inf.uni-konstanz.de/algo/publications/bp-celn-06.pdf
     """
-    betweenness=dict.fromkeys(G,0.0) # b[v]=0 for v in G
     if k is None:
         nodes = G
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S,P,sigma=_single_source_shortest_path_basic(G,s)
-        else:  # use Dijkstra's algorithm
-            S,P,sigma=_single_source_dijkstra_path_basic(G,s,weight)
-        # accumulation
-        if endpoints:
-            betweenness=_accumulate_endpoints(betweenness,S,P,sigma,s)
-        else:
-            betweenness=_accumulate_basic(betweenness,S,P,sigma,s)
+    chunks = split_chunks(nodes, effective_n_jobs(n_jobs, executor))
+    betweenness = _sum_partial(parallel_map(_betweenness_sources,
+                                            [(G, c, weight, endpoints)
+                                             for c in chunks],
+                                            n_jobs, executor))
     # rescaling
     betweenness=_rescale(betweenness, len(G),
                          normalized=normalized,
@@ -119,7 +127,8 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     return betweenness
 
 
-def edge_betweenness_centrality(G,normalized=True,weight=None):
+def edge_betweenness_centrality(G,normalized=True,weight=None,
+                                n_jobs=None,executor=None):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge `e` is the sum of the
@@ -147,6 +156,15 @@ def edge_betweenness_centrality(G,normalized=True,weight=None):
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    n_jobs : int or None, optional (default=None)
+      Number of processes used to compute the single-source
+      contributions.  None or 1 computes them in this process and
+      -1 uses all CPUs.
+
+    executor : object with a map() method, optional
+      An existing process pool, e.g. a multiprocessing.Pool, to use
+      instead of creating a new one.
+
     Returns
     -------
     edges : dictionary
@@ -175,17 +193,10 @@ def edge_betweenness_centrality(G,normalized=True,weight=None):
        Social Networks 30(2):136-145, 2008.
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
-    betweenness=dict.fromkeys(G,0.0) # b[v]=0 for v in G
-    # b[e]=0 for e in G.edges()
-    betweenness.update(dict.fromkeys(G.edges(),0.0))
-    for s in G:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S,P,sigma=_single_source_shortest_path_basic(G,s)
-        else:  # use Dijkstra's algorithm
-            S,P,sigma=_single_source_dijkstra_path_basic(G,s,weight)
-        # accumulation
-        betweenness=_accumulate_edges(betweenness,S,P,sigma,s)
+    chunks = split_chunks(G, effective_n_jobs(n_jobs, executor))
+    betweenness = _sum_partial(parallel_map(_edge_betweenness_sources,
+                                            [(G, c, weight) for c in chunks],
+                                            n_jobs, executor))
     # rescaling
     for n in G: # remove nodes to only return edges 
         del betweenness[n]
@@ -201,6 +212,47 @@ def edge_betweenness(G,normalized=True,weight=None):
 
 # helpers for betweenness centrality
 
+def _betweenness_sources(args):
+    # betweenness contributions of a chunk of sources
+    G, sources, weight, endpoints = args
+    betweenness=dict.fromkeys(G,0.0) # b[v]=0 for v in G
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S,P,sigma=_single_source_shortest_path_basic(G,s)
+        else:  # use Dijkstra's algorithm
+            S,P,sigma=_single_source_dijkstra_path_basic(G,s,weight)
+        # accumulation
+        if endpoints:
+            betweenness=_accumulate_endpoints(betweenness,S,P,sigma,s)
+        else:
+            betweenness=_accumulate_basic(betweenness,S,P,sigma,s)
+    return betweenness
+
+def _edge_betweenness_sources(args):
+    # edge betweenness contributions of a chunk of sources
+    G, sources, weight = args
+    betweenness=dict.fromkeys(G,0.0) # b[v]=0 for v in G
+    # b[e]=0 for e in G.edges()
+    betweenness.update(dict.fromkeys(G.edges(),0.0))
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S,P,sigma=_single_source_shortest_path_basic(G,s)
+        else:  # use Dijkstra's algorithm
+            S,P,sigma=_single_source_dijkstra_path_basic(G,s,weight)
+        # accumulation
+        betweenness=_accumulate_edges(betweenness,S,P,sigma,s)
+    return betweenness
+
+def _sum_partial(partials):
+    # add up the partial betweenness dicts computed for chunks of sources
+    betweenness=partials[0]
+    for partial in partials[1:]:
+        for v,c in partial.items():
+            betweenness[v]+=c
+    return betweenness
+
 def _single_source_shortest_path_basic(G,s):
     S=[]
     P={}
@@ -19,11 +19,15 @@ from networkx.algorithms.centrality.betweenness import\
     _single_source_dijkstra_path_basic as dijkstra
 from networkx.algorithms.centrality.betweenness import\
     _single_source_shortest_path_basic as shortest_path
+from networkx.algorithms.centrality.betweenness import _sum_partial
+from networkx.utils import parallel_map, split_chunks, effective_n_jobs
 
 
 def betweenness_centrality_subset(G,sources,targets,
                                   normalized=False,
-                                  weight=None):
+                                  weight=None,
+                                  n_jobs=None,
+                                  executor=None):
     """Compute betweenness centrality for a subset of nodes.
 
     .. math::
@@ -57,6 +61,14 @@ def betweenness_centrality_subset(G,sources,targets,
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    n_jobs : int or None, optional (default=None)
+      Number of processes over which the sources are split.
+      None or 1 computes everything in this process and -1 uses all CPUs.
+
+    executor : object with a map() method, optional
+      An existing process pool, e.g. a multiprocessing.Pool, to use
+      instead of creating a new one.
+
     Returns
     -------
     nodes : dictionary
@@ -91,21 +103,19 @@ def betweenness_centrality_subset(G,sources,targets,
        Social Networks 30(2):136-145, 2008.
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
-    b=dict.fromkeys(G,0.0) # b[v]=0 for v in G
-    for s in sources:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S,P,sigma=shortest_path(G,s)
-        else:  # use Dijkstra's algorithm
-            S,P,sigma=dijkstra(G,s,weight)
-        b=_accumulate_subset(b,S,P,sigma,s,targets)
+    chunks=split_chunks(sources,effective_n_jobs(n_jobs,executor))
+    b=_sum_partial(parallel_map(_betweenness_subset_sources,
+                                [(G,c,targets,weight,False) for c in chunks],
+                                n_jobs,executor))
     b=_rescale(b,len(G),normalized=normalized,directed=G.is_directed())
     return b
 
 
 def edge_betweenness_centrality_subset(G,sources,targets,
                                        normalized=False,
-                                       weight=None):
+                                       weight=None,
+                                       n_jobs=None,
+                                       executor=None):
     """Compute betweenness centrality for edges for a subset of nodes.
 
     .. math::
@@ -137,6 +147,14 @@ def edge_betweenness_centrality_subset(G,sources,targets,
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    n_jobs : int or None, optional (default=None)
+      Number of processes over which the sources are split.
+      None or 1 computes everything in this process and -1 uses all CPUs.
+
+    executor : object with a map() method, optional
+      An existing process pool, e.g. a multiprocessing.Pool, to use
+      instead of creating a new one.
+
     Returns
     -------
     edges : dictionary
@@ -172,15 +190,10 @@ def edge_betweenness_centrality_subset(G,sources,targets,
 
     """
 
-    b=dict.fromkeys(G,0.0) # b[v]=0 for v in G
-    b.update(dict.fromkeys(G.edges(),0.0)) # b[e] for e in G.edges()
-    for s in sources:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S,P,sigma=shortest_path(G,s)
-        else:  # use Dijkstra's algorithm
-            S,P,sigma=dijkstra(G,s,weight)
-        b=_accumulate_edges_subset(b,S,P,sigma,s,targets)
+    chunks=split_chunks(sources,effective_n_jobs(n_jobs,executor))
+    b=_sum_partial(parallel_map(_betweenness_subset_sources,
+                                [(G,c,targets,weight,True) for c in chunks],
+                                n_jobs,executor))
     for n in G: # remove nodes to only return edges 
         del b[n]
     b=_rescale_e(b,len(G),normalized=normalized,directed=G.is_directed())
@@ -194,6 +207,25 @@ def betweenness_centrality_source(G,normalized=True,weight=None,sources=None):
     return betweenness_centrality_subset(G,sources,targets,normalized,weight)
 
 
+def _betweenness_subset_sources(args):
+    # node or edge betweenness contributions of a chunk of sources
+    G,sources,targets,weight,edges=args
+    b=dict.fromkeys(G,0.0) # b[v]=0 for v in G
+    if edges:
+        b.update(dict.fromkeys(G.edges(),0.0)) # b[e] for e in G.edges()
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S,P,sigma=shortest_path(G,s)
+        else:  # use Dijkstra's algorithm
+            S,P,sigma=dijkstra(G,s,weight)
+        if edges:
+            b=_accumulate_edges_subset(b,S,P,sigma,s,targets)
+        else:
+            b=_accumulate_subset(b,S,P,sigma,s,targets)
+    return b
+
+
 def _accumulate_subset(betweenness,S,P,sigma,s,targets):
     delta=dict.fromkeys(S,0)
     target_set=set(targets)
@@ -460,3 +460,51 @@ class TestWeightedEdgeBetweennessCentrality(object):
         for n in sorted(G.edges()):
             assert_almost_equal(b[n],b_answer[n]/norm)
 
+
+
+class TestParallelBetweennessCentrality(object):
+
+    def test_n_jobs(self):
+        G = nx.krackhardt_kite_graph()
+        b = nx.betweenness_centrality(G)
+        bp = nx.betweenness_centrality(G, n_jobs=2)
+        for n in sorted(G):
+            assert_almost_equal(bp[n], b[n])
+
+    def test_k_endpoints_weighted(self):
+        G = weighted_G()
+        b = nx.betweenness_centrality(G, k=4, seed=1, endpoints=True,
+                                      weight='weight')
+        bp = nx.betweenness_centrality(G, k=4, seed=1, endpoints=True,
+                                       weight='weight', n_jobs=3)
+        for n in sorted(G):
+            assert_almost_equal(bp[n], b[n])
+
+    def test_executor(self):
+        class Executor(object):
+            def __init__(self):
+                self.calls = 0
+            def map(self, func, args):
+                args = list(args)
+                self.calls += len(args)
+                return map(func, args)
+        G = nx.florentine_families_graph()
+        executor = Executor()
+        b = nx.betweenness_centrality(G)
+        bp = nx.betweenness_centrality(G, n_jobs=4, executor=executor)
+        assert_equal(executor.calls, 4)
+        for n in sorted(G):
+            assert_almost_equal(bp[n], b[n])
+
+    def test_edge_n_jobs(self):
+        G = weighted_G()
+        b = nx.edge_betweenness_centrality(G, weight='weight')
+        bp = nx.edge_betweenness_centrality(G, weight='weight', n_jobs=2)
+        assert_equal(sorted(bp), sorted(b))
+        for e in b:
+            assert_almost_equal(bp[e], b[e])
+
+    def test_empty(self):
+        G = nx.Graph()
+        assert_equal(nx.betweenness_centrality(G, n_jobs=2), {})
+        assert_equal(nx.edge_betweenness_centrality(G, n_jobs=2), {})
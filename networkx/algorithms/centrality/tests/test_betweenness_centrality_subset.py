@@ -256,3 +256,25 @@ class TestEdgeSubsetBetweennessCentrality:
             assert_almost_equal(b[n],b_answer[n])
 
 
+
+
+class TestParallelSubsetBetweennessCentrality:
+
+    def test_n_jobs(self):
+        G=networkx.krackhardt_kite_graph()
+        sources=[0,1,2,5]
+        targets=[3,7,9]
+        b=betweenness_centrality_subset(G,sources,targets)
+        bp=betweenness_centrality_subset(G,sources,targets,n_jobs=2)
+        for n in sorted(G):
+            assert_almost_equal(bp[n],b[n])
+
+    def test_edge_n_jobs(self):
+        G=networkx.krackhardt_kite_graph()
+        sources=[0,1,2,5]
+        targets=[3,7,9]
+        b=edge_betweenness_centrality_subset(G,sources,targets)
+        bp=edge_betweenness_centrality_subset(G,sources,targets,n_jobs=2)
+        assert_equal(sorted(bp),sorted(b))
+        for e in b:
+            assert_almost_equal(bp[e],b[e])
@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 """
 =======
 Cliques
@@ -18,7 +19,9 @@ http://en.wikipedia.org/wiki/Clique_problem
 #    All rights reserved.
 #    BSD license.
 import networkx
+from networkx.algorithms.core import _core_number
 from networkx.utils.decorators import *
+from networkx.utils import effective_n_jobs, split_chunks, parallel_map
 __author__ = """Dan Schult (dschult@colgate.edu)"""
 __all__ = ['find_cliques', 'find_cliques_recursive', 'make_max_clique_graph',
            'make_clique_bipartite' ,'graph_clique_number',
@@ -28,13 +31,26 @@ __all__ = ['find_cliques', 'find_cliques_recursive', 'make_max_clique_graph',
 
 
 @not_implemented_for('directed')
-def find_cliques(G):
+def find_cliques(G, n_jobs=None, executor=None):
     """Search for all maximal cliques in a graph.
 
     Maximal cliques are the largest complete subgraph containing
     a given node.  The largest maximal clique is sometimes called
     the maximum clique.
 
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph.
+
+    n_jobs : int or None, optional (default=None)
+       Number of processes searching the cliques, see parallel_map().
+       With more than one process the cliques are only yielded once all
+       of them are found.
+
+    executor : object with a map() method, optional
+       An existing pool used instead of a new one, see parallel_map().
+
     Returns
     -------
     generator of lists: genetor of member list for each maximal clique
@@ -54,6 +70,14 @@ def find_cliques(G):
     The method essentially unrolls the recursion used in
     the references to avoid issues of recursion stack depth.
 
+    The nodes are taken in degeneracy order, the order in which
+    core_number() removes them, as proposed by Eppstein, Löffler and
+    Strash (2010) [4]_.  The cliques whose first node in that order is v
+    are searched among the neighbors of v after it, at most the
+    degeneracy of the graph, so that each node is an independent
+    subproblem and the subproblems can be searched in parallel.  For
+    dense graphs the neighborhoods are held as bit sets.
+
     This algorithm is not suitable for directed graphs.
 
     This algorithm ignores self-loops and parallel edges as
@@ -83,26 +107,126 @@ def find_cliques(G):
        Theoretical Computer Science,
        Volume 407, Issues 1-3, 6 November 2008, Pages 564-568,
        http://dx.doi.org/10.1016/j.tcs.2008.05.010
+
+    .. [4] D. Eppstein, M. Löffler and D. Strash,
+       Listing all maximal cliques in sparse graphs in near-optimal time,
+       Proceedings of the 21st International Symposium on Algorithms and
+       Computation (ISAAC), 403-414, 2010.
+       http://dx.doi.org/10.1007/978-3-642-17517-6_36
     """
-    # Cache nbrs and find first pivot (highest degree)
-    maxconn=-1
     nnbrs={}
-    pivotnbrs=set() # handle empty graph
     for n,nbrs in G.adjacency_iter():
         nbrs=set(nbrs)
         nbrs.discard(n)
-        conn = len(nbrs)
+        nnbrs[n]=nbrs
+    order=_degeneracy_order(nnbrs)
+    rank=dict(zip(order,range(len(order))))
+    n=len(nnbrs)
+    # Bit sets pay off on the neighborhoods of dense graphs only.
+    bits=(_popcount is not None and n>1 and
+          G.number_of_edges()>=0.15*n*(n-1))
+    n_jobs=effective_n_jobs(n_jobs,executor)
+    if n_jobs==1 and executor is None:
+        for v in order:
+            for clique in _node_cliques(nnbrs,rank,v,bits):
+                yield clique
+        return
+    tasks=[(nnbrs,rank,chunk,bits) for chunk in split_chunks(order,n_jobs)]
+    for cliques in parallel_map(_chunk_cliques,tasks,n_jobs,executor):
+        for clique in cliques:
+            yield clique
+
+
+def _degeneracy_order(nnbrs):
+    """Return the nodes in an order in which each node has at most the
+    degeneracy of the graph neighbors after it."""
+    nodes=list(nnbrs)
+    index=dict(zip(nodes,range(len(nodes))))
+    core,order=_core_number([[index[u] for u in nnbrs[v]] for v in nodes])
+    return [nodes[i] for i in order]
+
+
+def _chunk_cliques(args):
+    """Return the list of the maximal cliques whose first node in rank
+    order is in chunk."""
+    nnbrs,rank,chunk,bits=args
+    cliques=[]
+    for v in chunk:
+        cliques.extend(_node_cliques(nnbrs,rank,v,bits))
+    return cliques
+
+
+def _node_cliques(nnbrs,rank,v,bits=False):
+    """Yield the maximal cliques whose first node in rank order is v."""
+    rv=rank[v]
+    nbrs=nnbrs[v]
+    cand=[u for u in nbrs if rank[u]>rv]
+    if bits and len(cand)>=16:
+        # number the candidates first, then the nodes done before v
+        local=cand+[u for u in nbrs if rank[u]<rv]
+        index=dict(zip(local,range(len(local))))
+        masks=[0]*len(local)
+        for i,u in enumerate(cand):
+            m=0
+            for w in nnbrs[u]:
+                j=index.get(w)
+                if j is not None:
+                    m|=1<<j
+                    if j>=len(cand):
+                        # nodes done are only pivots, tested against cand
+                        masks[j]|=1<<i
+            masks[i]|=m
+        cand_bits=(1<<len(cand))-1
+        done_bits=((1<<len(local))-1)^cand_bits
+        return _expand_bits(local,masks,[v],cand_bits,done_bits)
+    cand=set(cand)
+    return _expand(nnbrs,[v],cand,nbrs-cand)
+
+
+def _pivot_nbrs(nnbrs,cand,done):
+    """Return the nodes of cand adjacent to a pivot node of cand or done
+    with the most neighbors in cand, or None if a node of done is
+    adjacent to all of cand."""
+    numb_cand=len(cand)
+    maxconn=-1
+    # look in done nodes first
+    for n in done:
+        cn = cand & nnbrs[n]
+        conn=len(cn)
         if conn > maxconn:
-            nnbrs[n] = pivotnbrs = nbrs
-            maxconn = conn
-        else:
-            nnbrs[n] = nbrs
-    # Initial setup
-    cand=set(nnbrs)
-    smallcand = set(cand - pivotnbrs)
-    done=set()
+            pivotnbrs=cn
+            maxconn=conn
+            if maxconn==numb_cand:
+                # this part of tree already searched
+                return None
+    # look in cand nodes second
+    for n in cand:
+        cn = cand & nnbrs[n]
+        conn=len(cn)
+        if conn > maxconn:
+            pivotnbrs=cn
+            maxconn=conn
+            if maxconn == numb_cand-1:
+                break
+    return pivotnbrs
+
+
+def _expand(nnbrs,clique_so_far,cand,done):
+    """Yield the maximal cliques made of clique_so_far and nodes of cand,
+    without nodes of done.
+
+    The method essentially unrolls the recursion used in
+    the references to avoid issues of recursion stack depth.
+    """
+    if not cand:
+        if not done:
+            yield clique_so_far[:]
+        return
+    pivotnbrs=_pivot_nbrs(nnbrs,cand,done)
+    if pivotnbrs is None:
+        return
+    smallcand = cand - pivotnbrs
     stack=[]
-    clique_so_far=[]
     # Start main loop
     while smallcand or stack:
         try:
@@ -132,41 +256,84 @@ def find_cliques(G):
             yield clique_so_far + list(new_cand)
             clique_so_far.pop()
             continue
-        # find pivot node (max connected in cand)
-        # look in done nodes first
-        numb_cand=len(new_cand)
-        maxconndone=-1
-        for n in new_done:
-            cn = new_cand & nnbrs[n]
-            conn=len(cn)
-            if conn > maxconndone:
-                pivotdonenbrs=cn
-                maxconndone=conn
-                if maxconndone==numb_cand:
-                    break
-        # Shortcut--this part of tree already searched
-        if maxconndone == numb_cand:
+        # pivot node is max connected in cand from done or cand
+        pivotnbrs=_pivot_nbrs(nnbrs,new_cand,new_done)
+        if pivotnbrs is None:
             clique_so_far.pop()
             continue
-        # still finding pivot node
-        # look in cand nodes second
+        # save search status for later backout
+        stack.append( (cand, done, smallcand) )
+        cand=new_cand
+        done=new_done
+        smallcand = cand - pivotnbrs
+
+
+# Number of ones in the binary representation of an int, if fast
+_popcount=getattr(int,'bit_count',None)
+
+
+def _expand_bits(nodes,masks,clique_so_far,cand,done):
+    """Like _expand() with the sets cand and done given as bit sets of
+    nodes and the neighbors of nodes[i] as the bit set masks[i]."""
+    def pivot_mask(cand,done):
+        numb_cand=_popcount(cand)
         maxconn=-1
-        for n in new_cand:
-            cn = new_cand & nnbrs[n]
-            conn=len(cn)
+        x=done
+        while x:
+            b=x & -x
+            x^=b
+            m=masks[b.bit_length()-1]
+            conn=_popcount(cand & m)
             if conn > maxconn:
-                pivotnbrs=cn
+                pivotmask=m
+                maxconn=conn
+                if maxconn==numb_cand:
+                    return None
+        x=cand
+        while x:
+            b=x & -x
+            x^=b
+            m=masks[b.bit_length()-1]
+            conn=_popcount(cand & m)
+            if conn > maxconn:
+                pivotmask=m
                 maxconn=conn
                 if maxconn == numb_cand-1:
                     break
-        # pivot node is max connected in cand from done or cand
-        if maxconndone > maxconn:
-            pivotnbrs = pivotdonenbrs
-        # save search status for later backout
+        return pivotmask
+
+    pivotmask=pivot_mask(cand,done)
+    if pivotmask is None:
+        return
+    smallcand=cand & ~pivotmask
+    stack=[]
+    while smallcand or stack:
+        if not smallcand:
+            cand,done,smallcand = stack.pop()
+            clique_so_far.pop()
+            continue
+        b=smallcand & -smallcand
+        smallcand^=b
+        i=b.bit_length()-1
+        clique_so_far.append(nodes[i])
+        cand&=~b
+        done|=b
+        m=masks[i]
+        new_cand=cand & m
+        new_done=done & m
+        if not new_cand:
+            if not new_done:
+                yield clique_so_far[:]
+            clique_so_far.pop()
+            continue
+        pivotmask=pivot_mask(new_cand,new_done)
+        if pivotmask is None:
+            clique_so_far.pop()
+            continue
         stack.append( (cand, done, smallcand) )
         cand=new_cand
         done=new_done
-        smallcand = cand - pivotnbrs
+        smallcand=cand & ~pivotmask
 
 
 def find_cliques_recursive(G):
@@ -415,8 +582,24 @@ def graph_number_of_cliques(G,cliques=None):
     An optional list of cliques can be input if already computed.
     """
     if cliques is None:
-        cliques=list(find_cliques(G))
-    return   len(cliques)
+        cliques=find_cliques(G)
+    return   sum(1 for c in cliques)
+
+
+def _node_cliques_iter(G,nodes,cliques):
+    """Return the nodes asked for, whether a single node was asked for,
+    and an iterator of (node, clique) for each node of nodes in each
+    clique, in a single pass over the cliques."""
+    if cliques is None:
+        cliques=find_cliques(G)
+    single=nodes is not None and not isinstance(nodes, list)
+    if nodes is None:
+        nodes=G.nodes()   # none, get entire graph
+    elif single:
+        nodes=[nodes]   # assume it is a single value
+    wanted=set(nodes)
+    pairs=((v,c) for c in cliques for v in c if v in wanted)
+    return nodes,single,pairs
 
 
 def node_clique_number(G,nodes=None,cliques=None):
@@ -438,37 +621,15 @@ def node_clique_number(G,nodes=None,cliques=None):
                 H=networkx.ego_graph(G,nodes)
                 d=max( (len(c) for c in find_cliques(H)) )
             return d
-        # nodes is None--find all cliques
-        cliques=list(find_cliques(G))
-
-    if nodes is None:
-        nodes=G.nodes()   # none, get entire graph
-
-    if not isinstance(nodes, list):   # check for a list
-        v=nodes
-        # assume it is a single value
-        d=max([len(c) for c in cliques if v in c])
-    else:
-        d={}
-        for v in nodes:
-            d[v]=max([len(c) for c in cliques if v in c])
+    nodes,single,pairs=_node_cliques_iter(G,nodes,cliques)
+    d=dict.fromkeys(nodes,0)
+    for v,c in pairs:
+        if len(c)>d[v]:
+            d[v]=len(c)
+    if single:
+        return d[nodes[0]]
     return d
 
-    # if nodes is None:                 # none, use entire graph
-    #     nodes=G.nodes()
-    # elif  not isinstance(nodes, list):    # check for a list
-    #     nodes=[nodes]             # assume it is a single value
-
-    # if cliques is None:
-    #     cliques=list(find_cliques(G))
-    # d={}
-    # for v in nodes:
-    #     d[v]=max([len(c) for c in cliques if v in c])
-
-    # if nodes in G:
-    #     return d[v] #return single value
-    # return d
-
 
 def number_of_cliques(G,nodes=None,cliques=None):
     """Returns the number of maximal cliques for each node.
@@ -476,20 +637,12 @@ def number_of_cliques(G,nodes=None,cliques=None):
     Returns a single or list depending on input nodes.
     Optional list of cliques can be input if already computed.
     """
-    if cliques is None:
-        cliques=list(find_cliques(G))
-
-    if nodes is None:
-        nodes=G.nodes()   # none, get entire graph
-
-    if not isinstance(nodes, list):   # check for a list
-        v=nodes
-        # assume it is a single value
-        numcliq=len([1 for c in cliques if v in c])
-    else:
-        numcliq={}
-        for v in nodes:
-            numcliq[v]=len([1 for c in cliques if v in c])
+    nodes,single,pairs=_node_cliques_iter(G,nodes,cliques)
+    numcliq=dict.fromkeys(nodes,0)
+    for v,c in pairs:
+        numcliq[v]+=1
+    if single:
+        return numcliq[nodes[0]]
     return numcliq
 
 
@@ -499,18 +652,10 @@ def cliques_containing_node(G,nodes=None,cliques=None):
     Returns a single list or list of lists depending on input nodes.
     Optional list of cliques can be input if already computed.
     """
-    if cliques is None:
-        cliques=list(find_cliques(G))
-
-    if nodes is None:
-        nodes=G.nodes()   # none, get entire graph
-
-    if not isinstance(nodes, list):   # check for a list
-        v=nodes
-        # assume it is a single value
-        vcliques=[c for c in cliques if v in c]
-    else:
-        vcliques={}
-        for v in nodes:
-            vcliques[v]=[c for c in cliques if v in c]
+    nodes,single,pairs=_node_cliques_iter(G,nodes,cliques)
+    vcliques=dict((v,[]) for v in nodes)
+    for v,c in pairs:
+        vcliques[v].append(c)
+    if single:
+        return vcliques[nodes[0]]
     return vcliques
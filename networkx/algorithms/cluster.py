@@ -3,6 +3,7 @@
 from itertools import combinations
 import networkx as nx
 from networkx import NetworkXError
+from networkx.utils import effective_n_jobs, split_chunks, parallel_map
 __author__ = """\n""".join(['Aric Hagberg <aric.hagberg@gmail.com>',
                             'Dan Schult (dschult@colgate.edu)',
                             'Pieter Swart (swart@lanl.gov)',
@@ -16,7 +17,7 @@ __author__ = """\n""".join(['Aric Hagberg <aric.hagberg@gmail.com>',
 __all__= ['triangles', 'average_clustering', 'clustering', 'transitivity',
           'square_clustering']
 
-def triangles(G, nodes=None):
+def triangles(G, nodes=None, method='forward', n_jobs=None, executor=None):
     """Compute the number of triangles.
 
     Finds the number of triangles that include a node as one vertex.
@@ -27,6 +28,18 @@ def triangles(G, nodes=None):
        A networkx graph
     nodes : container of nodes, optional (default= all nodes in G)
        Compute triangles for nodes in this container. 
+    method : string, optional (default='forward')
+       Algorithm used to count the triangles of the whole graph:
+       'forward' lists each triangle once from its lowest degree node,
+       'sparse' uses sparse matrix products of the adjacency matrix with
+       the edges so oriented (requires SciPy).  The products hold a
+       number for each path of two edges, so 'sparse' takes more memory
+       and is usually slower.
+    n_jobs : int or None, optional (default=None)
+       Number of processes counting the triangles of the whole graph
+       with the 'forward' method, see parallel_map().
+    executor : object with a map() method, optional
+       An existing pool used instead of a new one, see parallel_map().
 
     Returns
     -------
@@ -48,12 +61,26 @@ def triangles(G, nodes=None):
     When computing triangles for the entire graph each triangle is counted 
     three times, once at each node.  Self loops are ignored.
 
+    The triangles of the whole graph are found by orienting each edge
+    towards the node of higher degree, so that each node has few
+    successors, and intersecting the successors of the ends of each
+    edge [1]_.  Each triangle is found once.  When nodes is given the
+    triangles at these nodes are counted one by one instead.
+
+    References
+    ----------
+    .. [1] T. Schank and D. Wagner, Finding, counting and listing all
+       triangles in large graphs, an experimental study.  Proceedings of
+       the 4th Workshop on Experimental and Efficient Algorithms (WEA),
+       606-609, 2005.
     """
     if G.is_directed():
         raise NetworkXError("triangles() is not defined for directed graphs.")
     if nodes in G: 
         # return single value
         return next(_triangles_and_degree_iter(G,nodes))[2] // 2
+    if nodes is None:
+        return _triangle_counts(G, method, n_jobs, executor)
     return dict( (v,t // 2) for v,d,t in _triangles_and_degree_iter(G,nodes))
 
 def _triangles_and_degree_iter(G,nodes=None):
@@ -72,14 +99,95 @@ def _triangles_and_degree_iter(G,nodes=None):
         nodes_nbrs= ( (n,G[n]) for n in G.nbunch_iter(nodes) )
 
     for v,v_nbrs in nodes_nbrs:
-        vs=set(v_nbrs)-set([v])
+        vs=set(v_nbrs)
+        vs.discard(v)
         ntriangles=0
         for w in vs:
-            ws=set(G[w])-set([w])
-            ntriangles+=len(vs.intersection(ws))
+            w_nbrs=G[w]
+            ntriangles+=len(vs.intersection(w_nbrs))
+            if w in w_nbrs:
+                # self loop
+                ntriangles-=1
         yield (v,len(vs),ntriangles)
 
 
+def _oriented_adjacency(G):
+    """Return the nodes of G by increasing degree and the sorted lists of
+    positions in that order of the neighbors after each node."""
+    if G.is_multigraph():
+        raise NetworkXError("Not defined for multigraphs.")
+    nodes=sorted(G, key=lambda v: len(G[v]))
+    index=dict(zip(nodes,range(len(nodes))))
+    out=[]
+    for i,v in enumerate(nodes):
+        out.append(sorted(j for j in (index[u] for u in G[v]) if j>i))
+    return nodes,out
+
+
+def _forward_triangles(args):
+    """Return the list of the numbers of triangles at each node found from
+    the nodes of chunk, the lowest nodes of the triangles."""
+    out,chunk=args
+    t=[0]*len(out)
+    for i in chunk:
+        out_i=out[i]
+        if len(out_i)<2:
+            continue
+        succ=set(out_i)
+        for j in out_i:
+            common=succ.intersection(out[j])
+            if common:
+                k=len(common)
+                t[i]+=k
+                t[j]+=k
+                for l in common:
+                    t[l]+=1
+    return t
+
+
+def _triangle_counts(G, method='forward', n_jobs=None, executor=None):
+    """Return a dictionary of the number of triangles at each node of G."""
+    if method not in ('forward','sparse'):
+        raise ValueError('Unknown method %r.' % (method,))
+    nodes,out=_oriented_adjacency(G)
+    if method=='sparse':
+        t=_sparse_triangles(out)
+    else:
+        chunks=split_chunks(range(len(out)),
+                            effective_n_jobs(n_jobs,executor))
+        t=[0]*len(out)
+        for counts in parallel_map(_forward_triangles,
+                                   [(out,chunk) for chunk in chunks],
+                                   n_jobs,executor):
+            t=[a+b for a,b in zip(t,counts)]
+    t=dict(zip(nodes,t))
+    return dict((v,t[v]) for v in G)
+
+
+def _sparse_triangles(out):
+    """Return the list of the numbers of triangles at each node with sparse
+    matrix products of the oriented adjacency matrix U."""
+    import numpy
+    import scipy.sparse
+    n=len(out)
+    indptr=numpy.zeros(n+1,dtype=numpy.intp)
+    numpy.cumsum([len(o) for o in out],out=indptr[1:])
+    indices=numpy.fromiter((j for o in out for j in o),dtype=numpy.intp,
+                           count=indptr[-1])
+    U=scipy.sparse.csr_matrix((numpy.ones(len(indices),dtype=numpy.int64),
+                               indices,indptr),shape=(n,n))
+    # For a triangle i < j < k, (UU o U)[i,k] counts it at i and k, and
+    # (U^T U o U)[j,k] counts it at j.  Both products only pair the
+    # neighbors of lower degree nodes, unlike the square of the adjacency
+    # matrix.
+    first=U.dot(U).multiply(U)
+    middle=U.T.tocsr().dot(U).multiply(U)
+    t=(numpy.asarray(first.sum(axis=1)).ravel()+
+       numpy.asarray(first.sum(axis=0)).ravel()+
+       numpy.asarray(middle.sum(axis=1)).ravel())
+    return [int(x) for x in t]
+
+
 def _weighted_triangles_and_degree_iter(G, nodes=None, weight='weight'):
     """ Return an iterator of (node, degree, weighted_triangles).  
     
@@ -114,7 +222,8 @@ def _weighted_triangles_and_degree_iter(G, nodes=None, weight='weight'):
         yield (i,len(inbrs),weighted_triangles*2)
 
 
-def average_clustering(G, nodes=None, weight=None, count_zeros=True):
+def average_clustering(G, nodes=None, weight=None, count_zeros=True,
+                       n_jobs=None, executor=None):
     r"""Compute the average clustering coefficient for the graph G.
 
     The clustering coefficient for the graph is the average, 
@@ -139,6 +248,12 @@ def average_clustering(G, nodes=None, weight=None, count_zeros=True):
     count_zeros : bool (default=False)       
        If False include only the nodes with nonzero clustering in the average.
 
+    n_jobs : int or None, optional (default=None)
+       Number of processes counting the triangles, see triangles().
+
+    executor : object with a map() method, optional
+       An existing pool used instead of a new one, see triangles().
+
     Returns
     -------
     avg : float
@@ -167,12 +282,13 @@ def average_clustering(G, nodes=None, weight=None, count_zeros=True):
        nodes and leafs on clustering measures for small-world networks.
        http://arxiv.org/abs/0802.2512
     """
-    c=clustering(G,nodes,weight=weight).values()
+    c=clustering(G,nodes,weight=weight,n_jobs=n_jobs,
+                 executor=executor).values()
     if not count_zeros:
         c = [v for v in c if v > 0]
     return sum(c)/float(len(c))
 
-def clustering(G, nodes=None, weight=None):
+def clustering(G, nodes=None, weight=None, n_jobs=None, executor=None):
     r"""Compute the clustering coefficient for nodes.
 
     For unweighted graphs, the clustering of a node `u`
@@ -209,6 +325,13 @@ def clustering(G, nodes=None, weight=None):
        The edge attribute that holds the numerical value used as a weight.
        If None, then each edge has weight 1.
 
+    n_jobs : int or None, optional (default=None)
+       Number of processes counting the triangles of the whole graph
+       when weight is None, see triangles().
+
+    executor : object with a map() method, optional
+       An existing pool used instead of a new one, see triangles().
+
     Returns
     -------
     out : float, or dictionary
@@ -238,6 +361,9 @@ def clustering(G, nodes=None, weight=None):
                             'for directed graphs.')
     if weight is not None:
         td_iter=_weighted_triangles_and_degree_iter(G,nodes,weight)
+    elif nodes is None:
+        td_iter=((v,_degree(G,v),2*t) for v,t in
+                 _triangle_counts(G,n_jobs=n_jobs,executor=executor).items())
     else:
         td_iter=_triangles_and_degree_iter(G,nodes)
 
@@ -253,7 +379,12 @@ def clustering(G, nodes=None, weight=None):
         return list(clusterc.values())[0] # return single value
     return clusterc
 
-def transitivity(G):
+def _degree(G, v):
+    """Return the number of neighbors of v other than v."""
+    nbrs=G[v]
+    return len(nbrs)-1 if v in nbrs else len(nbrs)
+
+def transitivity(G, n_jobs=None, executor=None):
     r"""Compute graph transitivity, the fraction of all possible triangles 
     present in G.
 
@@ -270,6 +401,12 @@ def transitivity(G):
     ----------
     G : graph
 
+    n_jobs : int or None, optional (default=None)
+       Number of processes counting the triangles, see triangles().
+
+    executor : object with a map() method, optional
+       An existing pool used instead of a new one, see triangles().
+
     Returns
     -------
     out : float
@@ -283,9 +420,16 @@ def transitivity(G):
     """
     triangles=0 # 6 times number of triangles
     contri=0  # 2 times number of connected triples
-    for v,d,t in _triangles_and_degree_iter(G):
-        contri += d*(d-1)
-        triangles += t
+    if G.is_directed():
+        for v,d,t in _triangles_and_degree_iter(G):
+            contri += d*(d-1)
+            triangles += t
+    else:
+        for v,t in _triangle_counts(G,n_jobs=n_jobs,
+                                    executor=executor).items():
+            d=_degree(G,v)
+            contri += d*(d-1)
+            triangles += 2*t
     if triangles==0: # we had no triangles or possible triangles
         return 0.0
     else:
@@ -345,12 +489,20 @@ def square_clustering(G, nodes=None):
         node_iter = G
     else:
         node_iter =  G.nbunch_iter(nodes) 
+    node_iter = list(node_iter)
+    # the neighbor sets of the neighbors, made once for each node
+    nbrs = {}
+    for v in node_iter:
+        for u in G[v]:
+            if u not in nbrs:
+                nbrs[u] = set(G[u])
     clustering = {}
     for v in node_iter:
         clustering[v] = 0.0
         potential=0
         for u,w in combinations(G[v], 2):
-            squares = len((set(G[u]) & set(G[w])) - set([v]))
+            common = nbrs[u] & nbrs[w]
+            squares = len(common) - (v in common)
             clustering[v] += squares
             degm = squares + 1.0
             if w in G[u]:
@@ -5,7 +5,9 @@
 #    All rights reserved.
 #    BSD license.
 from collections import defaultdict
+from itertools import combinations
 import networkx as nx
+from networkx.utils import ArrayUnionFind
 __author__ = """\n""".join(['Conrad Lee <conradlee@gmail.com>',
                             'Aric Hagberg <aric.hagberg@gmail.com>'])
 __all__ = ['k_clique_communities']
@@ -41,6 +43,17 @@ def k_clique_communities(G, k, cliques=None):
     >>> list(nx.k_clique_communities(G, 6))
     []
 
+    Notes
+    -----
+    The maximal cliques of size k or more are merged with a union-find
+    structure over their indices, an ArrayUnionFind, as they are
+    enumerated.  Two of them are adjacent when they share k-1 nodes,
+    which is found from a shared (k-1)-subset for the cliques with few
+    such subsets and by counting the nodes shared with the cliques of
+    each of their nodes for the others.  No graph of the
+    cliques is built.  The communities are yielded once all the cliques
+    are merged.
+
     References
     ----------
     .. [1] Gergely Palla, Imre Derényi, Illés Farkas1, and Tamás Vicsek,
@@ -52,31 +65,66 @@ def k_clique_communities(G, k, cliques=None):
         raise nx.NetworkXError("k=%d, k must be greater than 1."%k)
     if cliques is None:
         cliques = nx.find_cliques(G)
-    cliques = [frozenset(c) for c in cliques if len(c) >= k]
 
-    # First index which nodes are in which cliques
-    membership_dict = defaultdict(list)
+    # The cliques of size k or more, as tuples of node numbers, and the
+    # union-find structure of their indices in them.
+    kcliques = []
+    components = ArrayUnionFind()
+    number = {}
+    # The cliques with few (k-1)-subsets are indexed by them: cliques
+    # sharing a subset are adjacent.  The others are found by counting
+    # the nodes they share with the cliques of each of their nodes.
+    subset_clique = {}
+    node_cliques = defaultdict(list)
+    node_big_cliques = defaultdict(list)
     for clique in cliques:
-        for node in clique:
-            membership_dict[node].append(clique)
+        size = len(clique)
+        if size < k:
+            continue
+        clique = tuple(sorted(number.setdefault(v, len(number))
+                              for v in clique))
+        i = len(kcliques)
+        kcliques.append(clique)
+        components.add()
+        small = _binomial(size, k - 1) <= 4 * size
+        if small:
+            for subset in combinations(clique, k - 1):
+                j = subset_clique.setdefault(subset, i)
+                if j != i:
+                    components.union(i, j)
+        _union_adjacent(components, i, clique, k,
+                        node_big_cliques if small else node_cliques)
+        for v in clique:
+            node_cliques[v].append(i)
+            if not small:
+                node_big_cliques[v].append(i)
+    del subset_clique, node_cliques, node_big_cliques
 
-    # For each clique, see which adjacent cliques percolate
-    perc_graph = nx.Graph()
-    perc_graph.add_nodes_from(cliques)
-    for clique in cliques:
-        for adj_clique in _get_adjacent_cliques(clique, membership_dict):
-            if len(clique.intersection(adj_clique)) >= (k - 1):
-                perc_graph.add_edge(clique, adj_clique)
+    nodes = [None] * len(number)
+    for v, n in number.items():
+        nodes[n] = v
+    communities = defaultdict(set)
+    for i, clique in enumerate(kcliques):
+        communities[components.find(i)].update(clique)
+    for community in communities.values():
+        yield frozenset(nodes[n] for n in community)
+
+
+def _union_adjacent(components, i, clique, k, node_cliques):
+    """Union clique i with the cliques of node_cliques sharing at least
+    k - 1 nodes with it."""
+    shared = defaultdict(int)
+    for v in clique:
+        for j in node_cliques[v]:
+            shared[j] += 1
+    for j, count in shared.items():
+        if count >= k - 1:
+            components.union(i, j)
 
-    # Connected components of clique graph with perc edges
-    # are the percolated cliques
-    for component in nx.connected_components(perc_graph):
-        yield(frozenset.union(*component))
 
-def _get_adjacent_cliques(clique, membership_dict):
-    adjacent_cliques = set()
-    for n in clique:
-        for adj_clique in membership_dict[n]:
-            if clique != adj_clique:
-                adjacent_cliques.add(adj_clique)
-    return adjacent_cliques
+def _binomial(n, k):
+    """Return the number of k-subsets of a set of n elements."""
+    result = 1
+    for i in range(min(k, n - k)):
+        result = result * (n - i) // (i + 1)
+    return result
@@ -41,6 +41,22 @@ def test_zachary():
     assert set(k_clique_communities(z, 5)) == zachary_k5_ground_truth
     assert set(k_clique_communities(z, 6)) == zachary_k6_ground_truth
 
+def test_random_graphs():
+    # compare with the components of the graph of adjacent cliques
+    for seed in range(5):
+        G = nx.gnp_random_graph(30, 0.1 * (seed + 1), seed=seed)
+        cliques = [frozenset(c) for c in nx.find_cliques(G)]
+        for k in range(2, 7):
+            kcliques = [c for c in cliques if len(c) >= k]
+            H = nx.Graph()
+            H.add_nodes_from(kcliques)
+            H.add_edges_from((c, d) for c, d in combinations(kcliques, 2)
+                             if len(c & d) >= k - 1)
+            expected = set(frozenset.union(*component)
+                           for component in nx.connected_components(H))
+            assert_equal(set(k_clique_communities(G, k)), expected)
+            assert_equal(set(k_clique_communities(G, k, cliques)), expected)
+
 @raises(nx.NetworkXError)
 def test_bad_k():
     c = list(k_clique_communities(nx.Graph(),1))
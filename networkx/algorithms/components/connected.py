@@ -8,8 +8,10 @@ Connected components.
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
+from itertools import chain
 import networkx as nx
 from networkx.utils.decorators import not_implemented_for
+from networkx.utils.union_find import ArrayUnionFind, _is_index_labeled
 from networkx.algorithms.shortest_paths \
     import single_source_shortest_path_length as sp_length
 __authors__ = "\n".join(['Eben Kenah',
@@ -49,7 +51,23 @@ def connected_components(G):
     Notes
     -----
     For undirected graphs only.
+
+    If the nodes of a large graph are the integers 0 to n-1 and NumPy is
+    available, the edges are merged in bulk in an ArrayUnionFind; the
+    components are then found before the first one is yielded and their
+    nodes are sorted.  Otherwise they are found by breadth first search
+    one at a time.
     """
+    # Below a few thousand nodes the search is faster than the arrays.
+    if len(G) >= 2000 and _is_index_labeled(G):
+        try:
+            components = _array_components(G)
+        except ImportError:
+            pass
+        else:
+            for c in components:
+                yield c
+            return
     seen={}
     for v in G:
         if v not in seen:
@@ -57,6 +75,20 @@ def connected_components(G):
             yield list(c)
             seen.update(c)
 
+def _array_components(G):
+    """Return the connected components of G, whose nodes are the integers
+    0 to n-1, merging all the edges at once in an ArrayUnionFind."""
+    import numpy
+    adj = G.adj
+    n = len(G)
+    degrees = numpy.fromiter(map(len, adj.values()), numpy.intp, n)
+    nbrs = numpy.fromiter(chain.from_iterable(adj.values()), numpy.intp,
+                          int(degrees.sum()))
+    nodes = numpy.repeat(numpy.fromiter(adj, numpy.intp, n), degrees)
+    components = ArrayUnionFind(n)
+    components.union_many(numpy.column_stack((nodes, nbrs)))
+    return components.components()
+
 @not_implemented_for('directed')
 def connected_component_subgraphs(G, copy=True):
     """Generate connected components as subgraphs.
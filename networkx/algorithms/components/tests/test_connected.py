@@ -21,6 +21,15 @@ class TestConnected:
         C=[[0, 1, 2, 3], [4, 5, 6, 7, 8, 9], [10, 11, 12, 13, 14]]
         assert_equal(sorted([sorted(g) for g in cc(G)]),sorted(C))
 
+    def test_connected_components_large(self):
+        # the components of large graphs with nodes 0 to n-1 are found
+        # with an ArrayUnionFind if NumPy is available
+        G=nx.gnm_random_graph(3000,2000,seed=1)
+        H=nx.relabel_nodes(G,dict((n,str(n)) for n in G))
+        C=sorted(sorted(map(str,c)) for c in nx.connected_components(G))
+        assert_equal(C,sorted(sorted(c) for c in nx.connected_components(H)))
+        assert_equal(sum(map(len,C)),3000)
+
     def test_number_connected_components(self):
         ncc=nx.number_connected_components
         assert_equal(ncc(self.G),3)
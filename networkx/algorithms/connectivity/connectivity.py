@@ -4,6 +4,7 @@ Flow based connectivity algorithms
 """
 import itertools
 import networkx as nx
+from networkx.utils import parallel_map, split_chunks, effective_n_jobs
 
 __author__ = '\n'.join(['Jordi Torrents <jtorrents@milnou.net>'])
 
@@ -15,7 +16,7 @@ __all__ = [ 'average_node_connectivity',
             'all_pairs_node_connectivity_matrix',
             ]
 
-def average_node_connectivity(G):
+def average_node_connectivity(G, n_jobs=None, executor=None):
     r"""Returns the average connectivity of a graph G.
 
     The average connectivity `\bar{\kappa}` of a graph G is the average
@@ -31,6 +32,14 @@ def average_node_connectivity(G):
     G : NetworkX graph
         Undirected graph
 
+    n_jobs : int or None, optional (default=None)
+        Number of processes used to solve the max-flow problems.  None
+        or 1 solves them in this process and -1 uses all CPUs.
+
+    executor : object with a map() method, optional
+        An existing process pool, e.g. a multiprocessing.Pool, to use
+        instead of creating a new one.
+
     Returns
     -------
     K : float
@@ -56,16 +65,16 @@ def average_node_connectivity(G):
     else:
         iter_func = itertools.combinations
 
-    H, mapping = _aux_digraph_node_connectivity(G)
-    num = 0.
-    den = 0.
-    for u,v in iter_func(G, 2):
-        den += 1
-        num += local_node_connectivity(G, u, v, aux_digraph=H, mapping=mapping)
-
-    if den == 0: # Null Graph
+    pairs = list(iter_func(G, 2))
+    if not pairs: # Null Graph
         return 0
-    return num/den
+    H, mapping = _aux_digraph_node_connectivity(G)
+    chunks = split_chunks(pairs, effective_n_jobs(n_jobs, executor))
+    results = parallel_map(_local_node_connectivities,
+                           [(H, mapping, chunk, None) for chunk in chunks],
+                           n_jobs, executor)
+    num = float(sum(sum(values) for values in results))
+    return num/len(pairs)
 
 def _aux_digraph_node_connectivity(G, nodelist=None):
     r"""Creates a directed graph D from an undirected graph G to compute flow
@@ -113,7 +122,33 @@ def _aux_digraph_node_connectivity(G, nodelist=None):
     D.add_edges_from(edges, capacity=1)
     return D, mapping
 
-def local_node_connectivity(G, s, t, aux_digraph=None, mapping=None):
+def _local_node_connectivities(args):
+    """Local node connectivity of each pair of nodes in a chunk.
+
+    The residual network of the auxiliary digraph is built once and
+    reused for all pairs.
+    """
+    H, mapping, pairs, cutoff = args
+    R = nx.build_residual_network(H)
+    return [nx.dinitz(H, '%sB' % mapping[u], '%sA' % mapping[v],
+                      residual=R, cutoff=cutoff).graph['flow_value']
+            for u, v in pairs]
+
+def _min_local_node_connectivity(args):
+    """Minimum local node connectivity over the pairs of nodes in a chunk.
+
+    The current minimum is used as cutoff, so max-flow computations stop
+    as soon as they can no longer improve it.
+    """
+    H, mapping, pairs, K = args
+    R = nx.build_residual_network(H)
+    for u, v in pairs:
+        K = min(K, nx.dinitz(H, '%sB' % mapping[u], '%sA' % mapping[v],
+                             residual=R, cutoff=K).graph['flow_value'])
+    return K
+
+def local_node_connectivity(G, s, t, aux_digraph=None, mapping=None,
+                            residual=None, cutoff=None):
     r"""Computes local node connectivity for nodes s and t.
 
     Local node connectivity for two non adjacent nodes s and t is the
@@ -144,6 +179,17 @@ def local_node_connectivity(G, s, t, aux_digraph=None, mapping=None):
     mapping : dict (default=None)
         Dictionary with a mapping of node names in G and in the auxiliary digraph.
 
+    residual : NetworkX DiGraph (default=None)
+        Residual network of the auxiliary digraph built with
+        build_residual_network(). Its flows are reset and it is reused,
+        which avoids rebuilding it for every pair of nodes. If None a new
+        residual network is built.
+
+    cutoff : integer (default=None)
+        If specified, the max-flow computation stops as soon as the flow
+        reaches cutoff and min(cutoff, K) is returned. This is enough
+        to test whether s and t are at least cutoff-connected.
+
     Returns
     -------
     K : integer
@@ -160,7 +206,7 @@ def local_node_connectivity(G, s, t, aux_digraph=None, mapping=None):
     Notes
     -----
     This is a flow based implementation of node connectivity. We compute the
-    maximum flow using the Ford and Fulkerson algorithm on an auxiliary digraph
+    maximum flow using Dinitz' algorithm (see dinitz) on an auxiliary digraph
     build from the original input graph:
 
     For an undirected graph G having `n` nodes and `m` edges we derive a
@@ -201,9 +247,11 @@ def local_node_connectivity(G, s, t, aux_digraph=None, mapping=None):
         H, mapping = _aux_digraph_node_connectivity(G)
     else:
         H = aux_digraph
-    return nx.max_flow(H,'%sB' % mapping[s], '%sA' % mapping[t])
+    R = nx.dinitz(H, '%sB' % mapping[s], '%sA' % mapping[t],
+                  residual=residual, cutoff=cutoff)
+    return R.graph['flow_value']
 
-def node_connectivity(G, s=None, t=None):
+def node_connectivity(G, s=None, t=None, n_jobs=None, executor=None):
     r"""Returns node connectivity for a graph or digraph G.
 
     Node connectivity is equal to the minimum number of nodes that
@@ -229,6 +277,14 @@ def node_connectivity(G, s=None, t=None):
     t : node
         Target node. Optional (default=None)
 
+    n_jobs : int or None, optional (default=None)
+        Number of processes used to solve the max-flow problems.  None
+        or 1 solves them in this process and -1 uses all CPUs.
+
+    executor : object with a map() method, optional
+        An existing process pool, e.g. a multiprocessing.Pool, to use
+        instead of creating a new one.
+
     Returns
     -------
     K : integer
@@ -252,8 +308,10 @@ def node_connectivity(G, s=None, t=None):
     of G. For details about the auxiliary digraph and the computation of
     local node connectivity see local_node_connectivity.
 
-    This implementation is based on algorithm 11 in [1]_. We use the Ford
-    and Fulkerson algorithm to compute max flow (see ford_fulkerson).
+    This implementation is based on algorithm 11 in [1]_. We use Dinitz'
+    algorithm to compute max flow (see dinitz). The residual network is
+    reused for all pairs and each max flow stops once it reaches the
+    current minimum, which is all that is needed to improve it.
 
     See also
     --------
@@ -296,20 +354,22 @@ def node_connectivity(G, s=None, t=None):
     deg = G.degree()
     min_deg = min(deg.values())
     v = next(n for n,d in deg.items() if d==min_deg)
-    # Reuse the auxiliary digraph
-    H, mapping = _aux_digraph_node_connectivity(G)
     # compute local node connectivity with all non-neighbors nodes
-    for w in set(G) - set(neighbors(v)) - set([v]):
-        K = min(K, local_node_connectivity(G, v, w,
-                                            aux_digraph=H, mapping=mapping))
+    pairs = [(v, w) for w in set(G) - set(neighbors(v)) - set([v])]
     # Same for non adjacent pairs of neighbors of v
-    for x,y in iter_func(neighbors(v), 2):
-        if y in G[x]: continue
-        K = min(K, local_node_connectivity(G, x, y,
-                                            aux_digraph=H, mapping=mapping))
-    return K
+    pairs.extend((x, y) for x, y in iter_func(neighbors(v), 2)
+                 if y not in G[x])
+    if not pairs:
+        return K
+    # Reuse the auxiliary digraph
+    H, mapping = _aux_digraph_node_connectivity(G)
+    chunks = split_chunks(pairs, effective_n_jobs(n_jobs, executor))
+    return min(parallel_map(_min_local_node_connectivity,
+                            [(H, mapping, chunk, K) for chunk in chunks],
+                            n_jobs, executor))
 
-def all_pairs_node_connectivity_matrix(G, nodelist=None):
+def all_pairs_node_connectivity_matrix(G, nodelist=None, cutoff=None,
+                                       n_jobs=None, executor=None):
     """Return a numpy 2d ndarray with node connectivity between all pairs
     of nodes.
 
@@ -321,6 +381,18 @@ def all_pairs_node_connectivity_matrix(G, nodelist=None):
     nodelist: list
         Ordering of nodes for rows and columns of matrix
 
+    cutoff : integer (default=None)
+        If specified, each max-flow computation stops as soon as the flow
+        reaches cutoff, so entries are min(cutoff, local connectivity).
+
+    n_jobs : int or None, optional (default=None)
+        Number of processes used to solve the max-flow problems.  None
+        or 1 solves them in this process and -1 uses all CPUs.
+
+    executor : object with a map() method, optional
+        An existing process pool, e.g. a multiprocessing.Pool, to use
+        instead of creating a new one.
+
     Returns
     -------
     K : 2d numpy ndarray
@@ -344,19 +416,25 @@ def all_pairs_node_connectivity_matrix(G, nodelist=None):
     if len(nodelist) != len(set(nodelist)):
         msg = "Ambiguous ordering: `nodelist` contained duplicates."
         raise nx.NetworkXError(msg)
-    n = G.order()
-    M = np.zeros((n, n), dtype=int)
+    index = dict(zip(nodelist, range(nlen)))
+    M = np.zeros((nlen, nlen), dtype=int)
     # Create auxiliary Digraph
     D, mapping = _aux_digraph_node_connectivity(G)
 
-    if G.is_directed():
-        for u, v in itertools.permutations(G, 2):
-            K = local_node_connectivity(G, u, v, aux_digraph=D, mapping=mapping)
-            M[mapping[u],mapping[v]] = K
+    directed = G.is_directed()
+    if directed:
+        pairs = list(itertools.permutations(nodelist, 2))
     else:
-        for u, v in itertools.combinations(G, 2):
-            K = local_node_connectivity(G, u, v, aux_digraph=D, mapping=mapping)
-            M[mapping[u],mapping[v]] = M[mapping[v],mapping[u]] = K
+        pairs = list(itertools.combinations(nodelist, 2))
+    chunks = split_chunks(pairs, effective_n_jobs(n_jobs, executor))
+    results = parallel_map(_local_node_connectivities,
+                           [(D, mapping, chunk, cutoff) for chunk in chunks],
+                           n_jobs, executor)
+    for chunk, values in zip(chunks, results):
+        for (u, v), K in zip(chunk, values):
+            M[index[u], index[v]] = K
+            if not directed:
+                M[index[v], index[u]] = K
 
     return M
 
@@ -387,7 +465,8 @@ def _aux_digraph_edge_connectivity(G):
         nx.set_edge_attributes(D, 'capacity', capacity)
         return D
 
-def local_edge_connectivity(G, u, v, aux_digraph=None):
+def local_edge_connectivity(G, u, v, aux_digraph=None, residual=None,
+                            cutoff=None):
     r"""Returns local edge connectivity for nodes s and t in G.
 
     Local edge connectivity for two nodes s and t is the minimum number
@@ -414,6 +493,16 @@ def local_edge_connectivity(G, u, v, aux_digraph=None):
         Auxiliary digraph to compute flow based edge connectivity. If None
         the auxiliary digraph is build.
 
+    residual : NetworkX DiGraph (default=None)
+        Residual network of the auxiliary digraph built with
+        build_residual_network(). Its flows are reset and it is reused,
+        which avoids rebuilding it for every pair of nodes. If None a new
+        residual network is built.
+
+    cutoff : integer (default=None)
+        If specified, the max-flow computation stops as soon as the flow
+        reaches cutoff and min(cutoff, K) is returned.
+
     Returns
     -------
     K : integer
@@ -430,7 +519,7 @@ def local_edge_connectivity(G, u, v, aux_digraph=None):
     Notes
     -----
     This is a flow based implementation of edge connectivity. We compute the
-    maximum flow using the Ford and Fulkerson algorithm on an auxiliary digraph
+    maximum flow using Dinitz' algorithm (see dinitz) on an auxiliary digraph
     build from the original graph:
 
     If the input graph is undirected, we replace each edge (u,v) with
@@ -460,7 +549,8 @@ def local_edge_connectivity(G, u, v, aux_digraph=None):
         H = _aux_digraph_edge_connectivity(G)
     else:
         H = aux_digraph
-    return nx.max_flow(H, u, v)
+    return nx.dinitz(H, u, v, residual=residual,
+                     cutoff=cutoff).graph['flow_value']
 
 def edge_connectivity(G, s=None, t=None):
     r"""Returns the edge connectivity of the graph or digraph G.
@@ -511,8 +601,9 @@ def edge_connectivity(G, s=None, t=None):
     algorithm 6 in [1]_ .
 
     For directed graphs, the algorithm does n calls to the max flow function.
-    This is an implementation of algorithm 8 in [1]_ . We use the Ford and
-    Fulkerson algorithm to compute max flow (see ford_fulkerson).
+    This is an implementation of algorithm 8 in [1]_ . We use Dinitz'
+    algorithm to compute max flow (see dinitz), reusing the residual network
+    and stopping each max flow once it reaches the current minimum.
 
     See also
     --------
@@ -541,17 +632,20 @@ def edge_connectivity(G, s=None, t=None):
             return 0
         # initial value for lambda is min degree (\delta(G))
         L = min(G.degree().values())
-        # reuse auxiliary digraph
+        # reuse auxiliary digraph and residual network
         H = _aux_digraph_edge_connectivity(G)
+        R = nx.build_residual_network(H)
         nodes = G.nodes()
         n = len(nodes)
         for i in range(n):
             try:
-                L = min(L, local_edge_connectivity(G, nodes[i],
-                                                    nodes[i+1], aux_digraph=H))
+                L = min(L, local_edge_connectivity(G, nodes[i], nodes[i+1],
+                                                   aux_digraph=H, residual=R,
+                                                   cutoff=L))
             except IndexError: # last node!
-                L = min(L, local_edge_connectivity(G, nodes[i],
-                                                    nodes[0], aux_digraph=H))
+                L = min(L, local_edge_connectivity(G, nodes[i], nodes[0],
+                                                   aux_digraph=H, residual=R,
+                                                   cutoff=L))
         return L
     else: # undirected
         # Algorithm 6 in [1]
@@ -559,8 +653,9 @@ def edge_connectivity(G, s=None, t=None):
             return 0
         # initial value for lambda is min degree (\delta(G))
         L = min(G.degree().values())
-        # reuse auxiliary digraph
+        # reuse auxiliary digraph and residual network
         H = _aux_digraph_edge_connectivity(G)
+        R = nx.build_residual_network(H)
         # A dominating set is \lambda-covering
         # We need a dominating set with at least two nodes
         for node in G:
@@ -572,5 +667,6 @@ def edge_connectivity(G, s=None, t=None):
             # thus we return min degree
             return L
         for w in D:
-            L = min(L, local_edge_connectivity(G, v, w, aux_digraph=H))
+            L = min(L, local_edge_connectivity(G, v, w, aux_digraph=H,
+                                               residual=R, cutoff=L))
         return L
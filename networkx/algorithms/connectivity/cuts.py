@@ -19,7 +19,24 @@ __all__ = [ 'minimum_st_node_cut',
             'minimum_edge_cut',
             ]
 
-def minimum_st_edge_cut(G, s, t, capacity='capacity'):
+def _cutset_from_residual(G, R, s):
+    """Edges of G leaving the nodes reachable from s in the residual
+    network R of a maximum flow."""
+    R_succ = R.succ
+    reachable = set([s])
+    stack = [s]
+    while stack:
+        u = stack.pop()
+        for v, attr in R_succ[u].items():
+            if v not in reachable and attr['flow'] < attr['capacity']:
+                reachable.add(v)
+                stack.append(v)
+    cutset = set()
+    for u in reachable:
+        cutset.update((u, v) for v in G[u] if v not in reachable)
+    return cutset
+
+def minimum_st_edge_cut(G, s, t, capacity='capacity', residual=None):
     """Returns the edges of the cut-set of a minimum (s, t)-cut.
 
     We use the max-flow min-cut theorem, i.e., the capacity of a minimum
@@ -44,6 +61,12 @@ def minimum_st_edge_cut(G, s, t, capacity='capacity'):
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
+    residual : DiGraph
+        Residual network of G built with build_residual_network(). Its
+        flows are reset and it is reused, which avoids rebuilding it for
+        every pair of nodes. If None a new residual network is built.
+        Default value: None.
+
     Returns
     -------
     cutset : set
@@ -72,23 +95,18 @@ def minimum_st_edge_cut(G, s, t, capacity='capacity'):
     3.0
     """
     try:
-        flow, H = nx.ford_fulkerson_flow_and_auxiliary(G, s, t, capacity=capacity)
-        cutset = set()
-        # Compute reachable nodes from source in the residual network
-        reachable = set(nx.single_source_shortest_path(H,s))
-        # And unreachable nodes
-        others = set(H) - reachable # - set([s])
-        # Any edge in the original network linking these two partitions
-        # is part of the edge cutset
-        for u, nbrs in ((n, G[n]) for n in reachable):
-            cutset.update((u,v) for v in nbrs if v in others)
-        return cutset
+        R = nx.dinitz(G, s, t, capacity=capacity, residual=residual)
     except nx.NetworkXUnbounded:
-        # Should we raise any other exception or just let ford_fulkerson
+        # Should we raise any other exception or just let dinitz
         # propagate nx.NetworkXUnbounded ?
         raise nx.NetworkXUnbounded("Infinite capacity path, no minimum cut.")
+    # Any edge in the original network linking the nodes reachable from
+    # the source in the residual network to the others is part of the
+    # edge cutset
+    return _cutset_from_residual(G, R, s)
 
-def minimum_st_node_cut(G, s, t, aux_digraph=None, mapping=None):
+def minimum_st_node_cut(G, s, t, aux_digraph=None, mapping=None,
+                        residual=None):
     r"""Returns a set of nodes of minimum cardinality that disconnect source
     from target in G.
 
@@ -105,6 +123,19 @@ def minimum_st_node_cut(G, s, t, aux_digraph=None, mapping=None):
     t : node
         Target node.
 
+    aux_digraph : NetworkX DiGraph (default=None)
+        Auxiliary digraph to compute flow based node connectivity. If None
+        the auxiliary digraph is build.
+
+    mapping : dict (default=None)
+        Dictionary with a mapping of node names in G and in the auxiliary
+        digraph.
+
+    residual : NetworkX DiGraph (default=None)
+        Residual network of the auxiliary digraph built with
+        build_residual_network(), reused between calls. If None a new
+        residual network is built.
+
     Returns
     -------
     cutset : set
@@ -127,8 +158,8 @@ def minimum_st_node_cut(G, s, t, aux_digraph=None, mapping=None):
     to the minimum node cut of G. It handles both directed and undirected
     graphs.
 
-    This implementation is based on algorithm 11 in [1]_. We use the Ford
-    and Fulkerson algorithm to compute max flow (see ford_fulkerson).
+    This implementation is based on algorithm 11 in [1]_. We use Dinitz'
+    algorithm to compute max flow (see dinitz).
 
     See also
     --------
@@ -148,7 +179,8 @@ def minimum_st_node_cut(G, s, t, aux_digraph=None, mapping=None):
         H, mapping = _aux_digraph_node_connectivity(G)
     else:
         H = aux_digraph
-    edge_cut = minimum_st_edge_cut(H, '%sB' % mapping[s], '%sA' % mapping[t])
+    edge_cut = minimum_st_edge_cut(H, '%sB' % mapping[s], '%sA' % mapping[t],
+                                   residual=residual)
     # Each node in the original graph maps to two nodes of the auxiliary graph
     node_cut = set(H.node[node]['id'] for edge in edge_cut for node in edge)
     return node_cut - set([s,t])
@@ -200,8 +232,8 @@ def minimum_node_cut(G, s=None, t=None):
     to the minimum node cut of G. It handles both directed and undirected
     graphs.
 
-    This implementation is based on algorithm 11 in [1]_. We use the Ford
-    and Fulkerson algorithm to compute max flow (see ford_fulkerson).
+    This implementation is based on algorithm 11 in [1]_. We use Dinitz'
+    algorithm to compute max flow (see dinitz).
 
     See also
     --------
@@ -244,19 +276,24 @@ def minimum_node_cut(G, s=None, t=None):
     v = next(n for n,d in deg.items() if d == min_deg)
     # Initial node cutset is all neighbors of the node with minimum degree
     min_cut = set(G[v])
-    # Reuse the auxiliary digraph
+    # Reuse the auxiliary digraph and its residual network
     H, mapping = _aux_digraph_node_connectivity(G)
+    R = nx.build_residual_network(H)
     # compute st node cuts between v and all its non-neighbors nodes in G
     # and store the minimum
-    for w in set(G) - set(neighbors(v)) - set([v]):
-        this_cut = minimum_st_node_cut(G, v, w, aux_digraph=H, mapping=mapping)
-        if len(min_cut) >= len(this_cut):
-            min_cut = this_cut
+    pairs = [(v, w) for w in set(G) - set(neighbors(v)) - set([v])]
     # Same for non adjacent pairs of neighbors of v
-    for x,y in iter_func(neighbors(v),2):
-        if y in G[x]: continue
-        this_cut = minimum_st_node_cut(G, x, y, aux_digraph=H, mapping=mapping)
-        if len(min_cut) >= len(this_cut):
+    pairs.extend((x, y) for x, y in iter_func(neighbors(v), 2)
+                 if y not in G[x])
+    for x, y in pairs:
+        # Only cuts at most as large as the current one are of interest,
+        # so stop the flow as soon as it exceeds the size of min_cut.
+        sB, tA = '%sB' % mapping[x], '%sA' % mapping[y]
+        nx.dinitz(H, sB, tA, residual=R, cutoff=len(min_cut) + 1)
+        if R.graph['flow_value'] <= len(min_cut):
+            edge_cut = _cutset_from_residual(H, R, sB)
+            this_cut = set(H.node[node]['id'] for edge in edge_cut
+                           for node in edge) - set([x, y])
             min_cut = this_cut
     return min_cut
 
@@ -306,8 +343,8 @@ def minimum_edge_cut(G, s=None, t=None):
     nodes in it. This is an implementation of algorithm 6 in [1]_.
 
     For directed graphs, the algorithm does n calls to the max flow function.
-    This is an implementation of algorithm 8 in [1]_. We use the Ford and
-    Fulkerson algorithm to compute max flow (see ford_fulkerson).
+    This is an implementation of algorithm 8 in [1]_. We use Dinitz'
+    algorithm to compute max flow (see dinitz).
 
     See also
     --------
@@ -323,15 +360,16 @@ def minimum_edge_cut(G, s=None, t=None):
         http://www.cse.msu.edu/~cse835/Papers/Graph_connectivity_revised.pdf
 
     """
-    # reuse auxiliary digraph
+    # reuse auxiliary digraph and its residual network
     H = _aux_digraph_edge_connectivity(G)
+    R = nx.build_residual_network(H)
     # Local minimum edge cut if s and t are not None
     if s is not None and t is not None:
         if s not in G:
             raise nx.NetworkXError('node %s not in graph' % s)
         if t not in G:
             raise nx.NetworkXError('node %s not in graph' % t)
-        return minimum_st_edge_cut(H, s, t)
+        return minimum_st_edge_cut(H, s, t, residual=R)
     # Global minimum edge cut
     # Analog to the algoritm for global edge connectivity
     if G.is_directed():
@@ -347,11 +385,13 @@ def minimum_edge_cut(G, s=None, t=None):
         n = len(nodes)
         for i in range(n):
             try:
-                this_cut = minimum_st_edge_cut(H, nodes[i], nodes[i+1])
+                this_cut = minimum_st_edge_cut(H, nodes[i], nodes[i+1],
+                                               residual=R)
                 if len(this_cut) <= len(min_cut):
                     min_cut = this_cut
             except IndexError: # Last node!
-                this_cut = minimum_st_edge_cut(H, nodes[i], nodes[0])
+                this_cut = minimum_st_edge_cut(H, nodes[i], nodes[0],
+                                               residual=R)
                 if len(this_cut) <= len(min_cut):
                     min_cut = this_cut
         return min_cut
@@ -376,7 +416,7 @@ def minimum_edge_cut(G, s=None, t=None):
             # with minimum degree
             return min_cut
         for w in D:
-            this_cut = minimum_st_edge_cut(H, v, w)
+            this_cut = minimum_st_edge_cut(H, v, w, residual=R)
             if len(this_cut) <= len(min_cut):
                 min_cut = this_cut
         return min_cut
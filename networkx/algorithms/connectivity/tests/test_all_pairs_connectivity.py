@@ -49,3 +49,27 @@ class TestConnectivityPairs(object):
     def test_all_pairs_connectivity_nodelist(self):
         G = nx.path_graph(4)
         C = nx.all_pairs_node_connectivity_matrix(G, nodelist=[1,2,3,1])
+
+    def test_all_pairs_connectivity_cutoff(self):
+        G = nx.complete_graph(5)
+        C = nx.all_pairs_node_connectivity_matrix(G, cutoff=2)
+        A = 2 * (numpy.ones((5, 5), dtype=int) - numpy.eye(5, dtype=int))
+        assert_equal(A, C)
+
+    def test_all_pairs_connectivity_nodelist_order(self):
+        G = nx.Graph()
+        G.add_path([0, 1, 2, 3])
+        G.add_edge(0, 2)
+        nodelist = [3, 0, 2]
+        C = nx.all_pairs_node_connectivity_matrix(G, nodelist=nodelist)
+        A = numpy.zeros((3, 3), dtype=int)
+        for i, u in enumerate(nodelist):
+            for j, v in enumerate(nodelist):
+                if u != v:
+                    A[i][j] = nx.node_connectivity(G, u, v)
+        assert_equal(A, C)
+
+    def test_all_pairs_connectivity_n_jobs(self):
+        G = nx.petersen_graph()
+        C = nx.all_pairs_node_connectivity_matrix(G)
+        assert_equal(C, nx.all_pairs_node_connectivity_matrix(G, n_jobs=2))
@@ -159,3 +159,46 @@ def test_directed_edge_connectivity():
     assert_equal(2, nx.edge_connectivity(D))
     assert_equal(2, nx.local_edge_connectivity(D,1,4))
     assert_equal(2, nx.edge_connectivity(D,1,4))
+
+def test_cutoff():
+    G = nx.icosahedral_graph()
+    assert_equal(nx.local_node_connectivity(G, 0, 6, cutoff=3), 3)
+    assert_equal(nx.local_node_connectivity(G, 0, 6, cutoff=10), 5)
+    assert_equal(nx.local_edge_connectivity(G, 0, 6, cutoff=2), 2)
+    assert_equal(nx.local_edge_connectivity(G, 0, 6, cutoff=10), 5)
+
+def test_reuse_residual():
+    from networkx.algorithms.connectivity.connectivity import \
+        _aux_digraph_node_connectivity, _aux_digraph_edge_connectivity
+    G = nx.barbell_graph(5, 2)
+    H, mapping = _aux_digraph_node_connectivity(G)
+    R = nx.build_residual_network(H)
+    for u, v, k in [(0, 1, 4), (0, 11, 1), (5, 6, 1), (1, 2, 4)]:
+        assert_equal(nx.local_node_connectivity(G, u, v, aux_digraph=H,
+                                                mapping=mapping, residual=R),
+                     k)
+    H = _aux_digraph_edge_connectivity(G)
+    R = nx.build_residual_network(H)
+    for u, v, k in [(0, 1, 4), (0, 11, 1), (1, 2, 4)]:
+        assert_equal(nx.local_edge_connectivity(G, u, v, aux_digraph=H,
+                                                residual=R), k)
+
+def test_n_jobs():
+    G = nx.petersen_graph()
+    assert_equal(nx.node_connectivity(G, n_jobs=2), 3)
+    G = nx.path_graph(3)
+    G.add_edges_from([(1,3),(1,4),(0,3),(0,4),(3,4)])
+    assert_equal(nx.average_node_connectivity(G, n_jobs=2), 2.2)
+
+def test_executor():
+    class Executor(object):
+        def __init__(self):
+            self.calls = 0
+        def map(self, func, args):
+            args = list(args)
+            self.calls += len(args)
+            return map(func, args)
+    executor = Executor()
+    G = nx.octahedral_graph()
+    assert_equal(nx.node_connectivity(G, n_jobs=3, executor=executor), 4)
+    assert_equal(executor.calls, 3)
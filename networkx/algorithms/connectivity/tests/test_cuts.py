@@ -155,3 +155,20 @@ def test_empty_graphs():
     assert_raises(nx.NetworkXPointlessConcept, nx.minimum_node_cut, D)
     assert_raises(nx.NetworkXPointlessConcept, nx.minimum_edge_cut, G)
     assert_raises(nx.NetworkXPointlessConcept, nx.minimum_edge_cut, D)
+
+def test_reuse_residual():
+    from networkx.algorithms.connectivity.connectivity import \
+        _aux_digraph_node_connectivity
+    G = nx.barbell_graph(5, 2)
+    H, mapping = _aux_digraph_node_connectivity(G)
+    R = nx.build_residual_network(H)
+    assert_equal(nx.minimum_st_node_cut(G, 0, 11, aux_digraph=H,
+                                        mapping=mapping, residual=R), set([4]))
+    assert_equal(nx.minimum_st_node_cut(G, 0, 1, aux_digraph=H,
+                                        mapping=mapping, residual=R),
+                 set([2, 3, 4]))
+    D = G.to_directed()
+    nx.set_edge_attributes(D, 'capacity', dict((e, 1) for e in D.edges()))
+    R = nx.build_residual_network(D)
+    assert_equal(nx.minimum_st_edge_cut(D, 0, 11, residual=R), set([(4, 5)]))
+    assert_equal(nx.minimum_st_edge_cut(D, 11, 0, residual=R), set([(7, 6)]))
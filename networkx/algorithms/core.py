@@ -20,8 +20,10 @@ __author__ = "\n".join(['Dan Schult (dschult@colgate.edu)',
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
-__all__ = ['core_number','k_core','k_shell','k_crust','k_corona','find_cores']
+__all__ = ['core_number','k_core','k_shell','k_crust','k_corona','find_cores',
+           'CoreMaintainer']
 
+from heapq import heappush, heappop
 import networkx as nx
 
 def core_number(G):
@@ -54,6 +56,13 @@ def core_number(G):
     For directed graphs the node degree is defined to be the
     in-degree + out-degree.
 
+    To keep the core numbers of a changing graph up to date without
+    decomposing it again after each change use CoreMaintainer.
+
+    See Also
+    --------
+    CoreMaintainer
+
     References
     ----------
     .. [1] An O(m) Algorithm for Cores Decomposition of Networks
@@ -69,38 +78,67 @@ def core_number(G):
                 'Input graph has self loops; the core number is not defined.',
                 'Consider using G.remove_edges_from(G.selfloop_edges()).')
 
+    nodes=G.nodes()
+    index=dict(zip(nodes,range(len(nodes))))
     if G.is_directed():
-        import itertools
-        def neighbors(v):
-            return itertools.chain.from_iterable([G.predecessors_iter(v),
-                                                  G.successors_iter(v)])
+        # the neighbors through in- and out-edges, so that the degree
+        # is the in-degree + out-degree
+        adj=[[index[u] for u in G.pred[v]]+[index[u] for u in G.succ[v]]
+             for v in nodes]
     else:
-        neighbors=G.neighbors_iter
-    degrees=G.degree()
-    # sort nodes by degree
-    nodes=sorted(degrees,key=degrees.get)
-    bin_boundaries=[0]
-    curr_degree=0
-    for i,v in enumerate(nodes):
-        if degrees[v]>curr_degree:
-            bin_boundaries.extend([i]*(degrees[v]-curr_degree))
-            curr_degree=degrees[v]
-    node_pos = dict((v,pos) for pos,v in enumerate(nodes))
-    # initial guesses for core is degree
-    core=degrees
-    nbrs=dict((v,set(neighbors(v))) for v in G)
-    for v in nodes:
-        for u in nbrs[v]:
-            if core[u] > core[v]:
-                nbrs[u].remove(v)
-                pos=node_pos[u]
-                bin_start=bin_boundaries[core[u]]
-                node_pos[u]=bin_start
-                node_pos[nodes[bin_start]]=pos
-                nodes[bin_start],nodes[pos]=nodes[pos],nodes[bin_start]
-                bin_boundaries[core[u]]+=1
-                core[u]-=1
-    return core
+        adj=[[index[u] for u in G.adj[v]] for v in nodes]
+    return dict(zip(nodes,_core_number(adj)[0]))
+
+
+def _core_number(adj):
+    """Return the list of core numbers of the nodes 0..n-1 with neighbor
+    lists adj, by the bucket algorithm of Batagelj and Zaversnik, and the
+    list of the nodes in the order they are removed.
+
+    In that order the core numbers never decrease and each node has at
+    most its core number of neighbors after it.
+    """
+    n=len(adj)
+    deg=[len(nbrs) for nbrs in adj]
+    md=max(deg) if n else 0
+    # bin[d] is the position in vert of the first node of degree d
+    bin=[0]*(md+1)
+    for d in deg:
+        bin[d]+=1
+    start=0
+    for d in range(md+1):
+        num=bin[d]
+        bin[d]=start
+        start+=num
+    # vert holds the nodes sorted by degree, pos the position of each
+    pos=[0]*n
+    vert=[0]*n
+    for v in range(n):
+        pos[v]=bin[deg[v]]
+        vert[pos[v]]=v
+        bin[deg[v]]+=1
+    for d in range(md,0,-1):
+        bin[d]=bin[d-1]
+    if md>=0:
+        bin[0]=0
+    for i in range(n):
+        v=vert[i]
+        dv=deg[v]
+        for u in adj[v]:
+            du=deg[u]
+            if du>dv:
+                # move u to the front of its bin and shrink the bin
+                pu=pos[u]
+                pw=bin[du]
+                w=vert[pw]
+                if u!=w:
+                    pos[u]=pw
+                    vert[pu]=w
+                    pos[w]=pu
+                    vert[pw]=u
+                bin[du]+=1
+                deg[u]=du-1
+    return deg,vert
 
 find_cores=core_number
 
@@ -116,7 +154,8 @@ def k_core(G,k=None,core_number=None):
     k : int, optional
       The order of the core.  If not specified return the main core.
     core_number : dictionary, optional
-      Precomputed core numbers for the graph G.
+      Precomputed core numbers for the graph G, such as the core_number
+      attribute of a CoreMaintainer kept up to date as G changes.
 
     Returns
     -------
@@ -141,7 +180,7 @@ def k_core(G,k=None,core_number=None):
 
     See Also
     --------
-    core_number
+    core_number, CoreMaintainer
 
     References
     ----------
@@ -169,7 +208,8 @@ def k_shell(G,k=None,core_number=None):
     k : int, optional
       The order of the shell.  If not specified return the main shell.
     core_number : dictionary, optional
-      Precomputed core numbers for the graph G.
+      Precomputed core numbers for the graph G, such as the core_number
+      attribute of a CoreMaintainer kept up to date as G changes.
 
 
     Returns
@@ -196,7 +236,7 @@ def k_shell(G,k=None,core_number=None):
 
     See Also
     --------
-    core_number
+    core_number, CoreMaintainer
     k_corona
 
 
@@ -225,7 +265,8 @@ def k_crust(G,k=None,core_number=None):
     k : int, optional
       The order of the shell.  If not specified return the main crust.
     core_number : dictionary, optional
-      Precomputed core numbers for the graph G.
+      Precomputed core numbers for the graph G, such as the core_number
+      attribute of a CoreMaintainer kept up to date as G changes.
 
     Returns
     -------
@@ -251,7 +292,7 @@ def k_crust(G,k=None,core_number=None):
 
     See Also
     --------
-    core_number
+    core_number, CoreMaintainer
 
     References
     ----------
@@ -281,7 +322,8 @@ def k_corona(G, k, core_number=None):
     k : int
        The order of the corona.
     core_number : dictionary, optional
-       Precomputed core numbers for the graph G.
+       Precomputed core numbers for the graph G, such as the core_number
+       attribute of a CoreMaintainer kept up to date as G changes.
 
     Returns
     -------
@@ -305,7 +347,7 @@ def k_corona(G, k, core_number=None):
 
     See Also
     --------
-    core_number
+    core_number, CoreMaintainer
 
     References
     ----------
@@ -322,3 +364,336 @@ def k_corona(G, k, core_number=None):
              if core_number[n] >= k
              and len([v for v in G[n] if core_number[v] >= k]) == k)
     return G.subgraph(nodes).copy()
+
+
+class CoreMaintainer(object):
+    """Keep the core numbers of a graph up to date as edges change.
+
+    Adding or removing an edge changes the core numbers of some nodes
+    by at most one, and only of nodes with the core number of the edge's
+    end with the lower core number.  The maintainer keeps an order of the
+    nodes in which each node has at most its core number of neighbors
+    after it, like the order in which core_number() removes the nodes,
+    and only visits the nodes whose place in that order changes, usually
+    a tiny part of the graph, instead of decomposing the graph again.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph without self loops.  The maintainer changes
+       G when edges and nodes are added or removed through it; G must not
+       be changed otherwise.
+
+    Attributes
+    ----------
+    core_number : dictionary
+       The core number of each node, kept up to date.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+       If G is directed or a multigraph.
+
+    NetworkXError
+       If G has self loops or a self loop is added.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(4)
+    >>> cm=nx.CoreMaintainer(G)
+    >>> cm.core_number
+    {0: 1, 1: 1, 2: 1, 3: 1}
+    >>> cm.add_edge(0,2)
+    >>> cm.core_number
+    {0: 2, 1: 2, 2: 2, 3: 1}
+    >>> cm.remove_edge(0,1)
+    >>> cm.core_number
+    {0: 1, 1: 1, 2: 1, 3: 1}
+
+    Notes
+    -----
+    The core numbers can be passed to k_core(), k_shell(), k_crust() and
+    k_corona() to avoid decomposing the graph again.
+
+    References
+    ----------
+    .. [1] Y. Zhang, J. X. Yu, Y. Zhang and L. Qin, A fast order-based
+       approach for core maintenance. Proceedings of the 33rd IEEE
+       International Conference on Data Engineering (ICDE), 337-348, 2017.
+    .. [2] A. E. Sariyuce, B. Gedik, G. Jacques-Silva, K.-L. Wu and
+       U. V. Catalyurek, Streaming algorithms for k-core decomposition.
+       Proceedings of the VLDB Endowment 6(6):433-444, 2013.
+    """
+    # Spacing of the labels giving the positions of the nodes in the order
+    _gap = 2 ** 32
+
+    def __init__(self, G):
+        if G.is_directed() or G.is_multigraph():
+            raise nx.NetworkXNotImplemented(
+                'not implemented for directed graphs or multigraphs')
+        if G.selfloop_edges():
+            raise nx.NetworkXError(
+                'Input graph has self loops; the core number is not defined. '
+                'Consider using G.remove_edges_from(G.selfloop_edges()).')
+        self.G = G
+        nodes = G.nodes()
+        index = dict(zip(nodes, range(len(nodes))))
+        core, order = _core_number([[index[u] for u in G.adj[v]]
+                                    for v in nodes])
+        self.core_number = dict(zip(nodes, core))
+        # The order is kept as a doubly linked list for each core number,
+        # between a head and a tail sentinel, with increasing labels.
+        self._next = {}
+        self._prev = {}
+        self._label = {}
+        self._head = {}
+        self._tail = {}
+        for i in order:
+            v = nodes[i]
+            self._insert_after(self._prev[self._level(core[i])[1]], [v])
+        # the number of neighbors after each node in the order
+        self._forward = {}
+        for v in G:
+            self._forward[v] = sum(1 for u in G.adj[v]
+                                   if self._before(v, u))
+
+    def add_node(self, n):
+        """Add the node n, with core number 0, if it is not in the graph."""
+        if n not in self.G:
+            self.G.add_node(n)
+            self.core_number[n] = 0
+            self._forward[n] = 0
+            self._insert_after(self._prev[self._level(0)[1]], [n])
+
+    def remove_node(self, n):
+        """Remove the node n and its edges."""
+        for v in list(self.G[n]):
+            self.remove_edge(n, v)
+        self.G.remove_node(n)
+        self._unlink(n)
+        del self.core_number[n]
+        del self._forward[n]
+        del self._label[n]
+
+    def add_edges_from(self, ebunch):
+        """Add the edges (u, v) in ebunch."""
+        for u, v in ebunch:
+            self.add_edge(u, v)
+
+    def remove_edges_from(self, ebunch):
+        """Remove the edges (u, v) in ebunch."""
+        for u, v in ebunch:
+            self.remove_edge(u, v)
+
+    def add_edge(self, u, v):
+        """Add the edge (u, v), and its nodes if they are not in the graph.
+
+        Adding an existing edge does nothing.
+        """
+        if u == v:
+            raise nx.NetworkXError('Self loops are not allowed.')
+        G = self.G
+        self.add_node(u)
+        self.add_node(v)
+        if v in G[u]:
+            return
+        G.add_edge(u, v)
+        if self._before(v, u):
+            u, v = v, u
+        core = self.core_number
+        forward = self._forward
+        label = self._label
+        k = core[u]
+        forward[u] += 1
+        if forward[u] <= k:
+            return
+        # Visit the nodes of core number k after u in order.  A node
+        # becomes a candidate to move to the (k+1)-core when it has more
+        # than k neighbors after it once the candidates before it are
+        # moved after it; backward[v] is the number of candidates before
+        # v.  The nodes left behind are moved back after the node being
+        # visited.
+        backward = {u: 0}
+        candidates = set()
+        moves = []
+        heap = [(label[u], u)]
+        while heap:
+            _, w = heappop(heap)
+            if w not in candidates and (w == u or
+                                        backward[w] + forward[w] > k):
+                candidates.add(w)
+                lw = label[w]
+                for x in G[w]:
+                    if core[x] == k and label[x] > lw:
+                        if x in backward:
+                            backward[x] += 1
+                        else:
+                            backward[x] = 1
+                            heappush(heap, (label[x], x))
+            elif backward[w]:
+                moves.append((w, self._left_behind(w, k, backward,
+                                                   candidates)))
+        # the labels are only changed now, as they order the heap
+        for w, moved in moves:
+            for v in moved:
+                self._unlink(v)
+            self._insert_after(w, moved)
+        candidates = sorted(candidates, key=label.__getitem__)
+        for w in candidates:
+            self._unlink(w)
+            core[w] = k + 1
+        self._insert_after(self._level(k + 1)[0], candidates)
+
+    def _left_behind(self, w, k, backward, candidates):
+        # w stays in the k-core and now has the candidates before it
+        # after it.  The candidates lose w from their neighbors and may
+        # be left behind too; return them in the order they go after w.
+        G = self.G
+        core = self.core_number
+        forward = self._forward
+        label = self._label
+        stack = [w]
+        pending = set()
+        moved = []
+        while stack:
+            v = stack.pop()
+            forward[v] += backward[v]
+            backward[v] = 0
+            was_candidate = v != w
+            lv = label[v]
+            for x in G[v]:
+                if core[x] != k:
+                    continue
+                if x in candidates or x in pending:
+                    if label[x] < lv:
+                        forward[x] -= 1
+                    elif was_candidate:
+                        backward[x] -= 1
+                    if (x in candidates and
+                        backward[x] + forward[x] <= k):
+                        candidates.remove(x)
+                        pending.add(x)
+                        stack.append(x)
+                elif was_candidate and x in backward and label[x] > lv:
+                    # not visited yet
+                    backward[x] -= 1
+            if was_candidate:
+                pending.remove(v)
+                moved.append(v)
+        return moved
+
+    def remove_edge(self, u, v):
+        """Remove the edge (u, v)."""
+        G = self.G
+        try:
+            G.remove_edge(u, v)
+        except nx.NetworkXError:
+            raise nx.NetworkXError('The edge %s-%s is not in the graph.'
+                                   % (u, v))
+        if self._before(v, u):
+            u, v = v, u
+        core = self.core_number
+        forward = self._forward
+        label = self._label
+        forward[u] -= 1
+        k = core[u]
+        # A node leaves the k-core when fewer than k of its neighbors are
+        # left in it; only the nodes that leave and their neighbors are
+        # visited.  Nodes waiting on the stack still count as in the
+        # k-core until they are processed.
+        degree = {}
+        pending = set()
+        stack = []
+        for w in (u, v):
+            if core[w] == k and w not in degree:
+                degree[w] = sum(1 for x in G[w] if core[x] >= k)
+                if degree[w] < k:
+                    pending.add(w)
+                    stack.append(w)
+        removed = []
+        while stack:
+            w = stack.pop()
+            removed.append(w)
+            core[w] = k - 1
+            for x in G[w]:
+                if core[x] == k and x not in pending:
+                    if x in degree:
+                        degree[x] -= 1
+                    else:
+                        degree[x] = sum(1 for y in G[x] if core[y] >= k)
+                    if degree[x] < k:
+                        pending.add(x)
+                        stack.append(x)
+        if not removed:
+            return
+        # The removed nodes go to the end of the nodes of core number
+        # k - 1, in the order they were removed.
+        rank = dict(zip(removed, range(len(removed))))
+        for w in removed:
+            lw = label[w]
+            for x in G[w]:
+                if core[x] == k and label[x] < lw:
+                    forward[x] -= 1
+        for w in removed:
+            r = rank[w]
+            forward[w] = sum(1 for x in G[w]
+                             if core[x] >= k or rank.get(x, -1) > r)
+            self._unlink(w)
+        self._insert_after(self._prev[self._level(k - 1)[1]], removed)
+
+    def _before(self, u, v):
+        # Whether u is before v in the order
+        cu = self.core_number[u]
+        cv = self.core_number[v]
+        return cu < cv or cu == cv and self._label[u] < self._label[v]
+
+    def _level(self, k):
+        # Return the head and tail sentinels of the nodes with core number k
+        if k not in self._head:
+            head = object()
+            tail = object()
+            self._head[k] = head
+            self._tail[k] = tail
+            self._next[head] = tail
+            self._prev[tail] = head
+            self._label[head] = 0
+            self._label[tail] = self._gap
+        return self._head[k], self._tail[k]
+
+    def _unlink(self, v):
+        prev = self._prev.pop(v)
+        next = self._next.pop(v)
+        self._next[prev] = next
+        self._prev[next] = prev
+
+    def _insert_after(self, a, nodes):
+        # Insert the nodes after a, relabeling the nodes following them
+        # when the labels are too close.
+        if not nodes:
+            return
+        label = self._label
+        nxt = self._next
+        prv = self._prev
+        start = label[a]
+        after = []
+        c = nxt[a]
+        while True:
+            n = len(after) + len(nodes) + 1
+            if c not in nxt:
+                # the tail sentinel can be moved freely
+                label[c] = max(label[c], start + n * self._gap)
+                break
+            if label[c] - start > n * n:
+                break
+            after.append(c)
+            c = nxt[c]
+        step = (label[c] - start) // (len(nodes) + len(after) + 1)
+        for i, v in enumerate(nodes + after):
+            label[v] = start + step * (i + 1)
+        b = nxt[a]
+        for v in nodes:
+            nxt[a] = v
+            prv[v] = a
+            a = v
+        nxt[a] = b
+        prv[b] = a
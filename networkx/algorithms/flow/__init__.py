@@ -1,3 +1,5 @@
+from networkx.algorithms.flow.residual import *
+from networkx.algorithms.flow.preflowpush import *
+from networkx.algorithms.flow.dinitz_alg import *
 from networkx.algorithms.flow.maxflow import *
 from networkx.algorithms.flow.mincost import *
-
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Dinitz' blocking flow algorithm for maximum flow problems.
+"""
+
+__author__ = """Loïc Séguin-C. <loicseguin@gmail.com>"""
+# Copyright (C) 2010 Loïc Séguin-C. <loicseguin@gmail.com>
+# All rights reserved.
+# BSD license.
+
+from collections import deque
+import networkx as nx
+from networkx.algorithms.flow.residual import _prepare_residual
+
+__all__ = ['dinitz']
+
+
+def _level_graph(R, s, t):
+    """Return the arcs of the level graph of R, or None if t cannot be
+    reached from s.
+
+    The level graph keeps the edges with residual capacity that lie on
+    shortest paths from s, so arcs[u] lists the (v, attr) pairs of the
+    edges (u, v) with level[v] == level[u] + 1.  Nodes at the level of t
+    or beyond are left out since they cannot be on a shortest s-t path.
+    """
+    R_succ = R.succ
+    level = {s: 0}
+    arcs = {}
+    queue = deque([s])
+    t_level = None
+    while queue:
+        u = queue.popleft()
+        lu = level[u] + 1
+        if t_level is not None and lu > t_level:
+            break
+        out = arcs[u] = []
+        for v, attr in R_succ[u].items():
+            if attr['flow'] < attr['capacity']:
+                lv = level.get(v)
+                if lv is None:
+                    if t_level is not None and v != t:
+                        continue
+                    level[v] = lv = lu
+                    if v == t:
+                        t_level = lu
+                    else:
+                        queue.append(v)
+                if lv == lu and (v == t or t_level is None or lu < t_level):
+                    out.append((v, attr))
+    if t_level is None:
+        return None
+    return arcs
+
+
+def _blocking_flow(R, s, t, arcs, limit):
+    """Augment flow along the paths of the level graph until it has no
+    s-t path left or limit units have been sent.  Return the amount of
+    flow sent."""
+    R_succ = R.succ
+    # current arc of every node, as a position in its list of arcs
+    current = dict.fromkeys(arcs, 0)
+    total = 0
+    path = [s]
+    used = []
+    while total < limit:
+        u = path[-1]
+        if u == t:
+            # Augment along the path by its bottleneck capacity.
+            flow = min(limit - total,
+                       min(attr['capacity'] - attr['flow']
+                           for attr in used))
+            for i, attr in enumerate(used):
+                attr['flow'] += flow
+                R_succ[path[i + 1]][path[i]]['flow'] -= flow
+            total += flow
+            # Retreat to the tail of the first saturated edge.
+            for i, attr in enumerate(used):
+                if attr['flow'] == attr['capacity']:
+                    del path[i + 1:]
+                    del used[i:]
+                    break
+            continue
+        nbrs = arcs.get(u, ())
+        i = current.get(u, 0)
+        while i < len(nbrs):
+            v, attr = nbrs[i]
+            if attr['flow'] < attr['capacity']:
+                break
+            i += 1
+        current[u] = i
+        if i < len(nbrs):
+            path.append(v)
+            used.append(attr)
+        else:
+            # Dead end: no path to t through u in the level graph.
+            if u == s:
+                break
+            path.pop()
+            used.pop()
+            current[path[-1]] += 1
+    return total
+
+
+def dinitz(G, s, t, capacity='capacity', residual=None, value_only=False,
+           cutoff=None):
+    """Find a maximum single-commodity flow using Dinitz' algorithm.
+
+    This function returns the residual network resulting after computing
+    the maximum flow.  See build_residual_network() for details about
+    its conventions.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    s : node
+        Source node for the flow.
+
+    t : node
+        Sink node for the flow.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    residual : DiGraph
+        Residual network built by build_residual_network() for G.  The
+        flows are reset and the network is reused, which avoids rebuilding
+        it when many (s, t) pairs of the same graph are solved.  If None,
+        a new residual network is created.  Default value: None.
+
+    value_only : bool
+        Accepted for compatibility with the other flow functions.  The
+        flows in the residual network are always a valid flow.
+        Default value: False.
+
+    cutoff : integer, float
+        If specified, the algorithm stops as soon as the flow value
+        reaches cutoff, and the resulting flow value is min(cutoff,
+        maximum flow value).  Useful when only a bound on the flow value
+        is needed.  Default value: None.
+
+    Returns
+    -------
+    R : DiGraph
+        The residual network after computing the maximum flow.  The
+        flow value is R.graph['flow_value'].
+
+    Raises
+    ------
+    NetworkXError
+        The algorithm does not support MultiGraph and MultiDiGraph. If
+        the input graph is an instance of one of these two classes, a
+        NetworkXError is raised.
+
+    NetworkXUnbounded
+        If the graph has a path of infinite capacity, the value of a
+        feasible flow on the graph is unbounded above and the function
+        raises a NetworkXUnbounded.
+
+    See Also
+    --------
+    max_flow, min_cut, preflow_push, build_residual_network
+
+    Notes
+    -----
+    Each phase finds a blocking flow in the level graph of shortest
+    paths, so there are at most `n` phases and the running time is
+    `O(n^2 m)` for `n` nodes and `m` edges, and `O(m sqrt(n))` on unit
+    capacity networks.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.DiGraph()
+    >>> G.add_edge('x','a', capacity=3.0)
+    >>> G.add_edge('x','b', capacity=1.0)
+    >>> G.add_edge('a','c', capacity=3.0)
+    >>> G.add_edge('b','c', capacity=5.0)
+    >>> G.add_edge('b','d', capacity=4.0)
+    >>> G.add_edge('d','e', capacity=2.0)
+    >>> G.add_edge('c','y', capacity=2.0)
+    >>> G.add_edge('e','y', capacity=3.0)
+    >>> R = nx.dinitz(G, 'x', 'y')
+    >>> R.graph['flow_value']
+    3.0
+    >>> nx.max_flow(G, 'x', 'y', flow_func=nx.dinitz)
+    3.0
+
+    References
+    ----------
+    .. [1] E. A. Dinitz, Algorithm for solution of a problem of maximum
+       flow in a network with power estimation. Soviet Math. Dokl.
+       11:1277-1280, 1970.
+    """
+    R = _prepare_residual(G, s, t, capacity, residual)
+    if cutoff is None:
+        cutoff = float('inf')
+    flow_value = 0
+    while flow_value < cutoff:
+        arcs = _level_graph(R, s, t)
+        if arcs is None:
+            break
+        flow_value += _blocking_flow(R, s, t, arcs, cutoff - flow_value)
+    R.graph['flow_value'] = flow_value
+    return R
@@ -9,6 +9,7 @@ __author__ = """Loïc Séguin-C. <loicseguin@gmail.com>"""
 # BSD license.
 
 import networkx as nx
+from networkx.algorithms.flow.residual import _build_flow_dict
 
 __all__ = ['ford_fulkerson',
            'ford_fulkerson_flow',
@@ -221,7 +222,8 @@ def _create_flow_dict(G, H, capacity='capacity'):
 
     return flow
 
-def ford_fulkerson(G, s, t, capacity='capacity'):
+def ford_fulkerson(G, s, t, capacity='capacity', flow_func=None,
+                   **kwargs):
     """Find a maximum single-commodity flow using the Ford-Fulkerson
     algorithm.
     
@@ -248,6 +250,18 @@ def ford_fulkerson(G, s, t, capacity='capacity'):
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
+    flow_func : function
+        A function for computing the maximum flow among a pair of nodes
+        in a capacitated graph, such as preflow_push() or dinitz().  It
+        is called as flow_func(G, s, t, capacity=capacity, **kwargs) and
+        must return the residual network with the flow value in
+        R.graph['flow_value'].  If None, the Edmonds-Karp augmenting path
+        algorithm is used.
+        Default value: None.
+
+    kwargs : any other keyword parameter is passed to flow_func, e.g.,
+        residual to reuse a residual network between calls.
+
     Returns
     -------
     flow_value : integer, float
@@ -285,12 +299,16 @@ def ford_fulkerson(G, s, t, capacity='capacity'):
     >>> flow
     3.0
     """
+    if flow_func is not None:
+        R = flow_func(G, s, t, capacity=capacity, **kwargs)
+        return R.graph['flow_value'], _build_flow_dict(G, R)
     flow_value, auxiliary = ford_fulkerson_flow_and_auxiliary(G, 
                                 s, t, capacity=capacity)
     flow_dict = _create_flow_dict(G, auxiliary, capacity=capacity)
     return flow_value, flow_dict
 
-def ford_fulkerson_flow(G, s, t, capacity='capacity'):
+def ford_fulkerson_flow(G, s, t, capacity='capacity', flow_func=None,
+                        **kwargs):
     """Return a maximum flow for a single-commodity flow problem.
 
     Parameters
@@ -312,6 +330,18 @@ def ford_fulkerson_flow(G, s, t, capacity='capacity'):
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
+    flow_func : function
+        A function for computing the maximum flow among a pair of nodes
+        in a capacitated graph, such as preflow_push() or dinitz().  It
+        is called as flow_func(G, s, t, capacity=capacity, **kwargs) and
+        must return the residual network with the flow value in
+        R.graph['flow_value'].  If None, the Edmonds-Karp augmenting path
+        algorithm is used.
+        Default value: None.
+
+    kwargs : any other keyword parameter is passed to flow_func, e.g.,
+        residual to reuse a residual network between calls.
+
     Returns
     -------
     flow_dict : dictionary
@@ -355,11 +385,15 @@ def ford_fulkerson_flow(G, s, t, capacity='capacity'):
     (x, a) 2.00
     (x, b) 1.00
     """
+    if flow_func is not None:
+        R = flow_func(G, s, t, capacity=capacity, **kwargs)
+        return _build_flow_dict(G, R)
     flow_value, auxiliary = ford_fulkerson_flow_and_auxiliary(G,
                                 s, t, capacity=capacity)
     return _create_flow_dict(G, auxiliary, capacity=capacity)
 
-def max_flow(G, s, t, capacity='capacity'):
+def max_flow(G, s, t, capacity='capacity', flow_func=None,
+             **kwargs):
     """Find the value of a maximum single-commodity flow.
     
     Parameters
@@ -381,6 +415,19 @@ def max_flow(G, s, t, capacity='capacity'):
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
+    flow_func : function
+        A function for computing the maximum flow among a pair of nodes
+        in a capacitated graph, such as preflow_push() or dinitz().  It
+        is called as flow_func(G, s, t, capacity=capacity, **kwargs) and
+        must return the residual network with the flow value in
+        R.graph['flow_value'].  If None, the Edmonds-Karp augmenting path
+        algorithm is used.
+        Default value: None.
+
+    kwargs : any other keyword parameter is passed to flow_func, e.g.,
+        residual to reuse a residual network between calls.  value_only=True
+        is passed unless given, since only the flow value is needed.
+
     Returns
     -------
     flow_value : integer, float
@@ -413,11 +460,18 @@ def max_flow(G, s, t, capacity='capacity'):
     >>> flow = nx.max_flow(G, 'x', 'y')
     >>> flow
     3.0
+    >>> nx.max_flow(G, 'x', 'y', flow_func=nx.preflow_push)
+    3.0
     """
+    if flow_func is not None:
+        kwargs.setdefault('value_only', True)
+        R = flow_func(G, s, t, capacity=capacity, **kwargs)
+        return R.graph['flow_value']
     return ford_fulkerson_flow_and_auxiliary(G, s, t, capacity=capacity)[0]
 
 
-def min_cut(G, s, t, capacity='capacity'):
+def min_cut(G, s, t, capacity='capacity', flow_func=None,
+            **kwargs):
     """Compute the value of a minimum (s, t)-cut.
 
     Use the max-flow min-cut theorem, i.e., the capacity of a minimum
@@ -442,6 +496,19 @@ def min_cut(G, s, t, capacity='capacity'):
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
+    flow_func : function
+        A function for computing the maximum flow among a pair of nodes
+        in a capacitated graph, such as preflow_push() or dinitz().  It
+        is called as flow_func(G, s, t, capacity=capacity, **kwargs) and
+        must return the residual network with the flow value in
+        R.graph['flow_value'].  If None, the Edmonds-Karp augmenting path
+        algorithm is used.
+        Default value: None.
+
+    kwargs : any other keyword parameter is passed to flow_func, e.g.,
+        residual to reuse a residual network between calls.  value_only=True
+        is passed unless given, since only the flow value is needed.
+
     Returns
     -------
     cutValue : integer, float
@@ -468,9 +535,9 @@ def min_cut(G, s, t, capacity='capacity'):
     >>> nx.min_cut(G, 'x', 'y')
     3.0
     """
-
     try:
-        return ford_fulkerson_flow_and_auxiliary(G, s, t, capacity=capacity)[0]
+        return max_flow(G, s, t, capacity=capacity, flow_func=flow_func,
+                        **kwargs)
     except nx.NetworkXUnbounded:
         raise nx.NetworkXUnbounded(
                 "Infinite capacity path, no minimum cut.")
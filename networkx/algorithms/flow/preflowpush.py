@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Highest-label preflow-push algorithm for maximum flow problems.
+"""
+
+__author__ = """Loïc Séguin-C. <loicseguin@gmail.com>"""
+# Copyright (C) 2010 Loïc Séguin-C. <loicseguin@gmail.com>
+# All rights reserved.
+# BSD license.
+
+from collections import deque
+import networkx as nx
+from networkx.algorithms.flow.residual import _prepare_residual
+
+__all__ = ['preflow_push']
+
+
+def _reverse_bfs(R, root, blocked):
+    """Return the distances in R from the nodes to root, following edges
+    with residual capacity backwards and never passing through blocked."""
+    R_pred = R.pred
+    heights = {root: 0}
+    queue = deque([(root, 0)])
+    while queue:
+        u, height = queue.popleft()
+        height += 1
+        for v, attr in R_pred[u].items():
+            if v not in heights and v != blocked and \
+               attr['flow'] < attr['capacity']:
+                heights[v] = height
+                queue.append((v, height))
+    return heights
+
+
+def _preflow_push_impl(R, s, t, global_relabel_freq, value_only):
+    R_succ = R.succ
+    n = len(R)
+    excess = dict.fromkeys(R, 0)
+    height = {}
+    # current edge of every node, as a position in the list of its edges
+    edges = dict((u, list(R_succ[u].items())) for u in R)
+    current = dict.fromkeys(R, 0)
+    # active (with excess) and inactive nodes at each height
+    active = [set() for h in range(2 * n)]
+    inactive = [set() for h in range(2 * n)]
+    relabels = [0]
+
+    def push(u, v, flow):
+        R_succ[u][v]['flow'] += flow
+        R_succ[v][u]['flow'] -= flow
+        excess[u] -= flow
+        excess[v] += flow
+
+    def relabel(u):
+        # one more than the lowest neighbor through a residual edge
+        relabels[0] += 1
+        return min(height[v] for v, attr in edges[u]
+                   if attr['flow'] < attr['capacity']) + 1
+
+    def discharge(u, limit):
+        # Push the excess of u away until none is left or the height of
+        # u reaches limit.  Return the new height of u.
+        h = height[u]
+        nbrs = edges[u]
+        i = current[u]
+        while True:
+            v, attr = nbrs[i]
+            if h == height[v] + 1 and attr['flow'] < attr['capacity']:
+                flow = min(excess[u], attr['capacity'] - attr['flow'])
+                push(u, v, flow)
+                if v in inactive[height[v]]:
+                    inactive[height[v]].remove(v)
+                    active[height[v]].add(v)
+                if excess[u] == 0:
+                    break
+            i += 1
+            if i == len(nbrs):
+                i = 0
+                h = relabel(u)
+                if h >= limit:
+                    break
+        current[u] = i
+        return h
+
+    def global_relabel(sink, other, limit):
+        # Set exact distances to the sink and rebuild the levels.  Nodes
+        # that cannot reach the sink are left out.  Return the highest
+        # active level.
+        heights = _reverse_bfs(R, sink, other)
+        for h in range(2 * n):
+            active[h].clear()
+            inactive[h].clear()
+        for u in R:
+            current[u] = 0
+            if u == sink or u == other:
+                continue
+            if u in heights and heights[u] < limit:
+                height[u] = heights[u]
+                if excess[u] > 0:
+                    active[height[u]].add(u)
+                else:
+                    inactive[height[u]].add(u)
+            else:
+                height[u] = max(height.get(u, 0), limit)
+        relabels[0] = 0
+        return max([h for h in range(limit) if active[h]] or [-1])
+
+    def gap_heuristic(gap, top):
+        # No node is left at height gap, so the nodes above it cannot
+        # reach the sink any more.
+        for h in range(gap + 1, top + 1):
+            for u in active[h] | inactive[h]:
+                height[u] = n + 1
+            active[h].clear()
+            inactive[h].clear()
+
+    def process(sink, other, limit, use_gap):
+        # Discharge the highest active node until no active node is left.
+        max_height = global_relabel(sink, other, limit)
+        threshold = global_relabel_freq * n
+        while max_height >= 0:
+            if not active[max_height]:
+                max_height -= 1
+                continue
+            u = active[max_height].pop()
+            old_height = height[u]
+            h = discharge(u, limit)
+            height[u] = h
+            if h < limit:
+                inactive[h].add(u)
+            # The pushes of u may have activated nodes up to height h - 1.
+            max_height = max(max_height, min(h, limit - 1))
+            if use_gap and h != old_height and not active[old_height] \
+               and not inactive[old_height]:
+                gap_heuristic(old_height, max_height)
+                max_height = old_height - 1
+            if threshold > 0 and relabels[0] >= threshold:
+                max_height = global_relabel(sink, other, limit)
+
+    # Phase 1: saturate the edges out of s and build a maximum preflow.
+    # A node reaching height n - 1 cannot reach t without passing
+    # through s, so it is on the source side of the minimum cut and is
+    # left alone until phase 2.
+    height[s] = n
+    height[t] = 0
+    for v, attr in R_succ[s].items():
+        flow = attr['capacity'] - attr['flow']
+        if flow > 0:
+            push(s, v, flow)
+    process(t, s, n - 1, True)
+    R.graph['flow_value'] = excess[t]
+    if value_only:
+        return R
+
+    # Phase 2: return the excess left at the nodes to s.
+    height[s] = 0
+    height[t] = 2 * n
+    process(s, t, 2 * n - 1, False)
+    return R
+
+
+def preflow_push(G, s, t, capacity='capacity', residual=None,
+                 global_relabel_freq=1, value_only=False):
+    """Find a maximum single-commodity flow using the highest-label
+    preflow-push algorithm.
+
+    This function returns the residual network resulting after computing
+    the maximum flow.  See build_residual_network() for details about
+    its conventions.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    s : node
+        Source node for the flow.
+
+    t : node
+        Sink node for the flow.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    residual : DiGraph
+        Residual network built by build_residual_network() for G.  The
+        flows are reset and the network is reused, which avoids rebuilding
+        it when many (s, t) pairs of the same graph are solved.  If None,
+        a new residual network is created.  Default value: None.
+
+    global_relabel_freq : integer, float
+        Relative frequency of applying the global relabeling heuristic,
+        which recomputes exact heights with a breadth-first search.  The
+        heights are recomputed after global_relabel_freq * n relabel
+        operations.  If 0, global relabeling is only done at the start.
+        Default value: 1.
+
+    value_only : bool
+        If True, stop after the first phase, which finds the flow value
+        and a minimum cut but leaves excess at some nodes, so the flows
+        in the residual network do not form a valid flow.
+        Default value: False.
+
+    Returns
+    -------
+    R : DiGraph
+        The residual network after computing the maximum flow.  The
+        flow value is R.graph['flow_value'].
+
+    Raises
+    ------
+    NetworkXError
+        The algorithm does not support MultiGraph and MultiDiGraph. If
+        the input graph is an instance of one of these two classes, a
+        NetworkXError is raised.
+
+    NetworkXUnbounded
+        If the graph has a path of infinite capacity, the value of a
+        feasible flow on the graph is unbounded above and the function
+        raises a NetworkXUnbounded.
+
+    See Also
+    --------
+    max_flow, min_cut, dinitz, build_residual_network
+
+    Notes
+    -----
+    The highest-label variant with the global relabeling and gap
+    heuristics runs in `O(n^2 sqrt(m))` time for `n` nodes and `m`
+    edges and is usually much faster than augmenting paths on large
+    networks.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.DiGraph()
+    >>> G.add_edge('x','a', capacity=3.0)
+    >>> G.add_edge('x','b', capacity=1.0)
+    >>> G.add_edge('a','c', capacity=3.0)
+    >>> G.add_edge('b','c', capacity=5.0)
+    >>> G.add_edge('b','d', capacity=4.0)
+    >>> G.add_edge('d','e', capacity=2.0)
+    >>> G.add_edge('c','y', capacity=2.0)
+    >>> G.add_edge('e','y', capacity=3.0)
+    >>> R = nx.preflow_push(G, 'x', 'y')
+    >>> R.graph['flow_value']
+    3.0
+    >>> nx.max_flow(G, 'x', 'y', flow_func=nx.preflow_push)
+    3.0
+
+    References
+    ----------
+    .. [1] A. V. Goldberg and R. E. Tarjan, A new approach to the
+       maximum-flow problem. Journal of the ACM 35(4):921-940, 1988.
+    .. [2] B. V. Cherkassky and A. V. Goldberg, On implementing the
+       push-relabel method for the maximum flow problem.
+       Algorithmica 19(4):390-410, 1997.
+    """
+    R = _prepare_residual(G, s, t, capacity, residual)
+    return _preflow_push_impl(R, s, t, global_relabel_freq, value_only)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Residual networks shared by the maximum flow algorithms.
+"""
+
+__author__ = """Loïc Séguin-C. <loicseguin@gmail.com>"""
+# Copyright (C) 2010 Loïc Séguin-C. <loicseguin@gmail.com>
+# All rights reserved.
+# BSD license.
+
+from collections import deque
+import networkx as nx
+
+__all__ = ['build_residual_network']
+
+
+def build_residual_network(G, capacity='capacity'):
+    """Build a residual network for the maximum flow algorithms.
+
+    The residual network R has the same nodes as G.  For every edge
+    (u, v) of G with positive capacity, R has the pair of edges (u, v)
+    and (v, u).  Each edge of R has a 'capacity' attribute and a 'flow'
+    attribute; flows are kept skew symmetric, i.e.,
+    R[u][v]['flow'] == -R[v][u]['flow'].
+
+    The same residual network can be passed as the residual argument
+    of preflow_push() and dinitz() for any number of (s, t) pairs of G.
+    The flows are reset at the start of every call.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    capacity: string
+        Name of the edge attribute holding the capacity.
+        Default value: 'capacity'.
+
+    Returns
+    -------
+    R : DiGraph
+        The residual network.  Infinite capacities are replaced by the
+        finite value R.graph['inf'], larger than any finite cut.
+
+    Raises
+    ------
+    NetworkXError
+        The algorithm does not support MultiGraph and MultiDiGraph. If
+        the input graph is an instance of one of these two classes, a
+        NetworkXError is raised.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph()
+    >>> G.add_edge('x', 'a', capacity=3.0)
+    >>> G.add_edge('a', 'y', capacity=2.0)
+    >>> R = nx.build_residual_network(G)
+    >>> R['a']['x']
+    {'capacity': 0, 'flow': 0}
+    """
+    if G.is_multigraph():
+        raise nx.NetworkXError(
+                'MultiGraph and MultiDiGraph not supported (yet).')
+
+    R = nx.DiGraph()
+    R.add_nodes_from(G)
+
+    inf = float('inf')
+    # Extract edges with positive capacities. Self loops excluded.
+    edge_list = [(u, v, attr) for u, v, attr in G.edges_iter(data=True)
+                 if u != v and attr.get(capacity, inf) > 0]
+    # Simulate infinity with three times the sum of the finite edge
+    # capacities or any positive value if the sum is zero.
+    inf = 3 * sum(attr[capacity] for u, v, attr in edge_list
+                  if capacity in attr and attr[capacity] != inf) or 1
+    R_succ = R.succ
+    if G.is_directed():
+        for u, v, attr in edge_list:
+            r = min(attr.get(capacity, inf), inf)
+            if v not in R_succ[u]:
+                R.add_edge(u, v, capacity=r, flow=0)
+                R.add_edge(v, u, capacity=0, flow=0)
+            else:
+                # The reverse edge (v, u) of G was added first.
+                R_succ[u][v]['capacity'] = r
+    else:
+        for u, v, attr in edge_list:
+            r = min(attr.get(capacity, inf), inf)
+            R.add_edge(u, v, capacity=r, flow=0)
+            R.add_edge(v, u, capacity=r, flow=0)
+
+    R.graph['inf'] = inf
+    return R
+
+
+def _prepare_residual(G, s, t, capacity, residual):
+    """Check s and t, then return a residual network with zero flows."""
+    if s not in G:
+        raise nx.NetworkXError('node %s not in graph' % str(s))
+    if t not in G:
+        raise nx.NetworkXError('node %s not in graph' % str(t))
+    if s == t:
+        raise nx.NetworkXError('source and sink are the same node')
+
+    if residual is None:
+        R = build_residual_network(G, capacity)
+    else:
+        R = residual
+        for u, nbrs in R.succ.items():
+            for attr in nbrs.values():
+                attr['flow'] = 0
+    _detect_unboundedness(R, s, t)
+    return R
+
+
+def _detect_unboundedness(R, s, t):
+    """Raise NetworkXUnbounded if R has an infinite capacity s-t path."""
+    inf = R.graph['inf']
+    R_succ = R.succ
+    seen = set([s])
+    queue = deque([s])
+    while queue:
+        u = queue.popleft()
+        for v, attr in R_succ[u].items():
+            if attr['capacity'] == inf and v not in seen:
+                if v == t:
+                    raise nx.NetworkXUnbounded(
+                            'Infinite capacity path, flow unbounded above.')
+                seen.add(v)
+                queue.append(v)
+
+
+def _build_flow_dict(G, R):
+    """Build the flow dict of dicts of G from the flows of R.
+
+    For undirected graphs flow_dict[u][v] and flow_dict[v][u] both hold
+    the amount of flow through the edge, as for ford_fulkerson().
+    """
+    R_succ = R.succ
+    flow_dict = dict((u, {}) for u in G)
+    if G.is_directed():
+        for u, v in G.edges_iter():
+            if v in R_succ[u]:
+                flow_dict[u][v] = max(0, R_succ[u][v]['flow'])
+            else:
+                flow_dict[u][v] = 0
+    else:
+        for u, v in G.edges_iter():
+            if v in R_succ[u]:
+                flow_dict[u][v] = abs(R_succ[u][v]['flow'])
+            else:
+                flow_dict[u][v] = 0
+            flow_dict[v][u] = flow_dict[u][v]
+    return flow_dict
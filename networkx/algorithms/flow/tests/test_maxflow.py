@@ -13,6 +13,30 @@ __author__ = """Loïc Séguin-C. <loicseguin@gmail.com>"""
 import networkx as nx
 from nose.tools import *
 
+flow_funcs = [nx.preflow_push, nx.dinitz]
+
+
+def validate_flows(G, s, t, flowDict, solnValue):
+    assert_equal(set(G), set(flowDict))
+    for u in G:
+        assert_equal(set(G[u]), set(flowDict[u]))
+    excess = dict((u, 0) for u in G)
+    for u in flowDict:
+        for v, flow in flowDict[u].items():
+            ok_(-1e-10 <= flow <= G[u][v].get('capacity', float('inf')))
+            if G.is_directed():
+                excess[u] -= flow
+                excess[v] += flow
+    if G.is_directed():
+        for u, exc in excess.items():
+            if u == s:
+                assert_almost_equal(exc, -solnValue)
+            elif u == t:
+                assert_almost_equal(exc, solnValue)
+            else:
+                assert_almost_equal(exc, 0)
+
+
 def compare_flows(G, s, t, solnFlows, solnValue):
     flowValue, flowDict = nx.ford_fulkerson(G, s, t)
     assert_equal(flowValue, solnValue)
@@ -20,6 +44,14 @@ def compare_flows(G, s, t, solnFlows, solnValue):
     assert_equal(nx.min_cut(G, s, t), solnValue)
     assert_equal(nx.max_flow(G, s, t), solnValue)
     assert_equal(nx.ford_fulkerson_flow(G, s, t), solnFlows)
+    for flow_func in flow_funcs:
+        flowValue, flowDict = nx.ford_fulkerson(G, s, t, flow_func=flow_func)
+        assert_equal(flowValue, solnValue)
+        validate_flows(G, s, t, flowDict, solnValue)
+        assert_equal(nx.min_cut(G, s, t, flow_func=flow_func), solnValue)
+        assert_equal(nx.max_flow(G, s, t, flow_func=flow_func), solnValue)
+        R = flow_func(G, s, t)
+        assert_equal(R.graph['flow_value'], solnValue)
 
 
 class TestMaxflow:
@@ -271,3 +303,72 @@ class TestMaxflow:
         G.add_weighted_edges_from([(0,1,1),(1,2,1),(2,3,1)],weight='capacity')
         G.remove_node(3)
         assert_raises(nx.NetworkXError,nx.max_flow,G,0,3)
+
+    def test_source_target_same(self):
+        G = nx.DiGraph([(0, 1)])
+        for flow_func in flow_funcs:
+            assert_raises(nx.NetworkXError, flow_func, G, 0, 0)
+
+    def test_flow_func_infcap_path(self):
+        G = nx.DiGraph()
+        G.add_edge('s', 'a')
+        G.add_edge('s', 'b', capacity=30)
+        G.add_edge('a', 'c')
+        G.add_edge('b', 'c', capacity=12)
+        G.add_edge('a', 't', capacity=60)
+        G.add_edge('c', 't')
+        for flow_func in flow_funcs:
+            assert_raises(nx.NetworkXUnbounded, flow_func, G, 's', 't')
+            assert_raises(nx.NetworkXUnbounded,
+                          nx.min_cut, G, 's', 't', flow_func=flow_func)
+
+    def test_reuse_residual(self):
+        G = nx.DiGraph()
+        G.add_edge('x', 'a', capacity=3.0)
+        G.add_edge('x', 'b', capacity=1.0)
+        G.add_edge('a', 'c', capacity=3.0)
+        G.add_edge('b', 'c', capacity=5.0)
+        G.add_edge('b', 'd', capacity=4.0)
+        G.add_edge('d', 'e', capacity=2.0)
+        G.add_edge('c', 'y', capacity=2.0)
+        G.add_edge('e', 'y', capacity=3.0)
+        R = nx.build_residual_network(G)
+        for flow_func in flow_funcs:
+            for s, t, value in [('x', 'y', 3.0), ('b', 'y', 4.0),
+                                ('x', 'c', 4.0), ('y', 'x', 0)]:
+                assert_true(flow_func(G, s, t, residual=R) is R)
+                assert_equal(R.graph['flow_value'], value)
+                assert_equal(nx.max_flow(G, s, t, flow_func=flow_func,
+                                         residual=R), value)
+
+    def test_value_only(self):
+        G = nx.complete_graph(6, create_using=nx.DiGraph())
+        for u, v in G.edges():
+            G[u][v]['capacity'] = u + v
+        R = nx.preflow_push(G, 0, 5, value_only=True)
+        assert_equal(R.graph['flow_value'], nx.max_flow(G, 0, 5))
+        for freq in [0, 0.5, 2]:
+            R = nx.preflow_push(G, 0, 5, global_relabel_freq=freq)
+            assert_equal(R.graph['flow_value'], nx.max_flow(G, 0, 5))
+
+    def test_dinitz_cutoff(self):
+        G = nx.DiGraph()
+        for i in range(1, 6):
+            G.add_edge('s', i, capacity=2)
+            G.add_edge(i, 't', capacity=2)
+        assert_equal(nx.dinitz(G, 's', 't').graph['flow_value'], 10)
+        assert_equal(nx.dinitz(G, 's', 't', cutoff=5).graph['flow_value'], 5)
+        assert_equal(nx.max_flow(G, 's', 't', flow_func=nx.dinitz,
+                                 cutoff=20), 10)
+
+    def test_random_graphs(self):
+        for seed in range(20):
+            G = nx.gnp_random_graph(15, 0.3, seed=seed, directed=True)
+            for u, v in G.edges():
+                G[u][v]['capacity'] = (u * 7 + v * 3) % 10
+            value = nx.max_flow(G, 0, 1)
+            for flow_func in flow_funcs:
+                flowValue, flowDict = nx.ford_fulkerson(G, 0, 1,
+                                                        flow_func=flow_func)
+                assert_equal(flowValue, value)
+                validate_flows(G, 0, 1, flowDict, value)
@@ -42,10 +42,17 @@ class TestMaxflowLargeGraph:
         for (u, v) in G.edges():
             G[u][v]['capacity'] = 5
         assert_equal(nx.ford_fulkerson(G, 1, 2)[0], 5 * (N - 1))
+        R = nx.build_residual_network(G)
+        for flow_func in [nx.preflow_push, nx.dinitz]:
+            assert_equal(nx.max_flow(G, 1, 2, flow_func=flow_func,
+                                     residual=R), 5 * (N - 1))
 
     def test_pyramid(self):
         N = 10 
 #        N = 100 # this gives a graph with 5051 nodes
         G = gen_pyramid(N)
         assert_almost_equal(nx.ford_fulkerson(G, (0, 0), 't')[0], 1.)
+        for flow_func in [nx.preflow_push, nx.dinitz]:
+            assert_almost_equal(nx.max_flow(G, (0, 0), 't',
+                                            flow_func=flow_func), 1.)
 
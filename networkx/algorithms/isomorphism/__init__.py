@@ -1,4 +1,7 @@
 from networkx.algorithms.isomorphism.isomorph import *
 from networkx.algorithms.isomorphism.vf2userfunc import *
+from networkx.algorithms.isomorphism.vf2pp import *
+from networkx.algorithms.isomorphism.multipattern import *
+from networkx.algorithms.isomorphism.canonical import *
 from networkx.algorithms.isomorphism.matchhelpers import *
 
@@ -0,0 +1,442 @@
+"""
+Canonical labeling and graph hashing.
+
+A canonical labeling numbers the nodes of a graph such that two graphs
+receive identical relabeled graphs if and only if they are isomorphic.
+It is computed by partition refinement with individualization: the
+nodes are colored by their attributes, the coloring is refined until
+it is equitable and ties are broken by individualizing one node of the
+first non-singleton cell at a time, while automorphisms found during
+the search prune symmetric branches.
+
+The certificate built from the canonical labeling can be used as a
+dictionary key, so that a collection of graphs can be partitioned into
+isomorphism classes with one canonical labeling per graph instead of one
+isomorphism test per pair of graphs.
+"""
+#    Copyright (C) 2004-2011 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from hashlib import md5
+from itertools import count
+import networkx as nx
+from networkx.utils import UnionFind
+
+__all__ = ['weisfeiler_lehman_graph_hash',
+           'canonical_labeling',
+           'canonical_certificate',
+           'isomorphism_classes']
+
+
+def weisfeiler_lehman_graph_hash(G, node_attr=None, edge_attr=None,
+                                 iterations=3):
+    """Return a Weisfeiler-Lehman hash of the graph G.
+
+    Every node starts with a label given by its attribute node_attr.
+    In each iteration the label of a node is replaced by a hash of the
+    label and the sorted labels of its neighbors, together with the
+    attributes edge_attr of the connecting edges.  The graph hash is a
+    hash of the multiset of node labels of all iterations.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph, directed or undirected.
+
+    node_attr : string, optional (default=None)
+       Node attribute used for the initial labels.  If None, all nodes
+       start with the same label.
+
+    edge_attr : string, optional (default=None)
+       Edge attribute taken into account by the refinement.  If None,
+       edge attributes are ignored.
+
+    iterations : int, optional (default=3)
+       Number of refinement iterations.
+
+    Returns
+    -------
+    h : string
+       Hexadecimal digest.
+
+    Examples
+    --------
+    >>> G1 = nx.cycle_graph(4)
+    >>> G2 = nx.relabel_nodes(G1, {0: 'a', 1: 'b', 2: 'c', 3: 'd'})
+    >>> nx.weisfeiler_lehman_graph_hash(G1) == nx.weisfeiler_lehman_graph_hash(G2)
+    True
+
+    Notes
+    -----
+    Isomorphic graphs have the same hash, but graphs with the same hash
+    need not be isomorphic; use canonical_certificate() to decide
+    isomorphism.  Attribute values are compared by their repr().
+
+    References
+    ----------
+    .. [1] N. Shervashidze, P. Schweitzer, E. J. van Leeuwen, K. Mehlhorn
+       and K. M. Borgwardt, Weisfeiler Lehman Graph Kernels,
+       Journal of Machine Learning Research 12 (2011), 2539-2561.
+    """
+    def digest(s):
+        return md5(s.encode('utf-8')).hexdigest()
+
+    def edge_labels(nbrs):
+        if G.is_multigraph():
+            return [repr(d.get(edge_attr)) if edge_attr is not None else ''
+                    for u, keydict in nbrs.items() for d in keydict.values()]
+        return [repr(d.get(edge_attr)) if edge_attr is not None else ''
+                for d in nbrs.values()]
+
+    if G.is_directed():
+        adjs = [G.succ, G.pred]
+    else:
+        adjs = [G.adj]
+    labels = dict((v, digest(repr(d.get(node_attr)))
+                   if node_attr is not None else '')
+                  for v, d in G.nodes_iter(data=True))
+    hashes = sorted(labels.values())
+    for _ in range(iterations):
+        new = {}
+        for v in G:
+            parts = [labels[v]]
+            for adj in adjs:
+                nbrs = []
+                for u, keydict in adj[v].items():
+                    for e in edge_labels({u: keydict}):
+                        nbrs.append(e + ':' + labels[u])
+                nbrs.sort()
+                parts.append(','.join(nbrs))
+            new[v] = digest(';'.join(parts))
+        labels = new
+        hashes.extend(sorted(labels.values()))
+    return digest('%s;%s;%s' % (G.is_directed(), G.is_multigraph(),
+                                ','.join(hashes)))
+
+
+def _sort_values(values):
+    # Sort attribute values, falling back to an order on type names and
+    # representations for values that cannot be compared with each other.
+    try:
+        return sorted(values)
+    except TypeError:
+        return sorted(values, key=lambda x: (type(x).__name__, repr(x)))
+
+
+def _ranks(values):
+    # Map each distinct value to its position in sorted order.
+    return dict(zip(_sort_values(set(values)), count()))
+
+
+def _prepare(G, node_attr, edge_attr):
+    # Return the nodes, their attribute values, the initial colors and
+    # the adjacency lists of (neighbor index, edge color) pairs; one list
+    # for undirected graphs, successors and predecessors for directed ones.
+    nodes = G.nodes()
+    index = dict(zip(nodes, count()))
+    if node_attr is None:
+        node_values = [None] * len(nodes)
+    else:
+        node_values = [G.node[v].get(node_attr) for v in nodes]
+    node_ranks = _ranks(node_values)
+    colors = [node_ranks[x] for x in node_values]
+
+    edge_values = {}
+    for u, v, d in G.edges_iter(data=True):
+        x = d.get(edge_attr) if edge_attr is not None else None
+        if G.is_multigraph():
+            edge_values.setdefault((index[u], index[v]), []).append(x)
+        else:
+            edge_values[index[u], index[v]] = x
+    if G.is_multigraph():
+        # A bundle of parallel edges is described by the sorted values
+        # of its edges, which also accounts for the multiplicity.
+        for e, values in edge_values.items():
+            edge_values[e] = tuple(_sort_values(values))
+    edge_ranks = _ranks(edge_values.values())
+
+    n = len(nodes)
+    if G.is_directed():
+        adjs = [[[] for v in nodes], [[] for v in nodes]]
+        for (u, v), x in edge_values.items():
+            adjs[0][u].append((v, edge_ranks[x]))
+            adjs[1][v].append((u, edge_ranks[x]))
+    else:
+        adjs = [[[] for v in nodes]]
+        for (u, v), x in edge_values.items():
+            adjs[0][u].append((v, edge_ranks[x]))
+            if u != v:
+                adjs[0][v].append((u, edge_ranks[x]))
+    return nodes, node_values, colors, adjs, edge_values
+
+
+def _refine(colors, adjs):
+    # Refine the coloring until it is equitable.  Colors are renumbered
+    # by the rank of their signature, so the result only depends on the
+    # colored graph and not on the order of the nodes.
+    n = len(colors)
+    ncolors = len(set(colors))
+    while True:
+        signatures = []
+        for v in range(n):
+            signature = [colors[v]]
+            for adj in adjs:
+                signature.append(tuple(sorted((e, colors[u])
+                                              for u, e in adj[v])))
+            signatures.append(tuple(signature))
+        ranks = _ranks(signatures)
+        colors = [ranks[s] for s in signatures]
+        if len(ranks) == ncolors:
+            return colors
+        ncolors = len(ranks)
+
+
+def _target_cell(colors):
+    # The nodes of the non-singleton cell with the smallest color.
+    sizes = {}
+    for c in colors:
+        sizes[c] = sizes.get(c, 0) + 1
+    target = min(c for c, size in sizes.items() if size > 1)
+    return [v for v, c in enumerate(colors) if c == target]
+
+
+def _leaf_certificate(colors, adjs):
+    # The graph relabeled by a discrete coloring, as a sorted edge list.
+    directed = len(adjs) == 2
+    return sorted((colors[v], colors[u], e)
+                  for v, nbrs in enumerate(adjs[0]) for u, e in nbrs
+                  if directed or colors[v] <= colors[u])
+
+
+def _canonical_colors(colors, adjs):
+    # Search the tree of individualizations for the discrete coloring
+    # with the smallest leaf certificate.  Each frame of the explicit
+    # stack holds a coloring, its target cell, the position of the next
+    # node to try, the automorphism orbits known to fix the path to the
+    # frame and the nodes of the target cell tried so far.
+    n = len(colors)
+    colors = _refine(colors, adjs)
+    if len(set(colors)) == n:
+        return colors
+    best = best_colors = None
+    stack = [[colors, _target_cell(colors), 0, UnionFind(), []]]
+    path = []
+    while stack:
+        frame = stack[-1]
+        colors, cell, i, orbits, tried = frame
+        v = None
+        while frame[2] < len(cell):
+            w = cell[frame[2]]
+            frame[2] += 1
+            # Skip nodes that an automorphism maps onto a tried node.
+            if all(orbits[w] != orbits[u] for u in tried):
+                v = w
+                break
+        if v is None:
+            stack.pop()
+            if path:
+                path.pop()
+            continue
+        tried.append(v)
+        new = [2 * c + (u != v) for u, c in enumerate(colors)]
+        new = _refine(new, adjs)
+        if len(set(new)) < n:
+            stack.append([new, _target_cell(new), 0, UnionFind(), []])
+            path.append(v)
+            continue
+        certificate = _leaf_certificate(new, adjs)
+        if best is None or certificate < best:
+            best, best_colors = certificate, new
+        elif certificate == best:
+            # Two leaves with the same graph give an automorphism, which
+            # relates the branches of all frames whose path it fixes.
+            node_of = [0] * n
+            for u, c in enumerate(best_colors):
+                node_of[c] = u
+            automorphism = [node_of[c] for c in new]
+            for depth, frame in enumerate(stack):
+                if depth > 0 and automorphism[path[depth - 1]] != \
+                        path[depth - 1]:
+                    break
+                frame_orbits = frame[3]
+                for u in range(n):
+                    frame_orbits.union(u, automorphism[u])
+            # The subtree below a node that is now known to be equivalent
+            # to a tried node holds no better leaf; abandon it.
+            for depth in range(len(stack) - 1):
+                orbits, tried = stack[depth][3:]
+                if any(orbits[tried[-1]] == orbits[u] for u in tried[:-1]):
+                    del stack[depth + 1:]
+                    del path[depth:]
+                    break
+    return best_colors
+
+
+def canonical_labeling(G, node_attr=None, edge_attr=None):
+    """Return a canonical labeling of the nodes of G.
+
+    The labeling maps the nodes to the integers 0 to n-1 such that
+    relabeling two graphs with their canonical labelings gives equal
+    graphs (including attributes) if and only if the graphs are
+    isomorphic.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph, directed or undirected, possibly with parallel
+       edges and self loops.
+
+    node_attr : string, optional (default=None)
+       Node attribute that must be preserved by isomorphisms.  Missing
+       attributes are treated as None.
+
+    edge_attr : string, optional (default=None)
+       Edge attribute that must be preserved by isomorphisms.  For
+       multigraphs the multiset of values of the parallel edges between
+       two nodes must be preserved.
+
+    Returns
+    -------
+    labeling : dict
+       Dictionary keyed by node with the canonical label as value.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(3)
+    >>> labeling = nx.canonical_labeling(G)
+    >>> labeling[1] in (0, 2)
+    True
+
+    Notes
+    -----
+    The nodes are colored by their attributes and the coloring is
+    refined until nodes of the same color have the same number of
+    neighbors of each color.  Remaining ties are broken by trying every
+    node of the first color class with more than one node in turn, as in
+    McKay's algorithm [1]_; the labeling giving the smallest relabeled
+    edge list wins.  Automorphisms found along the way prune branches
+    that are equivalent to ones already explored.  Attribute values are
+    ordered by their natural order, or by type name and repr() when they
+    cannot be compared.
+
+    The search is exponential in the worst case but fast on the graphs
+    that occur in practice, in particular on small graphs.
+
+    See Also
+    --------
+    canonical_certificate, isomorphism_classes
+
+    References
+    ----------
+    .. [1] B. D. McKay and A. Piperno, Practical graph isomorphism, II,
+       Journal of Symbolic Computation 60 (2014), 94-112.
+    """
+    nodes, node_values, colors, adjs, edge_values = \
+        _prepare(G, node_attr, edge_attr)
+    return dict(zip(nodes, _canonical_colors(colors, adjs)))
+
+
+def canonical_certificate(G, node_attr=None, edge_attr=None):
+    """Return a certificate that identifies G up to isomorphism.
+
+    Two graphs have equal certificates if and only if they are of the
+    same type and isomorphic, with isomorphisms preserving the
+    attributes node_attr and edge_attr.  The certificate is hashable
+    when the attribute values are, so it can be used as a dictionary key.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph, directed or undirected, possibly with parallel
+       edges and self loops.
+
+    node_attr : string, optional (default=None)
+       Node attribute that must be preserved by isomorphisms.
+
+    edge_attr : string, optional (default=None)
+       Edge attribute that must be preserved by isomorphisms.
+
+    Returns
+    -------
+    certificate : tuple
+       The graph type, the node attribute values in canonical order and
+       the edges between canonical labels with their attribute values.
+
+    Examples
+    --------
+    >>> G1 = nx.path_graph(4)
+    >>> G2 = nx.star_graph(3)
+    >>> G3 = nx.relabel_nodes(G1, {0: 3, 1: 2, 2: 0, 3: 1})
+    >>> nx.canonical_certificate(G1) == nx.canonical_certificate(G2)
+    False
+    >>> nx.canonical_certificate(G1) == nx.canonical_certificate(G3)
+    True
+
+    See Also
+    --------
+    canonical_labeling, isomorphism_classes
+    """
+    nodes, node_values, colors, adjs, edge_values = \
+        _prepare(G, node_attr, edge_attr)
+    labels = _canonical_colors(colors, adjs)
+    values = [None] * len(nodes)
+    for v, label in enumerate(labels):
+        values[label] = node_values[v]
+    edges = []
+    for (u, v), x in edge_values.items():
+        u, v = labels[u], labels[v]
+        if not G.is_directed() and u > v:
+            u, v = v, u
+        edges.append((u, v, x))
+    edges.sort(key=lambda e: e[:2])
+    return (G.is_directed(), G.is_multigraph(), tuple(values), tuple(edges))
+
+
+def isomorphism_classes(graphs, node_attr=None, edge_attr=None):
+    """Partition graphs into isomorphism classes.
+
+    Parameters
+    ----------
+    graphs : iterable of graphs
+       NetworkX graphs.
+
+    node_attr : string, optional (default=None)
+       Node attribute that must be preserved by isomorphisms.
+
+    edge_attr : string, optional (default=None)
+       Edge attribute that must be preserved by isomorphisms.
+
+    Returns
+    -------
+    classes : list of lists
+       The isomorphism classes in order of their first graph, each a list
+       of graphs in input order.
+
+    Examples
+    --------
+    >>> graphs = [nx.path_graph(3), nx.complete_graph(3), nx.star_graph(2)]
+    >>> [len(c) for c in nx.isomorphism_classes(graphs)]
+    [2, 1]
+
+    Notes
+    -----
+    Every graph is labeled canonically once and bucketed by its
+    certificate, so n graphs take n canonical labelings instead of a
+    quadratic number of isomorphism tests.
+
+    See Also
+    --------
+    canonical_certificate
+    """
+    classes = {}
+    order = []
+    for G in graphs:
+        certificate = canonical_certificate(G, node_attr, edge_attr)
+        if certificate not in classes:
+            classes[certificate] = []
+            order.append(certificate)
+        classes[certificate].append(G)
+    return [classes[c] for c in order]
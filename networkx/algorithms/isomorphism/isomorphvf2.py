@@ -826,20 +826,17 @@ class GMState(object):
                     GM.inout_2[G2_node] = self.depth
 
             # Now we add every other node...
+            # Only the neighbors of the new nodes can be new to the
+            # terminal sets, the neighbors of the nodes mapped before are
+            # already in them.
 
             # Updates for T_1^{inout}
-            new_nodes = set([])
-            for node in GM.core_1:
-                new_nodes.update([neighbor for neighbor in GM.G1[node] if neighbor not in GM.core_1])
-            for node in new_nodes:
+            for node in GM.G1[G1_node]:
                 if node not in GM.inout_1:
                     GM.inout_1[node] = self.depth
 
             # Updates for T_2^{inout}
-            new_nodes = set([])
-            for node in GM.core_2:
-                new_nodes.update([neighbor for neighbor in GM.G2[node] if neighbor not in GM.core_2])
-            for node in new_nodes:
+            for node in GM.G2[G2_node]:
                 if node not in GM.inout_2:
                     GM.inout_2[node] = self.depth
 
@@ -851,12 +848,14 @@ class GMState(object):
             del self.GM.core_1[self.G1_node]
             del self.GM.core_2[self.G2_node]
 
-        # Now we revert the other two vectors.
-        # Thus, we delete all entries which have this depth level.
-        for vector in (self.GM.inout_1, self.GM.inout_2):
-            for node in list(vector.keys()):
-                if vector[node] == self.depth:
-                    del vector[node]
+            # Now we revert the other two vectors.
+            # Thus, we delete all entries which have this depth level,
+            # which are the new nodes and some of their neighbors.
+            for vector, new_node, G in ((self.GM.inout_1, self.G1_node, self.GM.G1),
+                                        (self.GM.inout_2, self.G2_node, self.GM.G2)):
+                for node in [new_node] + list(G[new_node]):
+                    if vector.get(node) == self.depth:
+                        del vector[node]
 
 
 class DiGMState(object):
@@ -914,36 +913,27 @@ class DiGMState(object):
                     vector[G2_node] = self.depth
 
             # Now we add every other node...
+            # Only the neighbors of the new nodes can be new to the
+            # terminal sets, the neighbors of the nodes mapped before are
+            # already in them.
 
             # Updates for T_1^{in}
-            new_nodes = set([])
-            for node in GM.core_1:
-                new_nodes.update([predecessor for predecessor in GM.G1.predecessors(node) if predecessor not in GM.core_1])
-            for node in new_nodes:
+            for node in GM.G1.pred[G1_node]:
                 if node not in GM.in_1:
                     GM.in_1[node] = self.depth
 
             # Updates for T_2^{in}
-            new_nodes = set([])
-            for node in GM.core_2:
-                new_nodes.update([predecessor for predecessor in GM.G2.predecessors(node) if predecessor not in GM.core_2])
-            for node in new_nodes:
+            for node in GM.G2.pred[G2_node]:
                 if node not in GM.in_2:
                     GM.in_2[node] = self.depth
 
             # Updates for T_1^{out}
-            new_nodes = set([])
-            for node in GM.core_1:
-                new_nodes.update([successor for successor in GM.G1.successors(node) if successor not in GM.core_1])
-            for node in new_nodes:
+            for node in GM.G1[G1_node]:
                 if node not in GM.out_1:
                     GM.out_1[node] = self.depth
 
             # Updates for T_2^{out}
-            new_nodes = set([])
-            for node in GM.core_2:
-                new_nodes.update([successor for successor in GM.G2.successors(node) if successor not in GM.core_2])
-            for node in new_nodes:
+            for node in GM.G2[G2_node]:
                 if node not in GM.out_2:
                     GM.out_2[node] = self.depth
 
@@ -956,10 +946,15 @@ class DiGMState(object):
             del self.GM.core_1[self.G1_node]
             del self.GM.core_2[self.G2_node]
 
-        # Now we revert the other four vectors.
-        # Thus, we delete all entries which have this depth level.
-        for vector in (self.GM.in_1, self.GM.in_2, self.GM.out_1, self.GM.out_2):
-            for node in list(vector.keys()):
-                if vector[node] == self.depth:
-                    del vector[node]
-
+            # Now we revert the other four vectors.
+            # Thus, we delete all entries which have this depth level,
+            # which are the new nodes and some of their neighbors.
+            for vectors, new_node, G in (((self.GM.in_1, self.GM.out_1),
+                                          self.G1_node, self.GM.G1),
+                                         ((self.GM.in_2, self.GM.out_2),
+                                          self.G2_node, self.GM.G2)):
+                nodes = [new_node] + list(G.pred[new_node]) + list(G[new_node])
+                for vector in vectors:
+                    for node in nodes:
+                        if vector.get(node) == self.depth:
+                            del vector[node]
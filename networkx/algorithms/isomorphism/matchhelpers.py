@@ -82,7 +82,10 @@ default : value | list
 Returns
 -------
 match : function
-    The customized, categorical `node_match` function.
+    The customized, categorical `node_match` function.  Its label
+    attribute maps the attribute dictionary of a node to a value that is
+    equal for two nodes iff they match; VF2PPGraphMatcher uses it to group
+    the nodes into label classes.  The function can be pickled.
 
 Examples
 --------
@@ -92,39 +95,49 @@ Examples
 
 """
 
+class _CategoricalMatch(object):
+    # The match function returned by categorical_node_match() and
+    # categorical_edge_match().  It is a class rather than a closure so
+    # that it can be pickled and sent to worker processes.
+    def __init__(self, attr, default):
+        if nx.utils.is_string_like(attr):
+            self.attr = attr
+            self.default = default
+            self.attrs = None
+        else:
+            self.attrs = list(zip(attr, default)) # Python 3
+
+    def __call__(self, data1, data2):
+        return self.label(data1) == self.label(data2)
+
+    def label(self, data):
+        """Return a value that is equal for two attribute dictionaries iff
+        they match."""
+        if self.attrs is None:
+            return data.get(self.attr, self.default)
+        return frozenset([data.get(attr, d) for attr, d in self.attrs])
+
+
+class _CategoricalMultiedgeMatch(_CategoricalMatch):
+    # The match function returned by categorical_multiedge_match(), which
+    # compares the sets of values of the parallel edges.
+    def label(self, datasets):
+        """Return a value that is equal for two dictionaries of parallel
+        edge attribute dictionaries iff they match."""
+        if self.attrs is None:
+            return frozenset([data.get(self.attr, self.default)
+                              for data in datasets.values()])
+        return frozenset([tuple(data.get(attr, d) for attr, d in self.attrs)
+                          for data in datasets.values()])
+
+
 def categorical_node_match(attr, default):
-    if nx.utils.is_string_like(attr):
-        def match(data1, data2):
-            return data1.get(attr, default) == data2.get(attr, default)
-    else:
-        attrs = list(zip(attr, default)) # Python 3
-        def match(data1, data2):
-            values1 = set([data1.get(attr, d) for attr, d in attrs])
-            values2 = set([data2.get(attr, d) for attr, d in attrs])
-            return values1 == values2
-    return match
+    return _CategoricalMatch(attr, default)
 
 categorical_edge_match = copyfunc(categorical_node_match, 'categorical_edge_match')
 
 def categorical_multiedge_match(attr, default):
-    if nx.utils.is_string_like(attr):
-        def match(datasets1, datasets2):
-            values1 = set([data.get(attr, default) for data in datasets1.values()])
-            values2 = set([data.get(attr, default) for data in datasets2.values()])
-            return values1 == values2
-    else:
-        attrs = list(zip(attr, default)) # Python 3
-        def match(datasets1, datasets2):
-            values1 = set([])
-            for data1 in datasets1.values():
-                x = tuple( data1.get(attr, d) for attr, d in attrs )
-                values1.add(x)
-            values2 = set([])
-            for data2 in datasets2.values():
-                x = tuple( data2.get(attr, d) for attr, d in attrs )
-                values2.add(x)
-            return values1 == values2
-    return match
+    return _CategoricalMultiedgeMatch(attr, default)
 
 # Docstrings for categorical functions.
 categorical_node_match.__doc__ = categorical_doc
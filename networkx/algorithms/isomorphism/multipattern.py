@@ -0,0 +1,185 @@
+"""
+*********************
+Multi-pattern Matcher
+*********************
+
+Find the subgraphs of one graph that are isomorphic to any of several
+patterns.
+
+The MultiPatternMatcher runs the VF2++ search of VF2PPGraphMatcher for
+every pattern, but the node labels, the label classes sorted by degree
+and the counts of neighbor labels of the host graph are computed once
+and shared by the searches.  The searches can be split across worker
+processes by partitioning the nodes of the host graph tried for the
+first node of each pattern.
+
+Examples
+--------
+>>> from networkx.algorithms import isomorphism
+>>> G = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3)])
+>>> patterns = {'triangle': nx.complete_graph(3), 'star': nx.star_graph(3)}
+>>> MM = isomorphism.MultiPatternMatcher(G, patterns)
+>>> MM.matched_patterns()
+['triangle']
+>>> len([m for p, m in MM.subgraph_isomorphisms_iter() if p == 'triangle'])
+6
+"""
+#    Copyright (C) 2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+from networkx.utils import effective_n_jobs, split_chunks, parallel_map
+from networkx.algorithms.isomorphism.vf2pp import VF2PPGraphMatcher, \
+    _HostIndex
+
+__all__ = ['MultiPatternMatcher']
+
+
+class MultiPatternMatcher(object):
+    """Subgraph isomorphism checker for several patterns and one graph.
+
+    Suitable for Graph, DiGraph, MultiGraph and MultiDiGraph instances.
+    """
+    def __init__(self, G, patterns, node_match=None, edge_match=None):
+        """Initialize multi-pattern matcher.
+
+        Parameters
+        ----------
+        G : graph
+            The host graph searched for the patterns.
+
+        patterns : dict or iterable of graphs
+            The patterns, keyed by an identifier.  The identifier of a
+            pattern given in a list is its position.
+
+        node_match : callable
+            A function that returns True iff node n in G and node u in a
+            pattern should be considered equal, called like::
+
+               node_match(G.node[n], pattern.node[u])
+
+            A function made by categorical_node_match() is not called;
+            the nodes are instead grouped by the value of the attribute.
+
+        edge_match : callable
+            A function that returns True iff the edge attribute dictionary
+            for the pair of nodes (n1, n2) in G and (u1, u2) in a pattern
+            should be considered equal, called like::
+
+               edge_match(G[n1][n2], pattern[u1][u2])
+
+        Notes
+        -----
+        With several worker processes the patterns, G and the functions
+        node_match, unless made by categorical_node_match(), and
+        edge_match are sent to the workers and must be picklable, as the
+        functions made by the categorical_*_match() helpers are.
+        """
+        self.G = G
+        if isinstance(patterns, dict):
+            self.patterns = list(patterns.items())
+        else:
+            self.patterns = list(enumerate(patterns))
+        self.node_match = node_match
+        self.edge_match = edge_match
+
+        label = getattr(node_match, 'label', None)
+        if label is not None:
+            self._node_test = None
+            labels = dict((n, label(d)) for n, d in G.nodes_iter(True))
+            self._pattern_labels = [
+                dict((u, label(d)) for u, d in P.nodes_iter(True))
+                for pid, P in self.patterns]
+        else:
+            self._node_test = node_match
+            labels = None
+            self._pattern_labels = [None] * len(self.patterns)
+        self._host = _HostIndex(G, labels)
+
+    def subgraph_isomorphisms_iter(self, n_jobs=None, executor=None):
+        """Generator over the subgraph isomorphisms of all patterns.
+
+        Parameters
+        ----------
+        n_jobs : int or None, optional (default=None)
+           Number of processes searching the patterns, see parallel_map().
+           With more than one process the isomorphisms are only yielded
+           once all of them are found.
+
+        executor : object with a map() method, optional
+           An existing pool used instead of a new one, see parallel_map().
+
+        Returns
+        -------
+        generator of pairs (pattern_id, mapping), where mapping is a
+        dictionary from the nodes of a subgraph of G to the nodes of the
+        pattern, grouped by pattern in the order of the patterns.
+        """
+        n_jobs = effective_n_jobs(n_jobs, executor)
+        if n_jobs == 1 and executor is None:
+            for pid, GM in self._matchers():
+                for mapping in GM.subgraph_isomorphisms_iter():
+                    yield pid, mapping
+            return
+        results = self._map(n_jobs, executor, False)
+        for i, (pid, P) in enumerate(self.patterns):
+            for chunk in results:
+                for mapping in chunk[i]:
+                    yield pid, mapping
+
+    def matched_patterns(self, n_jobs=None, executor=None):
+        """Return the identifiers of the patterns that are isomorphic to a
+        subgraph of G, in the order of the patterns.
+
+        The search for a pattern stops at its first isomorphism.  See
+        subgraph_isomorphisms_iter() for the parameters.
+        """
+        n_jobs = effective_n_jobs(n_jobs, executor)
+        if n_jobs == 1 and executor is None:
+            return [pid for pid, GM in self._matchers()
+                    if GM.subgraph_is_isomorphic()]
+        results = self._map(n_jobs, executor, True)
+        return [pid for i, (pid, P) in enumerate(self.patterns)
+                if any(chunk[i] for chunk in results)]
+
+    def _matchers(self):
+        # The matchers of the patterns, sharing the index of G
+        for (pid, P), labels in zip(self.patterns, self._pattern_labels):
+            yield pid, VF2PPGraphMatcher._from_index(
+                self._host, P, labels, self._node_test, self.edge_match)
+
+    def _map(self, n_jobs, executor, first):
+        # Search the patterns in n_jobs tasks; task j tries the j-th part of
+        # the candidates for the first node of each pattern.
+        tasks = [(self._host, self.patterns, self._pattern_labels,
+                  self._node_test, self.edge_match, j, n_jobs, first)
+                 for j in range(n_jobs)]
+        return parallel_map(_match_part, tasks, n_jobs, executor)
+
+
+def _match_part(args):
+    """Return for each pattern the list of the subgraph isomorphisms, or of
+    the first one if first is True, whose first node in the matching order
+    is mapped to the part-th of parts parts of its candidates."""
+    host, patterns, pattern_labels, node_match, edge_match, part, parts, \
+        first = args
+    results = []
+    for (pid, P), labels in zip(patterns, pattern_labels):
+        GM = VF2PPGraphMatcher._from_index(host, P, labels, node_match,
+                                           edge_match)
+        GM._order, GM._parent = GM._matching_order()
+        mappings = []
+        if GM._order:
+            label = GM._label_2[GM._order[0]]
+            chunks = split_chunks(host.classes.get(label, []), parts)
+            GM._roots = chunks[part] if part < len(chunks) else []
+        if GM._order or part == 0:
+            for mapping in GM.subgraph_isomorphisms_iter():
+                mappings.append(mapping)
+                if first:
+                    break
+        results.append(mappings)
+    return results
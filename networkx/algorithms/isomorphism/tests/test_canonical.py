@@ -0,0 +1,148 @@
+"""
+    Tests for canonical labeling and graph hashing.
+"""
+
+import random
+
+from nose.tools import assert_true, assert_false, assert_equal
+import networkx as nx
+from networkx.generators import atlas
+from networkx.algorithms import isomorphism as iso
+
+
+def shuffled(G, rng):
+    labels = list(range(len(G)))
+    rng.shuffle(labels)
+    return nx.relabel_nodes(G, dict(zip(G, labels)))
+
+
+def random_graph(create_using, n, m, rng):
+    G = create_using
+    G.add_nodes_from(range(n))
+    for _ in range(m):
+        G.add_edge(rng.randrange(n), rng.randrange(n), w=rng.randint(0, 1))
+    for v in G:
+        G.node[v]['c'] = rng.randint(0, 1)
+    return G
+
+
+def test_atlas():
+    # the graphs of the atlas are pairwise non-isomorphic
+    rng = random.Random(1)
+    graphs = atlas.graph_atlas_g()
+    certificates = set(nx.canonical_certificate(G) for G in graphs)
+    assert_equal(len(certificates), len(graphs))
+    for G in graphs[::7]:
+        H = shuffled(G, rng)
+        assert_equal(nx.canonical_certificate(G), nx.canonical_certificate(H))
+        assert_equal(nx.weisfeiler_lehman_graph_hash(G),
+                     nx.weisfeiler_lehman_graph_hash(H))
+
+
+def test_canonical_labeling():
+    rng = random.Random(2)
+    G = nx.petersen_graph()
+    H = shuffled(G, rng)
+    for F in [G, H]:
+        labeling = nx.canonical_labeling(F)
+        assert_equal(sorted(labeling.values()), list(range(10)))
+    relabeled = [sorted(sorted(e) for e in
+                        nx.relabel_nodes(F, nx.canonical_labeling(F)).edges())
+                 for F in [G, H]]
+    assert_equal(relabeled[0], relabeled[1])
+
+
+def test_same_as_is_isomorphic():
+    rng = random.Random(3)
+    for i in range(200):
+        create_using = [nx.Graph(), nx.DiGraph(), nx.MultiGraph(),
+                        nx.MultiDiGraph()][i % 4]
+        n = rng.randint(1, 7)
+        m = rng.randint(0, 12)
+        G1 = random_graph(create_using, n, m, rng)
+        if i % 2:
+            G2 = shuffled(G1, rng)
+            if i % 3 == 0:
+                u, v = rng.sample(G2.nodes(), 2) if n > 1 else (0, 0)
+                G2.add_edge(u, v, w=1)
+        else:
+            G2 = random_graph(create_using.__class__(), n, m, rng)
+        if G1.is_multigraph():
+            # parallel edges are compared as multisets of values
+            em = lambda d1, d2: (sorted(d['w'] for d in d1.values()) ==
+                                 sorted(d['w'] for d in d2.values()))
+        else:
+            em = iso.categorical_edge_match('w', None)
+        nm = iso.categorical_node_match('c', None)
+        for node_attr, edge_attr, kwds in [
+                (None, None, {}),
+                ('c', None, {'node_match': nm}),
+                ('c', 'w', {'node_match': nm, 'edge_match': em})]:
+            c1 = nx.canonical_certificate(G1, node_attr, edge_attr)
+            c2 = nx.canonical_certificate(G2, node_attr, edge_attr)
+            isomorphic = nx.is_isomorphic(G1, G2, **kwds)
+            assert_equal(c1 == c2, isomorphic)
+            if isomorphic:
+                assert_equal(
+                    nx.weisfeiler_lehman_graph_hash(G1, node_attr, edge_attr),
+                    nx.weisfeiler_lehman_graph_hash(G2, node_attr, edge_attr))
+
+
+def test_symmetric():
+    rng = random.Random(4)
+    for G in [nx.complete_graph(12), nx.empty_graph(12), nx.cycle_graph(30),
+              nx.hypercube_graph(4), nx.complete_bipartite_graph(5, 5),
+              nx.disjoint_union(nx.petersen_graph(), nx.petersen_graph())]:
+        assert_equal(nx.canonical_certificate(G),
+                     nx.canonical_certificate(shuffled(G, rng)))
+    assert_false(nx.canonical_certificate(nx.cycle_graph(6)) ==
+                 nx.canonical_certificate(nx.disjoint_union(
+                     nx.cycle_graph(3), nx.cycle_graph(3))))
+    # strongly regular graphs with the same parameters
+    G1 = nx.LCF_graph(16, [5, -5], 8)
+    G2 = nx.LCF_graph(16, [-5, 5], 8)
+    assert_equal(nx.canonical_certificate(G1) == nx.canonical_certificate(G2),
+                 nx.is_isomorphic(G1, G2))
+
+
+def test_attributes():
+    G1 = nx.path_graph(3)
+    G2 = nx.path_graph(3)
+    G1.node[0]['color'] = 'red'
+    G2.node[1]['color'] = 'red'
+    assert_equal(nx.canonical_certificate(G1), nx.canonical_certificate(G2))
+    assert_false(nx.canonical_certificate(G1, 'color') ==
+                 nx.canonical_certificate(G2, 'color'))
+    # values of different types
+    G1.node[2]['color'] = 1
+    G3 = nx.Graph([(2, 1), (1, 0)])
+    G3.node[0]['color'] = 'red'
+    G3.node[2]['color'] = 1
+    assert_equal(nx.canonical_certificate(G1, 'color'),
+                 nx.canonical_certificate(G3, 'color'))
+    assert_equal(nx.weisfeiler_lehman_graph_hash(G1, 'color'),
+                 nx.weisfeiler_lehman_graph_hash(G3, 'color'))
+
+
+def test_graph_types():
+    G = nx.path_graph(3)
+    certificates = set(nx.canonical_certificate(t(G)) for t in
+                       [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph])
+    assert_equal(len(certificates), 4)
+    M = nx.MultiGraph([(0, 1), (0, 1)])
+    assert_false(nx.canonical_certificate(M) ==
+                 nx.canonical_certificate(nx.MultiGraph([(0, 1)])))
+
+
+def test_isomorphism_classes():
+    rng = random.Random(5)
+    graphs = []
+    for G in atlas.graph_atlas_g()[1:40]:
+        graphs.extend([G, shuffled(G, rng)])
+    rng.shuffle(graphs)
+    classes = nx.isomorphism_classes(graphs)
+    assert_equal(len(classes), 39)
+    for c in classes:
+        assert_equal(len(c), 2)
+        assert_true(nx.is_isomorphic(c[0], c[1]))
+    assert_equal(nx.isomorphism_classes([]), [])
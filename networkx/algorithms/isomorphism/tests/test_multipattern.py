@@ -0,0 +1,87 @@
+"""
+    Tests for the multi-pattern matcher.
+"""
+
+import random
+
+from nose.tools import assert_equal
+import networkx as nx
+from networkx.algorithms import isomorphism as iso
+
+
+def mappings(pairs):
+    return sorted((pid, sorted(m.items())) for pid, m in pairs)
+
+
+def grown(G, k, rng):
+    # a connected subgraph of k nodes
+    nodes = [rng.choice(G.nodes())]
+    while len(nodes) < k:
+        v = rng.choice(list(nx.all_neighbors(G, rng.choice(nodes))))
+        if v not in nodes:
+            nodes.append(v)
+    return G.subgraph(nodes)
+
+
+def labeled(G, rng):
+    for v in G:
+        G.node[v]['c'] = rng.randint(0, 2)
+    return G
+
+
+def test_same_as_vf2():
+    rng = random.Random(1)
+    for directed in [False, True]:
+        create_using = nx.DiGraph() if directed else None
+        G = labeled(nx.gnm_random_graph(30, 70, seed=1, directed=directed),
+                    rng)
+        patterns = [labeled(grown(G, k, rng), rng)
+                    for k in [1, 2, 3, 3, 4, 4, 5]]
+        patterns.append(labeled(nx.path_graph(3, create_using), rng))
+        Matcher = iso.DiGraphMatcher if directed else iso.GraphMatcher
+        for nm in [None, iso.categorical_node_match('c', 0)]:
+            expected = []
+            matched = []
+            for i, P in enumerate(patterns):
+                found = [(i, m) for m in
+                         Matcher(G, P, nm).subgraph_isomorphisms_iter()]
+                expected.extend(found)
+                if found:
+                    matched.append(i)
+            MM = iso.MultiPatternMatcher(G, patterns, nm)
+            assert_equal(mappings(MM.subgraph_isomorphisms_iter()),
+                         mappings(expected))
+            assert_equal(MM.matched_patterns(), matched)
+
+
+def test_parallel():
+    rng = random.Random(2)
+    G = labeled(nx.gnm_random_graph(40, 100, seed=2), rng)
+    patterns = dict(('p%d' % k, grown(G, k, rng))
+                    for k in range(1, 6))
+    patterns['triangle'] = nx.complete_graph(3)
+    nm = iso.categorical_node_match('c', 0)
+    MM = iso.MultiPatternMatcher(G, patterns, nm)
+    serial = mappings(MM.subgraph_isomorphisms_iter())
+    assert_equal(mappings(MM.subgraph_isomorphisms_iter(n_jobs=2)), serial)
+    assert_equal(sorted(MM.matched_patterns(n_jobs=3)),
+                 sorted(MM.matched_patterns()))
+    # the categorical match functions can be sent to the workers
+    for u, v in G.edges():
+        G[u][v]['w'] = rng.randint(0, 1)
+    for P in patterns.values():
+        for u, v in P.edges():
+            P[u][v]['w'] = rng.randint(0, 1)
+    em = iso.categorical_edge_match('w', 0)
+    MM = iso.MultiPatternMatcher(G, patterns, nm, em)
+    serial = mappings(MM.subgraph_isomorphisms_iter())
+    assert_equal(mappings(MM.subgraph_isomorphisms_iter(n_jobs=2)), serial)
+    M = nx.MultiGraph(G)
+    em = iso.categorical_multiedge_match(['w', 'x'], [0, 0])
+    MM = iso.MultiPatternMatcher(M, [nx.MultiGraph(P)
+                                     for P in patterns.values()], nm, em)
+    assert_equal(sorted(MM.matched_patterns(n_jobs=2)),
+                 sorted(MM.matched_patterns()))
+    # the empty pattern has one isomorphism
+    MM = iso.MultiPatternMatcher(G, [nx.Graph()])
+    assert_equal(list(MM.subgraph_isomorphisms_iter(n_jobs=2)), [(0, {})])
@@ -0,0 +1,123 @@
+"""
+    Tests for the VF2++ isomorphism algorithm.
+"""
+
+import os
+import random
+import struct
+
+from nose.tools import assert_true, assert_false, assert_equal
+import networkx as nx
+from networkx.algorithms import isomorphism as iso
+
+
+def create_graph(filename):
+    # Read a graph of the VF2 graph database, see test_isomorphvf2.py
+    fh = open(filename, mode='rb')
+    read = lambda: struct.unpack('<H', fh.read(2))[0]
+    graph = nx.Graph()
+    for from_node in range(read()):
+        for edge in range(read()):
+            graph.add_edge(from_node, read())
+    fh.close()
+    return graph
+
+
+def mappings(matchers):
+    return sorted(sorted(m.items()) for m in matchers)
+
+
+def random_graph(create_using, n, m, rng):
+    G = create_using
+    G.add_nodes_from(range(n))
+    for _ in range(m):
+        G.add_edge(rng.randrange(n), rng.randrange(n), w=rng.randint(0, 1))
+    for v in G:
+        G.node[v]['c'] = rng.randint(0, 1)
+    return G
+
+
+def test_same_as_vf2():
+    rng = random.Random(1)
+    for i in range(80):
+        G1 = random_graph([nx.Graph(), nx.DiGraph(), nx.MultiGraph(),
+                           nx.MultiDiGraph()][i % 4], rng.randint(1, 7),
+                          rng.randint(0, 12), rng)
+        nodes = rng.sample(G1.nodes(), rng.randint(0, len(G1)))
+        labels = list(range(len(nodes)))
+        rng.shuffle(labels)
+        G2 = nx.relabel_nodes(G1.subgraph(nodes), dict(zip(nodes, labels)))
+        labels = list(range(len(G1)))
+        rng.shuffle(labels)
+        H = nx.relabel_nodes(G1, dict(zip(G1, labels)))
+        if i % 3 == 0:
+            H.add_edge(0, 1)
+        if G1.is_multigraph():
+            em = iso.categorical_multiedge_match('w', 0)
+        else:
+            em = iso.categorical_edge_match('w', 0)
+        if G1.is_directed():
+            VF2 = iso.DiGraphMatcher
+        else:
+            VF2 = iso.GraphMatcher
+        for nm in [None, iso.categorical_node_match('c', 0),
+                   lambda d1, d2: d1['c'] == d2['c']]:
+            for e in [None, em]:
+                assert_equal(
+                    mappings(VF2(G1, G2, nm, e).subgraph_isomorphisms_iter()),
+                    mappings(iso.VF2PPGraphMatcher(G1, G2, nm, e)
+                             .subgraph_isomorphisms_iter()))
+                assert_equal(
+                    mappings(VF2(G1, H, nm, e).isomorphisms_iter()),
+                    mappings(iso.VF2PPGraphMatcher(G1, H, nm, e)
+                             .isomorphisms_iter()))
+
+
+def test_graph_db():
+    head, tail = os.path.split(__file__)
+    g1 = create_graph(os.path.join(head, 'iso_r01_s80.A99'))
+    g2 = create_graph(os.path.join(head, 'iso_r01_s80.B99'))
+    gm = iso.VF2PPGraphMatcher(g1, g2)
+    assert_true(gm.is_isomorphic())
+    assert_true(all(gm.mapping[u] in g2[gm.mapping[v]] for u, v in g1.edges()))
+    subgraph = create_graph(os.path.join(head, 'si2_b06_m200.A99'))
+    graph = create_graph(os.path.join(head, 'si2_b06_m200.B99'))
+    gm = iso.VF2PPGraphMatcher(graph, subgraph)
+    assert_true(gm.subgraph_is_isomorphic())
+
+
+def test_label_classes():
+    G1 = nx.cycle_graph(6)
+    G2 = nx.cycle_graph(6)
+    for n in G1:
+        G1.node[n]['color'] = n % 3
+        G2.node[n]['color'] = (n + 1) % 3
+    nm = iso.categorical_node_match('color', None)
+    gm = iso.VF2PPGraphMatcher(G1, G2, node_match=nm)
+    assert_equal(len(list(gm.isomorphisms_iter())), 2)
+    assert_true(all(G1.node[n]['color'] == G2.node[gm.mapping[n]]['color']
+                    for n in G1))
+    G2.node[0]['color'] = 2
+    assert_false(iso.VF2PPGraphMatcher(G1, G2, node_match=nm).is_isomorphic())
+    nm = iso.categorical_node_match(['color', 'size'], [None, 1])
+    assert_false(iso.VF2PPGraphMatcher(G1, G2, node_match=nm).is_isomorphic())
+
+
+def test_long_path():
+    # the search does not recurse
+    G1 = nx.path_graph(5000)
+    G2 = nx.relabel_nodes(G1, dict((n, -n) for n in G1))
+    gm = iso.VF2PPDiGraphMatcher(G1.to_directed(), G2.to_directed())
+    assert_true(gm.is_isomorphic())
+    assert_equal(len(list(iso.VF2PPGraphMatcher(G1, G2).isomorphisms_iter())),
+                 2)
+
+
+def test_empty():
+    G = nx.path_graph(3)
+    assert_equal(list(iso.VF2PPGraphMatcher(G, nx.Graph())
+                      .subgraph_isomorphisms_iter()), [{}])
+    assert_false(iso.VF2PPGraphMatcher(G, nx.path_graph(4))
+                 .subgraph_is_isomorphic())
+    assert_false(iso.VF2PPGraphMatcher(G, nx.complete_graph(3))
+                 .is_isomorphic())
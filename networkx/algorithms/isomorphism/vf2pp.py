@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+"""
+***************
+VF2++ Algorithm
+***************
+
+An implementation of the VF2++ algorithm for graph isomorphism and
+subgraph isomorphism testing.
+
+The VF2PPGraphMatcher and VF2PPDiGraphMatcher classes have the interface of
+the GraphMatcher and DiGraphMatcher classes of vf2userfunc, but match the
+nodes of G2 in an order fixed before the search and keep the terminal sets
+up to date as nodes are mapped and unmapped.  The candidates for a node of
+G2 are then the neighbors of the image of one of its matched neighbors,
+instead of all the nodes in the terminal sets, and the search runs with an
+explicit stack instead of recursion.
+
+Examples
+--------
+>>> from networkx.algorithms import isomorphism
+>>> G1 = nx.path_graph(4)
+>>> G2 = nx.path_graph(4)
+>>> GM = isomorphism.VF2PPGraphMatcher(G1,G2)
+>>> GM.is_isomorphic()
+True
+
+Matching nodes by a categorical attribute groups the nodes into label
+classes, so that only the nodes with the same label are tried:
+
+>>> G1 = nx.Graph([(1, 2), (2, 3)])
+>>> G1.node[1]['color'] = 'red'
+>>> G2 = nx.Graph([('a', 'b'), ('b', 'c')])
+>>> G2.node['c']['color'] = 'red'
+>>> nm = isomorphism.categorical_node_match('color', 'blue')
+>>> GM = isomorphism.VF2PPGraphMatcher(G1, G2, node_match=nm)
+>>> GM.is_isomorphic()
+True
+>>> sorted(GM.mapping.items())
+[(1, 'c'), (2, 'b'), (3, 'a')]
+
+Notes
+-----
+As in GraphMatcher, a subgraph isomorphism maps a node induced subgraph of
+G1 onto G2, and the mapping is from the nodes of G1 to the nodes of G2.
+
+The matching order puts the nodes with the rarest labels and the largest
+degrees first, and then visits the graph breadth first, preferring the
+nodes with the most neighbors already in the order [1]_.
+
+References
+----------
+.. [1] Alpár Jüttner and Péter Madarasi, "VF2++ -- An improved subgraph
+   isomorphism algorithm", Discrete Applied Mathematics, 242, pp. 69-81,
+   2018.
+"""
+#    Copyright (C) 2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from collections import defaultdict
+from heapq import heapify, heappush, heappop
+import networkx as nx
+
+__all__ = ['VF2PPGraphMatcher',
+           'VF2PPDiGraphMatcher']
+
+
+class VF2PPGraphMatcher(object):
+    """VF2++ isomorphism checker for graphs and directed graphs.
+
+    Suitable for Graph, DiGraph, MultiGraph and MultiDiGraph instances.
+    """
+    def __init__(self, G1, G2, node_match=None, edge_match=None):
+        """Initialize graph matcher.
+
+        Parameters
+        ----------
+        G1, G2: graph
+            The graphs to be tested.
+
+        node_match: callable
+            A function that returns True iff node n1 in G1 and n2 in G2
+            should be considered equal during the isomorphism test. The
+            function will be called like::
+
+               node_match(G1.node[n1], G2.node[n2])
+
+            A function made by categorical_node_match() is not called;
+            the nodes are instead grouped by the value of the attribute
+            and only the nodes of the same group are tried.
+
+        edge_match: callable
+            A function that returns True iff the edge attribute dictionary
+            for the pair of nodes (u1, v1) in G1 and (u2, v2) in G2 should be
+            considered equal during the isomorphism test. The function will
+            be called like::
+
+               edge_match(G1[u1][v1], G2[u2][v2])
+
+        Examples
+        --------
+        >>> from networkx.algorithms import isomorphism
+        >>> G1 = nx.path_graph(4)
+        >>> G2 = nx.path_graph(4)
+        >>> GM = isomorphism.VF2PPGraphMatcher(G1,G2)
+        """
+        self.G1 = G1
+        self.G2 = G2
+        self.node_match = node_match
+        self.edge_match = edge_match
+
+        # A categorical node_match compares the labels of the nodes
+        label = getattr(node_match, 'label', None)
+        if label is not None:
+            node_match = None
+            label_1 = dict((n, label(d)) for n, d in G1.nodes_iter(True))
+            label_2 = dict((n, label(d)) for n, d in G2.nodes_iter(True))
+        else:
+            label_1 = label_2 = None
+        self._setup(_HostIndex(G1, label_1), G2, label_2, node_match,
+                    edge_match)
+
+    @classmethod
+    def _from_index(cls, host, G2, label_2=None, node_match=None,
+                    edge_match=None):
+        # A matcher of G2 against the graph of host, whose index is shared
+        # with other matchers.  label_2 are the labels of the nodes of G2
+        # if host is labeled, and node_match is not a categorical match.
+        self = cls.__new__(cls)
+        self.G1 = host.G
+        self.G2 = G2
+        self.node_match = node_match
+        self.edge_match = edge_match
+        self._setup(host, G2, label_2, node_match, edge_match)
+        return self
+
+    def _setup(self, host, G2, label_2, node_match, edge_match):
+        self.test = 'graph'
+        self.core_1 = {}
+        self.core_2 = {}
+        self.mapping = {}
+        self._node_test = node_match
+        self._label_1 = host.labels
+        self._classes = host.classes
+        self._degree_1 = host.degree
+        self._label_counts_1 = host.label_counts
+        if label_2 is None:
+            self._label_2 = dict.fromkeys(G2)
+            self._label_counts_2 = None
+        else:
+            self._label_2 = label_2
+            self._label_counts_2 = _label_counts(G2, label_2)
+        self._degree_2 = _degrees(G2)
+
+        G1 = self.G1
+        if G1.is_directed():
+            self._adj = [(G1.succ, G2.succ), (G1.pred, G2.pred)]
+        else:
+            self._adj = [(G1.adj, G2.adj)]
+        # _terminal_1[i][n] is the number of mapped nodes that have n in
+        # their adjacency _adj[i][0]: n is in T_1^{inout}, or T_1^{out} and
+        # T_1^{in} for directed graphs, if it is not mapped and the count is
+        # not zero.
+        self._terminal_1 = [{} for adj in self._adj]
+        self._terminal_2 = [{} for adj in self._adj]
+        self._order = None
+        # The nodes of G1 tried for the first node of the matching order,
+        # all candidates if None.
+        self._roots = None
+
+    def is_isomorphic(self):
+        """Returns True if G1 and G2 are isomorphic graphs."""
+        try:
+            next(self.isomorphisms_iter())
+            return True
+        except StopIteration:
+            return False
+
+    def subgraph_is_isomorphic(self):
+        """Returns True if a subgraph of G1 is isomorphic to G2."""
+        try:
+            next(self.subgraph_isomorphisms_iter())
+            return True
+        except StopIteration:
+            return False
+
+    def isomorphisms_iter(self):
+        """Generator over isomorphisms between G1 and G2."""
+        self.test = 'graph'
+        G1 = self.G1
+        G2 = self.G2
+        if (G1.order() != G2.order() or G1.size() != G2.size() or
+            sorted(self._degree_1.values()) != sorted(self._degree_2.values())
+            or not self._labels_fit()):
+            return
+        for mapping in self._match():
+            yield mapping
+
+    def subgraph_isomorphisms_iter(self):
+        """Generator over isomorphisms between a subgraph of G1 and G2."""
+        self.test = 'subgraph'
+        if self.G1.order() < self.G2.order() or not self._labels_fit():
+            return
+        for mapping in self._match():
+            yield mapping
+
+    def _labels_fit(self):
+        # Whether there are enough nodes of each label in G1
+        count = defaultdict(int)
+        for l in self._label_2.values():
+            count[l] += 1
+        for l, c in count.items():
+            n = len(self._classes.get(l, ()))
+            if n < c or self.test == 'graph' and n != c:
+                return False
+        return True
+
+    def _matching_order(self):
+        # Order the nodes of G2 and choose for each node but the first of a
+        # connected component a parent: a neighbor before it in the order,
+        # and the adjacency of G1 in which the candidates for the node are
+        # the neighbors of the image of the parent.
+        G2 = self.G2
+        rarity = dict((n, len(self._classes.get(l, ())))
+                      for n, l in self._label_2.items())
+        degree = dict((n, sum(d)) for n, d in self._degree_2.items())
+        if G2.is_directed():
+            neighbors = lambda n: set(G2.succ[n]) | set(G2.pred[n])
+        else:
+            neighbors = lambda n: G2.adj[n]
+        index = dict(zip(G2, range(len(G2))))
+        roots = sorted(G2, key=lambda n: (rarity[n], -degree[n], index[n]))
+        order = []
+        parent = {}
+        placed = set()
+        connections = defaultdict(int)
+        for root in roots:
+            if root in placed:
+                continue
+            level = [root]
+            seen = set(level)
+            while level:
+                heap = [(-connections[n], -degree[n], rarity[n], index[n], n)
+                        for n in level]
+                heapify(heap)
+                level = set(level)
+                while heap:
+                    c, _, _, _, n = heappop(heap)
+                    if n in placed or -c != connections[n]:
+                        continue
+                    placed.add(n)
+                    order.append(n)
+                    for m in neighbors(n):
+                        connections[m] += 1
+                        if m not in parent and m not in placed:
+                            if G2.is_directed() and m not in G2.succ[n]:
+                                parent[m] = (n, self.G1.pred)
+                            else:
+                                parent[m] = (n, self.G1.adj)
+                        if m in level and m not in placed:
+                            heappush(heap, (-connections[m], -degree[m],
+                                            rarity[m], index[m], m))
+                next_level = []
+                for n in level:
+                    for m in neighbors(n):
+                        if m not in seen:
+                            seen.add(m)
+                            next_level.append(m)
+                level = next_level
+        return order, parent
+
+    def _candidates(self, u, nodes=None):
+        # Generate the nodes of G1 that u can be mapped to, among nodes if
+        # given.  The label classes are sorted by decreasing degree.
+        core_1 = self.core_1
+        label_1 = self._label_1
+        label = self._label_2[u]
+        degree_1 = self._degree_1
+        degree = self._degree_2[u]
+        total = sum(degree)
+        counts_1 = self._label_counts_1
+        counts = self._label_counts_2 and self._label_counts_2[u]
+        graph = self.test == 'graph'
+        node_match = self._node_test
+        if nodes is not None:
+            bucket = True
+        elif u in self._parent:
+            p, adj = self._parent[u]
+            nodes = adj[self.core_2[p]]
+            bucket = False
+        else:
+            nodes = self._classes.get(label, ())
+            bucket = True
+        for n in nodes:
+            if n in core_1 or label_1[n] != label:
+                continue
+            d = degree_1[n]
+            if graph:
+                if d != degree:
+                    if bucket and sum(d) < total:
+                        return
+                    continue
+            elif any(x < y for x, y in zip(d, degree)):
+                if bucket and sum(d) < total:
+                    return
+                continue
+            if counts is not None:
+                # the neighbors of u with each label need images among the
+                # neighbors of n
+                c = counts_1[n]
+                if graph:
+                    if c != counts:
+                        continue
+                elif any(c[i].get(l, 0) < k for i, nbrs in enumerate(counts)
+                         for l, k in nbrs.items()):
+                    continue
+            if node_match is not None and \
+               not node_match(self.G1.node[n], self.G2.node[u]):
+                continue
+            yield n
+
+    def _feasible(self, u, n):
+        # Whether u in G2 can be mapped to n in G1
+        core_1 = self.core_1
+        core_2 = self.core_2
+        edge_match = self.edge_match
+        multi_1 = self.G1.is_multigraph()
+        multi_2 = self.G2.is_multigraph()
+        graph = self.test == 'graph'
+        k = len(self._adj)
+        for adj_1, adj_2 in self._adj:
+            nbrs_1 = adj_1[n]
+            nbrs_2 = adj_2[u]
+            # R_self
+            if n in nbrs_1 or u in nbrs_2:
+                if n not in nbrs_1 or u not in nbrs_2:
+                    return False
+                if ((len(nbrs_1[n]) if multi_1 else 1) !=
+                    (len(nbrs_2[u]) if multi_2 else 1)):
+                    return False
+                if edge_match is not None and \
+                   not edge_match(nbrs_1[n], nbrs_2[u]):
+                    return False
+            # R_neighbor: the mapped neighbors of u are mapped to neighbors
+            # of n with as many edges, and n has no other mapped neighbors.
+            # The other neighbors are counted in each terminal set and out
+            # of all of them (the last count).
+            mapped = 0
+            count_2 = [0] * (k + 1)
+            for w, data_2 in nbrs_2.items():
+                if w == u:
+                    continue
+                if w in core_2:
+                    x = core_2[w]
+                    if x not in nbrs_1:
+                        return False
+                    data_1 = nbrs_1[x]
+                    if ((len(data_1) if multi_1 else 1) !=
+                        (len(data_2) if multi_2 else 1)):
+                        return False
+                    if edge_match is not None and \
+                       not edge_match(data_1, data_2):
+                        return False
+                    mapped += 1
+                else:
+                    new = True
+                    for i, terminal in enumerate(self._terminal_2):
+                        if terminal.get(w):
+                            count_2[i] += 1
+                            new = False
+                    if new:
+                        count_2[k] += 1
+            count_1 = [0] * (k + 1)
+            for x in nbrs_1:
+                if x == n:
+                    continue
+                if x in core_1:
+                    mapped -= 1
+                else:
+                    new = True
+                    for i, terminal in enumerate(self._terminal_1):
+                        if terminal.get(x):
+                            count_1[i] += 1
+                            new = False
+                    if new:
+                        count_1[k] += 1
+            if mapped:
+                return False
+            # R_termin, R_termout and R_new
+            if graph:
+                if count_1 != count_2:
+                    return False
+            elif any(c1 < c2 for c1, c2 in zip(count_1, count_2)):
+                return False
+        return True
+
+    def _map(self, u, n):
+        self.core_1[n] = u
+        self.core_2[u] = n
+        for (adj_1, adj_2), terminal_1, terminal_2 in \
+                zip(self._adj, self._terminal_1, self._terminal_2):
+            for x in adj_1[n]:
+                terminal_1[x] = terminal_1.get(x, 0) + 1
+            for w in adj_2[u]:
+                terminal_2[w] = terminal_2.get(w, 0) + 1
+
+    def _unmap(self, u):
+        n = self.core_2.pop(u)
+        del self.core_1[n]
+        for (adj_1, adj_2), terminal_1, terminal_2 in \
+                zip(self._adj, self._terminal_1, self._terminal_2):
+            for x in adj_1[n]:
+                terminal_1[x] -= 1
+            for w in adj_2[u]:
+                terminal_2[w] -= 1
+
+    def _match(self):
+        # Depth first search over the nodes of G2 in the matching order.
+        # stack[i] generates the candidates for order[i]; order[i] is
+        # mapped to the last candidate generated while it is in core_2.
+        if self._order is None:
+            self._order, self._parent = self._matching_order()
+        order = self._order
+        self.core_1 = {}
+        self.core_2 = {}
+        for terminal in self._terminal_1 + self._terminal_2:
+            terminal.clear()
+        if not order:
+            self.mapping = {}
+            yield self.mapping
+            return
+        stack = [self._candidates(order[0], self._roots)]
+        while stack:
+            u = order[len(stack) - 1]
+            if u in self.core_2:
+                self._unmap(u)
+            for n in stack[-1]:
+                if self._feasible(u, n):
+                    self._map(u, n)
+                    break
+            else:
+                stack.pop()
+                continue
+            if len(stack) == len(order):
+                self.mapping = self.core_1.copy()
+                yield self.mapping
+            else:
+                stack.append(self._candidates(order[len(stack)]))
+
+
+class VF2PPDiGraphMatcher(VF2PPGraphMatcher):
+    """VF2++ isomorphism checker for directed graphs."""
+    pass
+
+
+class _HostIndex(object):
+    # The labels, label classes sorted by decreasing degree, degrees and
+    # neighbor label counts of the nodes of G1.  They do not depend on G2,
+    # so that the matchers of several patterns against the same graph can
+    # share them.
+    def __init__(self, G, labels=None):
+        self.G = G
+        self.degree = degree = _degrees(G)
+        if labels is None:
+            self.labels = dict.fromkeys(G)
+            self.label_counts = None
+        else:
+            self.labels = labels
+            self.label_counts = _label_counts(G, labels)
+        classes = defaultdict(list)
+        for n in G:
+            classes[self.labels[n]].append(n)
+        for nodes in classes.values():
+            nodes.sort(key=lambda n: -sum(degree[n]))
+        self.classes = dict(classes)
+
+
+def _degrees(G):
+    # The degree of each node, as (in degree, out degree) if G is directed
+    if G.is_directed():
+        return dict((n, (G.in_degree(n), G.out_degree(n))) for n in G)
+    return dict((n, (d,)) for n, d in G.degree_iter())
+
+
+def _label_counts(G, labels):
+    # For each node and adjacency the number of other neighbors per label
+    if G.is_directed():
+        adjs = [G.succ, G.pred]
+    else:
+        adjs = [G.adj]
+    counts = {}
+    for n in G:
+        node_counts = []
+        for adj in adjs:
+            c = defaultdict(int)
+            for m in adj[n]:
+                if m != n:
+                    c[labels[m]] += 1
+            node_counts.append(dict(c))
+        counts[n] = tuple(node_counts)
+    return counts
@@ -11,7 +11,8 @@ from networkx.exception import NetworkXError
 from networkx.utils import not_implemented_for
 __author__ = """\n""".join(["Aric Hagberg <aric.hagberg@gmail.com>",
                             "Brandon Liu <brandon.k.liu@gmail.com"])
-__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix']
+__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'pagerank_batch',
+           'google_matrix', 'stochastic_sparse_matrix']
 
 
 @not_implemented_for('multigraph')
@@ -472,6 +473,256 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
                         'in %d iterations.' % max_iter)
 
 
+def stochastic_sparse_matrix(G, nodelist=None, weight='weight'):
+    """Return the row-stochastic transition matrix of G as a SciPy sparse
+    matrix.
+
+    Row i holds the probabilities of following each out-edge of node
+    nodelist[i], proportional to the edge weights.  The rows of nodes
+    without out-edges (dangling nodes) are zero.  The matrix can be passed
+    to pagerank_batch() to reuse it across calls on an unchanged graph.
+
+    Parameters
+    -----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    nodelist : list, optional
+      The order of the rows and columns.
+      If None, then the ordering is produced by G.nodes().
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    Returns
+    -------
+    M : SciPy sparse matrix
+       The transition matrix in CSR format.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 1)])
+    >>> M = nx.stochastic_sparse_matrix(G, nodelist=[0, 1, 2])
+    >>> print(M.toarray())
+    [[0.  1.  0. ]
+     [0.  0.  1. ]
+     [0.5 0.5 0. ]]
+
+    See Also
+    --------
+    pagerank_batch, google_matrix
+    """
+    try:
+        import numpy as np
+        import scipy.sparse
+    except ImportError:
+        raise ImportError("stochastic_sparse_matrix() requires SciPy: "
+                          "http://scipy.org/ ")
+    if nodelist is None:
+        nodelist = G.nodes()
+    N = len(nodelist)
+    if isinstance(G, nx.CSRGraph) and nodelist == G.nodelist:
+        # the CSR arrays already are the (symmetric) adjacency matrix
+        if weight is not None and weight == G._weight and \
+           G.weights is not None:
+            data = G.weights.astype(float)
+        else:
+            data = np.ones(len(G.indices))
+        M = scipy.sparse.csr_matrix((data, G.indices, G.offsets),
+                                    shape=(N, N))
+    else:
+        M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                      dtype=float)
+        if not G.is_directed() and G.number_of_selfloops() > 0:
+            # to_scipy_sparse_matrix() counts undirected self-loops twice
+            M = M.tolil()
+            M.setdiag(M.diagonal() / 2.0)
+            M = M.tocsr()
+    S = np.asarray(M.sum(axis=1)).flatten()
+    S[S != 0] = 1.0 / S[S != 0]
+    Q = scipy.sparse.spdiags(S, 0, N, N, format='csr')
+    return Q.dot(M).tocsr()
+
+
+def _vector_columns(values, nodelist, name):
+    """Return a 2d float array with one column per vector in values.
+
+    values is a dict keyed by node, a list of such dicts, or an array of
+    shape (N,) or (N, k) with rows in nodelist order.  Each column is
+    normalized to sum to one.
+    """
+    import numpy as np
+    if isinstance(values, dict):
+        values = [values]
+    if isinstance(values, (list, tuple)) and len(values) > 0 and \
+       isinstance(values[0], dict):
+        columns = []
+        for d in values:
+            missing = set(nodelist) - set(d)
+            if missing:
+                raise NetworkXError('%s dictionary '
+                                    'must have a value for every node. '
+                                    'Missing nodes %s' % (name, missing))
+            columns.append([d[n] for n in nodelist])
+        X = np.array(columns, dtype=float).T
+    else:
+        X = np.array(values, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        if X.ndim != 2 or X.shape[0] != len(nodelist):
+            raise NetworkXError('%s array must have one row for every '
+                                'node.' % name)
+    s = X.sum(axis=0)
+    if (s == 0).any():
+        raise NetworkXError('%s vectors must not sum to zero.' % name)
+    return X / s
+
+
+def pagerank_batch(G, personalization=None, alpha=0.85, max_iter=100,
+                   tol=1.0e-6, nstart=None, weight='weight', dangling=None,
+                   nodelist=None, matrix=None):
+    """Return the PageRank vectors for many personalization vectors at once.
+
+    The stochastic sparse matrix of G is built once, and all
+    personalization vectors are iterated together with sparse
+    matrix-matrix products.  The matrix can be built beforehand with
+    stochastic_sparse_matrix() and reused across calls, and a previous
+    result can be given as nstart to warm-start the iteration.
+
+    Parameters
+    -----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    personalization : dict, list of dicts or array, optional
+      The personalization vectors.  Either a dict keyed by node, a list
+      of such dicts or a NumPy array of shape (N,) or (N, k) whose rows
+      are ordered as nodelist.  Each vector is normalized to sum to one.
+      By default, a single uniform vector is used.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    max_iter : integer, optional
+      Maximum number of iterations in power method eigenvalue solver.
+
+    tol : float, optional
+      Error tolerance used to check convergence in power method solver.
+
+    nstart : dict, list of dicts or array, optional
+      Starting vectors of the iteration, in the same forms as
+      personalization.  An array of shape (N,) is used for every column.
+      Passing the result of a previous call warm-starts the iteration.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, i.e., nodes without
+      any outedges. The dict key is the node the outedge points to and the dict
+      value is the weight of that outedge. By default, dangling nodes are given
+      outedges according to the personalization vector of each column.
+
+    nodelist : list, optional
+      The order of the rows of the input and output arrays.
+      If None, then the ordering is produced by G.nodes().
+
+    matrix : SciPy sparse matrix, optional
+      The transition matrix of G in nodelist order, as returned by
+      stochastic_sparse_matrix(G, nodelist, weight).  If None, it is
+      built from G.  A given matrix is used as is, so it must be rebuilt
+      after G or its edge weights change.
+
+    Returns
+    -------
+    pagerank : NumPy array
+       Array of shape (N, k) holding one PageRank vector per column,
+       with rows ordered as nodelist.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> nodes = G.nodes()
+    >>> seeds = [{0: 1, 1: 0, 2: 0, 3: 0}, {0: 0, 1: 0, 2: 0, 3: 1}]
+    >>> X = nx.pagerank_batch(G, seeds, nodelist=nodes)
+    >>> X.shape
+    (4, 2)
+    >>> pr = dict(zip(nodes, X[:, 0]))
+    >>> M = nx.stochastic_sparse_matrix(G, nodelist=nodes)
+    >>> X = nx.pagerank_batch(G, seeds, nodelist=nodes, nstart=X, tol=1e-10,
+    ...                       matrix=M)
+
+    Notes
+    -----
+    The iteration stops when the l1 change of every column is below
+    N*tol.  Columns that have converged are no longer updated.
+
+    SciPy (http://scipy.org) is required for this function.
+
+    See Also
+    --------
+    pagerank, pagerank_scipy, google_matrix, stochastic_sparse_matrix
+    """
+    try:
+        import numpy as np
+        import scipy.sparse
+    except ImportError:
+        raise ImportError("pagerank_batch() requires SciPy: "
+                          "http://scipy.org/ ")
+    if nodelist is None:
+        nodelist = G.nodes()
+    N = len(nodelist)
+    if N == 0:
+        return np.zeros((0, 0))
+    if matrix is None:
+        matrix = stochastic_sparse_matrix(G, nodelist, weight)
+    elif matrix.shape != (N, N):
+        raise NetworkXError('matrix must have one row and column for '
+                            'every node.')
+    MT = matrix.T
+    is_dangling = np.where(np.asarray(matrix.sum(axis=1)).flatten() == 0)[0]
+
+    if personalization is None:
+        P = np.repeat(1.0 / N, N).reshape(-1, 1)
+    else:
+        P = _vector_columns(personalization, nodelist, 'Personalization')
+    k = P.shape[1]
+    if dangling is None:
+        D = P
+    else:
+        D = _vector_columns(dangling, nodelist, 'Dangling node')
+        if D.shape[1] not in (1, k):
+            raise NetworkXError('dangling and personalization have a '
+                                'different number of vectors.')
+    if nstart is None:
+        X = P.copy()
+    else:
+        X = _vector_columns(nstart, nodelist, 'Starting')
+        if X.shape[1] == 1 and k > 1:
+            X = np.repeat(X, k, axis=1)
+        elif X.shape[1] != k:
+            raise NetworkXError('nstart and personalization have a '
+                                'different number of vectors.')
+
+    # power iteration on all active columns at once
+    active = np.arange(k)
+    for _ in range(max_iter):
+        Xa = X[:, active]
+        danglesum = Xa[is_dangling].sum(axis=0)
+        Da = D if D.shape[1] == 1 else D[:, active]
+        Xnew = alpha * (MT.dot(Xa) + Da * danglesum) + \
+            (1.0 - alpha) * P[:, active]
+        err = np.absolute(Xnew - Xa).sum(axis=0)
+        X[:, active] = Xnew
+        active = active[err >= N * tol]
+        if len(active) == 0:
+            return X
+    raise NetworkXError('pagerank_batch: power iteration failed to converge '
+                        'in %d iterations.' % max_iter)
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -158,3 +158,79 @@ class TestPageRankScipy(TestPageRank):
     def test_empty_scipy(self):
         G = networkx.Graph()
         assert_equal(networkx.pagerank_scipy(G), {})
+
+    def test_batch_pagerank(self):
+        G = self.G
+        nodes = G.nodes()
+        x = networkx.pagerank_batch(G, alpha=0.9, tol=1.e-08, nodelist=nodes)
+        p = networkx.pagerank(G, alpha=0.9, tol=1.e-08)
+        assert_equal(x.shape, (len(G), 1))
+        for n, v in zip(nodes, x[:, 0]):
+            assert_almost_equal(v, p[n], places=6)
+        assert_raises(networkx.NetworkXError, networkx.pagerank_batch, G,
+                      max_iter=0)
+
+    def test_batch_personalization(self):
+        G = self.G
+        nodes = G.nodes()
+        personalize = [dict((n, random.random()) for n in G)
+                       for i in range(3)]
+        x = networkx.pagerank_batch(G, personalize, tol=1.e-08,
+                                    nodelist=nodes,
+                                    dangling=self.dangling_edges)
+        for j, pers in enumerate(personalize):
+            p = networkx.pagerank(G, personalization=pers, tol=1.e-08,
+                                  dangling=self.dangling_edges)
+            for n, v in zip(nodes, x[:, j]):
+                assert_almost_equal(v, p[n], places=6)
+        y = networkx.pagerank_batch(G, numpy.eye(len(G)), tol=1.e-08)
+        assert_equal(y.shape, (len(G), len(G)))
+        assert_true(numpy.allclose(y.sum(axis=0), 1.0))
+        personalize[1].pop(1)
+        assert_raises(networkx.NetworkXError, networkx.pagerank_batch, G,
+                      personalize)
+        assert_raises(networkx.NetworkXError, networkx.pagerank_batch, G,
+                      numpy.ones((2, 2)))
+
+    def test_batch_warm_start(self):
+        G = self.G
+        x = networkx.pagerank_batch(G, numpy.eye(len(G)), tol=1.e-10)
+        y = networkx.pagerank_batch(G, numpy.eye(len(G)), tol=1.e-10,
+                                    nstart=x, max_iter=2)
+        assert_true(numpy.allclose(x, y))
+
+    def test_batch_matrix(self):
+        G = networkx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 3)])
+        nodes = [0, 1, 2, 3]
+        M = networkx.stochastic_sparse_matrix(G, nodes)
+        x = networkx.pagerank_batch(G, nodelist=nodes)
+        assert_true(numpy.allclose(
+            networkx.pagerank_batch(G, nodelist=nodes, matrix=M), x))
+        # edits that keep the number of nodes and edges are not missed
+        G.remove_edge(2, 3)
+        G.add_edge(3, 0)
+        y = networkx.pagerank_batch(G, nodelist=nodes)
+        p = networkx.pagerank(G)
+        for n in nodes:
+            assert_almost_equal(y[n, 0], p[n], places=5)
+        assert_false(numpy.allclose(x, y))
+        G.add_edge(0, 2)
+        z = networkx.pagerank_batch(G, nodelist=nodes)
+        G[0][1]['weight'] = 3
+        assert_false(numpy.allclose(
+            networkx.pagerank_batch(G, nodelist=nodes), z))
+        assert_false(numpy.allclose(y, z))
+        assert_false(hasattr(G, '_pagerank_cache'))
+        assert_raises(networkx.NetworkXError, networkx.pagerank_batch, G,
+                      matrix=M[:2, :2])
+
+    def test_batch_csrgraph(self):
+        G = networkx.karate_club_graph()
+        p = networkx.pagerank(G, tol=1.e-08)
+        x = networkx.pagerank_batch(networkx.CSRGraph(G), tol=1.e-08)
+        for n in G:
+            assert_almost_equal(x[n, 0], p[n], places=6)
+
+    def test_empty_batch(self):
+        G = networkx.Graph()
+        assert_equal(networkx.pagerank_batch(G).shape, (0, 0))
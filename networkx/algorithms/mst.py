@@ -14,10 +14,13 @@ Computes minimum spanning tree of a weighted graph.
 __all__ = ['kruskal_mst',
            'minimum_spanning_edges',
            'minimum_spanning_tree',
-           'prim_mst_edges', 'prim_mst']
+           'prim_mst_edges', 'prim_mst',
+           'boruvka_mst_edges', 'boruvka_mst',
+           'boruvka_mst_stream']
 
 import networkx as nx
 from heapq import heappop, heappush
+from networkx.utils import effective_n_jobs, parallel_map, ArrayUnionFind
 
 def minimum_spanning_edges(G,weight='weight',data=True):
     """Generate edges in a minimum spanning forest of an undirected 
@@ -54,7 +57,8 @@ def minimum_spanning_edges(G,weight='weight',data=True):
 
     Notes
     -----
-    Uses Kruskal's algorithm.
+    Uses Kruskal's algorithm.  If the nodes are the integers 0 to n-1 the
+    forest is grown in an ArrayUnionFind.
 
     If the graph edges do not have a weight attribute a default weight of 1
     will be used.
@@ -68,13 +72,25 @@ def minimum_spanning_edges(G,weight='weight',data=True):
     # We use Kruskal's algorithm, first because it is very simple to
     # implement once UnionFind exists, and second, because the only slow
     # part (the sort) is sped up by being built in to Python.
-    from networkx.utils import UnionFind
+    # The nodes 0 to n-1 are kept in an ArrayUnionFind, which avoids the
+    # dictionary lookups of UnionFind.
+    from networkx.utils import UnionFind, ArrayUnionFind
+    from networkx.utils.union_find import _is_index_labeled
     if G.is_directed():
         raise nx.NetworkXError(
             "Mimimum spanning tree not defined for directed graphs.")
 
-    subtrees = UnionFind()
     edges = sorted(G.edges(data=True),key=lambda t: t[2].get(weight,1))
+    if _is_index_labeled(G):
+        subtrees = ArrayUnionFind(len(G))
+        for u,v,d in edges:
+            if subtrees.union(u,v):
+                if data:
+                    yield (u,v,d)
+                else:
+                    yield (u,v)
+        return
+    subtrees = UnionFind()
     for u,v,d in edges:
         if subtrees[u] != subtrees[v]:
             if data:
@@ -252,3 +268,291 @@ def prim_mst(G, weight = 'weight'):
     T.graph=G.graph.copy()
     return T
 
+
+def boruvka_mst_edges(G, weight='weight', data=True, maximum=False,
+                      n_jobs=None, executor=None):
+    """Generate edges in a minimum spanning forest of an undirected
+    weighted graph.
+
+    A minimum spanning tree is a subgraph of the graph (a tree)
+    with the minimum sum of edge weights.  A spanning forest is a
+    union of the spanning trees for each connected component of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+
+    weight : string
+       Edge data key to use for weight (default 'weight').
+
+    data : bool, optional
+       If True yield the edge data along with the edge.
+
+    maximum : bool, optional (default=False)
+       If True generate the edges of a maximum spanning forest instead.
+
+    n_jobs : int or None, optional (default=None)
+       Number of processes selecting the lightest edges in each round,
+       see parallel_map().
+
+    executor : object with a map() method, optional
+       An existing pool used instead of a new one, see parallel_map().
+
+    Returns
+    -------
+    edges : iterator
+       A generator that produces edges in the minimum spanning tree.
+       The edges are three-tuples (u,v,d) where d is the edge data.
+
+    Examples
+    --------
+    >>> G=nx.cycle_graph(4)
+    >>> G.add_edge(0,3,weight=2) # assign weight 2 to edge 0-3
+    >>> mst=nx.boruvka_mst_edges(G,data=False) # a generator of MST edges
+    >>> print(sorted(mst))
+    [(0, 1), (1, 2), (2, 3)]
+    >>> print(sorted(nx.boruvka_mst_edges(G,data=False,maximum=True)))
+    [(0, 1), (0, 3), (1, 2)]
+
+    Notes
+    -----
+    Uses Borůvka's algorithm on arrays of the edge ends and weights, see
+    boruvka_mst_stream().  The edges are generated in the order of
+    G.edges(), once the whole forest is found.  Requires NumPy.
+
+    If the graph edges do not have a weight attribute a default weight of 1
+    will be used.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+          "boruvka_mst_edges requires numpy : http://scipy.org/ ")
+    if G.is_directed():
+        raise nx.NetworkXError(
+            "Mimimum spanning tree not defined for directed graphs.")
+    index = dict(zip(G, range(len(G))))
+    m = G.number_of_edges()
+    ends = numpy.fromiter((index[n] for e in G.edges_iter() for n in e),
+                          numpy.intp, 2 * m).reshape(m, 2)
+    weights = numpy.fromiter((d.get(weight, 1)
+                              for u, v, d in G.edges_iter(data=True)),
+                             float, m)
+    forest = set(_boruvka(len(G), ends[:, 0], ends[:, 1], weights,
+                          maximum, n_jobs, executor).tolist())
+    del ends, weights
+    for i, (u, v, d) in enumerate(G.edges_iter(data=True)):
+        if i in forest:
+            if data:
+                yield (u, v, d)
+            else:
+                yield (u, v)
+
+
+def boruvka_mst(G, weight='weight', maximum=False, n_jobs=None,
+                executor=None):
+    """Return a minimum spanning tree or forest of an undirected
+    weighted graph.
+
+    A minimum spanning tree is a subgraph of the graph (a tree) with
+    the minimum sum of edge weights.
+
+    If the graph is not connected a spanning forest is constructed.  A
+    spanning forest is a union of the spanning trees for each
+    connected component of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+
+    weight : string
+       Edge data key to use for weight (default 'weight').
+
+    maximum : bool, optional (default=False)
+       If True return a maximum spanning tree or forest instead.
+
+    n_jobs : int or None, optional (default=None)
+       Number of processes, see boruvka_mst_edges().
+
+    executor : object with a map() method, optional
+       An existing pool used instead of a new one, see parallel_map().
+
+    Returns
+    -------
+    G : NetworkX Graph
+       A minimum spanning tree or forest.
+
+    Examples
+    --------
+    >>> G=nx.cycle_graph(4)
+    >>> G.add_edge(0,3,weight=2) # assign weight 2 to edge 0-3
+    >>> T=nx.boruvka_mst(G)
+    >>> print(sorted(T.edges(data=True)))
+    [(0, 1, {}), (1, 2, {}), (2, 3, {})]
+
+    Notes
+    -----
+    Uses Borůvka's algorithm, see boruvka_mst_edges().
+
+    If the graph edges do not have a weight attribute a default weight of 1
+    will be used.
+    """
+    T=nx.Graph(nx.boruvka_mst_edges(G,weight=weight,data=True,
+                                    maximum=maximum,n_jobs=n_jobs,
+                                    executor=executor))
+    # Add isolated nodes
+    if len(T)!=len(G):
+        T.add_nodes_from([n for n,d in G.degree().items() if d==0])
+    # Add node and graph attributes as shallow copy
+    for n in T:
+        T.node[n]=G.node[n].copy()
+    T.graph=G.graph.copy()
+    return T
+
+
+def boruvka_mst_stream(edges, maximum=False, n_jobs=None, executor=None):
+    """Return a minimum spanning forest of a graph given in blocks of edges.
+
+    Only the forest of the edges seen so far is kept between blocks, so
+    that graphs too large to be held in memory can be processed.
+
+    Parameters
+    ----------
+    edges : iterable
+       Blocks of edges, each a triple (u, v, w) of array_like of the same
+       length with the ends and the weights of the edges.  The nodes are
+       integers.
+
+    maximum : bool, optional (default=False)
+       If True return a maximum spanning forest instead.
+
+    n_jobs : int or None, optional (default=None)
+       Number of processes, see boruvka_mst_edges().
+
+    executor : object with a map() method, optional
+       An existing pool used instead of a new one, see parallel_map().
+
+    Returns
+    -------
+    u, v, w : NumPy arrays
+       The ends and the weights of the edges of the forest.
+
+    Examples
+    --------
+    >>> blocks = [([0, 1, 2], [1, 2, 3], [1.0, 1.0, 1.0]), ([0], [3], [0.5])]
+    >>> u, v, w = nx.boruvka_mst_stream(blocks)
+    >>> sorted(zip(u.tolist(), v.tolist()))
+    [(0, 1), (0, 3), (1, 2)]
+
+    Notes
+    -----
+    By the cycle property an edge that is not in a minimum spanning forest
+    of some of the edges of a graph is not in the minimum spanning forest
+    of the graph, so the forest of the graph is the forest of the edges of
+    the last block and the forest of the blocks before it.
+
+    The forest is found by Borůvka's algorithm [1]_: in each round every
+    component picks the lightest edge to another component and the
+    components are merged along these edges with an ArrayUnionFind.  The
+    edges inside a component are filtered out after each round.  The
+    lightest edges of the components are selected with array operations
+    and can be split across n_jobs processes.  Requires NumPy.
+
+    References
+    ----------
+    .. [1] O. Borůvka, O jistém problému minimálním, Práce moravské
+       přírodovědecké společnosti 3 (1926), 37-58.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+          "boruvka_mst_stream requires numpy : http://scipy.org/ ")
+    forest_u = numpy.zeros(0, dtype=numpy.intp)
+    forest_v = numpy.zeros(0, dtype=numpy.intp)
+    forest_w = numpy.zeros(0)
+    for u, v, w in edges:
+        u = numpy.concatenate((forest_u, numpy.asarray(u, dtype=numpy.intp)))
+        v = numpy.concatenate((forest_v, numpy.asarray(v, dtype=numpy.intp)))
+        w = numpy.concatenate((forest_w, numpy.asarray(w, dtype=float)))
+        m = len(u)
+        if not m:
+            continue
+        low = min(u.min(), v.min())
+        high = max(u.max(), v.max())
+        if low >= 0 and high < 4 * m:
+            keep = _boruvka(high + 1, u, v, w, maximum, n_jobs, executor)
+        else:
+            # number the nodes of the block and the forest 0 to n-1
+            nodes, ends = numpy.unique(numpy.concatenate((u, v)),
+                                       return_inverse=True)
+            keep = _boruvka(len(nodes), ends[:m], ends[m:], w, maximum,
+                            n_jobs, executor)
+        forest_u, forest_v, forest_w = u[keep], v[keep], w[keep]
+    return forest_u, forest_v, forest_w
+
+
+def _boruvka(n, u, v, w, maximum=False, n_jobs=None, executor=None):
+    """Return the indices of the edges of a minimum spanning forest of the
+    graph with nodes 0 to n-1 and edges (u[i], v[i]) of weight w[i]."""
+    import numpy
+    m = len(w)
+    # The edges are numbered in an order by weight; the numbers are keys
+    # without ties, so that the lightest edges of the components form a
+    # forest.
+    order = numpy.argsort(-w if maximum else w)
+    # alive are the numbers of the edges that may join two components,
+    # u and v their ends.
+    alive = numpy.arange(m)
+    u = u[order]
+    v = v[order]
+    n_jobs = effective_n_jobs(n_jobs, executor)
+    components = ArrayUnionFind(n)
+    component = numpy.arange(n)
+    forest = []
+    while len(alive):
+        cu = component[u]
+        cv = component[v]
+        between = cu != cv
+        if not between.all():
+            alive = alive[between]
+            u = u[between]
+            v = v[between]
+            cu = cu[between]
+            cv = cv[between]
+            if not len(alive):
+                break
+        if n_jobs == 1 and executor is None:
+            lightest = _lightest_edges((n, m, cu, cv, alive))
+        else:
+            tasks = [(n, m, cu[part], cv[part], alive[part])
+                     for part in _slices(len(alive), n_jobs)]
+            lightest = numpy.minimum.reduce(
+                parallel_map(_lightest_edges, tasks, n_jobs, executor))
+        selected = numpy.unique(lightest[lightest < m])
+        forest.append(order[selected])
+        selected = numpy.searchsorted(alive, selected)
+        components.union_many(numpy.column_stack((u[selected],
+                                                  v[selected])))
+        component = components.find_many(component)
+    if not forest:
+        return numpy.zeros(0, dtype=numpy.intp)
+    return numpy.concatenate(forest)
+
+
+def _lightest_edges(args):
+    """Return the array of the smallest number of the edges of each
+    component, or m for components without edges."""
+    import numpy
+    n, m, cu, cv, edges = args
+    lightest = numpy.empty(n, dtype=numpy.intp)
+    lightest.fill(m)
+    numpy.minimum.at(lightest, cu, edges)
+    numpy.minimum.at(lightest, cv, edges)
+    return lightest
+
+
+def _slices(m, parts):
+    """Return parts slices splitting range(m) into contiguous parts."""
+    bounds = [m * i // parts for i in range(parts + 1)]
+    return [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
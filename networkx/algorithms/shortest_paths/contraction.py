@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+Contraction hierarchies for fast point-to-point shortest path queries.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from heapq import heappush, heappop
+from itertools import count
+import networkx as nx
+
+__all__ = ['ContractionHierarchy']
+
+
+class ContractionHierarchy(object):
+    """A precomputed index for shortest path queries between two nodes.
+
+    The nodes of the graph are contracted one at a time in order of
+    importance.  Contracting a node removes it and adds a shortcut edge
+    between each pair of its neighbors whose shortest path went through
+    it.  A query is then a bidirectional Dijkstra search that only goes
+    up the hierarchy, towards nodes contracted later, and settles a few
+    hundred nodes even on graphs with millions of nodes where an ordinary
+    Dijkstra search would visit a large part of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       Edge weights must be nonnegative.  For multigraphs the lowest
+       weight of the parallel edges is used.
+
+    weight : string, optional (default='weight')
+       Edge data key corresponding to the edge weight.  Edges without it
+       have weight 1.
+
+    Attributes
+    ----------
+    rank : dict
+       The position of each node in the contraction order.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(5)
+    >>> CH=nx.ContractionHierarchy(G)
+    >>> length,path=CH.query(0,4)
+    >>> print(length)
+    4
+    >>> print(path)
+    [0, 1, 2, 3, 4]
+
+    Notes
+    -----
+    The index does not follow later changes of G; call rebuild() after
+    changing the nodes, edges or weights.  The index holds no reference
+    to G, so it can be stored with pickle (e.g. write_gpickle()) and
+    loaded by another process.
+
+    Building the index takes a local Dijkstra search for each pair of
+    neighbors of each contracted node.  It pays off when many queries are
+    made on a graph that rarely changes, such as a road network.  The
+    number of shortcuts, and so the time of both building and querying,
+    grows quickly on graphs without a hierarchical structure like random
+    graphs with high average degree.
+
+    See Also
+    --------
+    bidirectional_dijkstra, dijkstra_path, astar_path
+
+    References
+    ----------
+    .. [1] R. Geisberger, P. Sanders, D. Schultes and D. Delling,
+       Contraction hierarchies: faster and simpler hierarchical routing
+       in road networks. Proceedings of the 7th International Workshop
+       on Experimental Algorithms (WEA), 319-333, 2008.
+    """
+    # Number of nodes a witness search settles before giving up.  A
+    # lower limit builds the index faster but adds more shortcuts.
+    witness_limit = 100
+
+    def __init__(self, G, weight='weight'):
+        self.rebuild(G, weight)
+
+    def rebuild(self, G, weight=None):
+        """Rebuild the index for G, e.g. after its edges have changed.
+
+        Parameters
+        ----------
+        G : NetworkX graph
+
+        weight : string, optional
+           Edge data key corresponding to the edge weight.  The default
+           is the key used to build the index.
+        """
+        if weight is not None:
+            self.weight = weight
+        weight = self.weight
+        self.directed = G.is_directed()
+        # the remaining graph: succ[u][v] and pred[v][u] are the weight
+        # of the (shortcut) edge u-v.  For undirected graphs both are the
+        # same dicts.
+        succ = dict((u, {}) for u in G)
+        pred = dict((u, {}) for u in G) if self.directed else succ
+        for u, v, d in G.edges_iter(data=True):
+            w = d.get(weight, 1)
+            if w < 0:
+                raise ValueError('Contraction hierarchies require '
+                                 'nonnegative weights.')
+            if u == v:
+                continue
+            if v not in succ[u] or w < succ[u][v]:
+                succ[u][v] = pred[v][u] = w
+        # edges to higher ranked nodes, followed by forward searches, and
+        # reversed edges from higher ranked nodes for backward searches
+        self._up = dict((u, {}) for u in G)
+        self._down = dict((u, {}) for u in G) if self.directed else self._up
+        # the middle node of each shortcut (u, v)
+        self._middle = {}
+        self.rank = {}
+
+        # Order the nodes by edge difference, the number of shortcuts the
+        # contraction adds less the number of edges it removes, plus the
+        # number of contracted neighbors to spread the contractions evenly.
+        deleted = dict.fromkeys(G, 0)
+
+        def priority(v):
+            shortcuts = self._contract(succ, pred, v)
+            removed = len(succ[v]) + (len(pred[v]) if self.directed else 0)
+            return len(shortcuts) - removed + deleted[v]
+
+        c = count()
+        heap = [(priority(v), next(c), v) for v in G]
+        heap.sort()
+        while heap:
+            p, _, v = heappop(heap)
+            p = priority(v)
+            if heap and p > heap[0][0]:
+                heappush(heap, (p, next(c), v))
+                continue
+            self.rank[v] = len(self.rank)
+            for x in set(pred[v]) | set(succ[v]):
+                deleted[x] += 1
+            for a, b, w in self._contract(succ, pred, v):
+                succ[a][b] = pred[b][a] = w
+                self._middle[a, b] = v
+                if not self.directed:
+                    self._middle[b, a] = v
+            for x, w in succ[v].items():
+                self._up[v][x] = w
+                del pred[x][v]
+            if self.directed:
+                for x, w in pred[v].items():
+                    self._down[v][x] = w
+                    del succ[x][v]
+            del succ[v]
+            if self.directed:
+                del pred[v]
+        return self
+
+    def _contract(self, succ, pred, v):
+        # Return the shortcuts (a, b, weight) needed to remove v from the
+        # remaining graph.
+        shortcuts = []
+        targets = list(succ[v].items())
+        for a, wa in list(pred[v].items()):
+            if not self.directed:
+                # the pairs (a, b) and (b, a) are the same
+                targets = targets[1:]
+            wanted = {}
+            for b, wb in targets:
+                if b != a:
+                    wanted[b] = wa + wb
+            if not wanted:
+                continue
+            dist = self._witness_search(succ, a, v, wanted)
+            for b, w in wanted.items():
+                if dist.get(b, w + 1) > w:
+                    shortcuts.append((a, b, w))
+        return shortcuts
+
+    def _witness_search(self, succ, source, avoid, wanted):
+        # Dijkstra search from source in the remaining graph without
+        # avoid, stopping when the distances to the nodes of wanted are
+        # known to be at most their value in wanted, or after
+        # witness_limit nodes are settled.
+        limit = max(wanted.values())
+        left = len(wanted)
+        dist = {}
+        seen = {source: 0}
+        c = count()
+        fringe = [(0, next(c), source)]
+        settled = 0
+        while fringe and settled < self.witness_limit:
+            d, _, u = heappop(fringe)
+            if u in dist:
+                continue
+            if d > limit:
+                break
+            dist[u] = d
+            settled += 1
+            if u in wanted:
+                left -= 1
+                if left == 0:
+                    break
+            for x, w in succ[u].items():
+                if x == avoid:
+                    continue
+                dx = d + w
+                if x not in seen or dx < seen[x]:
+                    seen[x] = dx
+                    heappush(fringe, (dx, next(c), x))
+        # tentative distances are upper bounds and serve as witnesses too
+        return seen
+
+    def query(self, source, target):
+        """Return the length and the nodes of a shortest path.
+
+        Parameters
+        ----------
+        source : node
+           Starting node.
+
+        target : node
+           Ending node.
+
+        Returns
+        -------
+        length : number
+           Shortest path length.
+
+        path : list
+           The nodes of a shortest path from source to target.
+
+        Raises
+        ------
+        NetworkXError
+           If source or target is not in the graph.
+
+        NetworkXNoPath
+           If no path exists between source and target.
+        """
+        for n in (source, target):
+            if n not in self.rank:
+                raise nx.NetworkXError('Node %s not in graph.' % (n,))
+        if source == target:
+            return (0, [source])
+        adj = (self._up, self._down)
+        dist = ({source: 0}, {target: 0})
+        pred = ({source: None}, {target: None})
+        done = (set(), set())
+        c = count()
+        fringe = ([(0, next(c), source)], [(0, next(c), target)])
+        best = None
+        meet = None
+        while fringe[0] or fringe[1]:
+            if not fringe[1] or fringe[0] and fringe[0][0] < fringe[1][0]:
+                i = 0
+            else:
+                i = 1
+            d, _, u = heappop(fringe[i])
+            if u in done[i]:
+                continue
+            if best is not None and d >= best:
+                # nothing left in this direction can improve the path
+                del fringe[i][:]
+                continue
+            done[i].add(u)
+            if u in dist[1 - i]:
+                total = d + dist[1 - i][u]
+                if best is None or total < best:
+                    best = total
+                    meet = u
+            di = dist[i]
+            for x, w in adj[i][u].items():
+                dx = d + w
+                if x not in di or dx < di[x]:
+                    di[x] = dx
+                    pred[i][x] = u
+                    heappush(fringe[i], (dx, next(c), x))
+        if meet is None:
+            raise nx.NetworkXNoPath('No path between %s and %s.'
+                                    % (source, target))
+        path = [meet]
+        u = meet
+        while pred[0][u] is not None:
+            u = pred[0][u]
+            path.append(u)
+        path.reverse()
+        u = meet
+        while pred[1][u] is not None:
+            u = pred[1][u]
+            path.append(u)
+        return (best, self._unpack(path))
+
+    def _unpack(self, path):
+        # Replace the shortcuts between consecutive nodes of path with the
+        # paths they stand for.
+        middle = self._middle
+        result = [path[0]]
+        stack = [(path[i], path[i + 1]) for i in range(len(path) - 2, -1, -1)]
+        while stack:
+            a, b = stack.pop()
+            v = middle.get((a, b))
+            if v is None:
+                result.append(b)
+            else:
+                stack.append((v, b))
+                stack.append((a, v))
+        return result
@@ -11,9 +11,45 @@ import networkx as nx
 __author__ = """Aric Hagberg <aric.hagberg@gmail.com>"""
 __all__ = ['floyd_warshall',
            'floyd_warshall_predecessor_and_distance',
-           'floyd_warshall_numpy']
+           'floyd_warshall_numpy',
+           'shortest_path_length_matrix']
 
-def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
+
+def _floyd_warshall_inplace(A, P=None, block=32):
+    """Run Floyd's algorithm in place on the NumPy array A.
+
+    A holds the edge weights, with inf for nonedges and a zero diagonal.
+    If P is given, it holds the predecessor of j on a path from i in
+    P[i, j] and is updated with A.
+
+    The intermediate nodes are taken in blocks.  The rows of a block are
+    updated first, then all rows in strips small enough to stay in the
+    cache while the strip is updated for every node of the block.  The
+    results are the same as updating the whole array for one node at a
+    time, without the n x n temporary arrays.
+    """
+    import numpy as np
+    n = A.shape[0]
+    chunk = max(1, 65536 // max(n, 1))
+    buf = np.empty((max(chunk, block), n), dtype=A.dtype)
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        strips = [(start, stop)]
+        strips.extend((r, min(r + chunk, n)) for r in range(0, n, chunk))
+        for r0, r1 in strips:
+            R = A[r0:r1]
+            T = buf[:r1 - r0]
+            for k in range(start, stop):
+                np.add(R[:, k, None], A[k], out=T)
+                if P is None:
+                    np.minimum(R, T, out=R)
+                else:
+                    mask = T < R
+                    np.copyto(R, T, where=mask)
+                    np.copyto(P[r0:r1], P[k], where=mask)
+    return A
+
+def floyd_warshall_numpy(G, nodelist=None, weight='weight', dtype=None):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
 
     Parameters
@@ -27,6 +63,10 @@ def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     weight: string, optional (default= 'weight')
        Edge data key corresponding to the edge weight.
 
+    dtype : NumPy data type, optional
+       A floating point type for the distances, e.g. numpy.float32 to
+       halve the memory and time.  If None, numpy.float64 is used.
+
     Returns
     -------
     distance : NumPy matrix
@@ -40,6 +80,13 @@ def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     dense graphs or graphs with negative weights when Dijkstra's
     algorithm fails.  This algorithm can still fail if there are
     negative cycles.  It has running time O(n^3) with running space of O(n^2).
+
+    The matrix is updated in place in cache-sized blocks.  For sparse
+    graphs shortest_path_length_matrix() is much faster.
+
+    See Also
+    --------
+    shortest_path_length_matrix
     """
     try:
         import numpy as np
@@ -50,13 +97,11 @@ def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     # To handle cases when an edge has weight=0, we must make sure that
     # nonedges are not given the value 0 as well.
     A = nx.to_numpy_matrix(G, nodelist=nodelist, multigraph_weight=min,
-                              weight=weight, nonedge=np.inf)
-    n,m = A.shape
-    I = np.identity(n)
-    A[I==1] = 0 # diagonal elements should be zero
-    for i in range(n):
-        A = np.minimum(A, A[i,:] + A[:,i])
-    return A
+                              weight=weight, nonedge=np.inf, dtype=dtype)
+    A = np.asarray(A)
+    np.fill_diagonal(A, 0) # diagonal elements should be zero
+    _floyd_warshall_inplace(A)
+    return np.asmatrix(A)
 
 def floyd_warshall_predecessor_and_distance(G, weight='weight'):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
@@ -106,12 +151,27 @@ def floyd_warshall_predecessor_and_distance(G, weight='weight'):
         if undirected:
             dist[v][u] = min(e_weight, dist[v][u])
             pred[v][u] = v
+    inf = float('inf')
     for w in G:
+        pred_w = pred[w]
+        # only the nodes reachable from w can get shorter paths through w
+        dist_w = [(v, d) for v, d in dist[w].items() if d < inf]
         for u in G:
-            for v in G:
-                if dist[u][v] > dist[u][w] + dist[w][v]:
-                    dist[u][v] = dist[u][w] + dist[w][v]
-                    pred[u][v] = pred[w][v]
+            dist_u = dist[u]
+            dist_uw = dist_u[w]
+            if dist_uw == inf:
+                continue
+            pred_u = pred[u]
+            for v, dist_wv in dist_w:
+                d = dist_uw + dist_wv
+                if dist_u[v] > d:
+                    dist_u[v] = d
+                    pred_u[v] = pred_w[v]
+    # list every pair, including those without a path
+    for u in G:
+        dist_u = dist[u]
+        for v in G:
+            dist_u.setdefault(v, inf)
     return dict(pred),dict(dist)
 
 
@@ -149,6 +209,209 @@ def floyd_warshall(G, weight='weight'):
     # could make this its own function to reduce memory costs
     return floyd_warshall_predecessor_and_distance(G, weight=weight)[1]
 
+def shortest_path_length_matrix(G, nodelist=None, weight='weight',
+                                method='auto', dtype=None,
+                                return_predecessors=False):
+    """Return the matrix of shortest path lengths between all nodes.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    nodelist : list, optional
+       The rows and columns are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes().
+       Only paths between the nodes in nodelist are considered.
+
+    weight: string, optional (default= 'weight')
+       Edge data key corresponding to the edge weight.  Edges without it
+       have weight 1.
+
+    method : string, optional (default='auto')
+       'floyd-warshall', 'dijkstra' (nonnegative weights only),
+       'johnson', or 'auto' to use Floyd's algorithm for dense graphs and
+       Dijkstra's or Johnson's algorithm for sparse ones.
+
+    dtype : NumPy data type, optional
+       A floating point type for the distances.  If None, numpy.float64
+       is used.
+
+    return_predecessors : bool, optional (default=False)
+       If True, also return the matrix of predecessors.
+
+    Returns
+    -------
+    distance : NumPy array
+       distance[i, j] is the length of a shortest path from nodelist[i]
+       to nodelist[j], or inf if there is none.
+
+    predecessor : NumPy array
+       Only returned if return_predecessors is True.  predecessor[i, j] is
+       the index of the node before nodelist[j] on a shortest path from
+       nodelist[i], or -1 if i == j or there is no path.
+
+    Raises
+    ------
+    NetworkXUnbounded
+       If the graph has a cycle of negative length.
+
+    ValueError
+       If method is 'dijkstra' and the graph has negative weights, or
+       method is not known.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(4)
+    >>> D,P=nx.shortest_path_length_matrix(G,return_predecessors=True)
+    >>> D[0].tolist()
+    [0.0, 1.0, 2.0, 3.0]
+    >>> P[0].tolist()
+    [-1, 0, 1, 2]
+
+    Notes
+    -----
+    Floyd's algorithm takes O(n^3) time for n nodes whatever the number
+    of edges m, while Dijkstra's algorithm from every node takes
+    O(n m log n).  With 'auto', Dijkstra's algorithm (or Johnson's for
+    negative weights) is used when m is less than n^2 / 64.
+
+    The searches of Dijkstra's and Johnson's algorithms are done by
+    SciPy (scipy.sparse.csgraph) if it is installed and in Python
+    otherwise.
+
+    See Also
+    --------
+    floyd_warshall_numpy, all_pairs_dijkstra_path_length
+    """
+    import numpy as np
+    if dtype is None:
+        dtype = np.float64
+    if nodelist is None:
+        nodelist = G.nodes()
+    else:
+        nodeset = set(nodelist)
+        if len(nodeset) != len(nodelist):
+            raise nx.NetworkXError('nodelist contains duplicates.')
+        if any(u not in G for u in nodeset):
+            raise nx.NetworkXError('nodelist contains nodes not in G.')
+        if len(nodeset) < len(G):
+            G = G.subgraph(nodelist)
+    n = len(nodelist)
+    m = G.number_of_edges()
+    if not G.is_directed():
+        m *= 2
+    negative = any(d.get(weight, 1) < 0
+                   for u, v, d in G.edges_iter(data=True))
+    if method == 'auto':
+        if m * 64 >= n * n:
+            method = 'floyd-warshall'
+        else:
+            method = 'johnson' if negative else 'dijkstra'
+    if method == 'dijkstra' and negative:
+        raise ValueError('Dijkstra\'s algorithm requires nonnegative '
+                         'weights.')
+    if method == 'floyd-warshall':
+        A = np.asarray(nx.to_numpy_matrix(G, nodelist=nodelist,
+                                          multigraph_weight=min,
+                                          weight=weight, nonedge=np.inf,
+                                          dtype=dtype))
+        P = None
+        if return_predecessors:
+            P = np.where(np.isfinite(A), np.arange(n)[:, None], -1)
+            np.fill_diagonal(P, -1)
+        np.fill_diagonal(A, np.minimum(A.diagonal(), 0))
+        if np.any(A.diagonal() < 0):
+            raise nx.NetworkXUnbounded('Negative cost cycle detected.')
+        _floyd_warshall_inplace(A, P)
+        if np.any(A.diagonal() < 0):
+            raise nx.NetworkXUnbounded('Negative cost cycle detected.')
+    elif method in ('dijkstra', 'johnson'):
+        try:
+            A, P = _csgraph_all_pairs(G, nodelist, weight, method,
+                                      return_predecessors)
+        except ImportError:
+            A, P = _heap_all_pairs(G, nodelist, weight, method,
+                                   return_predecessors)
+        A = A.astype(dtype, copy=False)
+    else:
+        raise ValueError('Unknown method %s.' % (method,))
+    if return_predecessors:
+        return A, P
+    return A
+
+
+def _heap_all_pairs(G, nodelist, weight, method, return_predecessors):
+    # Dijkstra's algorithm from every node, with the edges reweighted by
+    # Johnson's potentials for method == 'johnson'.
+    import numpy as np
+    from networkx.algorithms.shortest_paths.weighted import \
+        _weighted_adjacency, _dijkstra, _bellman_ford
+    n = len(nodelist)
+    index = dict(zip(nodelist, range(n)))
+    neighbors = _weighted_adjacency(G, weight)
+    h = None
+    if method == 'johnson':
+        h = _bellman_ford(neighbors.__getitem__, nodelist)[1]
+        neighbors = dict((u, [(v, max(w + h[u] - h[v], 0))
+                              for v, w in nbrs])
+                         for u, nbrs in neighbors.items())
+    A = np.empty((n, n))
+    A.fill(np.inf)
+    P = np.empty((n, n), dtype=int) if return_predecessors else None
+    if P is not None:
+        P.fill(-1)
+    for i, u in enumerate(nodelist):
+        pred = {} if P is not None else None
+        dist = _dijkstra(neighbors.__getitem__, [u], pred=pred)
+        cols = [index[v] for v in dist]
+        lengths = list(dist.values())
+        if h is not None:
+            lengths = [d - h[u] + h[v] for v, d in dist.items()]
+        A[i, cols] = lengths
+        if P is not None:
+            P[i, cols] = [-1 if pred[v] is None else index[pred[v]]
+                          for v in dist]
+    return A, P
+
+
+def _csgraph_all_pairs(G, nodelist, weight, method, return_predecessors):
+    # Dijkstra's or Johnson's algorithm by scipy.sparse.csgraph.
+    import numpy as np
+    import scipy.sparse
+    from scipy.sparse.csgraph import dijkstra, johnson
+    from networkx.algorithms.shortest_paths.weighted import \
+        _weighted_adjacency
+    n = len(nodelist)
+    index = dict(zip(nodelist, range(n)))
+    rows = []
+    cols = []
+    data = []
+    for u, nbrs in _weighted_adjacency(G, weight).items():
+        for v, w in nbrs:
+            if u != v:
+                rows.append(index[u])
+                cols.append(index[v])
+                data.append(w)
+            elif w < 0:
+                # a negative self-loop is a negative cycle, but csgraph
+                # ignores the diagonal
+                raise nx.NetworkXUnbounded('Negative cost cycle detected.')
+    M = scipy.sparse.csr_matrix((np.array(data, dtype=float),
+                                 (np.array(rows, dtype=int),
+                                  np.array(cols, dtype=int))), shape=(n, n))
+    func = dijkstra if method == 'dijkstra' else johnson
+    try:
+        result = func(M, directed=True,
+                      return_predecessors=return_predecessors)
+    except scipy.sparse.csgraph.NegativeCycleError:
+        raise nx.NetworkXUnbounded('Negative cost cycle detected.')
+    if not return_predecessors:
+        return result, None
+    A, P = result
+    P = P.astype(int)
+    P[P < 0] = -1
+    return A, P
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -14,6 +14,10 @@ order by first flipping the edge orientation using R=G.reverse(copy=False).
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 import networkx as nx
 __author__ = """\n""".join(['Aric Hagberg <aric.hagberg@gmail.com>',
                             'Sérgio Nery Simões <sergionery@gmail.com>'])
@@ -21,6 +25,52 @@ __all__ = ['shortest_path', 'all_shortest_paths',
            'shortest_path_length', 'average_shortest_path_length',
            'has_path']
 
+
+class _PathDict(Mapping):
+    """Read-only dictionary of the shortest paths from a source, keyed by
+    target.
+
+    Only the predecessor of each node on its path, pred[v], is stored,
+    with pred[source] = None.  A path is built from the predecessors when
+    it is looked up, so the dictionary takes O(n) memory instead of O(n)
+    times the length of the paths.  Use dict(paths) for a plain dictionary.
+    If reverse is True the paths go from the targets to the source.
+    """
+    __slots__ = ('pred', 'reverse')
+
+    def __init__(self, pred, reverse=False):
+        self.pred = pred
+        self.reverse = reverse
+
+    def __len__(self):
+        return len(self.pred)
+
+    def __iter__(self):
+        return iter(self.pred)
+
+    def __contains__(self, target):
+        return target in self.pred
+
+    def __getitem__(self, target):
+        pred = self.pred
+        path = [target]
+        v = pred[target]
+        while v is not None:
+            path.append(v)
+            v = pred[v]
+        if not self.reverse:
+            path.reverse()
+        return path
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getstate__(self):
+        return (self.pred, self.reverse)
+
+    def __setstate__(self, state):
+        self.pred, self.reverse = state
+
 def has_path(G, source, target):
     """Return True if G has a path from source to target, False otherwise.
 
@@ -130,8 +180,7 @@ def shortest_path(G, source=None, target=None, weight=None):
                 paths=nx.single_source_dijkstra_path(G,target,weight=weight)
 
             # Now flip the paths so they go from a source to the target.
-            for target in paths:
-                paths[target] = list(reversed(paths[target]))
+            paths = _PathDict(paths.pred, reverse=True)
 
             if directed:
                 G.reverse(copy=False)
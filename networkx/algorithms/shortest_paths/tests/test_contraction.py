@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+import pickle
+from nose.tools import *
+import networkx as nx
+
+
+class TestContractionHierarchy:
+
+    def setUp(self):
+        self.XG = nx.DiGraph()
+        self.XG.add_weighted_edges_from([('s', 'u', 10), ('s', 'x', 5),
+                                         ('u', 'v', 1), ('u', 'x', 2),
+                                         ('v', 'y', 1), ('x', 'u', 3),
+                                         ('x', 'v', 5), ('x', 'y', 2),
+                                         ('y', 's', 7), ('y', 'v', 6)])
+        self.grid = nx.grid_2d_graph(6, 6)
+        for i, (u, v) in enumerate(sorted(self.grid.edges())):
+            self.grid[u][v]['weight'] = i % 5 + 1
+
+    def check_all_pairs(self, G, CH):
+        for s in G:
+            dist = nx.single_source_dijkstra_path_length(G, s)
+            for t in G:
+                if t not in dist:
+                    assert_raises(nx.NetworkXNoPath, CH.query, s, t)
+                    continue
+                length, path = CH.query(s, t)
+                assert_equal(length, dist[t])
+                assert_equal(path[0], s)
+                assert_equal(path[-1], t)
+                assert_equal(sum(G[u][v].get('weight', 1)
+                                 for u, v in zip(path, path[1:])), length)
+
+    def test_directed(self):
+        CH = nx.ContractionHierarchy(self.XG)
+        assert_equal(CH.query('s', 'v'), (9, ['s', 'x', 'u', 'v']))
+        self.check_all_pairs(self.XG, CH)
+
+    def test_undirected(self):
+        CH = nx.ContractionHierarchy(self.grid)
+        assert_equal(sorted(CH.rank.values()), list(range(36)))
+        self.check_all_pairs(self.grid, CH)
+
+    def test_random(self):
+        for directed in [False, True]:
+            G = nx.gnm_random_graph(30, 70, seed=7, directed=directed)
+            for i, (u, v) in enumerate(G.edges()):
+                G[u][v]['weight'] = (i * 7) % 4
+            self.check_all_pairs(G, nx.ContractionHierarchy(G))
+
+    def test_multigraph(self):
+        G = nx.MultiGraph()
+        G.add_edge(0, 1, weight=5)
+        G.add_edge(0, 1, weight=1)
+        G.add_edge(1, 2, weight=1)
+        G.add_edge(1, 1, weight=1)
+        CH = nx.ContractionHierarchy(G)
+        assert_equal(CH.query(0, 2), (2, [0, 1, 2]))
+        assert_equal(CH.query(2, 2), (0, [2]))
+
+    def test_rebuild(self):
+        G = nx.path_graph(4)
+        CH = nx.ContractionHierarchy(G)
+        assert_equal(CH.query(0, 3), (3, [0, 1, 2, 3]))
+        G.add_edge(0, 3, cost=1)
+        assert_equal(CH.query(0, 3), (3, [0, 1, 2, 3]))
+        CH.rebuild(G)
+        assert_equal(CH.query(0, 3), (1, [0, 3]))
+        CH.rebuild(G, weight='cost')
+        assert_equal(CH.weight, 'cost')
+        assert_equal(CH.query(3, 0), (1, [3, 0]))
+
+    def test_pickle(self):
+        CH = pickle.loads(pickle.dumps(nx.ContractionHierarchy(self.grid)))
+        self.check_all_pairs(self.grid, CH)
+
+    def test_errors(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, weight=-1)
+        assert_raises(ValueError, nx.ContractionHierarchy, G)
+        G = nx.Graph([(0, 1)])
+        G.add_node(2)
+        CH = nx.ContractionHierarchy(G)
+        assert_raises(nx.NetworkXNoPath, CH.query, 0, 2)
+        assert_raises(nx.NetworkXError, CH.query, 0, 3)
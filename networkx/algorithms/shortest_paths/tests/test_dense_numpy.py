@@ -65,3 +65,92 @@ class TestFloydNumpy(object):
         dist = nx.floyd_warshall_numpy(G)
         assert_equal(int(numpy.min(dist)), -14)
 
+
+    def check_matrix(self, G, method, nodelist=None):
+        from networkx.algorithms.shortest_paths.dense import _heap_all_pairs
+        if nodelist is None:
+            nodelist = G.nodes()
+        pred, dist = nx.floyd_warshall_predecessor_and_distance(
+            G.subgraph(nodelist))
+        expected = numpy.array([[dist[u][v] for v in nodelist]
+                                for u in nodelist])
+        D, P = nx.shortest_path_length_matrix(G, nodelist, method=method,
+                                              return_predecessors=True)
+        results = [(D, P)]
+        if method in ('dijkstra', 'johnson'):
+            results.append(_heap_all_pairs(G.subgraph(nodelist), nodelist,
+                                           'weight', method, True))
+        for D, P in results:
+            assert_almost_equal(D, expected)
+            # following the predecessors gives paths of the right length
+            for i in range(len(nodelist)):
+                for j in range(len(nodelist)):
+                    if i == j or not numpy.isfinite(D[i, j]):
+                        assert_equal(P[i, j], -1)
+                        continue
+                    length = 0
+                    k = j
+                    while k != i:
+                        length += min(d.get('weight', 1) for d in
+                                      self.edge_data(G, nodelist[P[i, k]],
+                                                     nodelist[k]))
+                        k = P[i, k]
+                    assert_almost_equal(length, D[i, j])
+
+    def edge_data(self, G, u, v):
+        if G.is_multigraph():
+            return G[u][v].values()
+        return [G[u][v]]
+
+    def test_shortest_path_length_matrix(self):
+        G = nx.gnm_random_graph(30, 60, seed=3, directed=True)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = (i * 7) % 5
+        for method in ['floyd-warshall', 'dijkstra', 'johnson', 'auto']:
+            self.check_matrix(G, method)
+            self.check_matrix(G.to_undirected(), method)
+            self.check_matrix(G, method, nodelist=list(range(29, 4, -1)))
+        M = nx.MultiGraph(G)
+        M.add_edge(0, 1, weight=0.5)
+        self.check_matrix(M, 'floyd-warshall')
+        self.check_matrix(M, 'dijkstra')
+
+    def test_shortest_path_length_matrix_negative(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(1, 2, -2), (2, 3, -4), (1, 5, 1),
+                                   (5, 4, 0), (4, 3, -5), (2, 5, -7)])
+        G.add_node(6)
+        for method in ['floyd-warshall', 'johnson', 'auto']:
+            self.check_matrix(G, method)
+        assert_raises(ValueError, nx.shortest_path_length_matrix, G,
+                      method='dijkstra')
+        assert_raises(ValueError, nx.shortest_path_length_matrix, G,
+                      method='bogus')
+        G.add_edge(3, 1, weight=1)
+        for method in ['floyd-warshall', 'johnson']:
+            assert_raises(nx.NetworkXUnbounded,
+                          nx.shortest_path_length_matrix, G, method=method)
+
+    def test_shortest_path_length_matrix_negative_selfloop(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 1, -1), (1, 2, -2)])
+        for method in ['floyd-warshall', 'johnson', 'auto']:
+            assert_raises(nx.NetworkXUnbounded,
+                          nx.shortest_path_length_matrix, G, method=method)
+        G.add_weighted_edges_from([(1, 1, 0), (3, 3, 2)])
+        for method in ['floyd-warshall', 'johnson', 'auto']:
+            self.check_matrix(G, method)
+
+    def test_shortest_path_length_matrix_dtype(self):
+        G = nx.cycle_graph(5)
+        D = nx.shortest_path_length_matrix(G, dtype=numpy.float32)
+        assert_equal(D.dtype, numpy.float32)
+        assert_equal(D[0].tolist(), [0, 1, 2, 2, 1])
+        D = nx.floyd_warshall_numpy(G, dtype=numpy.float32)
+        assert_equal(D.dtype, numpy.float32)
+        assert_raises(nx.NetworkXError, nx.shortest_path_length_matrix, G,
+                      nodelist=[0, 0])
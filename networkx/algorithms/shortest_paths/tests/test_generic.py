@@ -143,3 +143,19 @@ class TestGenericPath:
         G.add_path([0,1,2,3])
         G.add_node(4)
         paths = list(nx.all_shortest_paths(G,0,4))
+
+    def test_lazy_paths(self):
+        G = nx.DiGraph()
+        G.add_path([0, 1, 2, 3])
+        G.add_edge(0, 2)
+        for weight in [None, 'weight']:
+            p = nx.shortest_path(G, 0, weight=weight)
+            assert_equal(p.pred, {0: None, 1: 0, 2: 0, 3: 2})
+            assert_equal(dict(p), {0: [0], 1: [0, 1], 2: [0, 2],
+                                   3: [0, 2, 3]})
+            assert_equal(len(p), 4)
+            assert_false(4 in p)
+            assert_raises(KeyError, p.__getitem__, 4)
+            p = nx.shortest_path(G, target=3, weight=weight)
+            assert_equal(dict(p), {3: [3], 2: [2, 3], 1: [1, 2, 3],
+                                   0: [0, 2, 3]})
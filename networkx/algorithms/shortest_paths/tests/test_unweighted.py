@@ -47,6 +47,17 @@ class TestUnweightedPath:
         p=nx.all_pairs_shortest_path(self.grid)
         assert_equal(p[1][12],[1, 2, 3, 4, 8, 12])
 
+    def test_multi_source_bfs(self):
+        l,nearest,p=nx.multi_source_bfs(self.cycle,[0,3])
+        assert_equal(l,{0:0,1:1,2:1,3:0,4:1,5:2,6:1})
+        assert_equal(nearest,{0:0,1:0,2:3,3:3,4:3,5:p[5][0],6:0})
+        assert_true(p[5] in ([3,4,5],[0,6,5]))
+        l,nearest,p=nx.multi_source_bfs(self.cycle,[0,3],cutoff=0)
+        assert_equal(dict(p),{0:[0],3:[3]})
+        l,nearest,p=nx.multi_source_bfs(self.directed_cycle,[5])
+        assert_equal(p[2],[5,6,0,1,2])
+        assert_raises(ValueError,nx.multi_source_bfs,self.cycle,[])
+
     def test_all_pairs_shortest_path_length(self):
         l=nx.all_pairs_shortest_path_length(self.cycle)
         assert_equal(l[0],{0:0,1:1,2:2,3:3,4:3,5:2,6:1})
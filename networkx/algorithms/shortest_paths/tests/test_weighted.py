@@ -244,3 +244,93 @@ class TestWeightedPath:
         assert_equal(sorted(dist.items()),
                      [((0, 0), 0), ((0, 1), 1), ((1, 0), 1), ((1, 1), 2)])
 
+
+    def test_bellman_ford_random(self):
+        # compare with Floyd's algorithm on graphs with negative weights
+        checked = 0
+        for seed in range(5):
+            G = nx.gnm_random_graph(25, 80, seed=seed, directed=True)
+            for i, (u, v) in enumerate(G.edges()):
+                G[u][v]['weight'] = (i * 7 + seed) % 11 - 2
+            if nx.negative_edge_cycle(G):
+                raised = 0
+                for s in G:
+                    try:
+                        nx.bellman_ford(G, s)
+                    except nx.NetworkXUnbounded:
+                        raised += 1
+                assert_true(raised > 0)
+                continue
+            checked += 1
+            dist = nx.floyd_warshall(G)
+            for s in G:
+                P, D = nx.bellman_ford(G, s)
+                assert_equal(D, dict((v, d) for v, d in dist[s].items()
+                                     if d < float('inf')))
+                for v in D:
+                    if v != s:
+                        assert_equal(D[v], D[P[v]] + G[P[v]][v]['weight'])
+        assert_true(checked > 0)
+
+    def test_negative_edge_cycle_unchanged(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 2, -3), (2, 1, 2)])
+        assert_true(nx.negative_edge_cycle(G))
+        assert_equal(sorted(G), [0, 1, 2])
+        G[2][1]['weight'] = 3
+        assert_false(nx.negative_edge_cycle(G))
+        G = nx.Graph()
+        G.add_edge(0, 1, weight=-1)
+        assert_true(nx.negative_edge_cycle(G))
+        G = nx.DiGraph()
+        G.add_edge(0, 0, weight=-1)
+        assert_true(nx.negative_edge_cycle(G))
+
+    def test_johnson(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(1, 2, -2), (2, 3, -4), (1, 5, 1),
+                                   (5, 4, 0), (4, 3, -5), (2, 5, -7)])
+        G.add_node(6)
+        dist = nx.johnson(G)
+        for s in G:
+            assert_equal(dist[s], nx.bellman_ford(G, s)[1])
+        assert_equal(dist[1][3], -14)
+        assert_equal(nx.johnson(self.XG), nx.all_pairs_dijkstra_path_length(self.XG))
+        assert_equal(nx.johnson(self.MXG4), nx.all_pairs_dijkstra_path_length(self.MXG4))
+        assert_equal(nx.johnson(G, n_jobs=2), dist)
+        G.add_edge(3, 1, weight=1)
+        assert_raises(nx.NetworkXUnbounded, nx.johnson, G)
+
+    def test_multi_source_dijkstra(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 2, 5), (2, 3, 1),
+                                   (3, 4, 1), (0, 5, 10)])
+        d, nearest, p = nx.multi_source_dijkstra(G, [0, 4])
+        assert_equal(d, {0: 0, 1: 1, 2: 2, 3: 1, 4: 0, 5: 10})
+        assert_equal(nearest, {0: 0, 1: 0, 2: 4, 3: 4, 4: 4, 5: 0})
+        assert_equal(p[2], [4, 3, 2])
+        assert_equal(p[5], [0, 5])
+        d, nearest, p = nx.multi_source_dijkstra(G, [0, 4], cutoff=1)
+        assert_equal(sorted(d), [0, 1, 3, 4])
+        d, nearest, p = nx.multi_source_dijkstra(self.XG, ['s'])
+        assert_equal(d, nx.single_source_dijkstra_path_length(self.XG, 's'))
+        assert_equal(p['v'], ['s', 'x', 'u', 'v'])
+        d, nearest, p = nx.multi_source_dijkstra(self.MXG, ['u', 'y'],
+                                                 target='x')
+        assert_equal((d['x'], nearest['x'], p['x']), (2, 'u', ['u', 'x']))
+        assert_raises(ValueError, nx.multi_source_dijkstra, G, [])
+        # every node is reached from its nearest source
+        sources = [1, 5, 9]
+        d, nearest, p = nx.multi_source_dijkstra(self.grid, sources)
+        for v in self.grid:
+            lengths = [nx.dijkstra_path_length(self.grid, s, v)
+                       for s in sources]
+            assert_equal(d[v], min(lengths))
+            assert_equal(d[v], lengths[sources.index(nearest[v])])
+            assert_equal(p[v][0], nearest[v])
+            assert_equal(p[v][-1], v)
+
+    def test_all_pairs_dijkstra_multigraph(self):
+        assert_equal(nx.all_pairs_dijkstra_path_length(self.MXG)['s']['u'], 8)
+        assert_equal(nx.all_pairs_dijkstra_path(self.MXG)['s']['v'],
+                     ['s', 'x', 'u', 'v'])
@@ -15,10 +15,12 @@ __all__ = ['bidirectional_shortest_path',
            'single_source_shortest_path_length',
            'all_pairs_shortest_path',
            'all_pairs_shortest_path_length',
+           'multi_source_bfs',
            'predecessor']
 
 
 import networkx as nx
+from networkx.algorithms.shortest_paths.generic import _PathDict
 
 def single_source_shortest_path_length(G,source,cutoff=None):
     """Compute the shortest path lengths from source to all reachable nodes.
@@ -100,7 +102,75 @@ def all_pairs_shortest_path_length(G,cutoff=None):
         paths[n]=single_source_shortest_path_length(G,n,cutoff=cutoff)
     return paths
 
+def multi_source_bfs(G,sources,cutoff=None):
+    """Compute shortest paths and lengths from the nearest of many sources.
 
+    A single breadth-first search is started from all sources at once, so
+    each node is reached from its nearest source.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : iterable of nodes
+       Starting nodes for paths.
+
+    cutoff : integer, optional
+        Depth to stop the search. Only paths of length <= cutoff are returned.
+
+    Returns
+    -------
+    lengths,nearest,paths : dictionaries
+       Returns a tuple of three dictionaries keyed by node.
+       The first stores the number of edges from the nearest source.
+       The second stores the nearest source.
+       The third stores the path from the nearest source to that node,
+       built on access as for single_source_shortest_path().
+
+    Raises
+    ------
+    ValueError
+       If sources is empty.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(5)
+    >>> length,nearest,path=nx.multi_source_bfs(G,[0,4])
+    >>> length[2]
+    2
+    >>> nearest[3]
+    4
+    >>> path[3]
+    [4, 3]
+
+    Notes
+    -----
+    Ties between equally near sources are broken arbitrarily.
+
+    See Also
+    --------
+    single_source_shortest_path, multi_source_dijkstra
+    """
+    nextlevel=list(sources)  # list of nodes to check at next level
+    if not nextlevel:
+        raise ValueError('sources must not be empty')
+    pred=dict.fromkeys(nextlevel)  # predecessor of each node on its path
+    seen=dict.fromkeys(nextlevel,0)
+    nearest=dict((s,s) for s in nextlevel)
+    level=0
+    while nextlevel and (cutoff is None or level < cutoff):
+        level=level+1
+        thislevel=nextlevel
+        nextlevel=[]
+        for v in thislevel:
+            s=nearest[v]
+            for w in G[v]:
+                if w not in pred:
+                    pred[w]=v
+                    seen[w]=level
+                    nearest[w]=s
+                    nextlevel.append(w)
+    return (seen,nearest,_PathDict(pred))
 
 
 def bidirectional_shortest_path(G,source,target):
@@ -218,8 +288,10 @@ def single_source_shortest_path(G,source,cutoff=None):
 
     Returns
     -------
-    lengths : dictionary
-        Dictionary, keyed by target, of shortest paths.
+    paths : dictionary
+        Dictionary, keyed by target, of shortest paths.  The paths are
+        built on access from the predecessor of each node on its path,
+        which is stored in paths.pred (with paths.pred[source] = None).
 
     Examples
     --------
@@ -240,21 +312,21 @@ def single_source_shortest_path(G,source,cutoff=None):
     shortest_path
     """
     level=0                  # the current level
-    nextlevel={source:1}       # list of nodes to check at next level
-    paths={source:[source]}  # paths dictionary  (paths to key from source)
+    nextlevel=[source]       # list of nodes to check at next level
+    pred={source:None}       # predecessor of each node on its path
     if cutoff==0:
-        return paths
+        return _PathDict(pred)
     while nextlevel:
         thislevel=nextlevel
-        nextlevel={}
+        nextlevel=[]
         for v in thislevel:
             for w in G[v]:
-                if w not in paths:
-                    paths[w]=paths[v]+[w]
-                    nextlevel[w]=1
+                if w not in pred:
+                    pred[w]=v
+                    nextlevel.append(w)
         level=level+1
         if (cutoff is not None and cutoff <= level):  break
-    return paths
+    return _PathDict(pred)
 
 
 def all_pairs_shortest_path(G,cutoff=None):
@@ -269,8 +341,10 @@ def all_pairs_shortest_path(G,cutoff=None):
 
     Returns
     -------
-    lengths : dictionary
+    paths : dictionary
         Dictionary, keyed by source and target, of shortest paths.
+        The paths from each source are built on access, see
+        single_source_shortest_path().
 
     Examples
     --------
@@ -21,11 +21,82 @@ __all__ = ['dijkstra_path',
            'all_pairs_dijkstra_path',
            'all_pairs_dijkstra_path_length',
            'dijkstra_predecessor_and_distance',
-           'bellman_ford','negative_edge_cycle']
+           'multi_source_dijkstra',
+           'bellman_ford','negative_edge_cycle','johnson']
 
+from collections import deque
 import heapq
 import networkx as nx
-from networkx.utils import generate_unique_node
+from networkx.utils import parallel_map, split_chunks, effective_n_jobs
+from networkx.algorithms.shortest_paths.generic import _PathDict
+
+def _weighted_neighbors(G, weight):
+    """Return a function giving the (neighbor, weight) pairs of a node.
+
+    For multigraphs the weight is the lowest weight of the parallel edges.
+    """
+    if G.is_multigraph():
+        def neighbors(v):
+            return [(w, min(dd.get(weight,1) for dd in keydata.values()))
+                    for w,keydata in G[v].items()]
+    else:
+        def neighbors(v):
+            return [(w, dd.get(weight,1)) for w,dd in G[v].items()]
+    return neighbors
+
+
+def _weighted_adjacency(G, weight):
+    """Return the (neighbor, weight) pairs of all nodes as a dictionary.
+
+    Searches from many sources share it instead of looking up the edge
+    weights again for every source.
+    """
+    neighbors=_weighted_neighbors(G, weight)
+    return dict((v, neighbors(v)) for v in G)
+
+
+def _dijkstra(neighbors, sources, pred=None, cutoff=None, target=None):
+    """Dijkstra's algorithm from one or more sources.
+
+    Return the dictionary of distances to the nodes reached, in the order
+    they were settled.  neighbors(v) gives the (neighbor, weight) pairs of
+    v.  If pred is a dictionary, the predecessor of each node on its path
+    is stored in it, with pred[s] = None for the sources.  The search stops
+    once target is settled.
+    """
+    push=heapq.heappush
+    pop=heapq.heappop
+    dist = {}  # dictionary of final distances
+    seen = {}
+    fringe=[] # use heapq with (distance,label) tuples
+    for s in sources:
+        seen[s] = 0
+        push(fringe,(0,s))
+        if pred is not None:
+            pred[s] = None
+    while fringe:
+        (d,v)=pop(fringe)
+        if v in dist:
+            continue # already searched this node.
+        dist[v] = d
+        if v == target:
+            break
+        for w,cost in neighbors(v):
+            vw_dist = d + cost
+            if cutoff is not None:
+                if vw_dist>cutoff:
+                    continue
+            if w in dist:
+                if vw_dist < dist[w]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif w not in seen or vw_dist < seen[w]:
+                seen[w] = vw_dist
+                push(fringe,(vw_dist,w))
+                if pred is not None:
+                    pred[w] = v
+    return dist
+
 
 def dijkstra_path(G, source, target, weight='weight'):
     """Returns the shortest path from source to target in a weighted graph G.
@@ -145,7 +216,8 @@ def single_source_dijkstra_path(G,source, cutoff=None, weight='weight'):
     Returns
     -------
     paths : dictionary
-       Dictionary of shortest path lengths keyed by target.
+       Dictionary of shortest paths keyed by target.  The paths are built
+       on access, see single_source_dijkstra().
 
     Examples
     --------
@@ -210,39 +282,7 @@ def single_source_dijkstra_path_length(G, source, cutoff= None,
     single_source_dijkstra()
 
     """
-    dist = {}  # dictionary of final distances
-    seen = {source:0}
-    fringe=[] # use heapq with (distance,label) tuples
-    heapq.heappush(fringe,(0,source))
-    while fringe:
-        (d,v)=heapq.heappop(fringe)
-        if v in dist:
-            continue # already searched this node.
-        dist[v] = d
-        #for ignore,w,edgedata in G.edges_iter(v,data=True):
-        #is about 30% slower than the following
-        if G.is_multigraph():
-            edata=[]
-            for w,keydata in G[v].items():
-                minweight=min((dd.get(weight,1)
-                               for k,dd in keydata.items()))
-                edata.append((w,{weight:minweight}))
-        else:
-            edata=iter(G[v].items())
-
-        for w,edgedata in edata:
-            vw_dist = dist[v] + edgedata.get(weight,1)
-            if cutoff is not None:
-                if vw_dist>cutoff:
-                    continue
-            if w in dist:
-                if vw_dist < dist[w]:
-                    raise ValueError('Contradictory paths found:',
-                                     'negative weights?')
-            elif w not in seen or vw_dist < seen[w]:
-                seen[w] = vw_dist
-                heapq.heappush(fringe,(vw_dist,w))
-    return dist
+    return _dijkstra(_weighted_neighbors(G, weight), [source], cutoff=cutoff)
 
 
 def single_source_dijkstra(G,source,target=None,cutoff=None,weight='weight'):
@@ -269,6 +309,9 @@ def single_source_dijkstra(G,source,target=None,cutoff=None,weight='weight'):
        Returns a tuple of two dictionaries keyed by node.
        The first dictionary stores distance from the source.
        The second stores the path from the source to that node.
+       The paths are built on access from the predecessor of each node
+       on its path, which is stored in path.pred (with
+       path.pred[source] = None).
 
 
     Examples
@@ -300,44 +343,85 @@ def single_source_dijkstra(G,source,target=None,cutoff=None,weight='weight'):
     single_source_dijkstra_path_length()
     """
     if source==target:
-        return ({source:0}, {source:[source]})
-    dist = {}  # dictionary of final distances
-    paths = {source:[source]}  # dictionary of paths
-    seen = {source:0}
-    fringe=[] # use heapq with (distance,label) tuples
-    heapq.heappush(fringe,(0,source))
-    while fringe:
-        (d,v)=heapq.heappop(fringe)
-        if v in dist:
-            continue # already searched this node.
-        dist[v] = d
-        if v == target:
-            break
-        #for ignore,w,edgedata in G.edges_iter(v,data=True):
-        #is about 30% slower than the following
-        if G.is_multigraph():
-            edata=[]
-            for w,keydata in G[v].items():
-                minweight=min((dd.get(weight,1)
-                               for k,dd in keydata.items()))
-                edata.append((w,{weight:minweight}))
-        else:
-            edata=iter(G[v].items())
+        return ({source:0}, _PathDict({source:None}))
+    pred = {}  # predecessor of each node on its path
+    dist = _dijkstra(_weighted_neighbors(G, weight), [source], pred=pred,
+                     cutoff=cutoff, target=target)
+    return (dist,_PathDict(pred))
 
-        for w,edgedata in edata:
-            vw_dist = dist[v] + edgedata.get(weight,1)
-            if cutoff is not None:
-                if vw_dist>cutoff:
-                    continue
-            if w in dist:
-                if vw_dist < dist[w]:
-                    raise ValueError('Contradictory paths found:',
-                                     'negative weights?')
-            elif w not in seen or vw_dist < seen[w]:
-                seen[w] = vw_dist
-                heapq.heappush(fringe,(vw_dist,w))
-                paths[w] = paths[v]+[w]
-    return (dist,paths)
+
+def multi_source_dijkstra(G, sources, target=None, cutoff=None,
+                          weight='weight'):
+    """Compute shortest paths and lengths from the nearest of many sources.
+
+    A single Dijkstra search is started from all sources at once, so each
+    node is reached from its nearest source.  This is much faster than one
+    search per source, e.g. for assigning nodes to their nearest facility.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : iterable of nodes
+       Starting nodes for paths.
+
+    target : node label, optional
+       Ending node for path.  The search stops once it is reached.
+
+    cutoff : integer or float, optional
+       Depth to stop the search. Only paths of length <= cutoff are returned.
+
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight
+
+    Returns
+    -------
+    distance,nearest,path : dictionaries
+       Returns a tuple of three dictionaries keyed by node.
+       The first stores the distance from the nearest source.
+       The second stores the nearest source.
+       The third stores the path from the nearest source to that node,
+       built on access as for single_source_dijkstra().
+
+    Raises
+    ------
+    ValueError
+       If sources is empty.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(5)
+    >>> length,nearest,path=nx.multi_source_dijkstra(G,[0,4])
+    >>> print(length)
+    {0: 0, 4: 0, 1: 1, 3: 1, 2: 2}
+    >>> nearest[3]
+    4
+    >>> path[3]
+    [4, 3]
+
+    Notes
+    -----
+    Edge weight attributes must be numerical.
+    Distances are calculated as sums of weighted edges traversed.
+
+    Ties between equally near sources are broken arbitrarily.
+
+    See Also
+    --------
+    single_source_dijkstra(), multi_source_bfs()
+    """
+    sources=list(sources)
+    if not sources:
+        raise ValueError('sources must not be empty')
+    pred = {}
+    dist = _dijkstra(_weighted_neighbors(G, weight), sources, pred=pred,
+                     cutoff=cutoff, target=target)
+    # nodes are settled after their predecessors
+    nearest = {}
+    for v in dist:
+        u = pred[v]
+        nearest[v] = v if u is None else nearest[u]
+    return (dist,nearest,_PathDict(pred))
 
 
 def dijkstra_predecessor_and_distance(G,source, cutoff=None, weight='weight'):
@@ -442,10 +526,10 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
 
     The dictionary returned only has keys for reachable node pairs.
     """
+    neighbors=_weighted_adjacency(G, weight).__getitem__
     paths={}
     for n in G:
-        paths[n]=single_source_dijkstra_path_length(G,n, cutoff=cutoff,
-                                                    weight=weight)
+        paths[n]=_dijkstra(neighbors, [n], cutoff=cutoff)
     return paths
 
 def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
@@ -463,8 +547,10 @@ def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
 
     Returns
     -------
-    distance : dictionary
+    paths : dictionary
        Dictionary, keyed by source and target, of shortest paths.
+       The paths from each source are built on access, see
+       single_source_dijkstra().
 
     Examples
     --------
@@ -483,10 +569,12 @@ def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
     floyd_warshall()
 
     """
+    neighbors=_weighted_adjacency(G, weight).__getitem__
     paths={}
     for n in G:
-        paths[n]=single_source_dijkstra_path(G, n, cutoff=cutoff,
-                                             weight=weight)
+        pred={}
+        _dijkstra(neighbors, [n], pred=pred, cutoff=cutoff)
+        paths[n]=_PathDict(pred)
     return paths
 
 def bellman_ford(G, source, weight = 'weight'):
@@ -495,7 +583,9 @@ def bellman_ford(G, source, weight = 'weight'):
 
     The algorithm has a running time of O(mn) where n is the number of
     nodes and m is the number of edges.  It is slower than Dijkstra but
-    can handle negative edge weights.
+    can handle negative edge weights.  Only the nodes whose distance
+    changed are scanned again, which is usually much faster than the
+    worst case.
 
     Parameters
     ----------
@@ -553,37 +643,72 @@ def bellman_ford(G, source, weight = 'weight'):
     """
     if source not in G:
         raise KeyError("Node %s is not found in the graph"%source)
-    numb_nodes = len(G)
+    return _bellman_ford(_weighted_neighbors(G, weight), [source])
 
-    dist = {source: 0}
-    pred = {source: None}
 
-    if numb_nodes == 1:
-       return pred, dist
+def _bellman_ford(neighbors, sources):
+    """Queue-based Bellman-Ford algorithm from one or more sources.
 
-    if G.is_multigraph():
-        def get_weight(edge_dict):
-            return min([eattr.get(weight,1) for eattr in edge_dict.values()])
-    else:
-        def get_weight(edge_dict):
-            return edge_dict.get(weight,1)
-
-    for i in range(numb_nodes):
-        no_changes=True
-        # Only need edges from nodes in dist b/c all others have dist==inf
-        for u, dist_u in list(dist.items()): # get all edges from nodes in dist
-            for v, edict in G[u].items():  # double loop handles undirected too
-                dist_v = dist_u + get_weight(edict)
-                if v not in dist or dist[v] > dist_v:
-                    dist[v] = dist_v
-                    pred[v] = u
-                    no_changes = False
-        if no_changes:
-            break
-    else:
-        raise nx.NetworkXUnbounded("Negative cost cycle detected.")
+    Return the dictionaries of predecessors and distances.  neighbors(v)
+    gives the (neighbor, weight) pairs of v.  Raise NetworkXUnbounded if
+    a negative cycle is reachable from the sources.
+
+    Only nodes whose distance decreased are scanned, in first-in
+    first-out order.  The predecessors form a tree.  When the distance
+    of a node v decreases, the subtree below v is taken apart, since
+    the distances in it are out of date and the nodes in it need not be
+    scanned before v is [1]_.  If the node whose edge lowered the
+    distance of v is in that subtree, the predecessors form a cycle of
+    negative length.
+
+    References
+    ----------
+    .. [1] B. V. Cherkassky and A. V. Goldberg, Negative-cycle detection
+       algorithms. Mathematical Programming 85:277-311, 1999.
+    """
+    dist = {}
+    pred = {}
+    children = {}
+    for s in sources:
+        dist[s] = 0
+        pred[s] = None
+        children[s] = []
+    queue = deque(dist)
+    active = set(dist)  # nodes in the queue and in the tree
+    while queue:
+        u = queue.popleft()
+        if u not in active:
+            continue # removed from the tree, will be queued again
+        active.remove(u)
+        dist_u = dist[u]
+        for v, w in neighbors(u):
+            dist_v = dist_u + w
+            if v in dist and dist_v >= dist[v]:
+                continue
+            if v in children:
+                # take the subtree of v apart
+                stack = [v]
+                while stack:
+                    x = stack.pop()
+                    if x == u:
+                        raise nx.NetworkXUnbounded(
+                            "Negative cost cycle detected.")
+                    if x != v:
+                        active.discard(x)
+                    stack.extend(children.pop(x))
+                p = pred[v]
+                if p is not None and p in children:
+                    children[p].remove(v)
+            dist[v] = dist_v
+            pred[v] = u
+            children[u].append(v)
+            children[v] = []
+            if v not in active:
+                active.add(v)
+                queue.append(v)
     return pred, dist
 
+
 def negative_edge_cycle(G, weight = 'weight'):
     """Return True if there exists a negative edge cycle anywhere in G.
 
@@ -614,23 +739,99 @@ def negative_edge_cycle(G, weight = 'weight'):
     Edge weight attributes must be numerical.
     Distances are calculated as sums of weighted edges traversed.
 
-    This algorithm uses bellman_ford() but finds negative cycles
-    on any component by first adding a new node connected to
-    every node, and starting bellman_ford on that node.  It then
-    removes that extra node.
+    This algorithm starts the Bellman-Ford algorithm from every node at
+    once, so that negative cycles are found in any component.
     """
-    newnode = generate_unique_node()
-    G.add_edges_from([ (newnode,n) for n in G])
-
     try:
-        bellman_ford(G, newnode, weight)
+        _bellman_ford(_weighted_neighbors(G, weight), G.nodes())
     except nx.NetworkXUnbounded:
-        G.remove_node(newnode)
         return True
-    G.remove_node(newnode)
     return False
 
 
+def johnson(G, weight='weight', n_jobs=None, executor=None):
+    """Compute shortest path lengths between all nodes in a weighted
+    graph with Johnson's algorithm.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       Edge weights may be negative.
+
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight
+
+    n_jobs : int or None, optional (default=None)
+       Number of processes used for the Dijkstra searches.  None or 1
+       runs them in this process and -1 uses all CPUs.
+
+    executor : object with a map() method, optional
+       An existing process pool, e.g. a multiprocessing.Pool, to use
+       instead of creating a new one.
+
+    Returns
+    -------
+    distance : dictionary
+       Dictionary, keyed by source and target, of shortest path lengths.
+
+    Raises
+    ------
+    NetworkXUnbounded
+       If the graph has a cycle of negative length.  Note: any negative
+       weight edge in an undirected graph is a negative cost cycle.
+
+    Examples
+    --------
+    >>> G=nx.DiGraph()
+    >>> G.add_weighted_edges_from([(0,1,3),(1,2,-2),(0,2,2)])
+    >>> length=nx.johnson(G)
+    >>> length[0]
+    {0: 0, 1: 3, 2: 1}
+
+    Notes
+    -----
+    The Bellman-Ford algorithm is run once to find potentials h(v) for
+    which the reduced weights w(u, v) + h(u) - h(v) are nonnegative.
+    Then Dijkstra's algorithm is run from every node with the reduced
+    weights, in O(n m log n) time instead of O(n^2 m) for the
+    Bellman-Ford algorithm from every node.
+
+    The dictionary returned only has keys for reachable node pairs.
+
+    See Also
+    --------
+    all_pairs_dijkstra_path_length, floyd_warshall, bellman_ford,
+    shortest_path_length_matrix
+    """
+    adjacency = _weighted_adjacency(G, weight)
+    h = None
+    if any(w < 0 for nbrs in adjacency.values() for v, w in nbrs):
+        pred, h = _bellman_ford(adjacency.__getitem__, G.nodes())
+        adjacency = dict((u, [(v, max(w + h[u] - h[v], 0)) for v, w in nbrs])
+                         for u, nbrs in adjacency.items())
+    chunks = split_chunks(G, effective_n_jobs(n_jobs, executor))
+    lengths = {}
+    for partial in parallel_map(_johnson_sources,
+                                [(adjacency, h, c) for c in chunks],
+                                n_jobs, executor):
+        lengths.update(partial)
+    return lengths
+
+
+def _johnson_sources(args):
+    # shortest path lengths from a chunk of sources
+    adjacency, h, sources = args
+    neighbors = adjacency.__getitem__
+    lengths = {}
+    for s in sources:
+        dist = _dijkstra(neighbors, [s])
+        if h is not None:
+            hs = h[s]
+            dist = dict((v, d - hs + h[v]) for v, d in dist.items())
+        lengths[s] = dist
+    return lengths
+
+
 def bidirectional_dijkstra(G, source, target, weight = 'weight'):
     """Dijkstra's algorithm for shortest paths using bidirectional search.
 
@@ -109,6 +109,30 @@ class TestCliques:
         H2=nx.make_max_clique_graph(G)
         assert_equal(H1.adj,H2.adj)
 
+    def test_random_graphs(self):
+        # sparse graphs, and dense ones searched with bit sets
+        for i, p in enumerate([0.05, 0.3, 0.7, 0.85]):
+            G = nx.gnp_random_graph(40, p, seed=i)
+            G.add_node(100)
+            expected = sorted(map(sorted, nx.find_cliques_recursive(G)))
+            assert_equal(sorted(map(sorted, nx.find_cliques(G))), expected)
+            assert_equal(sorted(map(sorted, nx.find_cliques(G, n_jobs=2))),
+                         expected)
+
+    def test_statistics_single_pass(self):
+        G = nx.gnp_random_graph(40, 0.3, seed=5)
+        cliques = list(nx.find_cliques(G))
+        for v in G:
+            mine = [c for c in cliques if v in c]
+            assert_equal(nx.number_of_cliques(G, v), len(mine))
+            assert_equal(nx.node_clique_number(G, v),
+                         max(len(c) for c in mine))
+            assert_equal(sorted(map(sorted, nx.cliques_containing_node(G, v))),
+                         sorted(map(sorted, mine)))
+        assert_equal(nx.node_clique_number(G),
+                     nx.node_clique_number(G, G.nodes()))
+        assert_equal(nx.graph_number_of_cliques(G), len(cliques))
+
     @raises(nx.NetworkXNotImplemented)
     def test_directed(self):
         cliques=nx.find_cliques(nx.DiGraph())
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from nose.tools import *
+from nose import SkipTest
 import networkx as nx
 
 class TestTriangles:
@@ -34,6 +35,20 @@ class TestTriangles:
         assert_equal(list(nx.triangles(G).values()),[5, 3, 3, 5, 5])
         assert_equal(nx.triangles(G,1),3)
 
+    def test_methods(self):
+        G = nx.gnm_random_graph(40, 200, seed=1)
+        G.add_edge(0, 0)
+        expected = nx.triangles(G, G.nodes())
+        assert_equal(nx.triangles(G), expected)
+        assert_equal(nx.triangles(G, n_jobs=2), expected)
+        assert_equal(list(nx.triangles(G).values()), list(expected.values()))
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        assert_equal(nx.triangles(G, method='sparse'), expected)
+        assert_raises(ValueError, nx.triangles, G, method='bogus')
+
 
 class TestWeightedClustering:
 
@@ -109,6 +124,14 @@ class TestClustering:
                      [5./6., 1.0, 1.0, 5./6., 5./6.])
         assert_equal(nx.clustering(G,[1,4]),{1: 1.0, 4: 0.83333333333333337})
 
+    def test_self_loops(self):
+        G = nx.gnm_random_graph(30, 120, seed=2)
+        G.add_edges_from([(0, 0), (5, 5)])
+        assert_equal(nx.clustering(G), nx.clustering(G, G.nodes()))
+        assert_equal(nx.clustering(G, n_jobs=2), nx.clustering(G))
+        H = G.copy()
+        H.remove_edges_from(H.selfloop_edges())
+        assert_almost_equal(nx.transitivity(G), nx.transitivity(H))
 
 
 class TestTransitivity:
@@ -112,3 +112,51 @@ class TestCore:
         # k=2
         k_corona_subgraph=nx.k_corona(self.H,k=0)
         assert_equal(sorted(k_corona_subgraph.nodes()),[0])
+
+    def test_directed(self):
+        # reciprocal edges count twice towards the degree
+        G = nx.DiGraph([(0, 1), (1, 0), (1, 2), (2, 1), (2, 0), (0, 2)])
+        G.add_edge(3, 0)
+        assert_equal(nx.core_number(G), {0: 4, 1: 4, 2: 4, 3: 1})
+
+
+class TestCoreMaintainer:
+
+    def test_example(self):
+        G = nx.path_graph(4)
+        cm = nx.CoreMaintainer(G)
+        cm.add_edge(0, 2)
+        assert_equal(cm.core_number, {0: 2, 1: 2, 2: 2, 3: 1})
+        cm.add_edge(4, 5)
+        assert_equal(cm.core_number[4], 1)
+        cm.remove_edge(0, 1)
+        assert_equal(cm.core_number, nx.core_number(G))
+        cm.remove_node(2)
+        assert_equal(cm.core_number, {0: 0, 1: 0, 3: 0, 4: 1, 5: 1})
+        assert_equal(sorted(G), [0, 1, 3, 4, 5])
+
+    def test_random_updates(self):
+        import random
+        rng = random.Random(42)
+        for seed in range(20):
+            G = nx.gnm_random_graph(30, rng.randint(0, 120), seed=seed)
+            cm = nx.CoreMaintainer(G)
+            for i in range(60):
+                if rng.random() < 0.5 and G.number_of_edges() > 0:
+                    cm.remove_edge(*rng.choice(G.edges()))
+                else:
+                    cm.add_edges_from([rng.sample(range(32), 2)])
+                assert_equal(cm.core_number, nx.core_number(G))
+            k_core = nx.k_core(G, core_number=cm.core_number)
+            assert_equal(sorted(k_core), sorted(nx.k_core(G)))
+
+    def test_errors(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.CoreMaintainer,
+                      nx.DiGraph())
+        assert_raises(nx.NetworkXNotImplemented, nx.CoreMaintainer,
+                      nx.MultiGraph())
+        assert_raises(nx.NetworkXError, nx.CoreMaintainer,
+                      nx.Graph([(0, 0)]))
+        cm = nx.CoreMaintainer(nx.path_graph(3))
+        assert_raises(nx.NetworkXError, cm.add_edge, 1, 1)
+        assert_raises(nx.NetworkXError, cm.remove_edge, 0, 2)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from nose.tools import *
+from nose import SkipTest
 import networkx as nx
 
 class TestMST:
@@ -80,6 +81,18 @@ class TestMST:
         assert_equal(sorted(T.edges()),[(1,3),(2,3)])
         assert_equal(sorted(T.nodes()),[1,2,3,13])
 
+    def test_mst_index_labels(self):
+        # nodes 0 to n-1 are grown in an ArrayUnionFind
+        G=nx.gnm_random_graph(200,1000,seed=1)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=(i*7919)%1000
+        H=nx.relabel_nodes(G,dict((n,str(n)) for n in G))
+        weight=lambda T: sum(d['weight'] for u,v,d in T.edges(data=True))
+        T=nx.minimum_spanning_tree(G)
+        assert_equal(weight(T),weight(nx.minimum_spanning_tree(H)))
+        assert_equal(T.number_of_edges(),len(G)-
+                     nx.number_connected_components(G))
+
     def test_prim_mst(self):
         T=nx.prim_mst(self.G)
         assert_equal(T.edges(data=True),self.tree_edgelist)
@@ -131,3 +144,73 @@ class TestMST:
         assert_equal(sorted(T.edges()),[(1,3),(2,3)])
         assert_equal(sorted(T.nodes()),[1,2,3,13])
 
+
+
+class TestBoruvka:
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        example=TestMST()
+        example.setUp()
+        self.G=example.G
+        self.tree_edgelist=example.tree_edgelist
+        G=nx.gnm_random_graph(300,1500,seed=2)
+        G.add_nodes_from(range(300,310))
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=(i*7919)%500
+        self.random=G
+
+    def weight(self,edges):
+        return sum(d.get('weight',1) for u,v,d in edges)
+
+    def test_boruvka_mst_edges(self):
+        edgelist=sorted(nx.boruvka_mst_edges(self.G))
+        assert_equal([(min(u,v),max(u,v),d) for u,v,d in edgelist],
+                     self.tree_edgelist)
+
+    def test_boruvka_mst(self):
+        G=self.random
+        T=nx.boruvka_mst(G)
+        assert_equal(sorted(T.nodes()),sorted(G.nodes()))
+        assert_equal(T.number_of_edges(),
+                     len(G)-nx.number_connected_components(G))
+        assert_equal(self.weight(T.edges(data=True)),
+                     self.weight(nx.minimum_spanning_edges(G)))
+
+    def test_boruvka_maximum(self):
+        G=self.random
+        H=G.copy()
+        for u,v,d in H.edges(data=True):
+            d['weight']=-d['weight']
+        T=nx.boruvka_mst(G,maximum=True)
+        assert_equal(self.weight(T.edges(data=True)),
+                     -self.weight(nx.minimum_spanning_edges(H)))
+
+    def test_boruvka_parallel(self):
+        G=self.random
+        assert_equal(sorted(nx.boruvka_mst_edges(G,data=False,n_jobs=2)),
+                     sorted(nx.boruvka_mst_edges(G,data=False)))
+
+    def test_boruvka_stream(self):
+        G=self.random
+        edges=[(u,v,d['weight']) for u,v,d in G.edges(data=True)]
+        blocks=[list(zip(*edges[i:i+200])) for i in range(0,len(edges),200)]
+        u,v,w=nx.boruvka_mst_stream(blocks)
+        assert_equal(len(u),len(G)-nx.number_connected_components(G))
+        assert_equal(w.sum(),self.weight(nx.minimum_spanning_edges(G)))
+        u,v,w=nx.boruvka_mst_stream(blocks,maximum=True)
+        assert_equal(w.sum(),self.weight(nx.boruvka_mst_edges(G,
+                                                              maximum=True)))
+        u,v,w=nx.boruvka_mst_stream([])
+        assert_equal(len(u),0)
+
+    def test_boruvka_directed(self):
+        assert_raises(nx.NetworkXError,list,
+                      nx.boruvka_mst_edges(nx.DiGraph([(1,2)])))
@@ -2,4 +2,5 @@ from networkx.classes.graph import Graph
 from networkx.classes.digraph import DiGraph
 from networkx.classes.multigraph import MultiGraph
 from networkx.classes.multidigraph import MultiDiGraph
+from networkx.classes.csrgraph import CSRGraph, CSRDiGraph
 from networkx.classes.function import *
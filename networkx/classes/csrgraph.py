@@ -0,0 +1,849 @@
+"""Compact read-only graph classes backed by CSR arrays.
+
+CSRGraph and CSRDiGraph store the adjacency structure of a graph in
+compressed sparse row (CSR) form: an ``offsets`` array of length n+1, an
+``indices`` array holding the neighbor of every stored edge and an optional
+``weights`` array holding one numeric attribute per edge.  Node labels are
+kept in a list and mapped to the integer positions used in the arrays.
+
+The classes implement the read-only part of the Graph/DiGraph API, so
+most algorithms run on them unchanged while using a small fraction of the
+memory of the dict-of-dicts representation.  Any attempt to modify the
+graph raises NetworkXError.
+
+NumPy (http://scipy.org) is required for these classes.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from bisect import bisect_left
+from copy import deepcopy
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+import networkx as nx
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.exception import NetworkXError
+
+__all__ = ['CSRGraph', 'CSRDiGraph']
+
+
+def _read_only(*args, **kwds):
+    """Raise an error when trying to modify a CSR graph."""
+    raise NetworkXError("CSR graphs are read-only; "
+                        "use nx.Graph(G) or nx.DiGraph(G) for a mutable copy.")
+
+
+def _index_dtype(n, m):
+    """Return the smallest integer dtype able to index n nodes and m edges."""
+    import numpy as np
+    if max(n, m) < 2**31 - 1:
+        return np.int32
+    return np.int64
+
+
+def _csr_from_coo(n, rows, cols, weights=None, sum_duplicates=False):
+    """Return (offsets, indices, weights) CSR arrays from coordinate arrays.
+
+    Within each row the column indices are sorted.  Duplicate entries are
+    merged, keeping the first weight or summing them if sum_duplicates
+    is True.
+    """
+    import numpy as np
+    rows = np.asarray(rows)
+    cols = np.asarray(cols)
+    order = np.lexsort((cols, rows))
+    rows = rows[order]
+    cols = cols[order]
+    if weights is not None:
+        weights = np.asarray(weights)[order]
+    if len(rows) > 1:
+        keep = np.empty(len(rows), dtype=bool)
+        keep[0] = True
+        keep[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        if not keep.all():
+            if weights is not None:
+                if sum_duplicates:
+                    weights = np.add.reduceat(weights, np.flatnonzero(keep))
+                else:
+                    weights = weights[keep]
+            rows = rows[keep]
+            cols = cols[keep]
+    dtype = _index_dtype(n, len(cols))
+    offsets = np.zeros(n + 1, dtype=dtype)
+    if n > 0:
+        np.cumsum(np.bincount(rows, minlength=n), out=offsets[1:])
+    return offsets, cols.astype(dtype), weights
+
+
+def _transpose(n, offsets, indices, weights):
+    """Return the CSR arrays of the transposed adjacency structure."""
+    import numpy as np
+    rows = np.repeat(np.arange(n, dtype=indices.dtype), np.diff(offsets))
+    order = np.argsort(indices, kind='mergesort')
+    t_offsets = np.zeros(n + 1, dtype=offsets.dtype)
+    if n > 0:
+        np.cumsum(np.bincount(indices, minlength=n), out=t_offsets[1:])
+    t_weights = None if weights is None else weights[order]
+    return t_offsets, rows[order], t_weights
+
+
+class _EdgeColumn(object):
+    """Read-only view of an edge array indexed lazily.
+
+    Entries where mask is False read as 1, and position k of the view is
+    position order[k] of values.  Both are applied to the requested
+    positions only, so values, mask and order can stay memory mapped.
+    """
+    __slots__ = ('_values', '_mask', '_order')
+
+    def __init__(self, values, mask=None, order=None):
+        self._values = values
+        self._mask = mask
+        self._order = order
+
+    @property
+    def dtype(self):
+        return self._values.dtype
+
+    def __len__(self):
+        if self._order is not None:
+            return len(self._order)
+        return len(self._values)
+
+    def __getitem__(self, key):
+        import numpy as np
+        if self._order is not None:
+            key = self._order[key]
+        values = self._values[key]
+        if self._mask is None:
+            return values
+        present = self._mask[key]
+        if np.ndim(values) == 0:
+            return values if present else values.dtype.type(1)
+        return np.where(present, values, 1).astype(values.dtype)
+
+    def __array__(self, dtype=None, copy=None):
+        values = self[:]
+        if dtype is not None:
+            values = values.astype(dtype)
+        return values
+
+    def astype(self, dtype):
+        return self[:].astype(dtype)
+
+
+class _CSRAtlas(Mapping):
+    """Read-only mapping from the neighbors of one node to edge data.
+
+    The edge data dictionary is created on access and holds the weight
+    attribute only.  Changes to it are not stored in the graph.
+    """
+    __slots__ = ('_graph', '_indices', '_weights', '_start', '_stop')
+
+    def __init__(self, graph, indices, weights, start, stop):
+        self._graph = graph
+        self._indices = indices
+        self._weights = weights
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __iter__(self):
+        nodes = self._graph._nodes
+        return (nodes[j] for j in
+                self._indices[self._start:self._stop].tolist())
+
+    def _find(self, nbr):
+        try:
+            j = self._graph._index[nbr]
+        except (KeyError, TypeError):
+            return None
+        pos = bisect_left(self._indices, j, self._start, self._stop)
+        if pos < self._stop and self._indices[pos] == j:
+            return pos
+        return None
+
+    def __contains__(self, nbr):
+        return self._find(nbr) is not None
+
+    def __getitem__(self, nbr):
+        pos = self._find(nbr)
+        if pos is None:
+            raise KeyError(nbr)
+        if self._weights is None:
+            return {}
+        return {self._graph._weight: self._weights[pos].item()}
+
+    def items(self):
+        nodes = self._graph._nodes
+        nbrs = self._indices[self._start:self._stop].tolist()
+        if self._weights is None:
+            return [(nodes[j], {}) for j in nbrs]
+        key = self._graph._weight
+        wts = self._weights[self._start:self._stop].tolist()
+        return [(nodes[j], {key: w}) for j, w in zip(nbrs, wts)]
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _CSRAdjacency(Mapping):
+    """Read-only mapping from nodes to their neighbor mappings."""
+    __slots__ = ('_graph', '_offsets', '_indices', '_weights')
+
+    def __init__(self, graph, offsets, indices, weights):
+        self._graph = graph
+        self._offsets = offsets
+        self._indices = indices
+        self._weights = weights
+
+    def __len__(self):
+        return len(self._graph._nodes)
+
+    def __iter__(self):
+        return iter(self._graph._nodes)
+
+    def __contains__(self, n):
+        try:
+            return n in self._graph._index
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        i = self._graph._index[n]
+        return _CSRAtlas(self._graph, self._indices, self._weights,
+                         int(self._offsets[i]), int(self._offsets[i + 1]))
+
+    def __repr__(self):
+        return repr(dict((n, dict(nbrs.items())) for n, nbrs in self.items()))
+
+
+class _CSRNodes(Mapping):
+    """Read-only mapping from nodes to (empty) node attribute dicts."""
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __len__(self):
+        return len(self._graph._nodes)
+
+    def __iter__(self):
+        return iter(self._graph._nodes)
+
+    def __contains__(self, n):
+        try:
+            return n in self._graph._index
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        if n not in self:
+            raise KeyError(n)
+        return {}
+
+
+class CSRGraph(Graph):
+    """
+    Read-only undirected graph stored in compressed sparse row form.
+
+    Each undirected edge u-v is stored twice, once in the row of u and
+    once in the row of v; self-loops are stored once.  A single numeric
+    edge attribute (the weight) can be kept per edge.  Node attributes are
+    not stored.
+
+    Parameters
+    ----------
+    data : input graph
+        Data to initialize graph.  If data=None (default) an empty
+        graph is created.  The data can be any NetworkX graph or any
+        input accepted by to_networkx_graph().
+    nodelist : list, optional
+        The node order used for the integer positions in the arrays.
+        If None, the order of data.nodes() is used.
+    weight : string or None, optional (default='weight')
+        The edge attribute holding the numerical value stored in the
+        weights array.  Edges without the attribute get weight 1.
+        If None, no weights are stored and edge data dicts are empty.
+    dtype : NumPy data type, optional
+        The data type of the weights array.  If None it is inferred.
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    Attributes
+    ----------
+    offsets : NumPy array
+        The neighbors of the node at position i are
+        indices[offsets[i]:offsets[i+1]].
+    indices : NumPy array
+        Neighbor positions of all stored edges, sorted within each row.
+    weights : NumPy array or None
+        Edge weights aligned with indices.
+    nodelist : list
+        Node labels in array order.
+
+    See Also
+    --------
+    CSRDiGraph
+    Graph
+
+    Notes
+    -----
+    Multigraph input is collapsed into a simple graph, summing the weights
+    of parallel edges.
+
+    G[u] returns a read-only mapping; G[u][v] returns a new dict each time
+    it is accessed so assigning to it has no effect on the graph.
+
+    Examples
+    --------
+    >>> G = nx.CSRGraph(nx.path_graph(4))
+    >>> sorted(G.neighbors(1))
+    [0, 2]
+    >>> nx.single_source_shortest_path_length(G, 0)
+    {0: 0, 1: 1, 2: 2, 3: 3}
+    >>> nx.is_frozen(G)
+    True
+    """
+    frozen = True
+
+    def __init__(self, data=None, nodelist=None, weight='weight',
+                 dtype=None, **attr):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("CSRGraph requires numpy: http://scipy.org/ ")
+        self.graph = {}
+        if data is None:
+            data = nx.Graph()
+        elif not isinstance(data, Graph):
+            create_using = nx.DiGraph() if self.is_directed() else nx.Graph()
+            data = nx.to_networkx_graph(data, create_using=create_using)
+        if nodelist is None:
+            nodelist = data.nodes()
+        index = dict(zip(nodelist, range(len(nodelist))))
+        if len(index) != len(nodelist):
+            raise NetworkXError("nodelist contains duplicates.")
+        symmetric = not (self.is_directed() and data.is_directed())
+        rows = []
+        cols = []
+        wts = [] if weight is not None else None
+        for u, v, d in data.edges_iter(nodelist, data=True):
+            try:
+                i, j = index[u], index[v]
+            except KeyError:
+                continue
+            rows.append(i)
+            cols.append(j)
+            if wts is not None:
+                wts.append(d.get(weight, 1))
+            if symmetric and i != j:
+                rows.append(j)
+                cols.append(i)
+                if wts is not None:
+                    wts.append(d.get(weight, 1))
+        n = len(nodelist)
+        dt = _index_dtype(n, len(rows))
+        rows = np.array(rows, dtype=dt)
+        cols = np.array(cols, dtype=dt)
+        if wts is not None:
+            wts = np.array(wts, dtype=dtype)
+        offsets, indices, wts = _csr_from_coo(n, rows, cols, wts,
+                                              data.is_multigraph())
+        self.graph.update(data.graph)
+        self.graph.update(attr)
+        self._setup(list(nodelist), offsets, indices, wts, weight)
+
+    @classmethod
+    def from_csr_arrays(cls, offsets, indices, weights=None, nodelist=None,
+                        weight='weight', validate=True, transposed=None,
+                        weight_mask=None, in_order=None, **attr):
+        """Return a CSR graph built directly from CSR arrays.
+
+        Parameters
+        ----------
+        offsets : array_like
+            Row offsets of length n+1.
+        indices : array_like
+            Neighbor positions, of length offsets[-1].
+        weights : array_like, optional
+            Edge weights aligned with indices.
+        nodelist : list, optional
+            Node labels in array order.  If None, nodes are 0..n-1.
+        weight : string, optional (default='weight')
+            The edge attribute name reported for the weights.
+        validate : bool, optional (default=True)
+            If False, trust that the indices are in range and sorted
+            within each row instead of checking them, which avoids
+            reading the whole indices array.
+        transposed : tuple of arrays, optional
+            For CSRDiGraph, the (in_offsets, in_indices, in_weights)
+            arrays of the predecessors if they are already known.
+            Otherwise they are computed.
+        weight_mask : array_like of bools, optional
+            Flags aligned with indices; edges whose flag is False get
+            weight 1.
+        in_order : array_like, optional
+            For CSRDiGraph with transposed given, the position in indices
+            of every edge of in_indices.  If given, in_weights is ignored
+            and the weights of the predecessors are read from weights
+            through in_order.
+        attr : keyword arguments, optional
+            Attributes to add to graph as key=value pairs.
+
+        Notes
+        -----
+        For CSRGraph the arrays must be symmetric (every edge u-v stored
+        in both rows); this is not checked.  Rows whose indices are not
+        sorted are sorted.  The arrays are used without copying when
+        possible, so they may be NumPy memory maps.  weight_mask and
+        in_order are applied to the weights of one row at a time, so
+        they do not copy the weights either.
+        """
+        import numpy as np
+        offsets = np.asarray(offsets)
+        indices = np.asarray(indices)
+        n = len(offsets) - 1
+        if n < 0 or offsets[0] != 0 or offsets[-1] != len(indices):
+            raise NetworkXError("offsets do not match the indices array.")
+        if weights is not None:
+            weights = np.asarray(weights)
+            if len(weights) != len(indices):
+                raise NetworkXError("weights and indices differ in length.")
+            if weight_mask is not None:
+                weight_mask = np.asarray(weight_mask)
+                if len(weight_mask) != len(indices):
+                    raise NetworkXError("weight_mask and indices differ "
+                                        "in length.")
+            if transposed is not None and in_order is not None:
+                in_order = np.asarray(in_order)
+                if len(in_order) != len(indices):
+                    raise NetworkXError("in_order and indices differ "
+                                        "in length.")
+                transposed = tuple(transposed[:2]) + (
+                    _EdgeColumn(weights, weight_mask, in_order),)
+            if weight_mask is not None:
+                weights = _EdgeColumn(weights, weight_mask)
+        if nodelist is None:
+            nodelist = list(range(n))
+        elif len(nodelist) != n:
+            raise NetworkXError("nodelist and offsets do not match.")
+        if validate:
+            if len(indices) > 0 and (indices.min() < 0 or
+                                     indices.max() >= n):
+                raise NetworkXError("indices out of range.")
+            rows = np.repeat(np.arange(n), np.diff(offsets))
+            if len(indices) > 1:
+                unsorted = ((rows[1:] == rows[:-1]) &
+                            (indices[1:] < indices[:-1]))
+                if unsorted.any():
+                    offsets, indices, weights = _csr_from_coo(n, rows,
+                                                              indices, weights)
+                    transposed = None
+        G = cls.__new__(cls)
+        G.graph = {}
+        G.graph.update(attr)
+        G._setup(list(nodelist), offsets, indices, weights,
+                 weight if weights is not None else None, transposed)
+        return G
+
+    @classmethod
+    def from_edge_arrays(cls, sources, targets, weights=None, nodelist=None,
+                         weight='weight', **attr):
+        """Return a CSR graph built from arrays of edge endpoints.
+
+        Parameters
+        ----------
+        sources, targets : array_like
+            Integer positions of the edge endpoints.
+        weights : array_like, optional
+            Edge weights aligned with sources and targets.
+        nodelist : list, optional
+            Node labels in array order.  If None, nodes are
+            0..max(sources, targets).
+        weight : string, optional (default='weight')
+            The edge attribute name reported for the weights.
+        attr : keyword arguments, optional
+            Attributes to add to graph as key=value pairs.
+
+        Notes
+        -----
+        For CSRGraph each edge is stored in both directions.  Duplicate
+        edges are merged and their weights summed.
+        """
+        import numpy as np
+        sources = np.asarray(sources)
+        targets = np.asarray(targets)
+        if len(sources) != len(targets):
+            raise NetworkXError("sources and targets differ in length.")
+        if weights is not None:
+            weights = np.asarray(weights)
+            if len(weights) != len(sources):
+                raise NetworkXError("weights and sources differ in length.")
+        if nodelist is None:
+            n = 0
+            if len(sources) > 0:
+                n = int(max(sources.max(), targets.max())) + 1
+            nodelist = list(range(n))
+        n = len(nodelist)
+        if len(sources) > 0 and (min(sources.min(), targets.min()) < 0 or
+                                 max(sources.max(), targets.max()) >= n):
+            raise NetworkXError("edge endpoints out of range.")
+        if not issubclass(cls, DiGraph):
+            loop = sources == targets
+            sources, targets = (np.concatenate((sources, targets[~loop])),
+                                np.concatenate((targets, sources[~loop])))
+            if weights is not None:
+                weights = np.concatenate((weights, weights[~loop]))
+        offsets, indices, weights = _csr_from_coo(n, sources, targets,
+                                                  weights, True)
+        G = cls.__new__(cls)
+        G.graph = {}
+        G.graph.update(attr)
+        G._setup(list(nodelist), offsets, indices, weights,
+                 weight if weights is not None else None)
+        return G
+
+    def _setup(self, nodelist, offsets, indices, weights, weight,
+               transposed=None):
+        """Attach the arrays and the dict-like views to the graph."""
+        self._nodes = nodelist
+        self._index = dict(zip(nodelist, range(len(nodelist))))
+        self._weight = weight
+        self.offsets = offsets
+        self.indices = indices
+        self.weights = weights
+        self.adj = _CSRAdjacency(self, offsets, indices, weights)
+        self.edge = self.adj
+        self.node = _CSRNodes(self)
+
+    def _new(self, nodelist, offsets, indices, weights, graph):
+        """Return a graph of the same class sharing the given arrays."""
+        H = self.__class__.__new__(self.__class__)
+        H.graph = graph
+        H._setup(nodelist, offsets, indices, weights, self._weight)
+        return H
+
+    @property
+    def nodelist(self):
+        return self._nodes
+
+    add_node = _read_only
+    add_nodes_from = _read_only
+    remove_node = _read_only
+    remove_nodes_from = _read_only
+    add_edge = _read_only
+    add_edges_from = _read_only
+    add_weighted_edges_from = _read_only
+    remove_edge = _read_only
+    remove_edges_from = _read_only
+    add_star = _read_only
+    add_path = _read_only
+    add_cycle = _read_only
+    clear = _read_only
+
+    def nodes_iter(self, data=False):
+        if data:
+            return ((n, {}) for n in self._nodes)
+        return iter(self._nodes)
+
+    def neighbors_iter(self, n):
+        try:
+            i = self._index[n]
+        except (KeyError, TypeError):
+            raise NetworkXError("The node %s is not in the graph."%(n,))
+        nodes = self._nodes
+        return (nodes[j] for j in
+                self.indices[self.offsets[i]:self.offsets[i+1]].tolist())
+
+    def neighbors(self, n):
+        return list(self.neighbors_iter(n))
+
+    def has_edge(self, u, v):
+        try:
+            return v in self.adj[u]
+        except (KeyError, TypeError):
+            return False
+
+    def _bunch_positions(self, nbunch):
+        """Return a list of array positions of the nodes in nbunch."""
+        if nbunch is None:
+            return range(len(self._nodes))
+        index = self._index
+        return [index[n] for n in self.nbunch_iter(nbunch)]
+
+    def edges_iter(self, nbunch=None, data=False):
+        nodes = self._nodes
+        offsets = self.offsets
+        indices = self.indices
+        weights = self.weights if data else None
+        key = self._weight
+        seen = set()
+        for i in self._bunch_positions(nbunch):
+            start = int(offsets[i])
+            stop = int(offsets[i+1])
+            if nbunch is None:
+                # rows are visited in order; skip edges to earlier rows
+                start = bisect_left(indices, i, start, stop)
+            u = nodes[i]
+            nbrs = indices[start:stop].tolist()
+            if weights is not None:
+                edges = zip(nbrs, ({key: w} for w in
+                                   weights[start:stop].tolist()))
+            else:
+                edges = ((j, {}) for j in nbrs)
+            for j, d in edges:
+                if j in seen:
+                    continue
+                if data:
+                    yield (u, nodes[j], d)
+                else:
+                    yield (u, nodes[j])
+            if nbunch is not None:
+                seen.add(i)
+
+    def _degrees(self, offsets, indices, weights, weight):
+        """Return an array of (weighted) row sums, counting self-loops
+        twice for undirected graphs."""
+        import numpy as np
+        n = len(self._nodes)
+        rows = np.repeat(np.arange(n), np.diff(offsets))
+        if weight is None or weight != self._weight or weights is None:
+            deg = np.diff(offsets)
+            w = None
+        else:
+            deg = np.bincount(rows, weights=weights, minlength=n)
+            w = weights
+        if not self.is_directed():
+            loops = rows == indices
+            if loops.any():
+                deg = deg + np.bincount(rows[loops], minlength=n,
+                                        weights=None if w is None
+                                        else w[loops]).astype(deg.dtype)
+        return deg
+
+    def _row_degree(self, i, offsets, indices, weights, weight):
+        """Return the (weighted) degree of the row at position i."""
+        start = int(offsets[i])
+        stop = int(offsets[i+1])
+        pos = None
+        if not self.is_directed():
+            pos = bisect_left(indices, i, start, stop)
+            if pos == stop or indices[pos] != i:
+                pos = None
+        if weight is None or weight != self._weight or weights is None:
+            return stop - start + (pos is not None)
+        deg = weights[start:stop].sum().item()
+        if pos is not None:
+            deg += weights[pos].item()
+        return deg
+
+    def degree_iter(self, nbunch=None, weight=None):
+        nodes = self._nodes
+        if nbunch is None:
+            deg = self._degrees(self.offsets, self.indices, self.weights,
+                                weight)
+            return zip(nodes, deg.tolist())
+        return ((nodes[i], self._row_degree(i, self.offsets, self.indices,
+                                            self.weights, weight))
+                for i in self._bunch_positions(nbunch))
+
+    def copy(self):
+        """Return a copy of the graph sharing the (read-only) arrays."""
+        return self._new(self._nodes, self.offsets, self.indices,
+                         self.weights, deepcopy(self.graph))
+
+    def subgraph(self, nbunch):
+        """Return the CSR subgraph induced on nodes in nbunch.
+
+        The nodes keep their relative order in the arrays.  The graph
+        attribute dict is shared with the original graph.
+        """
+        import numpy as np
+        n = len(self._nodes)
+        keep = np.zeros(n, dtype=bool)
+        keep[self._bunch_positions(nbunch)] = True
+        kept = np.flatnonzero(keep)
+        newpos = np.zeros(n, dtype=self.indices.dtype)
+        newpos[kept] = np.arange(len(kept), dtype=self.indices.dtype)
+        rows = np.repeat(np.arange(n), np.diff(self.offsets))
+        mask = keep[rows] & keep[self.indices]
+        rows = newpos[rows[mask]]
+        indices = newpos[self.indices[mask]]
+        weights = None if self.weights is None else self.weights[mask]
+        offsets = np.zeros(len(kept) + 1, dtype=self.offsets.dtype)
+        np.cumsum(np.bincount(rows, minlength=len(kept)), out=offsets[1:])
+        nodes = self._nodes
+        return self._new([nodes[i] for i in kept.tolist()], offsets,
+                         indices, weights, self.graph)
+
+    def to_directed(self):
+        """Return a CSRDiGraph with both directions of each edge.
+
+        The arrays are shared with this graph.
+        """
+        H = CSRDiGraph.__new__(CSRDiGraph)
+        H.graph = deepcopy(self.graph)
+        H._setup(self._nodes, self.offsets, self.indices, self.weights,
+                 self._weight)
+        return H
+
+    def to_undirected(self):
+        """Return a copy of the graph sharing the (read-only) arrays."""
+        return self.copy()
+
+
+class CSRDiGraph(CSRGraph, DiGraph):
+    """
+    Read-only directed graph stored in compressed sparse row form.
+
+    The successors are stored in CSR form (offsets, indices, weights)
+    and the predecessors in the transposed arrays (in_offsets,
+    in_indices, in_weights).  See CSRGraph for the parameters.
+
+    See Also
+    --------
+    CSRGraph
+    DiGraph
+
+    Examples
+    --------
+    >>> G = nx.CSRDiGraph(nx.DiGraph([(0, 1), (1, 2)]))
+    >>> G.successors(1), G.predecessors(1)
+    ([2], [0])
+    """
+    def _setup(self, nodelist, offsets, indices, weights, weight,
+               transposed=None):
+        super(CSRDiGraph, self)._setup(nodelist, offsets, indices,
+                                       weights, weight)
+        if transposed is None:
+            transposed = _transpose(len(nodelist), offsets, indices, weights)
+        self.in_offsets, self.in_indices, self.in_weights = transposed
+        self.succ = self.adj
+        self.pred = _CSRAdjacency(self, self.in_offsets, self.in_indices,
+                                  self.in_weights)
+
+    successors_iter = CSRGraph.neighbors_iter
+    successors = CSRGraph.neighbors
+
+    def predecessors_iter(self, n):
+        try:
+            i = self._index[n]
+        except (KeyError, TypeError):
+            raise NetworkXError("The node %s is not in the digraph."%(n,))
+        nodes = self._nodes
+        return (nodes[j] for j in self.in_indices[
+                self.in_offsets[i]:self.in_offsets[i+1]].tolist())
+
+    def predecessors(self, n):
+        return list(self.predecessors_iter(n))
+
+    def _edges(self, offsets, indices, weights, nbunch, data, reverse):
+        nodes = self._nodes
+        key = self._weight
+        for i in self._bunch_positions(nbunch):
+            start = int(offsets[i])
+            stop = int(offsets[i+1])
+            u = nodes[i]
+            nbrs = indices[start:stop].tolist()
+            if data and weights is not None:
+                wts = weights[start:stop].tolist()
+                edges = ((nodes[j], {key: w}) for j, w in zip(nbrs, wts))
+            elif data:
+                edges = ((nodes[j], {}) for j in nbrs)
+            else:
+                edges = ((nodes[j],) for j in nbrs)
+            for e in edges:
+                if reverse:
+                    yield (e[0], u) + e[1:]
+                else:
+                    yield (u,) + e
+
+    def edges_iter(self, nbunch=None, data=False):
+        return self._edges(self.offsets, self.indices, self.weights,
+                           nbunch, data, False)
+
+    out_edges_iter = edges_iter
+
+    def in_edges_iter(self, nbunch=None, data=False):
+        return self._edges(self.in_offsets, self.in_indices, self.in_weights,
+                           nbunch, data, True)
+
+    def in_degree_iter(self, nbunch=None, weight=None):
+        args = (self.in_offsets, self.in_indices, self.in_weights, weight)
+        nodes = self._nodes
+        if nbunch is None:
+            return zip(nodes, self._degrees(*args).tolist())
+        return ((nodes[i], self._row_degree(i, *args))
+                for i in self._bunch_positions(nbunch))
+
+    def out_degree_iter(self, nbunch=None, weight=None):
+        args = (self.offsets, self.indices, self.weights, weight)
+        nodes = self._nodes
+        if nbunch is None:
+            return zip(nodes, self._degrees(*args).tolist())
+        return ((nodes[i], self._row_degree(i, *args))
+                for i in self._bunch_positions(nbunch))
+
+    def degree_iter(self, nbunch=None, weight=None):
+        if nbunch is not None:
+            nbunch = list(self.nbunch_iter(nbunch))
+        return ((u, din + dout) for (u, din), (v, dout) in
+                zip(self.in_degree_iter(nbunch, weight),
+                    self.out_degree_iter(nbunch, weight)))
+
+    def to_directed(self):
+        """Return a copy of the graph sharing the (read-only) arrays."""
+        return self.copy()
+
+    def to_undirected(self, reciprocal=False):
+        """Return a CSRGraph with the edges of this graph.
+
+        If reciprocal is True, keep only edges that appear in both
+        directions.  If both u->v and v->u exist the weight of u->v is
+        kept for the edge with u before v in the node order.
+        """
+        import numpy as np
+        n = len(self._nodes)
+        rows = np.repeat(np.arange(n, dtype=self.indices.dtype),
+                         np.diff(self.offsets))
+        cols = self.indices
+        weights = self.weights
+        if reciprocal:
+            key = rows.astype(np.int64) * n + cols
+            rkey = cols.astype(np.int64) * n + rows
+            mask = np.zeros(len(key), dtype=bool)
+            if len(key) > 0:
+                pos = np.searchsorted(key, rkey)
+                pos[pos == len(key)] = 0
+                mask = key[pos] == rkey
+            rows, cols = rows[mask], cols[mask]
+            if weights is not None:
+                weights = weights[mask]
+        loop = rows == cols
+        r = np.concatenate((rows, cols[~loop]))
+        c = np.concatenate((cols, rows[~loop]))
+        if weights is not None:
+            weights = np.concatenate((weights, weights[~loop]))
+        offsets, indices, weights = _csr_from_coo(n, r, c, weights)
+        H = CSRGraph.__new__(CSRGraph)
+        H.graph = deepcopy(self.graph)
+        H._setup(self._nodes, offsets, indices, weights, self._weight)
+        return H
+
+    def reverse(self, copy=True):
+        """Return a CSRDiGraph with the directions of the edges reversed.
+
+        The arrays are shared with this graph; copy is ignored since
+        the graph cannot be modified.
+        """
+        return self._new(self._nodes, self.in_offsets, self.in_indices,
+                         self.in_weights, deepcopy(self.graph))
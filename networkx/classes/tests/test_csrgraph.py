@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+from nose.tools import *
+from nose import SkipTest
+import networkx as nx
+
+
+class TestCSRGraph(object):
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, weight=2)
+        G.add_edge(1, 2, weight=3)
+        G.add_edge(2, 0)
+        G.add_edge(2, 3, weight=4)
+        G.add_edge(3, 3, weight=5)
+        G.add_node(4)
+        self.G = G
+        self.C = nx.CSRGraph(G)
+
+    def test_nodes(self):
+        C = self.C
+        assert_equal(sorted(C), [0, 1, 2, 3, 4])
+        assert_equal(len(C), 5)
+        assert_true(3 in C)
+        assert_false(5 in C)
+        assert_false([] in C)
+        assert_equal(sorted(C.nodes(data=True))[0], (0, {}))
+
+    def test_adjacency(self):
+        C = self.C
+        assert_equal(dict(C[1].items()), {0: {'weight': 2}, 2: {'weight': 3}})
+        assert_equal(C[2][0], {'weight': 1})
+        assert_true(C.has_edge(3, 2))
+        assert_false(C.has_edge(0, 3))
+        assert_false(C.has_edge(0, 'x'))
+        assert_equal(C.get_edge_data(0, 4, default=0), 0)
+        assert_equal(sorted(C.neighbors(2)), [0, 1, 3])
+        assert_equal(list(C.neighbors_iter(4)), [])
+        assert_raises(nx.NetworkXError, C.neighbors, 7)
+
+    def test_edges(self):
+        C = self.C
+        assert_equal(sorted(C.edges()), sorted(self.G.edges()))
+        assert_equal(sorted(C.edges(data=True)),
+                     [(0, 1, {'weight': 2}), (0, 2, {'weight': 1}),
+                      (1, 2, {'weight': 3}), (2, 3, {'weight': 4}),
+                      (3, 3, {'weight': 5})])
+        assert_equal(sorted(C.edges([1, 2])), [(1, 0), (1, 2), (2, 0), (2, 3)])
+        assert_equal(C.number_of_edges(), 5)
+        assert_equal(C.size(weight='weight'), 15.0)
+
+    def test_degree(self):
+        C = self.C
+        assert_equal(C.degree(), self.G.degree())
+        assert_equal(C.degree(3), 3)
+        assert_equal(C.degree(weight='weight'),
+                     self.G.degree(weight='weight'))
+        assert_equal(C.degree([2, 3], weight='weight'), {2: 8, 3: 14})
+        assert_equal(C.degree(weight='other'), C.degree())
+
+    def test_selfloops(self):
+        C = self.C
+        assert_equal(C.nodes_with_selfloops(), [3])
+        assert_equal(C.number_of_selfloops(), 1)
+
+    def test_read_only(self):
+        C = self.C
+        assert_true(nx.is_frozen(C))
+        assert_raises(nx.NetworkXError, C.add_edge, 0, 3)
+        assert_raises(nx.NetworkXError, C.add_node, 5)
+        assert_raises(nx.NetworkXError, C.remove_node, 0)
+        assert_raises(nx.NetworkXError, C.clear)
+
+    def test_subgraph(self):
+        H = self.C.subgraph([0, 1, 3])
+        assert_true(isinstance(H, nx.CSRGraph))
+        assert_equal(sorted(H), [0, 1, 3])
+        assert_equal(sorted(H.edges(data=True)),
+                     [(0, 1, {'weight': 2}), (3, 3, {'weight': 5})])
+
+    def test_algorithms(self):
+        G = nx.karate_club_graph()
+        G.add_path([100, 101, 102])
+        C = nx.CSRGraph(G)
+        assert_equal(nx.single_source_shortest_path_length(C, 0),
+                     nx.single_source_shortest_path_length(G, 0))
+        assert_equal(sorted(map(sorted, nx.connected_components(C))),
+                     sorted(map(sorted, nx.connected_components(G))))
+        assert_equal(nx.Graph(C).edges(), G.edges())
+
+    def test_unweighted(self):
+        C = nx.CSRGraph(self.G, weight=None)
+        assert_true(C.weights is None)
+        assert_equal(C[0][1], {})
+        assert_equal(sorted(C.edges(data=True))[0], (0, 1, {}))
+
+    def test_nodelist(self):
+        C = nx.CSRGraph(self.G, nodelist=[4, 3, 2, 1, 0])
+        assert_equal(C.nodelist, [4, 3, 2, 1, 0])
+        assert_equal(list(C.offsets), [0, 0, 2, 5, 7, 9])
+        assert_equal(sorted(C.edges()), sorted((v, u) for u, v in
+                                               self.G.edges()))
+        assert_raises(nx.NetworkXError, nx.CSRGraph, self.G, [0, 0])
+
+    def test_multigraph(self):
+        G = nx.MultiGraph([(0, 1), (0, 1), (1, 2)])
+        C = nx.CSRGraph(G)
+        assert_equal(C[0][1], {'weight': 2})
+        assert_equal(C.number_of_edges(), 2)
+
+    def test_from_edge_arrays(self):
+        C = nx.CSRGraph.from_edge_arrays([0, 1, 1], [1, 2, 2], [1, 2, 3],
+                                         nodelist=['a', 'b', 'c', 'd'])
+        assert_equal(sorted(C), ['a', 'b', 'c', 'd'])
+        assert_equal(C['b']['c'], {'weight': 5})
+        assert_false(C.has_edge('c', 'a'))
+        assert_raises(nx.NetworkXError, nx.CSRGraph.from_edge_arrays,
+                      [0], [4], nodelist=[0, 1])
+
+    def test_from_csr_arrays(self):
+        C = nx.CSRGraph.from_csr_arrays([0, 1, 3, 4], [1, 2, 0, 1])
+        assert_equal(sorted(C.edges()), [(0, 1), (1, 2)])
+        assert_raises(nx.NetworkXError, nx.CSRGraph.from_csr_arrays,
+                      [0, 1, 3], [1, 2, 0, 1])
+
+    def test_to_directed(self):
+        D = self.C.to_directed()
+        assert_true(isinstance(D, nx.CSRDiGraph))
+        assert_equal(sorted(D.edges()), sorted(self.G.to_directed().edges()))
+
+
+class TestCSRDiGraph(object):
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G = nx.DiGraph()
+        G.add_edge(0, 1, weight=2)
+        G.add_edge(1, 0, weight=3)
+        G.add_edge(1, 2, weight=1)
+        G.add_edge(2, 2, weight=4)
+        G.add_edge(3, 1, weight=5)
+        self.G = G
+        self.C = nx.CSRDiGraph(G)
+
+    def test_edges(self):
+        C = self.C
+        assert_true(C.is_directed())
+        assert_equal(sorted(C.edges(data=True)),
+                     sorted(self.G.edges(data=True)))
+        assert_equal(sorted(C.in_edges(data=True)),
+                     sorted(self.G.in_edges(data=True)))
+        assert_equal(sorted(C.in_edges(1)), [(0, 1), (3, 1)])
+        assert_equal(sorted(C.successors(1)), [0, 2])
+        assert_equal(sorted(C.predecessors(1)), [0, 3])
+        assert_equal(sorted(C.pred[1]), [0, 3])
+        assert_raises(nx.NetworkXError, C.predecessors, 7)
+
+    def test_degree(self):
+        C = self.C
+        G = self.G
+        assert_equal(C.degree(), G.degree())
+        assert_equal(C.in_degree(), G.in_degree())
+        assert_equal(C.out_degree(weight='weight'),
+                     G.out_degree(weight='weight'))
+        assert_equal(C.degree(2, weight='weight'), 9)
+
+    def test_conversions(self):
+        C = self.C
+        G = self.G
+        assert_equal(sorted(C.reverse().edges()), sorted(G.reverse().edges()))
+        U = C.to_undirected()
+        assert_true(isinstance(U, nx.CSRGraph))
+        assert_false(U.is_directed())
+        assert_equal(sorted(U.edges()), sorted(G.to_undirected().edges()))
+        R = C.to_undirected(reciprocal=True)
+        assert_equal(sorted(R.edges()), [(0, 1), (2, 2)])
+        H = C.subgraph([0, 1])
+        assert_equal(sorted(H.edges()), [(0, 1), (1, 0)])
+        assert_equal(sorted(H.in_edges(0)), [(1, 0)])
+
+    def test_algorithms(self):
+        G = nx.gnp_random_graph(30, 0.1, seed=42, directed=True)
+        C = nx.CSRDiGraph(G)
+        assert_equal(sorted(map(sorted, nx.strongly_connected_components(C))),
+                     sorted(map(sorted, nx.strongly_connected_components(G))))
+        assert_equal(nx.single_source_shortest_path_length(C, 0),
+                     nx.single_source_shortest_path_length(G, 0))
+
+    def test_from_edge_arrays(self):
+        C = nx.CSRDiGraph.from_edge_arrays([0, 1], [1, 2])
+        assert_equal(sorted(C.edges()), [(0, 1), (1, 2)])
+        assert_equal(C.in_degree(), {0: 0, 1: 1, 2: 1})
+
+    def test_from_csr_arrays_mask_order(self):
+        C = self.C
+        mask = numpy.array([True, False, True, True, False])
+        in_order = numpy.argsort(C.indices, kind='mergesort')
+        D = nx.CSRDiGraph.from_csr_arrays(C.offsets, C.indices, C.weights,
+                                          transposed=(C.in_offsets,
+                                                      C.in_indices, None),
+                                          weight_mask=mask, in_order=in_order)
+        G = self.G.copy()
+        del G[1][0]['weight']
+        del G[3][1]['weight']
+        E = nx.CSRDiGraph(G)
+        assert_equal(sorted(D.edges(data=True)), sorted(E.edges(data=True)))
+        assert_equal(sorted(D.in_edges(data=True)),
+                     sorted(E.in_edges(data=True)))
+        assert_equal(D.pred[1][3], {'weight': 1})
+        assert_equal(D.in_degree(weight='weight'),
+                     E.in_degree(weight='weight'))
+        assert_equal(D.in_degree(1, weight='weight'), 3)
+        assert_equal(D.out_degree(weight='weight'),
+                     E.out_degree(weight='weight'))
+        assert_equal(sorted(D.subgraph([0, 1]).edges(data=True)),
+                     sorted(E.subgraph([0, 1]).edges(data=True)))
+        assert_raises(nx.NetworkXError, nx.CSRDiGraph.from_csr_arrays,
+                      C.offsets, C.indices, C.weights, weight_mask=mask[:2])
@@ -164,7 +164,10 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
                                 fixed=None,
                                 iterations=50,
                                 weight='weight',
-                                scale=1.0):
+                                scale=1.0,
+                                method=None,
+                                theta=0.9,
+                                multilevel=False):
     """Position nodes using Fruchterman-Reingold force-directed algorithm. 
 
     Parameters
@@ -199,6 +202,24 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
         Scale factor for positions. The nodes are positioned 
         in a box of size [0,scale] x [0,scale].  
 
+    method : string or None  optional (default=None)
+        If None, the repulsive forces between all pairs of nodes are
+        computed exactly, which takes O(n^2) time and memory per
+        iteration.  If 'barnes_hut', the repulsion from far away groups
+        of nodes is approximated by their center of mass in a quadtree
+        (octree in 3d), which takes O(n log n) time, and the attraction
+        is computed from the edge list.  Requires scipy.
+
+    theta : float  optional (default=0.9)
+       Accuracy of the 'barnes_hut' method.  A group of nodes is
+       approximated when its width is less than theta times its
+       distance.  Smaller values are slower and more accurate.
+
+    multilevel : bool  optional (default=False)
+       If True and method is 'barnes_hut', lay out a sequence of coarser
+       graphs built by merging matched pairs of nodes, and use each
+       layout as starting point for the next finer graph.  This gives
+       better layouts of large graphs for the same number of iterations.
 
     Returns
     -------
@@ -212,11 +233,17 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
 
     # The same using longer function name
     >>> pos=nx.fruchterman_reingold_layout(G)
+
+    # Large graphs
+    >>> G=nx.grid_2d_graph(30,30)
+    >>> pos=nx.spring_layout(G,method='barnes_hut',multilevel=True)
     """
     try:
         import numpy as np
     except ImportError:
         raise ImportError("fruchterman_reingold_layout() requires numpy: http://scipy.org/ ")
+    if method not in (None, 'barnes_hut'):
+        raise nx.NetworkXError("Unknown layout method %s" % method)
     if fixed is not None:
         nfixed=dict(zip(G,range(len(G))))
         fixed=np.asarray([nfixed[v] for v in fixed])
@@ -234,6 +261,21 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
     if len(G)==1:
         return {G.nodes()[0]:(1,)*dim}
 
+    if method == 'barnes_hut':
+        A=nx.to_scipy_sparse_matrix(G,weight=weight,dtype='f')
+        if multilevel:
+            if fixed is not None:
+                raise nx.NetworkXError(
+                    "multilevel layout does not support fixed nodes")
+            pos=_multilevel_fruchterman_reingold(A,dim,k,pos_arr,
+                                                 iterations,theta)
+        else:
+            pos=_barnes_hut_fruchterman_reingold(A,dim,k,pos_arr,fixed,
+                                                 iterations,theta)
+        if fixed is None:
+            pos=_rescale_layout(pos,scale=scale)
+        return dict(zip(G,pos))
+
     try:
         # Sparse matrix
         if len(G) < 500:  # sparse solver for large graphs
@@ -385,6 +427,244 @@ def _sparse_fruchterman_reingold(A, dim=2, k=None, pos=None, fixed=None,
     return pos
 
 
+def _barnes_hut_repulsion(pos, k, theta, block=10000):
+    # Repulsive displacement k*k/distance**2 on every node, with the
+    # contribution of far away groups of nodes approximated by their
+    # center of mass.  The groups are the cells of a quadtree (octree
+    # in 3d, ...) stored level by level as sorted Morton keys.
+    import numpy as np
+    nnodes, dim = pos.shape
+    lower = pos.min(axis=0)
+    size = (pos.max(axis=0) - lower).max()
+    if size == 0:
+        size = 1.0
+    # deep enough that leaves hold only a few nodes
+    depth = int(np.ceil(np.log(nnodes) / np.log(2 ** dim))) + 2
+    depth = max(1, min(depth, 60 // dim))
+    grid = np.floor((pos - lower) / size * 2 ** depth).astype(np.int64)
+    grid = np.clip(grid, 0, 2 ** depth - 1)
+    morton = np.zeros(nnodes, dtype=np.int64)
+    for b in range(depth):
+        for i in range(dim):
+            morton |= ((grid[:, i] >> b) & 1) << (b * dim + i)
+    # cells, node membership, mass and center of mass at every level
+    levels = []
+    for d in range(1, depth + 1):
+        keys = morton >> (dim * (depth - d))
+        cells, member = np.unique(keys, return_inverse=True)
+        member = member.ravel()
+        mass = np.bincount(member).astype(float)
+        center = np.empty((len(cells), dim))
+        for i in range(dim):
+            center[:, i] = np.bincount(member, weights=pos[:, i]) / mass
+        levels.append((cells, member, mass, center, size / 2 ** d))
+    # children of each cell as slices of the cells of the next level
+    children = []
+    for d in range(depth - 1):
+        cells = levels[d][0]
+        parents = levels[d + 1][0] >> dim
+        children.append((np.searchsorted(parents, cells, 'left'),
+                         np.searchsorted(parents, cells, 'right')))
+
+    displacement = np.zeros((nnodes, dim))
+    for start in range(0, nnodes, block):
+        # (node, cell) pairs still to visit, starting with the top cells
+        ncells = len(levels[0][0])
+        nodes = np.repeat(np.arange(start, min(start + block, nnodes)),
+                          ncells)
+        cell = np.tile(np.arange(ncells), len(nodes) // ncells)
+        for d in range(depth):
+            cells, member, mass, center, width = levels[d]
+            own = member[nodes] == cell
+            m = mass[cell] - own
+            c = center[cell]
+            if d == depth - 1:
+                # leaf: interact with the other nodes in the cell
+                # through their center of mass
+                accept = m > 0
+                shift = own & accept
+                c[shift] = ((c[shift] * mass[cell[shift], None]
+                             - pos[nodes[shift]]) / m[shift, None])
+            delta = pos[nodes] - c
+            distance = np.sqrt((delta ** 2).sum(axis=1))
+            if d < depth - 1:
+                accept = ~own & (width < theta * distance)
+            distance = np.where(distance < 0.01, 0.01, distance)
+            force = np.where(accept, m * k * k / distance ** 2, 0.0)
+            for i in range(dim):
+                displacement[:, i] += np.bincount(nodes,
+                                                  weights=delta[:, i] * force,
+                                                  minlength=nnodes)
+            if d == depth - 1:
+                break
+            # open the cells that are too close (and not just this node)
+            expand = ~accept & (m > 0)
+            nodes = nodes[expand]
+            first, last = children[d]
+            first = first[cell[expand]]
+            count = last[cell[expand]] - first
+            nodes = np.repeat(nodes, count)
+            offset = np.arange(count.sum()) - np.repeat(np.cumsum(count)
+                                                        - count, count)
+            cell = np.repeat(first, count) + offset
+    return displacement
+
+
+def _barnes_hut_fruchterman_reingold(A, dim=2, k=None, pos=None, fixed=None,
+                                     iterations=50, theta=0.9,
+                                     temperature=0.1):
+    # Position nodes in adjacency matrix A using Fruchterman-Reingold
+    # Entry point for NetworkX graph is fruchterman_reingold_layout()
+    # Barnes-Hut version: the repulsion is approximated with a tree
+    # in O(n log n) and the attraction is computed from the edge arrays.
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("_barnes_hut_fruchterman_reingold() requires numpy: http://scipy.org/ ")
+    try:
+        nnodes,_=A.shape
+    except AttributeError:
+        raise nx.NetworkXError(
+            "fruchterman_reingold() takes an adjacency matrix as input")
+    try:
+        from scipy.sparse import coo_matrix
+    except ImportError:
+        raise ImportError("_barnes_hut_fruchterman_reingold() requires scipy: http://scipy.org/ ")
+    A=coo_matrix(A)
+    rows=A.row
+    cols=A.col
+    weights=np.asarray(A.data,dtype=float)
+
+    if pos is None:
+        # random initial positions
+        pos=np.asarray(np.random.random((nnodes,dim)))
+    else:
+        pos=np.array(pos,dtype=float)
+
+    # optimal distance between nodes
+    if k is None:
+        k=np.sqrt(1.0/nnodes)
+    # the initial "temperature" is the largest step allowed in the
+    # dynamics, by default about .1 of domain area (=1x1)
+    t=temperature
+    # simple cooling scheme.
+    # linearly step down by dt on each iteration so last iteration is size dt.
+    dt=t/float(iterations+1)
+    for iteration in range(iterations):
+        displacement=_barnes_hut_repulsion(pos,k,theta)
+        # attraction along the edges
+        delta=pos[rows]-pos[cols]
+        distance=np.sqrt((delta**2).sum(axis=1))
+        distance=np.where(distance<0.01,0.01,distance)
+        force=weights*distance/k
+        for i in range(dim):
+            displacement[:,i]-=np.bincount(rows,weights=delta[:,i]*force,
+                                           minlength=nnodes)
+        # update positions
+        length=np.sqrt((displacement**2).sum(axis=1))
+        length=np.where(length<0.01,0.1,length)
+        delta_pos=displacement*(t/length)[:,None]
+        if fixed is not None:
+            # don't change positions of fixed nodes
+            delta_pos[fixed]=0.0
+        pos+=delta_pos
+        # cool temperature
+        t-=dt
+        if fixed is None:
+            # fixed nodes keep their coordinates, so only rescale
+            # when there are none
+            pos=_rescale_layout(pos)
+    return pos
+
+
+def _coarsen(A):
+    # Merge the nodes of a heavy edge matching of A into single nodes.
+    # Return the group of every node and the adjacency matrix of groups.
+    import numpy as np
+    from scipy.sparse import coo_matrix
+    nnodes=A.shape[0]
+    S=(A+A.T).tocsr()
+    indptr=S.indptr.tolist()
+    indices=S.indices.tolist()
+    data=S.data.tolist()
+    group=[-1]*nnodes
+    ngroups=0
+    for u in np.random.permutation(nnodes).tolist():
+        if group[u]>=0:
+            continue
+        best=-1
+        heaviest=0
+        for i in range(indptr[u],indptr[u+1]):
+            v=indices[i]
+            if group[v]<0 and v!=u and data[i]>heaviest:
+                best=v
+                heaviest=data[i]
+        group[u]=ngroups
+        if best>=0:
+            group[best]=ngroups
+        ngroups+=1
+    group=np.asarray(group)
+    A=coo_matrix(A)
+    keep=group[A.row]!=group[A.col]
+    C=coo_matrix((A.data[keep],(group[A.row[keep]],group[A.col[keep]])),
+                 shape=(ngroups,ngroups)).tocsr()
+    return group,C
+
+
+def _multilevel_fruchterman_reingold(A, dim=2, k=None, pos=None,
+                                     iterations=50, theta=0.9):
+    # Multilevel Barnes-Hut Fruchterman-Reingold: lay out a sequence of
+    # coarser graphs obtained by merging matched nodes, starting from the
+    # coarsest, and use each layout as the initial positions of the
+    # next finer graph.
+    import numpy as np
+    from scipy.sparse import coo_matrix
+    A=coo_matrix(A).tocsr()
+    nnodes=A.shape[0]
+    graphs=[A]
+    groups=[]
+    while graphs[-1].shape[0]>100:
+        group,C=_coarsen(graphs[-1])
+        if C.shape[0]>0.8*graphs[-1].shape[0]:
+            break
+        groups.append(group)
+        graphs.append(C)
+    # initial positions of every level are the centers of their groups
+    positions=[pos]
+    for group in groups:
+        if positions[-1] is None:
+            positions.append(None)
+            continue
+        npos=np.zeros((group.max()+1,dim))
+        count=np.bincount(group).astype(float)
+        for i in range(dim):
+            npos[:,i]=np.bincount(group,weights=positions[-1][:,i])/count
+        positions.append(npos)
+
+    def level_k(n):
+        # keep the requested distance relative to the number of nodes
+        if k is None:
+            return np.sqrt(1.0/n)
+        return k*np.sqrt(float(nnodes)/n)
+
+    level=len(graphs)-1
+    n=graphs[level].shape[0]
+    pos=_barnes_hut_fruchterman_reingold(graphs[level],dim,level_k(n),
+                                         positions[level],None,
+                                         iterations,theta)
+    while level>0:
+        level-=1
+        coarse_k=level_k(n)
+        n=graphs[level].shape[0]
+        # move each node next to the position of its group
+        jitter=np.random.random((n,dim))-0.5
+        pos=pos[groups[level]]+0.1*level_k(n)*jitter
+        pos=_barnes_hut_fruchterman_reingold(graphs[level],dim,level_k(n),
+                                             pos,None,iterations,theta,
+                                             temperature=min(0.1,coarse_k))
+    return pos
+
+
 def spectral_layout(G, dim=2, weight='weight', scale=1):
     """Position nodes using the eigenvectors of the graph Laplacian. 
 
@@ -1,7 +1,7 @@
 """Unit tests for layout functions."""
 import sys
 from nose import SkipTest
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_true, assert_raises
 import networkx as nx
 
 class TestLayout(object):
@@ -59,3 +59,48 @@ class TestLayout(object):
 
         pos=nx.drawing.layout._sparse_fruchterman_reingold(A,dim=3)
         assert_equal(pos.shape,(6,3))
+
+    def test_barnes_hut(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('scipy not available.')
+        G=self.bigG
+        vpos=nx.spring_layout(G,method='barnes_hut')
+        assert_equal(len(vpos),len(G))
+        vpos=nx.spring_layout(G,dim=3,method='barnes_hut',multilevel=True)
+        assert_equal(len(vpos[(0,0)]),3)
+        vpos=nx.spring_layout(self.Gs,method='barnes_hut',multilevel=True)
+        assert_equal(sorted(vpos),list('abcdef'))
+        pos={'a':(0,0),'f':(1,1)}
+        vpos=nx.spring_layout(self.Gs,pos=pos,fixed=['a','f'],
+                              method='barnes_hut')
+        assert_equal(tuple(vpos['a']),(0,0))
+        assert_equal(tuple(vpos['f']),(1,1))
+        assert_raises(nx.NetworkXError,nx.spring_layout,self.Gs,pos=pos,
+                      fixed=['a'],method='barnes_hut',multilevel=True)
+        assert_raises(nx.NetworkXError,nx.spring_layout,self.Gs,
+                      method='other')
+
+    def test_barnes_hut_repulsion(self):
+        pos=numpy.random.random((200,2))
+        k=0.1
+        delta=pos[:,None,:]-pos[None,:,:]
+        distance=numpy.sqrt((delta**2).sum(axis=-1))
+        distance=numpy.where(distance<0.01,0.01,distance)
+        force=k*k/distance**2
+        numpy.fill_diagonal(force,0)
+        exact=(delta*force[:,:,None]).sum(axis=1)
+        approx=nx.drawing.layout._barnes_hut_repulsion(pos,k,0.5,block=64)
+        error=numpy.sqrt(((approx-exact)**2).sum(axis=1))
+        norm=numpy.sqrt((exact**2).sum(axis=1))
+        assert_true(numpy.median(error/norm)<0.01)
+
+    def test_adjacency_interface_barnes_hut(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('scipy not available.')
+        A=nx.to_scipy_sparse_matrix(self.Gs,dtype='d')
+        pos=nx.drawing.layout._barnes_hut_fruchterman_reingold(A,dim=3)
+        assert_equal(pos.shape,(6,3))
@@ -15,6 +15,7 @@ __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
 import itertools
 import random
 import math
+from heapq import heappush, heappop
 import networkx as nx
 from networkx.generators.classic import empty_graph, path_graph, complete_graph
 
@@ -43,7 +44,7 @@ __all__ = ['fast_gnp_random_graph',
 #-------------------------------------------------------------------------
 
 
-def fast_gnp_random_graph(n, p, seed=None, directed=False):
+def fast_gnp_random_graph(n, p, seed=None, directed=False, edge_array=False):
     """Return a random graph G_{n,p} (Erdős-Rényi graph, binomial graph).
 
     Parameters
@@ -52,10 +53,15 @@ def fast_gnp_random_graph(n, p, seed=None, directed=False):
         The number of nodes.
     p : float
         Probability for edge creation.
-    seed : int, optional
-        Seed for random number generator (default=None).
+    seed : int, numpy.random.RandomState or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  With a NumPy
+        random number generator the edges are drawn in bulk by NumPy.
     directed : bool, optional (default=False)
         If True return a directed graph
+    edge_array : bool, optional (default=False)
+        If True return the edges drawn in bulk by NumPy, seeded by seed,
+        as an integer array with a row (u, v) for each edge instead of a
+        graph.
 
     Notes
     -----
@@ -78,6 +84,13 @@ def fast_gnp_random_graph(n, p, seed=None, directed=False):
        "Efficient generation of large random networks",
        Phys. Rev. E, 71, 036113, 2005.
     """
+    rng = _numpy_random_state(seed, edge_array)
+    if rng is not None:
+        edges = _gnp_edges(n, p, directed, rng)
+        if edge_array:
+            return edges
+        return _graph_from_edges(n, edges, "fast_gnp_random_graph(%s,%s)"
+                                 % (n, p), directed)
     G = empty_graph(n)
     G.name="fast_gnp_random_graph(%s,%s)"%(n,p)
 
@@ -117,7 +130,7 @@ def fast_gnp_random_graph(n, p, seed=None, directed=False):
     return G
 
 
-def gnp_random_graph(n, p, seed=None, directed=False):
+def gnp_random_graph(n, p, seed=None, directed=False, edge_array=False):
     """Return a random graph G_{n,p} (Erdős-Rényi graph, binomial graph).
 
     Chooses each of the possible edges with probability p.
@@ -130,10 +143,15 @@ def gnp_random_graph(n, p, seed=None, directed=False):
         The number of nodes.
     p : float
         Probability for edge creation.
-    seed : int, optional
-        Seed for random number generator (default=None).
+    seed : int, numpy.random.RandomState or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  With a NumPy
+        random number generator the edges are drawn in bulk by NumPy.
     directed : bool, optional (default=False)
         If True return a directed graph
+    edge_array : bool, optional (default=False)
+        If True return the edges drawn in bulk by NumPy, seeded by seed,
+        as an integer array with a row (u, v) for each edge instead of a
+        graph.
 
     See Also
     --------
@@ -142,13 +160,22 @@ def gnp_random_graph(n, p, seed=None, directed=False):
     Notes
     -----
     This is an O(n^2) algorithm.  For sparse graphs (small p) see
-    fast_gnp_random_graph for a faster algorithm.
+    fast_gnp_random_graph for a faster algorithm.  With a NumPy random
+    number generator or edge_array=True the edges are drawn as in
+    fast_gnp_random_graph, in O(n+m) time.
 
     References
     ----------
     .. [1] P. Erdős and A. Rényi, On Random Graphs, Publ. Math. 6, 290 (1959).
     .. [2] E. N. Gilbert, Random Graphs, Ann. Math. Stat., 30, 1141 (1959).
     """
+    rng = _numpy_random_state(seed, edge_array)
+    if rng is not None:
+        edges = _gnp_edges(n, p, directed, rng)
+        if edge_array:
+            return edges
+        return _graph_from_edges(n, edges, "gnp_random_graph(%s,%s)" % (n, p),
+                                 directed)
     if directed:
         G=nx.DiGraph()
     else:
@@ -237,7 +264,7 @@ def dense_gnm_random_graph(n, m, seed=None):
             u+=1
             v=u+1
 
-def gnm_random_graph(n, m, seed=None, directed=False):
+def gnm_random_graph(n, m, seed=None, directed=False, edge_array=False):
     """Return the random graph G_{n,m}.
 
     Produces a graph picked randomly out of the set of all graphs
@@ -249,11 +276,23 @@ def gnm_random_graph(n, m, seed=None, directed=False):
         The number of nodes.
     m : int
         The number of edges.
-    seed : int, optional
-        Seed for random number generator (default=None).
+    seed : int, numpy.random.RandomState or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  With a NumPy
+        random number generator the edges are drawn in bulk by NumPy.
     directed : bool, optional (default=False)
         If True return a directed graph
+    edge_array : bool, optional (default=False)
+        If True return the edges drawn in bulk by NumPy, seeded by seed,
+        as an integer array with a row (u, v) for each edge instead of a
+        graph.
     """
+    rng = _numpy_random_state(seed, edge_array)
+    if rng is not None:
+        edges = _gnm_edges(n, m, directed, rng)
+        if edge_array:
+            return edges
+        return _graph_from_edges(n, edges, "gnm_random_graph(%s,%s)" % (n, m),
+                                 directed)
     if directed:
         G=nx.DiGraph()
     else:
@@ -350,7 +389,7 @@ def newman_watts_strogatz_graph(n, k, p, seed=None):
     return G
 
 
-def watts_strogatz_graph(n, k, p, seed=None):
+def watts_strogatz_graph(n, k, p, seed=None, edge_array=False):
     """Return a Watts-Strogatz small-world graph.
 
 
@@ -362,8 +401,13 @@ def watts_strogatz_graph(n, k, p, seed=None):
         Each node is connected to k nearest neighbors in ring topology
     p : float
         The probability of rewiring each edge
-    seed : int, optional
-        Seed for random number generator (default=None)
+    seed : int, numpy.random.RandomState or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  With a NumPy
+        random number generator the edges are rewired in bulk by NumPy.
+    edge_array : bool, optional (default=False)
+        If True return the edges rewired in bulk by NumPy, seeded by seed,
+        as an integer array with a row (u, v) for each edge instead of a
+        graph.
 
     See Also
     --------
@@ -383,6 +427,13 @@ def watts_strogatz_graph(n, k, p, seed=None):
     rewiring does not increase the number of edges. The rewired graph
     is not guaranteed to be connected as in  connected_watts_strogatz_graph().
 
+    When the edges are rewired in bulk all the new ends are drawn at once
+    and the ones that the rule above rejects are drawn again, in rounds,
+    until all are accepted; nearly complete graphs are finished one edge
+    at a time.  The graphs have the same distribution as with the
+    sequential rewiring but come from different random numbers, so a seed
+    does not give the same graph with and without NumPy.
+
     References
     ----------
     .. [1] Duncan J. Watts and Steven H. Strogatz,
@@ -391,6 +442,13 @@ def watts_strogatz_graph(n, k, p, seed=None):
     """
     if k>=n:
         raise nx.NetworkXError("k>=n, choose smaller k or larger n")
+    rng = _numpy_random_state(seed, edge_array)
+    if rng is not None:
+        edges = _watts_strogatz_edges(n, k, p, rng)
+        if edge_array:
+            return edges
+        return _graph_from_edges(n, edges, "watts_strogatz_graph(%s,%s,%s)"
+                                 % (n, k, p))
     if seed is not None:
         random.seed(seed)
 
@@ -570,7 +628,7 @@ def _random_subset(seq,m):
         targets.add(x)
     return targets
 
-def barabasi_albert_graph(n, m, seed=None):
+def barabasi_albert_graph(n, m, seed=None, edge_array=False):
     """Return random graph using Barabási-Albert preferential attachment model.
 
     A graph of n nodes is grown by attaching new nodes each with m
@@ -583,8 +641,13 @@ def barabasi_albert_graph(n, m, seed=None):
         Number of nodes
     m : int
         Number of edges to attach from a new node to existing nodes
-    seed : int, optional
-        Seed for random number generator (default=None).
+    seed : int, numpy.random.RandomState or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  With a NumPy
+        random number generator the targets are drawn in bulk by NumPy.
+    edge_array : bool, optional (default=False)
+        If True return the edges drawn in bulk by NumPy, seeded by seed,
+        as an integer array with a row (u, v) for each edge instead of a
+        graph.
 
     Returns
     -------
@@ -594,6 +657,10 @@ def barabasi_albert_graph(n, m, seed=None):
     -----
     The initialization is a graph with with m nodes and no edges.
 
+    When the targets are drawn in bulk the targets of all the nodes are
+    drawn at once as positions in the list of edge ends, and only the
+    targets repeating a node are drawn again one at a time.
+
     References
     ----------
     .. [1] A. L. Barabási and R. Albert "Emergence of scaling in
@@ -603,6 +670,13 @@ def barabasi_albert_graph(n, m, seed=None):
     if m < 1 or  m >=n:
         raise nx.NetworkXError(\
               "Barabási-Albert network must have m>=1 and m<n, m=%d,n=%d"%(m,n))
+    rng = _numpy_random_state(seed, edge_array)
+    if rng is not None:
+        edges = _barabasi_albert_edges(n, m, rng)
+        if edge_array:
+            return edges
+        return _graph_from_edges(n, edges, "barabasi_albert_graph(%s,%s)"
+                                 % (n, m))
     if seed is not None:
         random.seed(seed)
 
@@ -888,3 +962,251 @@ def random_powerlaw_tree_sequence(n, gamma=3, seed=None, tries=100):
           "Exceeded max (%d) attempts for a valid tree sequence."%tries)
     return False
 
+
+
+#-------------------------------------------------------------------------
+#  Vectorized samplers
+#-------------------------------------------------------------------------
+
+
+def _numpy_random_state(seed, edge_array):
+    # Return the NumPy random number generator for the vectorized samplers,
+    # or None if seed is meant for the random module.
+    if edge_array:
+        return nx.utils.create_random_state(seed)
+    try:
+        import numpy
+    except ImportError:
+        return None
+    Generator = getattr(numpy.random, 'Generator', numpy.random.RandomState)
+    if isinstance(seed, (numpy.random.RandomState, Generator)):
+        return seed
+    return None
+
+
+def _graph_from_edges(n, edges, name, directed=False):
+    # Build the graph on the nodes 0 to n-1 with the rows of edges in bulk.
+    if directed:
+        G = nx.DiGraph()
+    else:
+        G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(zip(edges[:, 0].tolist(), edges[:, 1].tolist()))
+    G.name = name
+    return G
+
+
+def _pairs(k, n, directed):
+    # Return the edges at the indices k of the list of all n(n-1) ordered
+    # pairs (directed) or n(n-1)/2 pairs u < v ordered by v (undirected).
+    import numpy
+    if directed:
+        u = k // (n - 1)
+        v = k % (n - 1)
+        v += v >= u
+        return numpy.column_stack((u, v))
+    v = ((1 + numpy.sqrt(8 * k + 1)) // 2).astype(numpy.int64)
+    # correct the rounding of the square root
+    v -= v * (v - 1) // 2 > k
+    v += (v + 1) * v // 2 <= k
+    return numpy.column_stack((k - v * (v - 1) // 2, v))
+
+
+def _gnp_edges(n, p, directed, rng):
+    # Skip over the pairs between edges with geometrically distributed
+    # gaps (Batagelj and Brandes), drawn in batches slightly larger than the expected number
+    # of edges left.
+    import numpy
+    total = n * (n - 1) if directed else n * (n - 1) // 2
+    if p <= 0 or total == 0:
+        k = numpy.zeros(0, dtype=numpy.int64)
+    elif p >= 1:
+        k = numpy.arange(total, dtype=numpy.int64)
+    else:
+        chunks = []
+        last = -1
+        while last < total:
+            mean = p * (total - last - 1)
+            size = int(mean + 4 * math.sqrt(mean) + 16)
+            k = last + numpy.cumsum(rng.geometric(p, size))
+            chunks.append(k)
+            last = k[-1]
+        k = numpy.concatenate(chunks)
+        k = k[:numpy.searchsorted(k, total)]
+    return _pairs(k.astype(numpy.int64), n, directed)
+
+
+def _gnm_edges(n, m, directed, rng):
+    # Choose m of the pair indices uniformly without replacement.  Unless
+    # the graph is dense, draw indices with replacement until there are m
+    # distinct ones and keep a random m of them.
+    import numpy
+    total = n * (n - 1) if directed else n * (n - 1) // 2
+    m = int(math.ceil(m))
+    if m >= total:
+        k = numpy.arange(total, dtype=numpy.int64)
+    elif m <= 0:
+        k = numpy.zeros(0, dtype=numpy.int64)
+    elif 3 * m > total:
+        k = numpy.sort(rng.permutation(total)[:m])
+    else:
+        k = numpy.zeros(0, dtype=numpy.int64)
+        while len(k) < m:
+            size = int(1.1 * (m - len(k))) + 16
+            draws = (rng.uniform(size=size) * total).astype(numpy.int64)
+            k = numpy.unique(numpy.concatenate((k, draws)))
+        k = numpy.sort(rng.permutation(k)[:m])
+    return _pairs(k.astype(numpy.int64), n, directed)
+
+
+def _watts_strogatz_edges(n, k, p, rng, rounds=20):
+    # Rewire all the chosen lattice edges at once and draw again the new
+    # ends that watts_strogatz_graph() would reject: self loops, the edges
+    # kept from the lattice, the lattice edges that come later in the
+    # order of rewiring (including the old edge itself) and the new edges
+    # of the earlier rewired edges.  A repeat of an earlier new edge is
+    # only drawn again once all the edges before that one are settled,
+    # so that every draw is rejected against final edges only.
+    import numpy
+    u = numpy.tile(numpy.arange(n, dtype=numpy.int64), k // 2)
+    v = (u + numpy.repeat(numpy.arange(1, k // 2 + 1), n)) % n
+    rewired = numpy.flatnonzero(rng.uniform(size=len(u)) < p)
+    fixed = numpy.ones(len(u), dtype=bool)
+    fixed[rewired] = False
+    a = u[rewired]
+    static = numpy.ones(len(rewired), dtype=bool)
+    settled = 0
+    for _ in range(rounds):
+        redraw = numpy.flatnonzero(static)
+        w = (rng.uniform(size=len(redraw)) * n).astype(numpy.int64)
+        v[rewired[redraw]] = w
+        # the position of the lattice edge a-w, which joins the nodes at
+        # distance d <= k/2 on the ring, in the order of rewiring
+        ahead = (w - a[redraw]) % n
+        d = numpy.minimum(ahead, n - ahead)
+        j = (d - 1) * n + numpy.where(ahead == d, a[redraw], w)
+        j[(d == 0) | (d > k // 2)] = -1
+        static[redraw] = (d == 0) | ((j >= 0) & (fixed[j] |
+                                                (j >= rewired[redraw])))
+        # the earliest rewired edge with the same new ends
+        b = v[rewired]
+        key = numpy.minimum(a, b) * n + numpy.maximum(a, b)
+        order = numpy.argsort(key, kind='mergesort')
+        head = numpy.arange(len(order))
+        if len(order):
+            new_group = numpy.concatenate(
+                ([True], key[order[1:]] != key[order[:-1]]))
+            head = numpy.maximum.accumulate(
+                numpy.where(new_group, head, 0))
+        first = numpy.empty(len(order), dtype=numpy.int64)
+        first[order] = order[head]
+        repeat = first != numpy.arange(len(order))
+        bad = static | repeat
+        if not bad.any():
+            return numpy.column_stack((u, v))
+        settled = numpy.flatnonzero(bad)[0]
+        static |= repeat & (first < settled)
+    # Nearly complete graphs where the rounds do not settle, e.g. because
+    # a node is joined to all others: keep the rewired edges before the
+    # first unsettled one and rewire the others one at a time as
+    # watts_strogatz_graph() does.
+    lattice = (u + numpy.repeat(numpy.arange(1, k // 2 + 1), n)) % n
+    nbrs = [set() for _ in range(n)]
+    for x, y in zip(u.tolist(), lattice.tolist()):
+        nbrs[x].add(y)
+        nbrs[y].add(x)
+    final = rewired[:settled]
+    for x, y in zip(u[final].tolist(), lattice[final].tolist()):
+        nbrs[x].remove(y)
+        nbrs[y].remove(x)
+    for x, y in zip(u[final].tolist(), v[final].tolist()):
+        nbrs[x].add(y)
+        nbrs[y].add(x)
+    rest = rewired[settled:].tolist()
+    for x, y in zip(u[rest].tolist(), lattice[rest].tolist()):
+        w = int(rng.uniform() * n)
+        while w == x or w in nbrs[x]:
+            w = int(rng.uniform() * n)
+            if len(nbrs[x]) >= n - 1:
+                break
+        else:
+            nbrs[x].remove(y)
+            nbrs[y].remove(x)
+            nbrs[x].add(w)
+            nbrs[w].add(x)
+    return numpy.array([(x, y) for x in range(n) for y in nbrs[x] if x < y],
+                       dtype=numpy.int64).reshape(-1, 2)
+
+
+def _barabasi_albert_edges(n, m, rng):
+    # The node m is joined to the nodes 0 to m-1 and the node t > m to m
+    # distinct nodes drawn from the first 2m(t-m) ends of the earlier edges,
+    # listed as the m targets of each node s >= m followed by m copies of
+    # s.  All the draws are made at once.  A drawn target of s has the
+    # value of that target, so the value of each pick is copied along a
+    # chain of earlier picks (a tree of picks) from a node in the list.
+    # Picks repeating a node are drawn again row by row in the order of the
+    # nodes, which only needs the final values of the earlier rows, and the
+    # new value is copied to the picks below.
+    import numpy
+    rows = n - m - 1
+    first = numpy.column_stack((numpy.repeat(m, m), numpy.arange(m)))
+    if rows <= 0:
+        return first
+    length = 2 * m * numpy.arange(1, rows + 1)
+    draws = (rng.uniform(size=(rows, m)) *
+             length[:, None]).astype(numpy.int64).ravel()
+    source, r = numpy.divmod(draws, 2 * m)
+    value = numpy.where(r >= m, m + source, -1)
+    value[(r < m) & (source == 0)] = r[(r < m) & (source == 0)]
+    parent = numpy.where(value < 0, (source - 1) * m + r, -1)
+    pending = numpy.flatnonzero(value < 0)
+    while len(pending):
+        value[pending] = value[parent[pending]]
+        pending = pending[value[pending] < 0]
+    # the picks copying each pick
+    child = numpy.flatnonzero(parent >= 0)
+    child = child[numpy.argsort(parent[child], kind='mergesort')]
+    start = numpy.concatenate(([0], numpy.cumsum(
+        numpy.bincount(parent[parent >= 0], minlength=rows * m))))
+
+    def repeats(i):
+        return len(set(value[i * m:(i + 1) * m].tolist())) < m
+
+    values = numpy.sort(value.reshape(rows, m), axis=1)
+    heap = numpy.flatnonzero((values[:, 1:] == values[:, :-1]).any(axis=1))
+    heap = heap.tolist()
+    queued = set(heap)
+    while heap:
+        i = heappop(heap)
+        if not repeats(i):
+            continue
+        seen = set()
+        for q in range(i * m, (i + 1) * m):
+            x = int(value[q])
+            if x in seen:
+                while x in seen:
+                    s, c = divmod(int(rng.uniform() * length[i]), 2 * m)
+                    if c >= m:
+                        x = m + s
+                    elif s == 0:
+                        x = c
+                    else:
+                        x = int(value[(s - 1) * m + c])
+                # copy the new value down the tree of picks below q
+                value[q] = x
+                below = numpy.array([q])
+                while len(below):
+                    count = start[below + 1] - start[below]
+                    offset = numpy.repeat(start[below] - numpy.cumsum(count)
+                                          + count, count)
+                    below = child[offset + numpy.arange(count.sum())]
+                    value[below] = x
+                    for j in set((below // m).tolist()) - queued:
+                        if repeats(j):
+                            queued.add(j)
+                            heappush(heap, j)
+            seen.add(x)
+    targets = numpy.column_stack((numpy.repeat(numpy.arange(m + 1, n), m),
+                                  value))
+    return numpy.concatenate((first, targets))
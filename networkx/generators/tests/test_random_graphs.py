@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 from nose.tools import *
+from nose import SkipTest
+import random
 from networkx import *
 from networkx.generators.random_graphs import *
 
@@ -127,3 +129,94 @@ class TestGeneratorsRandom():
         # infinite loop used to occur when a node has degree n-1 and needs to rewire
         watts_strogatz_graph(10, 9, 0.25, seed=0)
         newman_watts_strogatz_graph(10, 9, 0.5, seed=0)
+
+
+class TestGeneratorsRandomNumpy(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+             raise SkipTest('NumPy not available.')
+
+    def check_edges(self, E, n, m=None, directed=False):
+        assert_equal(E.shape[1], 2)
+        if m is not None:
+            assert_equal(len(E), m)
+        assert_true(((E >= 0) & (E < n)).all())
+        assert_false((E[:, 0] == E[:, 1]).any())
+        if directed:
+            pairs = set(map(tuple, E.tolist()))
+        else:
+            pairs = set(map(frozenset, E.tolist()))
+        assert_equal(len(pairs), len(E))
+
+    def test_seed(self):
+        for f, args in [(fast_gnp_random_graph, (50, 0.1)),
+                        (gnp_random_graph, (50, 0.1)),
+                        (gnm_random_graph, (50, 100)),
+                        (watts_strogatz_graph, (50, 4, 0.3)),
+                        (barabasi_albert_graph, (50, 3))]:
+            E = f(*args, seed=42, edge_array=True)
+            assert_equal(E.tolist(), f(*args, seed=42, edge_array=True).tolist())
+            G = f(*args, seed=numpy.random.RandomState(42))
+            assert_equal(sorted(G), list(range(50)))
+            assert_equal(sorted(map(sorted, G.edges())),
+                         sorted(map(sorted, E.tolist())))
+
+    def test_gnp(self):
+        for n, p in [(0, 0.5), (1, 0.5), (10, -1), (10, 1.1), (100, 0.05),
+                     (60, 0.9)]:
+            for directed in [False, True]:
+                E = fast_gnp_random_graph(n, p, seed=1, directed=directed,
+                                          edge_array=True)
+                self.check_edges(E, n, directed=directed)
+                if p >= 1:
+                    assert_equal(len(E), n * (n - 1) // (1 + (not directed)))
+                if p <= 0:
+                    assert_equal(len(E), 0)
+        G = gnp_random_graph(10, 0.5, seed=numpy.random.RandomState(1),
+                             directed=True)
+        assert_true(G.is_directed())
+        E = gnp_random_graph(2000, 0.01, seed=2, edge_array=True)
+        assert_true(abs(len(E) - 19990) < 5 * 141)
+
+    def test_gnm(self):
+        for n, m in [(1, 3), (10, 0), (10, 20), (10, 40), (10, 100),
+                     (200, 1000)]:
+            for directed in [False, True]:
+                E = gnm_random_graph(n, m, seed=1, directed=directed,
+                                     edge_array=True)
+                total = n * (n - 1) // (1 + (not directed))
+                self.check_edges(E, n, min(m, total), directed)
+
+    def test_watts_strogatz(self):
+        for n, k, p in [(10, 2, 0.25), (10, 4, 1.0), (10, 9, 0.5),
+                        (20, 18, 1.0), (500, 6, 0.2), (500, 6, 0.0)]:
+            E = watts_strogatz_graph(n, k, p, seed=1, edge_array=True)
+            self.check_edges(E, n, n * (k // 2))
+        E = watts_strogatz_graph(500, 6, 0.0, seed=1, edge_array=True)
+        assert_equal(sorted(map(sorted, E.tolist())),
+                     sorted(map(sorted, watts_strogatz_graph(500, 6, 0.0).edges())))
+
+    def test_watts_strogatz_distribution(self):
+        # the bulk rewiring samples the graphs of the sequential one
+        random.seed(1)
+        rng = numpy.random.RandomState(1)
+        for n, k, p in [(12, 4, 0.5), (6, 4, 0.7)]:
+            degrees = []
+            for seed in [None, rng]:
+                degrees.append(numpy.mean([
+                    max(watts_strogatz_graph(n, k, p, seed=seed).degree().values())
+                    for i in range(3000)]))
+            assert_true(abs(degrees[0] - degrees[1]) < 0.05)
+
+    def test_barabasi_albert(self):
+        for n, m in [(2, 1), (100, 1), (100, 3), (11, 10), (2000, 8)]:
+            E = barabasi_albert_graph(n, m, seed=1, edge_array=True)
+            self.check_edges(E, n, (n - m) * m)
+            # each new node is joined to earlier nodes
+            assert_true((E[:, 1] < E[:, 0]).all())
+            assert_equal(sorted(set(E[:, 0].tolist())), list(range(m, n)))
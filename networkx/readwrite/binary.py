@@ -0,0 +1,400 @@
+"""
+*************
+Binary Graphs
+*************
+Read and write graphs as binary snapshots of NumPy arrays.
+
+A snapshot holds the adjacency structure of the graph in compressed
+sparse row (CSR) form, the node labels and one column per node or edge
+attribute, each stored as a raw NumPy array.  Reading a snapshot with
+mmap=True maps the arrays from the file instead of loading them, so a
+large graph opens almost immediately and several processes reading the
+same file share the operating system's page cache.
+
+Format
+------
+The file starts with the 8 bytes ``NXGRAPH1`` and the length of a header
+as an unsigned 64 bit little-endian integer, followed by the header, a
+pickled dictionary describing the graph and the arrays.  Each array
+follows as raw data aligned to 64 bytes.
+
+The arrays are
+
+* ``nodes``: the node labels, if NumPy can store them (all integers,
+  all floats or all strings); otherwise the labels are pickled in the
+  header,
+* ``offsets``, ``indices``: the CSR arrays.  The neighbors of the node
+  at position i are ``indices[offsets[i]:offsets[i+1]]``.  For
+  undirected graphs every edge is stored in the rows of both ends,
+* ``in_offsets``, ``in_indices``, ``in_order``: for directed graphs the
+  CSR arrays of the predecessors and the position of each of their
+  entries in ``indices``,
+* ``node:<name>``, ``edge:<name>``: an attribute column aligned with the
+  nodes or with ``indices``, and ``node_mask:<name>``,
+  ``edge_mask:<name>`` flagging the entries that have the attribute
+  when some do not,
+* ``node_int:<name>``, ``edge_int:<name>``: for a column of floats
+  holding some integers, the entries that are integers.
+
+Attributes whose values are not all numbers or all strings are pickled
+in the header.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import os
+import struct
+import networkx as nx
+from networkx.utils import open_file, not_implemented_for
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+__all__ = ['write_graph_binary', 'read_graph_binary']
+
+_MAGIC = b'NXGRAPH1'
+_ALIGN = 64
+
+
+def _column(values, mixed=False):
+    """Return values as a NumPy array, or None if they are not all
+    integers, all floats or all strings.
+
+    If mixed is True, integers and floats together give a float column,
+    provided that the integers are exact as floats.
+    """
+    import numpy as np
+    kinds = set()
+    for v in values:
+        if isinstance(v, (bool, np.bool_)):
+            kinds.add('b')
+        elif isinstance(v, (int, np.integer)):
+            kinds.add('i')
+        elif isinstance(v, (float, np.floating)):
+            kinds.add('f')
+        elif nx.utils.is_string_like(v):
+            kinds.add('s')
+        else:
+            return None
+    if kinds == set('if') and mixed:
+        if any(isinstance(v, (int, np.integer)) and abs(v) > 2**53
+               for v in values):
+            return None
+        return np.array(values, dtype=float)
+    if len(kinds) != 1:
+        return None
+    try:
+        column = np.array(values)
+    except (OverflowError, ValueError):
+        return None
+    if column.dtype.kind not in 'biufU':
+        return None
+    return column
+
+
+def _attribute_columns(prefix, datas, arrays, extra):
+    """Add a column for every attribute key of the dicts in datas.
+
+    Attributes that cannot be columns go into extra, a dict mapping the
+    position of each dict to its remaining attributes.
+    """
+    import numpy as np
+    keys = set()
+    for d in datas:
+        keys.update(d)
+    for key in keys:
+        present = [key in d for d in datas]
+        values = [d[key] for d in datas if key in d]
+        column = _column(values, mixed=True)
+        if column is None or not nx.utils.is_string_like(key):
+            for i, d in enumerate(datas):
+                if key in d:
+                    extra.setdefault(i, {})[key] = d[key]
+            continue
+        ints = None
+        if column.dtype.kind == 'f':
+            ints = np.array([isinstance(v, (int, np.integer))
+                             for v in values])
+            if not ints.any():
+                ints = None
+        if not all(present):
+            mask = np.array(present)
+            full = np.zeros(len(datas), dtype=column.dtype)
+            full[mask] = column
+            column = full
+            if ints is not None:
+                full = np.zeros(len(datas), dtype=bool)
+                full[mask] = ints
+                ints = full
+            arrays['%s_mask:%s' % (prefix, key)] = mask
+        if ints is not None:
+            arrays['%s_int:%s' % (prefix, key)] = ints
+        arrays['%s:%s' % (prefix, key)] = column
+
+
+@not_implemented_for('multigraph')
+@open_file(1, mode='wb')
+def write_graph_binary(G, path):
+    """Write G as a binary snapshot of NumPy arrays.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph.  Multigraphs are not supported.
+    path : file or string
+       File or filename to write.
+       Filenames ending in .gz or .bz2 will be compressed, but only
+       uncompressed files can be memory-mapped by read_graph_binary().
+
+    Examples
+    --------
+    >>> G=nx.path_graph(4)
+    >>> nx.write_graph_binary(G, "test.nxb")
+
+    See Also
+    --------
+    read_graph_binary, write_gpickle
+
+    Notes
+    -----
+    Node and edge attributes whose values are all numbers or all strings
+    are stored as NumPy arrays; any other attributes are pickled.
+    """
+    import numpy as np
+    nodes = G.nodes()
+    n = len(nodes)
+    index = dict(zip(nodes, range(n)))
+    rows = []
+    cols = []
+    datas = []
+    for i, u in enumerate(nodes):
+        for v, d in G.adj[u].items():
+            rows.append(i)
+            cols.append(index[v])
+            datas.append(d)
+    m = len(rows)
+    dtype = np.int32 if max(n, m) < 2**31 - 1 else np.int64
+    rows = np.array(rows, dtype=dtype)
+    cols = np.array(cols, dtype=dtype)
+    order = np.lexsort((cols, rows))
+    indices = cols[order]
+    datas = [datas[k] for k in order.tolist()]
+    offsets = np.zeros(n + 1, dtype=dtype)
+    np.cumsum(np.bincount(rows, minlength=n), out=offsets[1:])
+
+    arrays = {'offsets': offsets, 'indices': indices}
+    header = {'directed': G.is_directed(), 'graph': G.graph, 'n': n}
+    node_array = _column(nodes) if n > 0 else None
+    if node_array is not None and node_array.tolist() == nodes:
+        arrays['nodes'] = node_array
+        header['nodes'] = None
+    else:
+        header['nodes'] = nodes
+    if G.is_directed():
+        in_order = np.argsort(indices, kind='mergesort').astype(dtype)
+        in_offsets = np.zeros(n + 1, dtype=dtype)
+        np.cumsum(np.bincount(indices, minlength=n), out=in_offsets[1:])
+        arrays['in_offsets'] = in_offsets
+        arrays['in_indices'] = np.sort(rows)[in_order]
+        arrays['in_order'] = in_order
+    node_extra = {}
+    _attribute_columns('node', [G.node[u] for u in nodes], arrays, node_extra)
+    edge_extra = {}
+    _attribute_columns('edge', datas, arrays, edge_extra)
+    if not G.is_directed():
+        # keep the pickled attributes of each undirected edge only once
+        entry_rows = np.repeat(np.arange(n), np.diff(offsets)).tolist()
+        idx = indices.tolist()
+        edge_extra = dict((k, d) for k, d in edge_extra.items()
+                          if entry_rows[k] <= idx[k])
+    header['node_extra'] = node_extra
+    header['edge_extra'] = edge_extra
+
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout[name] = (array.dtype.str, array.shape, offset)
+        offset += (array.nbytes + _ALIGN - 1) // _ALIGN * _ALIGN
+    header['arrays'] = layout
+    header['data_size'] = offset
+    data = pickle.dumps(header, 2)
+    start = len(_MAGIC) + 8 + len(data)
+    padding = (_ALIGN - start % _ALIGN) % _ALIGN
+    path.write(_MAGIC)
+    path.write(struct.pack('<Q', len(data) + padding))
+    path.write(data)
+    path.write(b'\0' * padding)
+    for name, (dtype, shape, offset) in sorted(layout.items(),
+                                               key=lambda x: x[1][2]):
+        array = arrays[name]
+        path.write(array.tobytes() if hasattr(array, 'tobytes')
+                   else array.tostring())
+        path.write(b'\0' * ((_ALIGN - array.nbytes % _ALIGN) % _ALIGN))
+
+
+@open_file(0, mode='rb')
+def read_graph_binary(path, mmap=False, weight='weight', csr=True):
+    """Read a graph from a binary snapshot written by write_graph_binary().
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    mmap : bool, optional (default=False)
+       If True, map the arrays from the file instead of reading them.
+       Only the header and the node labels are read, so the graph opens
+       quickly whatever its size and the pages of the file are shared by
+       all processes that map it.  The file must not be compressed.
+    weight : string or None, optional (default='weight')
+       The edge attribute used as the weights of a CSR graph.  Edges
+       without the attribute get weight 1.  Ignored if csr=False.
+    csr : bool, optional (default=True)
+       If True return a read-only CSRGraph or CSRDiGraph sharing the
+       arrays, which keeps only the weight edge attribute and no node
+       attributes.  If False return a Graph or DiGraph with all the
+       attributes.
+
+    Returns
+    -------
+    G : CSRGraph, CSRDiGraph, Graph or DiGraph
+       The graph.  With mmap=True the arrays of a CSR graph are
+       read-only memory maps of the file.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(4)
+    >>> G.add_edge(0, 1, weight=2.5)
+    >>> nx.write_graph_binary(G, "test.nxb")
+    >>> C=nx.read_graph_binary("test.nxb", mmap=True)
+    >>> C[0][1]
+    {'weight': 2.5}
+    >>> H=nx.read_graph_binary("test.nxb", csr=False)
+    >>> sorted(H.edges(data=True))
+    [(0, 1, {'weight': 2.5}), (1, 2, {}), (2, 3, {})]
+
+    See Also
+    --------
+    write_graph_binary, CSRGraph, read_gpickle
+    """
+    import numpy as np
+    if path.read(len(_MAGIC)) != _MAGIC:
+        raise nx.NetworkXError('Not a binary graph file.')
+    size = struct.unpack('<Q', path.read(8))[0]
+    header = pickle.loads(path.read(size))
+    start = len(_MAGIC) + 8 + size
+    if mmap:
+        try:
+            file_size = os.fstat(path.fileno()).st_size
+        except (AttributeError, IOError, OSError, ValueError):
+            file_size = None
+        if file_size != start + header['data_size']:
+            raise nx.NetworkXError('mmap=True requires an uncompressed '
+                                   'binary graph file.')
+    arrays = {}
+    position = 0
+    for name, (dtype, shape, offset) in sorted(header['arrays'].items(),
+                                               key=lambda x: x[1][2]):
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        if mmap:
+            if count == 0:
+                arrays[name] = np.zeros(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode='r',
+                                         offset=start + offset, shape=shape)
+            continue
+        path.read(offset - position)
+        buf = path.read(count * dtype.itemsize)
+        arrays[name] = np.frombuffer(buf, dtype=dtype).reshape(shape)
+        position = offset + count * dtype.itemsize
+
+    if header['nodes'] is None:
+        nodes = arrays['nodes'].tolist()
+    else:
+        nodes = header['nodes']
+    directed = header['directed']
+    offsets = arrays['offsets']
+    indices = arrays['indices']
+
+    if csr:
+        weights = arrays.get('edge:%s' % weight)
+        if weights is not None and weights.dtype.kind not in 'biuf':
+            raise nx.NetworkXError('Edge attribute %s is not numeric.'
+                                   % weight)
+        cls = nx.CSRDiGraph if directed else nx.CSRGraph
+        transposed = None
+        in_order = None
+        if directed:
+            transposed = (arrays['in_offsets'], arrays['in_indices'], None)
+            in_order = arrays['in_order']
+        # the mask and the predecessor order are applied per row on
+        # access so that mapped arrays are not copied
+        C = cls.from_csr_arrays(offsets, indices, weights, nodelist=nodes,
+                                weight=weight, validate=False,
+                                transposed=transposed,
+                                weight_mask=arrays.get('edge_mask:%s'
+                                                       % weight),
+                                in_order=in_order)
+        C.graph.update(header['graph'])
+        return C
+
+    G = nx.DiGraph() if directed else nx.Graph()
+    G.graph.update(header['graph'])
+    node_data = [{} for u in nodes]
+    _decode_columns('node', arrays, node_data)
+    for i, d in header['node_extra'].items():
+        node_data[i].update(d)
+    G.add_nodes_from(zip(nodes, node_data))
+    rows = np.repeat(np.arange(len(nodes)), np.diff(offsets)).tolist()
+    cols = indices.tolist()
+    edge_data = [{} for k in cols]
+    _decode_columns('edge', arrays, edge_data)
+    for k, d in header['edge_extra'].items():
+        edge_data[k].update(d)
+    G.add_edges_from((nodes[i], nodes[j], d) for i, j, d in
+                     zip(rows, cols, edge_data) if directed or i <= j)
+    return G
+
+
+def _decode_columns(prefix, arrays, datas):
+    # Add the values of the attribute columns to the dicts in datas.
+    import numpy as np
+    for name, column in arrays.items():
+        if not name.startswith(prefix + ':'):
+            continue
+        key = name[len(prefix) + 1:]
+        values = column.tolist()
+        ints = arrays.get('%s_int:%s' % (prefix, key))
+        if ints is not None:
+            for i in np.flatnonzero(ints).tolist():
+                values[i] = int(values[i])
+        mask = arrays.get('%s_mask:%s' % (prefix, key))
+        if mask is None:
+            for d, value in zip(datas, values):
+                d[key] = value
+        else:
+            for d, value, present in zip(datas, values, mask.tolist()):
+                if present:
+                    d[key] = value
+
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
+
+
+# fixture for nose tests
+def teardown_module(module):
+    os.unlink('test.nxb')
@@ -25,6 +25,10 @@ Python dictionary as data::
 Arbitrary data::
 
  1 2 7 green
+
+Large files with a fixed number of columns per line can be read in
+chunks with read_edgelist(path, chunksize=...), iter_edgelist_chunks()
+or read_edgelist_csr(), which parse whole chunks of lines with NumPy.
 """
 __author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
 #    Copyright (C) 2004-2011 by 
@@ -39,8 +43,11 @@ __all__ = ['generate_edgelist',
            'parse_edgelist',
            'read_edgelist',
            'read_weighted_edgelist',
-           'write_weighted_edgelist']
+           'write_weighted_edgelist',
+           'iter_edgelist_chunks',
+           'read_edgelist_csr']
 
+from itertools import islice
 from networkx.utils import open_file, make_str
 import networkx as nx
 
@@ -294,9 +301,220 @@ def parse_edgelist(lines, comments='#', delimiter=None,
         G.add_edge(u, v, attr_dict=edgedata)
     return G
 
+def _convert_column(column, dtype, name):
+    # Convert a column of strings to dtype, leaving strings as they are.
+    if dtype is None or dtype is str:
+        return column
+    try:
+        return column.astype(dtype)
+    except (TypeError, ValueError):
+        raise TypeError("Failed to convert %s to type %s." % (name, dtype))
+
+
+def _edgelist_chunks(lines, comments, delimiter, nodetype, data, chunksize,
+                     encoding, progress):
+    # Parse chunks of chunksize lines into arrays of sources, targets
+    # and a dict of typed edge data columns.
+    import numpy as np
+    if data is True:
+        raise TypeError("Reading edge lists in chunks requires edge data "
+                        "given as a list of (label,type) tuples or False.")
+    columns = list(data or [])
+    ncols = None
+    nedges = 0
+    while True:
+        chunk = list(islice(lines, chunksize))
+        if not chunk:
+            break
+        if isinstance(chunk[0], bytes):
+            text = b''.join(chunk).decode(encoding)
+        else:
+            text = ''.join(chunk)
+        rows = text.splitlines()
+        if comments is not None and comments in text:
+            rows = [row.split(comments, 1)[0] for row in rows]
+        rows = [row for row in rows if row and not row.isspace()]
+        if not rows:
+            continue
+        if ncols is None:
+            # the first line fixes the number of columns
+            ncols = len(rows[0].split(delimiter))
+            if ncols < 2:
+                raise IndexError("Edge list lines need at least 2 columns.")
+            if columns and ncols != 2 + len(columns):
+                raise IndexError(
+                    "Edge data %s and data_keys %s are not the same length"%
+                    (rows[0].split(delimiter)[2:], data))
+        if delimiter is None:
+            tokens = ' '.join(rows).split()
+        else:
+            tokens = delimiter.join(rows).split(delimiter)
+        if len(tokens) != ncols * len(rows):
+            raise IndexError("All edge list lines must have %d columns."
+                             % ncols)
+        table = np.array(tokens).reshape(len(rows), ncols)
+        if delimiter is not None:
+            table = np.char.strip(table)
+        u = _convert_column(table[:, 0], nodetype, 'nodes')
+        v = _convert_column(table[:, 1], nodetype, 'nodes')
+        edgedata = {}
+        for i, (edge_key, edge_type) in enumerate(columns):
+            edgedata[edge_key] = _convert_column(table[:, i + 2], edge_type,
+                                                 '%s data' % edge_key)
+        nedges += len(rows)
+        if progress is not None:
+            progress(nedges)
+        yield u, v, edgedata
+
+
+@open_file(0,mode='rb')
+def iter_edgelist_chunks(path, comments='#', delimiter=None, nodetype=None,
+                         data=False, chunksize=1000000, encoding='utf-8',
+                         progress=None):
+    """Generate the edges of an edge list file in chunks of NumPy arrays.
+
+    Every line must have the same number of columns: the two nodes
+    followed by the edge data.  Each chunk of lines is split and converted
+    with NumPy as a whole, which is much faster than parsing the lines one
+    by one and lets the edges be processed while the file is still being
+    read.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read. If a file is provided, it should be
+       opened in 'rb' mode.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    comments : string, optional
+       The character used to indicate the start of a comment.
+    delimiter : string, optional
+       The string used to separate values.  The default is whitespace.
+    nodetype : int, float, str, NumPy dtype, optional
+       Convert node data from strings to specified type.  The default is
+       to keep the strings.
+    data : False or list of (label,type) tuples
+       Tuples specifying dictionary key names and types for edge data.
+       If False the data columns are ignored.
+    chunksize : int, optional
+       Number of lines parsed at once.
+    encoding: string, optional
+       Specify which encoding to use when reading file.
+    progress : function, optional
+       Called with the number of edges read so far after every chunk.
+
+    Returns
+    -------
+    chunks : generator
+       A generator of (sources, targets, data) tuples where sources
+       and targets are NumPy arrays of nodes and data is a dictionary
+       of NumPy arrays of edge data keyed by label.
+
+    Examples
+    --------
+    >>> G = nx.Graph()
+    >>> G.add_weighted_edges_from([(0, 1, 1.0), (1, 2, 2.0), (2, 3, 0.5)])
+    >>> nx.write_weighted_edgelist(G, 'test.weighted.edgelist')
+    >>> for u, v, d in nx.iter_edgelist_chunks('test.weighted.edgelist',
+    ...                                        nodetype=int, chunksize=2,
+    ...                                        data=(('weight', float),)):
+    ...     print((u.tolist(), v.tolist(), d['weight'].tolist()))
+    ([0, 1], [1, 2], [1.0, 2.0])
+    ([2], [3], [0.5])
+
+    See Also
+    --------
+    read_edgelist, read_edgelist_csr
+    """
+    return _edgelist_chunks(path, comments, delimiter, nodetype, data,
+                            chunksize, encoding, progress)
+
+
+def read_edgelist_csr(path, comments='#', delimiter=None, nodetype=None,
+                      data=False, weight='weight', directed=False,
+                      chunksize=1000000, encoding='utf-8', progress=None):
+    """Read an edge list file into a compact read-only CSR graph.
+
+    The file is parsed in chunks as in iter_edgelist_chunks() and the
+    edges go straight into the arrays of a CSRGraph, without building
+    dictionaries for the nodes or edges.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read. If a file is provided, it should be
+       opened in 'rb' mode.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    comments : string, optional
+       The character used to indicate the start of a comment.
+    delimiter : string, optional
+       The string used to separate values.  The default is whitespace.
+    nodetype : int, float, str, NumPy dtype, optional
+       Convert node data from strings to specified type.
+    data : False or list of (label,type) tuples
+       Tuples specifying dictionary key names and types for edge data.
+    weight : string, optional
+       Label of the data column used as edge weights.  Other data
+       columns are dropped.  If the label is not in data the graph is
+       unweighted.
+    directed : bool, optional
+       If True return a CSRDiGraph, otherwise a CSRGraph.
+    chunksize : int, optional
+       Number of lines parsed at once.
+    encoding: string, optional
+       Specify which encoding to use when reading file.
+    progress : function, optional
+       Called with the number of edges read so far after every chunk.
+
+    Returns
+    -------
+    G : CSRGraph or CSRDiGraph
+       The nodes are sorted.  Parallel edges are merged and their
+       weights summed.
+
+    Examples
+    --------
+    >>> G = nx.Graph()
+    >>> G.add_weighted_edges_from([(0, 1, 1.0), (1, 2, 2.0), (2, 3, 0.5)])
+    >>> nx.write_weighted_edgelist(G, 'test.weighted.edgelist')
+    >>> G = nx.read_edgelist_csr('test.weighted.edgelist', nodetype=int,
+    ...                          data=(('weight', float),))
+    >>> G.nodelist
+    [0, 1, 2, 3]
+    >>> G[1][2]
+    {'weight': 2.0}
+
+    See Also
+    --------
+    iter_edgelist_chunks, CSRGraph
+    """
+    import numpy as np
+    sources = []
+    targets = []
+    weights = []
+    for u, v, d in iter_edgelist_chunks(path, comments, delimiter, nodetype,
+                                        data, chunksize, encoding, progress):
+        sources.append(u)
+        targets.append(v)
+        if weight in d:
+            weights.append(d[weight])
+    if not sources:
+        return (nx.CSRDiGraph if directed else nx.CSRGraph)()
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+    m = len(sources)
+    nodelist, index = np.unique(np.concatenate((sources, targets)),
+                                return_inverse=True)
+    index = index.ravel()
+    cls = nx.CSRDiGraph if directed else nx.CSRGraph
+    return cls.from_edge_arrays(index[:m], index[m:],
+                                np.concatenate(weights) if weights else None,
+                                nodelist=nodelist.tolist(), weight=weight)
+
+
 @open_file(0,mode='rb')
 def read_edgelist(path, comments="#", delimiter=None, create_using=None, 
-                  nodetype=None, data=True, edgetype=None, encoding='utf-8'):
+                  nodetype=None, data=True, edgetype=None, encoding='utf-8',
+                  chunksize=None, progress=None):
     """Read a graph from a list of edges.
 
     Parameters
@@ -320,6 +538,16 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None,
        Convert edge data from strings to specified type and use as 'weight'
     encoding: string, optional
        Specify which encoding to use when reading file.
+    chunksize : int, optional
+       If given, read the file in chunks of chunksize lines and add the
+       edges of each chunk at once.  If data is False or a list of
+       (label,type) tuples the chunks are parsed with NumPy and all lines
+       must have the same number of columns; see iter_edgelist_chunks().
+       With data=True the chunks are parsed by parse_edgelist().  The
+       obsolete edgetype cannot be combined with chunksize.
+    progress : function, optional
+       With chunksize, called with the number of edges read so far after
+       every chunk.
 
     Returns
     -------
@@ -350,17 +578,60 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None,
     >>> G.edges(data = True)
     [(1, 2, {'weight': 3.0})]
 
+    Large files can be read in chunks:
+
+    >>> G = nx.read_edgelist('test.edgelist', nodetype=int, chunksize=100000,
+    ...                      data=(('weight',float),))
+
     See parse_edgelist() for more examples of formatting.
 
     See Also
     --------
-    parse_edgelist
+    parse_edgelist, iter_edgelist_chunks, read_edgelist_csr
 
     Notes
     -----
     Since nodes must be hashable, the function nodetype must return hashable
     types (e.g. int, float, str, frozenset - or tuples of those, etc.) 
     """
+    if chunksize is not None:
+        if edgetype is not None:
+            raise ValueError("edgetype is not supported with chunksize, "
+                             "give data=(('weight', edgetype),) instead.")
+        G = parse_edgelist([], create_using=create_using)
+        if data is True:
+            # edge data dictionaries cannot be split into columns, so the
+            # chunks are parsed line by line
+            nedges = 0
+            while True:
+                chunk = [line.decode(encoding)
+                         for line in islice(path, chunksize)]
+                if not chunk:
+                    break
+                # a multigraph keeps every line, in order
+                H = parse_edgelist(chunk, comments=comments,
+                                   delimiter=delimiter,
+                                   create_using=nx.MultiDiGraph()
+                                   if G.is_directed() else nx.MultiGraph(),
+                                   nodetype=nodetype, data=True)
+                G.add_nodes_from(H)
+                G.add_edges_from(H.edges_iter(data=True))
+                nedges += H.number_of_edges()
+                if progress is not None:
+                    progress(nedges)
+            return G
+        for u, v, d in _edgelist_chunks(path, comments, delimiter, nodetype,
+                                        data, chunksize, encoding, progress):
+            u = u.tolist()
+            v = v.tolist()
+            if d:
+                keys = list(d)
+                values = zip(*[d[key].tolist() for key in keys])
+                G.add_edges_from((a, b, dict(zip(keys, x)))
+                                 for a, b, x in zip(u, v, values))
+            else:
+                G.add_edges_from(zip(u, v))
+        return G
     lines = (line.decode(encoding) for line in path)
     return parse_edgelist(lines,comments=comments, delimiter=delimiter,
                           create_using=create_using, nodetype=nodetype,
@@ -14,6 +14,10 @@ Format
 ------
 GEXF is an XML format.  See http://gexf.net/format/schema.html for the
 specification and http://gexf.net/format/basic.html for examples.
+
+Large files can be read and written with stream=True, which parses the
+document incrementally and writes it one element at a time instead of
+holding the whole XML tree in memory.
 """
 #    Copyright (C) 2013 by
 #    Aric Hagberg <hagberg@lanl.gov>
@@ -27,16 +31,20 @@ __all__ = ['write_gexf', 'read_gexf', 'relabel_gexf_graph', 'generate_gexf']
 import itertools
 import networkx as nx
 from networkx.utils import open_file, make_str
+from xml.sax.saxutils import quoteattr
 try:
-    from xml.etree.cElementTree import Element, ElementTree, tostring
+    from xml.etree.cElementTree import Element, ElementTree, tostring, \
+        iterparse
 except ImportError:
     try:
-        from xml.etree.ElementTree import Element, ElementTree, tostring
+        from xml.etree.ElementTree import Element, ElementTree, tostring, \
+            iterparse
     except ImportError:
         pass
 
 @open_file(1,mode='wb')
-def write_gexf(G, path, encoding='utf-8',prettyprint=True,version='1.1draft'):
+def write_gexf(G, path, encoding='utf-8',prettyprint=True,version='1.1draft',
+               stream=False):
     """Write G in GEXF format to path.
 
     "GEXF (Graph Exchange XML Format) is a language for describing
@@ -53,11 +61,15 @@ def write_gexf(G, path, encoding='utf-8',prettyprint=True,version='1.1draft'):
        Encoding for text data.
     prettyprint : bool (optional)
        If True use line breaks and indenting in output XML.
+    stream : bool (optional)
+       If True write the nodes and edges one at a time without building
+       the XML tree of the whole document in memory.
 
     Examples
     --------
     >>> G=nx.path_graph(4)
     >>> nx.write_gexf(G, "test.gexf")
+    >>> nx.write_gexf(G, "test.gexf", stream=True)
 
     Notes
     -----
@@ -74,8 +86,11 @@ def write_gexf(G, path, encoding='utf-8',prettyprint=True,version='1.1draft'):
     """
     writer = GEXFWriter(encoding=encoding,prettyprint=prettyprint,
                         version=version)
-    writer.add_graph(G)
-    writer.write(path)
+    if stream:
+        writer.stream_graph(G, path)
+    else:
+        writer.add_graph(G)
+        writer.write(path)
 
 def generate_gexf(G, encoding='utf-8',prettyprint=True,version='1.1draft'):
     """Generate lines of GEXF format representation of G"
@@ -120,7 +135,8 @@ def generate_gexf(G, encoding='utf-8',prettyprint=True,version='1.1draft'):
         yield line
 
 @open_file(0,mode='rb')
-def read_gexf(path,node_type=None,relabel=False,version='1.1draft'):
+def read_gexf(path,node_type=None,relabel=False,version='1.1draft',
+              stream=False):
     """Read graph in GEXF format from path.
 
     "GEXF (Graph Exchange XML Format) is a language for describing
@@ -139,6 +155,11 @@ def read_gexf(path,node_type=None,relabel=False,version='1.1draft'):
        If True relabel the nodes to use the GEXF node "label" attribute
        instead of the node "id" attribute as the NetworkX node label.
 
+    stream : bool (default: False)
+       If True parse the file incrementally, adding the nodes and edges
+       to the graph as their elements are read and then discarding them.
+       This uses much less memory for large files.
+
     Returns
     -------
     graph: NetworkX graph
@@ -154,7 +175,7 @@ def read_gexf(path,node_type=None,relabel=False,version='1.1draft'):
     ----------
     .. [1] GEXF graph format, http://gexf.net/format/
     """
-    reader = GEXFReader(node_type=node_type,version=version)
+    reader = GEXFReader(node_type=node_type,version=version,iterparse=stream)
     if relabel:
         G=relabel_gexf_graph(reader(path))
     else:
@@ -282,7 +303,7 @@ class GEXFWriter(GEXF):
         s=tostring(self.xml).decode(self.encoding)
         return s
 
-    def add_graph(self, G):
+    def make_graph_element(self, G):
         # set graph attributes
         if G.graph.get('mode')=='dynamic':
             mode='dynamic'
@@ -296,13 +317,60 @@ class GEXFWriter(GEXF):
             default='undirected'
         graph_element = Element("graph",defaultedgetype=default,mode=mode)
         self.graph_element=graph_element
+        return graph_element
+
+    def add_graph(self, G):
+        graph_element = self.make_graph_element(G)
         self.add_nodes(G,graph_element)
         self.add_edges(G,graph_element)
         self.xml.append(graph_element)
 
+    def stream_graph(self, G, fh):
+        # Serialize graph G in GEXF to the open fh one element at a time.
+        # The nodes and edges are walked twice, first to collect the
+        # attribute definitions and graph mode that go before them and
+        # then to write them.
+        graph_element = self.make_graph_element(G)
+        first_edge_id = next(self.edge_id)
+        self.edge_id = itertools.count(first_edge_id)
+        for element in self.node_elements(G):
+            pass
+        for element in self.edge_elements(G):
+            pass
+        self.edge_id = itertools.count(first_edge_id)
+        header='<?xml version="1.0" encoding="%s"?>'%self.encoding
+        fh.write(header.encode(self.encoding))
+        self.write_start(fh, self.xml, 0)
+        self.write_start(fh, graph_element, 1)
+        for attributes_element in graph_element:
+            self.write_element(fh, attributes_element, 2)
+        nodes_element = Element('nodes')
+        self.write_start(fh, nodes_element, 2)
+        for element in self.node_elements(G):
+            self.write_element(fh, element, 3)
+        self.write_end(fh, nodes_element, 2)
+        edges_element = Element('edges')
+        self.write_start(fh, edges_element, 2)
+        for element in self.edge_elements(G):
+            self.write_element(fh, element, 3)
+        self.write_end(fh, edges_element, 2)
+        self.write_end(fh, graph_element, 1)
+        self.write_end(fh, self.xml, 0)
 
     def add_nodes(self, G, graph_element):
         nodes_element = Element('nodes')
+        for node_element in self.node_elements(G):
+            nodes_element.append(node_element)
+        graph_element.append(nodes_element)
+
+    def add_edges(self, G, graph_element):
+        edges_element = Element('edges')
+        for edge_element in self.edge_elements(G):
+            edges_element.append(edge_element)
+        graph_element.append(edges_element)
+
+    def node_elements(self, G):
+        # generate the node elements
         for node,data in G.nodes_iter(data=True):
             node_data=data.copy()
             node_id = make_str(node_data.pop('id', node))
@@ -328,11 +396,10 @@ class GEXFWriter(GEXF):
             node_data=self.add_viz(node_element,node_data)
             node_data=self.add_attributes("node", node_element,
                                           node_data, default)
-            nodes_element.append(node_element)
-        graph_element.append(nodes_element)
+            yield node_element
 
-
-    def add_edges(self, G, graph_element):
+    def edge_elements(self, G):
+        # generate the edge elements
         def edge_key_data(G):
             # helper function to unify multigraph and graph edge iterator
             if G.is_multigraph():
@@ -351,7 +418,6 @@ class GEXFWriter(GEXF):
                         edge_id=next(self.edge_id)
                     yield u,v,edge_id,edge_data
 
-        edges_element = Element('edges')
         for u,v,key,edge_data in edge_key_data(G):
             kw={'id':make_str(key)}
             try:
@@ -389,8 +455,7 @@ class GEXFWriter(GEXF):
             edge_data=self.add_viz(edge_element,edge_data)
             edge_data=self.add_attributes("edge", edge_element,
                                           edge_data, default)
-            edges_element.append(edge_element)
-        graph_element.append(edges_element)
+            yield edge_element
 
 
     def add_attributes(self, node_or_edge, xml_obj, data, default):
@@ -583,6 +648,28 @@ class GEXFWriter(GEXF):
         fh.write(header.encode(self.encoding))
         document.write(fh, encoding=self.encoding)
 
+    def write_start(self, fh, elem, level):
+        # start tag of elem, without its children
+        attrib = ''.join(' %s=%s' % (k, quoteattr(v))
+                         for k, v in elem.attrib.items())
+        s = '<%s%s>' % (elem.tag, attrib)
+        if self.prettyprint:
+            s = "\n" + level*"  " + s
+        fh.write(s.encode(self.encoding, 'xmlcharrefreplace'))
+
+    def write_end(self, fh, elem, level):
+        s = '</%s>' % elem.tag
+        if self.prettyprint:
+            s = "\n" + level*"  " + s
+        fh.write(s.encode(self.encoding))
+
+    def write_element(self, fh, elem, level):
+        # elem and its children
+        if self.prettyprint:
+            self.indent(elem, level)
+            elem.tail = None
+            fh.write(("\n" + level*"  ").encode(self.encoding))
+        fh.write(tostring(elem))
 
     def indent(self, elem, level=0):
         # in-place prettyprint formatter
@@ -604,18 +691,21 @@ class GEXFWriter(GEXF):
 class GEXFReader(GEXF):
     # Class to read GEXF format files
     # use read_gexf() function
-    def __init__(self, node_type=None,version='1.1draft'):
+    def __init__(self, node_type=None,version='1.1draft',iterparse=False):
         try:
             import xml.etree.ElementTree
         except ImportError:
              raise ImportError('GEXF reader requires '
                                'xml.elementtree.ElementTree')
         self.node_type=node_type
+        self.iterparse=iterparse
         # assume simple graph and test for multigraph on read
         self.simple_graph=True
         self.set_version(version)
 
     def __call__(self, stream):
+        if self.iterparse:
+            return self.iter_graph(stream)
         self.xml = ElementTree(file=stream)
         g=self.xml.find("{%s}graph" % self.NS_GEXF)
         if g is not None:
@@ -629,7 +719,55 @@ class GEXFReader(GEXF):
         raise nx.NetworkXError("No <graph> element in GEXF file")
 
 
-    def make_graph(self, graph_xml):
+    def iter_graph(self, stream):
+        # Build the graph while the file is parsed, discarding the node
+        # and edge elements once they have been added.
+        G = None
+        graph_xml = None
+        path = [] # open elements
+        for event, elem in iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                if not path:
+                    # pick the version from the namespace of the root
+                    if not elem.tag.startswith("{%s}" % self.NS_GEXF):
+                        for version in self.versions:
+                            self.set_version(version)
+                            if elem.tag.startswith("{%s}" % self.NS_GEXF):
+                                break
+                    tags = dict((name, "{%s}%s" % (self.NS_GEXF, name))
+                                for name in ['graph', 'attributes', 'nodes',
+                                             'node', 'edges', 'edge'])
+                elif len(path) == 1 and elem.tag == tags['graph'] \
+                        and G is None:
+                    G = self.new_graph(elem)
+                    graph_xml = elem
+                    node_attr = {}
+                    edge_attr = {}
+                elif len(path) == 2 and path[1] is graph_xml \
+                        and elem.tag == tags['edges']:
+                    self.add_weight_attribute(edge_attr)
+                path.append(elem)
+                continue
+            path.pop()
+            if G is None or len(path) < 2 or path[1] is not graph_xml:
+                continue
+            if len(path) == 2 and elem.tag == tags['attributes']:
+                self.read_attributes(G, elem, node_attr, edge_attr)
+            elif len(path) == 3 and elem.tag == tags['node'] \
+                    and path[2].tag == tags['nodes']:
+                self.add_node(G, elem, node_attr)
+                elem.clear()
+                path[2].remove(elem)
+            elif len(path) == 3 and elem.tag == tags['edge'] \
+                    and path[2].tag == tags['edges']:
+                self.add_edge(G, elem, edge_attr)
+                elem.clear()
+                path[2].remove(elem)
+        if G is None:
+            raise nx.NetworkXError("No <graph> element in GEXF file")
+        return self.finish_graph(G)
+
+    def new_graph(self, graph_xml):
         # start with empty DiGraph or MultiDiGraph
         edgedefault = graph_xml.get("defaultedgetype", None)
         if edgedefault=='directed':
@@ -654,36 +792,40 @@ class GEXFReader(GEXF):
         self.timeformat=graph_xml.get('timeformat')
         if self.timeformat == 'date':
             self.timeformat = 'string'
+        G.graph['edge_default']={}
+        return G
 
-        # node and edge attributes
-        attributes_elements=graph_xml.findall("{%s}attributes"%self.NS_GEXF)
-        # dictionaries to hold attributes and attribute defaults
-        node_attr={}
-        node_default={}
-        edge_attr={}
-        edge_default={}
-        for a in attributes_elements:
-            attr_class = a.get("class")
-            if attr_class=='node':
-                na,nd = self.find_gexf_attributes(a)
-                node_attr.update(na)
-                node_default.update(nd)
-                G.graph['node_default']=node_default
-            elif attr_class=='edge':
-                ea,ed = self.find_gexf_attributes(a)
-                edge_attr.update(ea)
-                edge_default.update(ed)
-                G.graph['edge_default']=edge_default
-            else:
-                raise # unknown attribute class
+    def read_attributes(self, G, attributes_element, node_attr, edge_attr):
+        # add the attributes and attribute defaults of an attributes element
+        attr_class = attributes_element.get("class")
+        if attr_class=='node':
+            na,nd = self.find_gexf_attributes(attributes_element)
+            node_attr.update(na)
+            G.graph.setdefault('node_default',{}).update(nd)
+        elif attr_class=='edge':
+            ea,ed = self.find_gexf_attributes(attributes_element)
+            edge_attr.update(ea)
+            G.graph['edge_default'].update(ed)
+        else:
+            raise # unknown attribute class
 
+    def add_weight_attribute(self, edge_attr):
         # Hack to handle Gephi0.7beta bug
         # add weight attribute
         ea={'weight':{'type': 'double', 'mode': 'static', 'title': 'weight'}}
-        ed={}
         edge_attr.update(ea)
-        edge_default.update(ed)
-        G.graph['edge_default']=edge_default
+
+    def make_graph(self, graph_xml):
+        G = self.new_graph(graph_xml)
+
+        # node and edge attributes
+        attributes_elements=graph_xml.findall("{%s}attributes"%self.NS_GEXF)
+        # dictionaries to hold attributes
+        node_attr={}
+        edge_attr={}
+        for a in attributes_elements:
+            self.read_attributes(G, a, node_attr, edge_attr)
+        self.add_weight_attribute(edge_attr)
 
         # add nodes
         nodes_element=graph_xml.find("{%s}nodes" % self.NS_GEXF)
@@ -696,7 +838,9 @@ class GEXFReader(GEXF):
         if edges_element is not None:
             for edge_xml in edges_element.findall("{%s}edge" % self.NS_GEXF):
                 self.add_edge(G, edge_xml, edge_attr)
+        return self.finish_graph(G)
 
+    def finish_graph(self, G):
         # switch to Graph or DiGraph if no parallel edges were found.
         if self.simple_graph:
             if G.is_directed():
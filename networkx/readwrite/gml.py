@@ -13,7 +13,9 @@ overtaken and adapted by several other systems for drawing graphs."
 
 See http://www.infosun.fim.uni-passau.de/Graphlet/GML/gml-tr.html
 
-Requires pyparsing: http://pyparsing.wikispaces.com/
+The reader uses its own tokenizer and adds the nodes and edges to the
+graph as they are parsed.  If pyparsing (http://pyparsing.wikispaces.com/)
+is installed it is used as a fallback for files the tokenizer rejects.
 
 Format
 ------
@@ -58,6 +60,8 @@ except ImportError:
     import html.entities as htmlentitydefs
 
 def unescape(text):
+    if '&' not in text:
+        return text
     def fixup(m):
         text = m.group(0)
         if text[:2] == "&#":
@@ -97,8 +101,8 @@ def read_gml(path, relabel=False):
 
     Raises
     ------
-    ImportError
-        If the pyparsing module is not available.
+    NetworkXError
+        If the file is not valid GML.
 
     See Also
     --------
@@ -106,7 +110,6 @@ def read_gml(path, relabel=False):
 
     Notes
     -----
-    Requires pyparsing: http://pyparsing.wikispaces.com/
     The GML specification says that files should be ASCII encoded, with any
     extended ASCII characters (iso8859-1) appearing as HTML character entities.
 
@@ -122,7 +125,12 @@ def read_gml(path, relabel=False):
     >>> H=nx.read_gml('test.gml')
     """
     lines = (unescape(line.decode('ascii')) for line in path)
-    G = parse_gml(lines, relabel=relabel)
+    def reread():
+        path.seek(0)
+        return (unescape(line.decode('ascii')) for line in path)
+    G = _parse_gml_graph(lines, reread if hasattr(path, 'seek') else None)
+    if relabel:
+        G = _relabel_gml(G)
     return G
 
 def parse_gml(lines, relabel=True):
@@ -143,8 +151,8 @@ def parse_gml(lines, relabel=True):
 
     Raises
     ------
-    ImportError
-        If the pyparsing module is not available.
+    NetworkXError
+        If the data is not valid GML.
 
     See Also
     --------
@@ -155,13 +163,223 @@ def parse_gml(lines, relabel=True):
     This stores nested GML attributes as dictionaries in the
     NetworkX graph, node, and edge attribute structures.
 
-    Requires pyparsing: http://pyparsing.wikispaces.com/
+    The nodes and edges are added to the graph as they are parsed, so
+    the "directed" graph attribute must come before the edges.  If the
+    data is rejected and pyparsing is available, a string or list of
+    lines is parsed again with pyparsing.
 
     References
     ----------
     GML specification:
     http://www.infosun.fim.uni-passau.de/Graphlet/GML/gml-tr.html
+
+    Examples
+    --------
+    >>> G=nx.parse_gml('graph [ node [ id 0 label "a" ] node [ id 1 ] ]',
+    ...                relabel=False)
+    >>> sorted(G.nodes(data=True))
+    [(0, {'id': 0, 'label': 'a'}), (1, {'id': 1})]
+    """
+    if is_string_like(lines):
+        lines = lines.splitlines(True)
+    # lines can be read again unless they come from an iterator
+    if iter(lines) is lines:
+        reread = None
+    else:
+        reread = lambda: lines
+    G = _parse_gml_graph(lines, reread)
+    if relabel:
+        G = _relabel_gml(G)
+    return G
+
+
+# A token is a bracket, a number, a word, a complete quoted string or the
+# start of a string continued on the following lines.
+_gml_token = re.compile(r'''
+    (?P<comment>\#.*)
+  | (?P<bracket>[\[\]])
+  | (?P<real>[+-]?\d+\.\d*(?:[eE][+-]?\d+)?)
+  | (?P<int>[\d-]+)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<string>"(?:[^"\\]|\\.)*")
+  | (?P<open>"(?:[^"\\]|\\.)*\Z)
+  | (?P<error>\S)
+  ''', re.VERBOSE | re.DOTALL)
+_gml_string_end = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def _tokenize_gml(lines):
+    """Generate (kind, value) tokens from lines of GML.
+
+    Kinds are '[', ']', 'word', 'string', 'int', 'real' and 'header'
+    for the Creator and Version lines before the graph.
     """
+    header = True
+    lines = iter(lines)
+    for line in lines:
+        if header:
+            key = line.split(None, 1)[:1]
+            if key == ['Creator'] or key == ['Version']:
+                rest = line.lstrip()[len(key[0]):].rstrip('\r\n')
+                yield 'header', (key[0], rest)
+                continue
+        pos = 0
+        while True:
+            for m in _gml_token.finditer(line, pos):
+                kind = m.lastgroup
+                value = m.group()
+                if kind == 'word':
+                    yield kind, value
+                elif kind == 'int':
+                    try:
+                        yield kind, int(value)
+                    except ValueError:
+                        raise NetworkXError('Bad GML integer %s' % value)
+                elif kind == 'bracket':
+                    yield value, value
+                elif kind == 'string':
+                    yield kind, value[1:-1]
+                elif kind == 'real':
+                    yield kind, float(value)
+                elif kind == 'comment':
+                    continue
+                elif kind == 'open':
+                    break
+                else:
+                    raise NetworkXError('Bad GML character %s' % value)
+                header = False
+            else:
+                break
+            # join the lines of a string that spans several lines
+            value = [value]
+            for line in lines:
+                m = _gml_string_end.match(line)
+                if m is not None:
+                    value.append(m.group())
+                    break
+                value.append(line)
+            else:
+                raise NetworkXError('Unterminated GML string')
+            yield 'string', ''.join(value)[1:-1]
+            pos = m.end()
+
+
+def _gml_value(tokens):
+    # Return the next value, parsing a list into a dictionary.
+    for kind, value in tokens:
+        if kind == '[':
+            return _gml_list(tokens)
+        if kind == ']' or kind == 'header':
+            break
+        return value
+    raise NetworkXError('Expected a GML value')
+
+
+def _gml_list(tokens):
+    # Return the key-value pairs up to the closing bracket as a dictionary.
+    result = {}
+    for kind, key in tokens:
+        if kind == ']':
+            return result
+        if kind != 'word':
+            raise NetworkXError('Expected a GML key, found %s' % (key,))
+        result[str(key)] = _gml_value(tokens)
+    raise NetworkXError('Missing ] in GML')
+
+
+def _parse_gml_tokens(tokens):
+    # Build the graph, adding the nodes and edges as they are parsed.
+    graph_attr = {}
+    for kind, value in tokens:
+        if kind == 'header':
+            graph_attr[value[0]] = value[1]
+        elif kind == 'word' and value == 'graph':
+            break
+        else:
+            raise NetworkXError('Expected GML graph, found %s' % (value,))
+    else:
+        raise NetworkXError('No GML graph found')
+    if next(tokens, (None,))[0] != '[':
+        raise NetworkXError('Expected [ after GML graph')
+    G = nx.MultiGraph()
+    multigraph = False
+    for kind, key in tokens:
+        if kind == ']':
+            break
+        if kind != 'word':
+            raise NetworkXError('Expected a GML key, found %s' % (key,))
+        value = _gml_value(tokens)
+        if key == 'node' or key == 'edge':
+            if not isinstance(value, dict):
+                raise NetworkXError('Bad GML %s: %s' % (key, value))
+            try:
+                if key == 'node':
+                    G.add_node(value['id'], attr_dict=value)
+                else:
+                    source = value.pop('source')
+                    target = value.pop('target')
+                    if G.has_edge(source, target):
+                        multigraph = True
+                    G.add_edge(source, target, attr_dict=value)
+            except KeyError as err:
+                raise NetworkXError('GML %s without %s' % (key, err))
+        else:
+            if key == 'directed' and (value == 1) != G.is_directed():
+                if G.number_of_edges() > 0:
+                    raise NetworkXError('GML directed attribute found '
+                                        'after the edges')
+                if value == 1:
+                    G = nx.MultiDiGraph(G)
+                else:
+                    G = nx.MultiGraph(G)
+            graph_attr[key] = value
+    else:
+        raise NetworkXError('Missing ] in GML')
+    G.graph.update(graph_attr)
+    # switch to Graph or DiGraph if no parallel edges were found.
+    if not multigraph:
+        if G.is_directed():
+            G=nx.DiGraph(G)
+        else:
+            G=nx.Graph(G)
+    return G
+
+
+def _have_pyparsing():
+    try:
+        import pyparsing
+    except ImportError:
+        try:
+            import matplotlib.pyparsing
+        except:
+            return False
+    return True
+
+
+def _parse_gml_graph(lines, reread=None):
+    # Parse with the tokenizer, falling back to pyparsing with the lines
+    # returned by reread() if they are rejected.
+    try:
+        return _parse_gml_tokens(_tokenize_gml(lines))
+    except NetworkXError:
+        if reread is None or not _have_pyparsing():
+            raise
+    return _pyparse_gml_graph(reread())
+
+
+def _relabel_gml(G):
+    # relabel, but check for duplicate labels first
+    mapping=[(n,d['label']) for n,d in G.node.items()]
+    x,y=zip(*mapping)
+    if len(set(y))!=len(G):
+        raise NetworkXError('Failed to relabel nodes: '
+                            'duplicate node labels found. '
+                            'Use relabel=False.')
+    return nx.relabel_nodes(G,dict(mapping))
+
+
+def _pyparse_gml_graph(lines):
+    # Build the graph from the pyparsing parse tree of the lines.
     try:
         from pyparsing import ParseException
     except ImportError:
@@ -220,22 +438,13 @@ def parse_gml(lines, relabel=True):
             G=nx.DiGraph(G)
         else:
             G=nx.Graph(G)
-
-    if relabel:
-        # relabel, but check for duplicate labels first
-        mapping=[(n,d['label']) for n,d in G.node.items()]
-        x,y=zip(*mapping)
-        if len(set(y))!=len(G):
-            raise NetworkXError('Failed to relabel nodes: '
-                                'duplicate node labels found. '
-                                'Use relabel=False.')
-        G=nx.relabel_nodes(G,dict(mapping))
     return G
 
 def pyparse_gml():
     """A pyparsing tokenizer for GML graph format.
 
-    This is not intended to be called directly.
+    This is not intended to be called directly.  It is only used when
+    the GML tokenizer of parse_gml() rejects the data.
 
     See Also
     --------
@@ -431,17 +640,6 @@ def write_gml(G, path):
         path.write(line.encode('ascii', 'xmlcharrefreplace'))
 
 
-# fixture for nose tests
-def setup_module(module):
-    from nose import SkipTest
-    try:
-        import pyparsing
-    except:
-        try:
-            import matplotlib.pyparsing
-        except:
-            raise SkipTest("pyparsing not available")
-
 # fixture for nose tests
 def teardown_module(module):
     import os
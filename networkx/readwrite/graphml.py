@@ -33,6 +33,10 @@ GraphML is an XML format.  See
 http://graphml.graphdrawing.org/specification.html for the specification and
 http://graphml.graphdrawing.org/primer/graphml-primer.html
 for examples.
+
+Large files can be read and written with stream=True, which parses the
+document incrementally and writes it one element at a time instead of
+holding the whole XML tree in memory.
 """
 __author__ = """\n""".join(['Salim Fadhley',
                             'Aric Hagberg (hagberg@lanl.gov)'
@@ -44,16 +48,19 @@ __all__ = ['write_graphml', 'read_graphml', 'generate_graphml',
 import networkx as nx
 from networkx.utils import open_file, make_str
 import warnings
+from xml.sax.saxutils import quoteattr
 try:
-    from xml.etree.cElementTree import Element, ElementTree, tostring, fromstring
+    from xml.etree.cElementTree import Element, ElementTree, tostring, \
+        fromstring, iterparse
 except ImportError:
     try:
-        from xml.etree.ElementTree import Element, ElementTree, tostring, fromstring
+        from xml.etree.ElementTree import Element, ElementTree, tostring, \
+            fromstring, iterparse
     except ImportError:
         pass
 
 @open_file(1,mode='wb')
-def write_graphml(G, path, encoding='utf-8',prettyprint=True):
+def write_graphml(G, path, encoding='utf-8',prettyprint=True,stream=False):
     """Write G in GraphML XML format to path
 
     Parameters
@@ -67,11 +74,15 @@ def write_graphml(G, path, encoding='utf-8',prettyprint=True):
        Encoding for text data.
     prettyprint : bool (optional)
        If True use line breaks and indenting in output XML.
+    stream : bool (optional)
+       If True write the nodes and edges one at a time without building
+       the XML tree of the whole document in memory.
 
     Examples
     --------
     >>> G=nx.path_graph(4)
     >>> nx.write_graphml(G, "test.graphml")
+    >>> nx.write_graphml(G, "test.graphml", stream=True)
 
     Notes
     -----
@@ -79,8 +90,11 @@ def write_graphml(G, path, encoding='utf-8',prettyprint=True):
     edges together) hyperedges, nested graphs, or ports.
     """
     writer = GraphMLWriter(encoding=encoding,prettyprint=prettyprint)
-    writer.add_graph_element(G)
-    writer.dump(path)
+    if stream:
+        writer.stream_graph(G, path)
+    else:
+        writer.add_graph_element(G)
+        writer.dump(path)
 
 def generate_graphml(G, encoding='utf-8',prettyprint=True):
     """Generate GraphML lines for G
@@ -113,7 +127,7 @@ def generate_graphml(G, encoding='utf-8',prettyprint=True):
         yield line
 
 @open_file(0,mode='rb')
-def read_graphml(path,node_type=str):
+def read_graphml(path,node_type=str,stream=False):
     """Read graph in GraphML format from path.
 
     Parameters
@@ -125,6 +139,11 @@ def read_graphml(path,node_type=str):
     node_type: Python type (default: str)
        Convert node ids to this type
 
+    stream: bool (default: False)
+       If True parse the file incrementally, adding the nodes and edges
+       to the graph as their elements are read and then discarding them.
+       This uses much less memory for large files.
+
     Returns
     -------
     graph: NetworkX graph
@@ -148,7 +167,7 @@ def read_graphml(path,node_type=str):
     the file to "file.graphml.gz".
 
     """
-    reader = GraphMLReader(node_type=node_type)
+    reader = GraphMLReader(node_type=node_type,iterparse=stream)
     # need to check for multiple graphs
     glist=list(reader(path=path))
     return glist[0]
@@ -300,41 +319,45 @@ class GraphMLWriter(GraphML):
                               scope=scope, default=default_value)
             xml_obj.append(obj)
 
-    def add_nodes(self, G, graph_element):
+    def node_elements(self, G):
+        """Generate the XML elements of the nodes of G."""
+        default=G.graph.get('node_default',{})
         for node,data in G.nodes_iter(data=True):
             node_element = Element("node", id = make_str(node))
-            default=G.graph.get('node_default',{})
             self.add_attributes("node", node_element, data, default)
-            graph_element.append(node_element)
+            yield node_element
 
-    def add_edges(self, G, graph_element):
+    def edge_elements(self, G):
+        """Generate the XML elements of the edges of G."""
+        default=G.graph.get('edge_default',{})
         if G.is_multigraph():
             for u,v,key,data in G.edges_iter(data=True,keys=True):
                 edge_element = Element("edge",source=make_str(u),
                                        target=make_str(v))
-                default=G.graph.get('edge_default',{})
                 self.add_attributes("edge", edge_element, data, default)
                 self.add_attributes("edge", edge_element,
                                     {'key':key}, default)
-                graph_element.append(edge_element)
+                yield edge_element
         else:
             for u,v,data in G.edges_iter(data=True):
                 edge_element = Element("edge",source=make_str(u),
                                        target=make_str(v))
-                default=G.graph.get('edge_default',{})
                 self.add_attributes("edge", edge_element, data, default)
-                graph_element.append(edge_element)
+                yield edge_element
 
-    def add_graph_element(self, G):
-        """
-        Serialize graph G in GraphML to the stream.
-        """
+    def add_nodes(self, G, graph_element):
+        for node_element in self.node_elements(G):
+            graph_element.append(node_element)
+
+    def add_edges(self, G, graph_element):
+        for edge_element in self.edge_elements(G):
+            graph_element.append(edge_element)
+
+    def make_graph_element(self, G, graphid):
         if G.is_directed():
             default_edge_type='directed'
         else:
             default_edge_type='undirected'
-
-        graphid=G.graph.pop('id',None)
         if graphid is None:
             graph_element = Element("graph",
                                 edgedefault = default_edge_type)
@@ -342,15 +365,73 @@ class GraphMLWriter(GraphML):
             graph_element = Element("graph",
                                 edgedefault = default_edge_type,
                                 id=graphid)
-
         default={}
         data=dict((k,v) for (k,v) in  G.graph.items()
-                  if k not in ['node_default','edge_default'])
+                  if k not in ['node_default','edge_default','id'])
         self.add_attributes("graph", graph_element, data, default)
+        return graph_element
+
+    def add_graph_element(self, G):
+        """
+        Serialize graph G in GraphML to the stream.
+        """
+        graphid=G.graph.pop('id',None)
+        graph_element = self.make_graph_element(G, graphid)
         self.add_nodes(G,graph_element)
         self.add_edges(G,graph_element)
         self.xml.append(graph_element)
 
+    def stream_graph(self, G, stream):
+        """
+        Write graph G in GraphML to the stream one element at a time.
+
+        The nodes and edges are walked twice, first to collect the key
+        definitions that go at the start of the document and then to
+        write them, so the XML tree of the graph is never held in memory.
+        """
+        graph_element = self.make_graph_element(G, G.graph.get('id'))
+        for element in self.node_elements(G):
+            pass
+        for element in self.edge_elements(G):
+            pass
+        header='<?xml version="1.0" encoding="%s"?>'%self.encoding
+        stream.write(header.encode(self.encoding))
+        self.write_start(stream, self.xml, 0)
+        for key_element in self.xml:
+            self.write_element(stream, key_element, 1)
+        self.write_start(stream, graph_element, 1)
+        for element in graph_element:
+            self.write_element(stream, element, 2)
+        for element in self.node_elements(G):
+            self.write_element(stream, element, 2)
+        for element in self.edge_elements(G):
+            self.write_element(stream, element, 2)
+        self.write_end(stream, graph_element, 1)
+        self.write_end(stream, self.xml, 0)
+
+    def write_start(self, stream, elem, level):
+        # start tag of elem, without its children
+        attrib = ''.join(' %s=%s' % (k, quoteattr(v))
+                         for k, v in elem.attrib.items())
+        s = '<%s%s>' % (elem.tag, attrib)
+        if self.prettyprint:
+            s = "\n" + level*"  " + s
+        stream.write(s.encode(self.encoding, 'xmlcharrefreplace'))
+
+    def write_end(self, stream, elem, level):
+        s = '</%s>' % elem.tag
+        if self.prettyprint:
+            s = "\n" + level*"  " + s
+        stream.write(s.encode(self.encoding))
+
+    def write_element(self, stream, elem, level):
+        # elem and its children
+        if self.prettyprint:
+            self.indent(elem, level)
+            elem.tail = None
+            stream.write(("\n" + level*"  ").encode(self.encoding))
+        stream.write(tostring(elem))
+
     def add_graphs(self, graph_list):
         """
         Add many graphs to this GraphML document.
@@ -386,16 +467,21 @@ class GraphMLWriter(GraphML):
 class GraphMLReader(GraphML):
     """Read a GraphML document.  Produces NetworkX graph objects.
     """
-    def __init__(self, node_type=str):
+    def __init__(self, node_type=str, iterparse=False):
         try:
             import xml.etree.ElementTree
         except ImportError:
              raise ImportError('GraphML reader requires '
                                'xml.elementtree.ElementTree')
         self.node_type=node_type
+        self.iterparse=iterparse
         self.multigraph=False # assume multigraph and test for parallel edges
 
     def __call__(self, path=None, string=None):
+        if path is not None and self.iterparse:
+          for G in self.iter_graphs(path):
+              yield G
+          return
         if path is not None:
           self.xml = ElementTree(file=path)
         elif string is not None:
@@ -406,7 +492,50 @@ class GraphMLReader(GraphML):
         for g in self.xml.findall("{%s}graph" % self.NS_GRAPHML):
             yield self.make_graph(g, keys, defaults)
 
-    def make_graph(self, graph_xml, graphml_keys, defaults):
+    def iter_graphs(self, path):
+        # Build the graphs while the file is parsed, discarding the node
+        # and edge elements once they have been added.
+        node_tag = "{%s}node" % self.NS_GRAPHML
+        edge_tag = "{%s}edge" % self.NS_GRAPHML
+        graph_tag = "{%s}graph" % self.NS_GRAPHML
+        key_tag = "{%s}key" % self.NS_GRAPHML
+        hyperedge_tag = "{%s}hyperedge" % self.NS_GRAPHML
+        keys = {}
+        defaults = {}
+        root = None
+        graph_xml = None
+        depth = 0 # number of open graph elements
+        for event, elem in iterparse(path, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                elif elem.tag == graph_tag:
+                    depth += 1
+                    if depth == 1:
+                        graph_xml = elem
+                        G = self.new_graph(graph_xml, keys, defaults)
+                elif elem.tag == hyperedge_tag and depth == 1:
+                    raise nx.NetworkXError("GraphML reader does not support "
+                                           "hyperedges")
+            elif depth == 1 and elem.tag == node_tag:
+                self.add_node(G, elem, keys)
+                elem.clear()
+                graph_xml.remove(elem)
+            elif depth == 1 and elem.tag == edge_tag:
+                self.add_edge(G, elem, keys)
+                elem.clear()
+                graph_xml.remove(elem)
+            elif elem.tag == graph_tag:
+                depth -= 1
+                if depth == 0:
+                    G = self.finish_graph(G, graph_xml, keys)
+                    elem.clear()
+                    root.remove(elem)
+                    yield G
+            elif elem.tag == key_tag and depth == 0:
+                self.decode_key(elem, keys, defaults)
+
+    def new_graph(self, graph_xml, graphml_keys, defaults):
         # set default graph type
         edgedefault = graph_xml.get("edgedefault", None)
         if edgedefault=='directed':
@@ -424,6 +553,10 @@ class GraphMLReader(GraphML):
                 G.graph['node_default'].update({name:python_type(value)})
             if key_for=='edge':
                 G.graph['edge_default'].update({name:python_type(value)})
+        return G
+
+    def make_graph(self, graph_xml, graphml_keys, defaults):
+        G = self.new_graph(graph_xml, graphml_keys, defaults)
         # hyperedges are not supported
         hyperedge=graph_xml.find("{%s}hyperedge" % self.NS_GRAPHML)
         if hyperedge is not None:
@@ -434,6 +567,9 @@ class GraphMLReader(GraphML):
         # add edges
         for edge_xml in graph_xml.findall("{%s}edge" % self.NS_GRAPHML):
             self.add_edge(G, edge_xml, graphml_keys)
+        return self.finish_graph(G, graph_xml, graphml_keys)
+
+    def finish_graph(self, G, graph_xml, graphml_keys):
         # add graph data
         data = self.decode_data_elements(graphml_keys, graph_xml)
         G.graph.update(data)
@@ -543,28 +679,32 @@ class GraphMLReader(GraphML):
         graphml_keys = {}
         graphml_key_defaults = {}
         for k in graph_element.findall("{%s}key" % self.NS_GRAPHML):
-            attr_id = k.get("id")
-            attr_type=k.get('attr.type')
-            attr_name=k.get("attr.name")
-            yfiles_type=k.get("yfiles.type")
-            if yfiles_type is not None:
-                attr_name = yfiles_type
-                attr_type = 'yfiles'
-            if attr_type is None:
-                attr_type = "string"
-                warnings.warn("No key type for id %s. Using string"%attr_id)
-            if attr_name is None:
-                raise nx.NetworkXError("Unknown key for id %s in file."%attr_id)
-            graphml_keys[attr_id] = {
-                "name":attr_name,
-                "type":self.python_type[attr_type],
-                "for":k.get("for")}
-            # check for "default" subelement of key element
-            default=k.find("{%s}default" % self.NS_GRAPHML)
-            if default is not None:
-                graphml_key_defaults[attr_id]=default.text
+            self.decode_key(k, graphml_keys, graphml_key_defaults)
         return graphml_keys,graphml_key_defaults
 
+    def decode_key(self, k, graphml_keys, graphml_key_defaults):
+        """Add the key and key default of a key element."""
+        attr_id = k.get("id")
+        attr_type=k.get('attr.type')
+        attr_name=k.get("attr.name")
+        yfiles_type=k.get("yfiles.type")
+        if yfiles_type is not None:
+            attr_name = yfiles_type
+            attr_type = 'yfiles'
+        if attr_type is None:
+            attr_type = "string"
+            warnings.warn("No key type for id %s. Using string"%attr_id)
+        if attr_name is None:
+            raise nx.NetworkXError("Unknown key for id %s in file."%attr_id)
+        graphml_keys[attr_id] = {
+            "name":attr_name,
+            "type":self.python_type[attr_type],
+            "for":k.get("for")}
+        # check for "default" subelement of key element
+        default=k.find("{%s}default" % self.NS_GRAPHML)
+        if default is not None:
+            graphml_key_defaults[attr_id]=default.text
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+from nose.tools import *
+from nose import SkipTest
+import networkx as nx
+from networkx.testing.utils import *
+import os
+import tempfile
+
+
+class TestBinary(object):
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G = nx.Graph(name='test')
+        G.add_edge('a', 'b', weight=2.5, label='x')
+        G.add_edge('b', 'c', weight=1)
+        G.add_edge('c', 'd', path=[1, 2])
+        G.add_edge('d', 'd', weight=4)
+        G.add_node('a', color='red', size=3)
+        G.add_node('e', size=4)
+        G.add_node('f', pos=(1, 2))
+        self.G = G
+        self.DG = nx.DiGraph(G)
+        self.DG.add_edge('a', 'e', weight=7)
+        fd, self.fname = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.unlink(self.fname)
+
+    def test_round_trip(self):
+        for G in [self.G, self.DG]:
+            nx.write_graph_binary(G, self.fname)
+            for mmap in [False, True]:
+                H = nx.read_graph_binary(self.fname, mmap=mmap, csr=False)
+                assert_equal(H.is_directed(), G.is_directed())
+                assert_equal(H.graph, G.graph)
+                assert_nodes_equal(H.nodes(data=True), G.nodes(data=True))
+                assert_edges_equal(H.edges(data=True), G.edges(data=True))
+
+    def test_csr(self):
+        nx.write_graph_binary(self.G, self.fname)
+        for mmap in [False, True]:
+            C = nx.read_graph_binary(self.fname, mmap=mmap)
+            assert_true(isinstance(C, nx.CSRGraph))
+            assert_equal(C.graph['name'], 'test')
+            assert_equal(sorted(C), sorted(self.G))
+            assert_equal(sorted(C.edges(data=True)),
+                         [('a', 'b', {'weight': 2.5}),
+                          ('b', 'c', {'weight': 1.0}),
+                          ('c', 'd', {'weight': 1.0}),
+                          ('d', 'd', {'weight': 4.0})])
+        C = nx.read_graph_binary(self.fname, mmap=True)
+        assert_false(C.indices.flags.writeable)
+        C = nx.read_graph_binary(self.fname, weight=None)
+        assert_equal(C['a']['b'], {})
+        assert_raises(nx.NetworkXError, nx.read_graph_binary, self.fname,
+                      weight='label')
+
+    def test_csr_directed(self):
+        nx.write_graph_binary(self.DG, self.fname)
+        C = nx.read_graph_binary(self.fname, mmap=True)
+        assert_true(isinstance(C, nx.CSRDiGraph))
+        assert_equal(sorted(C.edges()), sorted(self.DG.edges()))
+        assert_equal(sorted(C.in_edges('e', data=True)),
+                     [('a', 'e', {'weight': 7.0})])
+        assert_equal(C.in_degree(weight='weight'),
+                     nx.CSRDiGraph(self.DG).in_degree(weight='weight'))
+        E = nx.CSRDiGraph(self.DG)
+        for mmap in [False, True]:
+            C = nx.read_graph_binary(self.fname, mmap=mmap)
+            assert_equal(sorted(C.in_edges(data=True)),
+                         sorted(E.in_edges(data=True)))
+            assert_equal(C.pred['d'], {'c': {'weight': 1.0},
+                                       'd': {'weight': 4.0}})
+            assert_equal(C.in_degree('d', weight='weight'), 5.0)
+            assert_equal(C.out_degree(weight='weight'),
+                         E.out_degree(weight='weight'))
+
+    def test_integer_nodes(self):
+        G = nx.gnp_random_graph(50, 0.1, seed=1, directed=True)
+        nx.write_graph_binary(G, self.fname)
+        C = nx.read_graph_binary(self.fname, mmap=True)
+        assert_equal(C.nodelist, list(range(50)))
+        assert_equal(sorted(C.edges()), sorted(G.edges()))
+        assert_equal(nx.single_source_shortest_path_length(C, 0),
+                     nx.single_source_shortest_path_length(G, 0))
+
+    def test_mixed_numbers(self):
+        G = nx.Graph()
+        G.add_edge(1, 2.5, weight=2.5)
+        G.add_edge(2.5, 3, weight=1)
+        G.add_edge(3, 4, cost=2**60)
+        G.add_edge(4, 1, cost=0.5)
+        G.node[1]['size'] = 1
+        G.node[3]['size'] = 1.5
+        nx.write_graph_binary(G, self.fname)
+        for mmap in [False, True]:
+            H = nx.read_graph_binary(self.fname, mmap=mmap, csr=False)
+            nodes = sorted(H)
+            assert_equal(nodes, [1, 2.5, 3, 4])
+            assert_equal([type(u) for u in nodes], [int, float, int, int])
+            for u, v, d in H.edges_iter(data=True):
+                for key, value in d.items():
+                    assert_equal(value, G[u][v][key])
+                    assert_equal(type(value), type(G[u][v][key]))
+            assert_equal(type(H.node[1]['size']), int)
+            assert_equal(type(H.node[3]['size']), float)
+        C = nx.read_graph_binary(self.fname)
+        assert_equal(C[1][2.5], {'weight': 2.5})
+        assert_equal(C[2.5][3], {'weight': 1.0})
+
+    def test_empty(self):
+        for G in [nx.Graph(), nx.empty_graph(3)]:
+            nx.write_graph_binary(G, self.fname)
+            for mmap in [False, True]:
+                H = nx.read_graph_binary(self.fname, mmap=mmap, csr=False)
+                assert_equal(sorted(H), sorted(G))
+                assert_equal(H.number_of_edges(), 0)
+
+    def test_compressed(self):
+        fd, fname = tempfile.mkstemp(suffix='.gz')
+        os.close(fd)
+        try:
+            nx.write_graph_binary(self.G, fname)
+            H = nx.read_graph_binary(fname, csr=False)
+            assert_edges_equal(H.edges(data=True), self.G.edges(data=True))
+            assert_raises(nx.NetworkXError, nx.read_graph_binary, fname,
+                          mmap=True)
+        finally:
+            os.unlink(fname)
+
+    def test_errors(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.write_graph_binary,
+                      nx.MultiGraph(), self.fname)
+        with open(self.fname, 'wb') as fh:
+            fh.write(b'not a graph')
+        assert_raises(nx.NetworkXError, nx.read_graph_binary, self.fname)
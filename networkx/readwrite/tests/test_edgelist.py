@@ -1,7 +1,9 @@
 """
     Unit tests for edgelists.
 """
-from nose.tools import assert_equal, assert_raises, assert_not_equal
+from nose.tools import assert_equal, assert_raises, assert_not_equal, \
+    assert_true
+from nose import SkipTest
 import networkx as nx
 import io
 import tempfile
@@ -232,3 +234,140 @@ class TestEdgelist:
         os.unlink(fname)
 
 
+
+
+class TestChunkedEdgelist:
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        self.s = b"""\
+# comment line
+1 2 2.0 red
+2 3 3.0 blue # trailing comment
+
+3 4 4.0 red
+4 1 1.5 green
+5 5 0.5 red
+"""
+
+    def test_iter_chunks(self):
+        chunks = list(nx.iter_edgelist_chunks(io.BytesIO(self.s),
+                                              nodetype=int, chunksize=2,
+                                              data=[('weight', float),
+                                                    ('color', str)]))
+        u = numpy.concatenate([c[0] for c in chunks])
+        v = numpy.concatenate([c[1] for c in chunks])
+        w = numpy.concatenate([c[2]['weight'] for c in chunks])
+        assert_equal(u.tolist(), [1, 2, 3, 4, 5])
+        assert_equal(v.tolist(), [2, 3, 4, 1, 5])
+        assert_equal(w.tolist(), [2.0, 3.0, 4.0, 1.5, 0.5])
+        assert_equal(chunks[-1][2]['color'].tolist(), ['red'])
+        assert_true(u.dtype.kind == 'i')
+
+    def test_delimiter(self):
+        s = b"a, b,1\n b,c ,2\n"
+        chunks = list(nx.iter_edgelist_chunks(io.BytesIO(s), delimiter=',',
+                                              data=[('weight', int)]))
+        assert_equal(len(chunks), 1)
+        u, v, d = chunks[0]
+        assert_equal(u.tolist(), ['a', 'b'])
+        assert_equal(v.tolist(), ['b', 'c'])
+        assert_equal(d['weight'].tolist(), [1, 2])
+
+    def test_ignore_data(self):
+        chunks = list(nx.iter_edgelist_chunks(io.BytesIO(self.s)))
+        assert_equal(chunks[0][2], {})
+        assert_equal(chunks[0][1].tolist(), ['2', '3', '4', '1', '5'])
+
+    def test_progress(self):
+        counts = []
+        list(nx.iter_edgelist_chunks(io.BytesIO(self.s), chunksize=3,
+                                     progress=counts.append))
+        assert_equal(counts, [2, 4, 5])
+
+    def test_errors(self):
+        def read(s, **kwds):
+            return list(nx.iter_edgelist_chunks(io.BytesIO(s), **kwds))
+        assert_raises(IndexError, read, b"1 2 3\n1 2\n")
+        assert_raises(IndexError, read, self.s, data=[('weight', float)])
+        assert_raises(TypeError, read, self.s, nodetype=int,
+                      data=[('weight', float), ('color', float)])
+        assert_raises(TypeError, read, b"a b\n", nodetype=int)
+        assert_raises(TypeError, read, self.s, data=True)
+
+    def test_read_edgelist_chunksize(self):
+        data = [('weight', float), ('color', str)]
+        G = nx.read_edgelist(io.BytesIO(self.s), nodetype=int, data=data)
+        H = nx.read_edgelist(io.BytesIO(self.s), nodetype=int, data=data,
+                             chunksize=2)
+        assert_equal_edges(H.edges(data=True), G.edges(data=True))
+        assert_true(all(type(n) is int for n in H))
+        D = nx.read_edgelist(io.BytesIO(self.s), chunksize=10,
+                             data=False, create_using=nx.DiGraph())
+        assert_true(D.is_directed())
+        assert_equal(sorted(D.edges()), [('1', '2'), ('2', '3'), ('3', '4'),
+                                         ('4', '1'), ('5', '5')])
+
+    def test_read_edgelist_chunksize_options(self):
+        s = b"""\
+1 2 {'weight': 3}
+2 3
+# comment
+3 1 {'weight': 1, 'color': 'red'}
+1 2 {'color': 'blue'}
+4 5
+"""
+        for create_using in [None, nx.DiGraph(), nx.MultiGraph()]:
+            G = nx.read_edgelist(io.BytesIO(s), nodetype=int,
+                                 create_using=create_using)
+            counts = []
+            H = nx.read_edgelist(io.BytesIO(s), nodetype=int, chunksize=2,
+                                 progress=counts.append,
+                                 create_using=G.__class__())
+            assert_equal(H.__class__, G.__class__)
+            assert_equal(H.nodes(), G.nodes())
+            edges = [sorted((sorted((u, v)), sorted(d.items()))
+                            for u, v, d in F.edges_iter(data=True))
+                     for F in [G, H]]
+            assert_equal(edges[0], edges[1])
+            assert_equal(counts, [2, 3, 5])
+        M = nx.read_edgelist(io.BytesIO(self.s), chunksize=2, data=False,
+                             create_using=nx.MultiGraph())
+        assert_true(M.is_multigraph())
+        assert_equal(M.number_of_edges(), 5)
+        assert_raises(TypeError, nx.read_edgelist, io.BytesIO(self.s),
+                      chunksize=2)
+        assert_raises(ValueError, nx.read_edgelist, io.BytesIO(self.s),
+                      chunksize=2, edgetype=float)
+
+    def test_read_edgelist_csr(self):
+        G = nx.read_edgelist_csr(io.BytesIO(self.s), nodetype=int,
+                                 chunksize=2, data=[('weight', float),
+                                                    ('color', str)])
+        assert_true(isinstance(G, nx.CSRGraph))
+        assert_equal(G.nodelist, [1, 2, 3, 4, 5])
+        assert_equal(G[1][4], {'weight': 1.5})
+        assert_equal(G.number_of_edges(), 5)
+        D = nx.read_edgelist_csr(io.BytesIO(self.s), directed=True)
+        assert_true(isinstance(D, nx.CSRDiGraph))
+        assert_equal(sorted(D.edges()), [('1', '2'), ('2', '3'), ('3', '4'),
+                                         ('4', '1'), ('5', '5')])
+        assert_equal(D['1']['2'], {})
+
+    def test_file(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from((i, i + 1, i / 2.0) for i in range(50))
+        (fd, fname) = tempfile.mkstemp(suffix='.gz')
+        nx.write_weighted_edgelist(G, fname)
+        H = nx.read_edgelist_csr(fname, nodetype=int, chunksize=7,
+                                 data=[('weight', float)])
+        assert_equal(sorted(H.edges(data=True)), sorted(G.edges(data=True)))
+        os.close(fd)
+        os.unlink(fname)
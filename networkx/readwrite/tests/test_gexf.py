@@ -321,3 +321,38 @@ class TestGEXF(object):
         fh.seek(0)
         H=nx.read_gexf(fh,node_type=int)
         assert_equal(H.node[1]['testattr'], True)
+
+    def test_stream_read(self):
+        for fh in [self.simple_directed_fh, self.attribute_fh,
+                   self.simple_undirected_fh]:
+            H=nx.read_gexf(fh)
+            fh.seek(0)
+            I=nx.read_gexf(fh,stream=True)
+            fh.seek(0)
+            assert_equal(type(H),type(I))
+            assert_equal(sorted(H.nodes(data=True)),sorted(I.nodes(data=True)))
+            assert_equal(sorted(H.edges(data=True)),sorted(I.edges(data=True)))
+            assert_equal(H.graph,I.graph)
+        fh=io.BytesIO(b'<gexf xmlns="http://www.gexf.net/1.1draft"/>')
+        assert_raises(nx.NetworkXError,nx.read_gexf,fh,stream=True)
+
+    def test_stream_write(self):
+        G=nx.MultiDiGraph()
+        G.add_edge(1,2,weight=3.0,label='a<b')
+        G.add_edge(1,2)
+        G.add_edge(2,3,start=1,end=4)
+        G.add_node(3,color='red',big=True,
+                   viz={'size':2.0,'color':{'r':1,'g':2,'b':3,'a':1.0}})
+        for version in ['1.1draft','1.2draft']:
+            fh=io.BytesIO()
+            nx.write_gexf(G,fh,version=version)
+            fh.seek(0)
+            H=nx.read_gexf(fh,node_type=int)
+            fh=io.BytesIO()
+            nx.write_gexf(G,fh,version=version,stream=True)
+            fh.seek(0)
+            I=nx.read_gexf(fh,node_type=int,stream=True)
+            assert_equal(I.graph['mode'],'dynamic')
+            assert_equal(sorted(H.nodes(data=True)),sorted(I.nodes(data=True)))
+            assert_equal(sorted(H.edges(data=True,keys=True)),
+                         sorted(I.edges(data=True,keys=True)))
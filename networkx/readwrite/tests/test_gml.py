@@ -8,16 +8,6 @@ from nose import SkipTest
 import networkx
 
 class TestGraph(object):
-    @classmethod
-    def setupClass(cls):
-        global pyparsing
-        try:
-            import pyparsing
-        except ImportError:
-            try:
-                import matplotlib.pyparsing as pyparsing
-            except:
-                raise SkipTest('gml test: pyparsing not available.')
 
     def setUp(self):
         self.simple_data="""Creator me
@@ -184,3 +174,63 @@ graph
   ]
 ]"""
         assert_equal(data, answer)
+
+    def test_parse_gml_lines(self):
+        G=networkx.parse_gml(self.simple_data,relabel=True)
+        H=networkx.parse_gml(iter(self.simple_data.splitlines(True)),
+                             relabel=True)
+        assert_true(H.is_directed())
+        assert_equal(G.graph,H.graph)
+        assert_equal(H.graph['pos'],{'x':0,'y':1})
+        assert_equal(H.graph['Creator'],' me')
+        assert_equal(sorted(G.nodes(data=True)),sorted(H.nodes(data=True)))
+        assert_equal(sorted(G.edges(data=True)),sorted(H.edges(data=True)))
+
+    def test_tokens(self):
+        data="""graph [ # comment
+  label "two # lines
+and a \\"quote\\"" real 1.5e3 int -3 word abc
+  node [ id 0 ] node [ id 1 ] edge [ source 0 target 1 ]
+  edge [ source 0 target 1 weight 2.0 ] ]"""
+        G=networkx.parse_gml(data,relabel=False)
+        assert_true(G.is_multigraph())
+        assert_false(G.is_directed())
+        assert_equal(G.graph,{'label':'two # lines\nand a \\"quote\\"',
+                              'real':1500.0,'int':-3,'word':'abc'})
+        assert_equal(sorted(d.get('weight',0) for u,v,d in G.edges(data=True)),
+                     [0,2.0])
+
+    def test_parse_errors(self):
+        for data in ['graph [ node [ id 0 ]',
+                     'graph [ node 0 ]',
+                     'graph [ node [ label "a" ] ]',
+                     'graph [ edge [ source 0 ] ]',
+                     'node [ id 0 ]',
+                     'graph [ "key" 1 ]',
+                     'graph [ key 1 ! ]',
+                     'graph [ key "unterminated ]']:
+            assert_raises(networkx.NetworkXError,networkx.parse_gml,
+                          iter([data]))
+
+    def test_directed_after_nodes(self):
+        data="""graph [ node [ id 0 ] directed 1 node [ id 1 ]
+  edge [ source 1 target 0 ] ]"""
+        G=networkx.parse_gml(data,relabel=False)
+        assert_true(G.is_directed())
+        assert_equal(G.edges(),[(1,0)])
+        data="""graph [ edge [ source 1 target 0 ] directed 1 ]"""
+        assert_raises(networkx.NetworkXError,networkx.parse_gml,
+                      iter([data]))
+
+    def test_pyparsing_fallback(self):
+        try:
+            import pyparsing
+        except ImportError:
+            try:
+                import matplotlib.pyparsing
+            except:
+                raise SkipTest('gml test: pyparsing not available.')
+        data="""graph [ edge [ source 1 target 0 ] directed 1 ]"""
+        G=networkx.parse_gml(data,relabel=False)
+        assert_true(G.is_directed())
+        assert_equal(G.edges(),[(1,0)])
@@ -443,3 +443,67 @@ xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdr
         assert_equal(H.node['n0']['test'],True)
         assert_equal(H.node['n2']['test'],False)
 
+
+    def test_stream_read(self):
+        for fh, G in [(self.simple_directed_fh, self.simple_directed_graph),
+                      (self.attribute_fh, self.attribute_graph)]:
+            fh.seek(0)
+            H=nx.read_graphml(fh)
+            fh.seek(0)
+            I=nx.read_graphml(fh,stream=True)
+            fh.seek(0)
+            assert_equal(type(H),type(I))
+            assert_equal(sorted(H.nodes(data=True)),sorted(I.nodes(data=True)))
+            assert_equal(sorted(H.edges(data=True)),sorted(I.edges(data=True)))
+            assert_equal(H.graph,I.graph)
+
+    def test_stream_read_errors(self):
+        s="""<?xml version="1.0" encoding="UTF-8"?>
+<graphml xmlns="http://graphml.graphdrawing.org/xmlns">
+  <graph id="G" edgedefault="directed">
+    <node id="n0"/>
+    <node id="n1"/>
+    <hyperedge>
+       <endpoint node="n0"/>
+       <endpoint node="n1"/>
+    </hyperedge>
+  </graph>
+</graphml>
+"""
+        fh = io.BytesIO(s.encode('UTF-8'))
+        assert_raises(nx.NetworkXError,nx.read_graphml,fh,stream=True)
+        s=s.replace('<hyperedge>','<edge source="n0" target="n1" directed="false"/><!--')
+        s=s.replace('</hyperedge>','-->')
+        fh = io.BytesIO(s.encode('UTF-8'))
+        assert_raises(nx.NetworkXError,nx.read_graphml,fh,stream=True)
+
+    def test_stream_write(self):
+        G=nx.MultiGraph()
+        G.add_edge(1,2,weight=3.0,label='a<b')
+        G.add_edge(1,2)
+        G.add_node(3,color='red',big=True)
+        G.graph['name']='test'
+        G.graph['node_default']={'color':'yellow'}
+        for prettyprint in [True,False]:
+            fh=io.BytesIO()
+            nx.write_graphml(G,fh,prettyprint=prettyprint)
+            fh.seek(0)
+            H=nx.read_graphml(fh,node_type=int)
+            fh=io.BytesIO()
+            nx.write_graphml(G,fh,prettyprint=prettyprint,stream=True)
+            fh.seek(0)
+            I=nx.read_graphml(fh,node_type=int,stream=True)
+            assert_true(I.is_multigraph())
+            assert_equal(sorted(H.nodes(data=True)),sorted(I.nodes(data=True)))
+            assert_equal(sorted(H.edges(data=True,keys=True)),
+                         sorted(I.edges(data=True,keys=True)))
+            assert_equal(H.graph,I.graph)
+
+    def test_stream_write_file(self):
+        G=nx.path_graph(100)
+        (fd,fname)=tempfile.mkstemp(suffix='.graphml.gz')
+        nx.write_graphml(G,fname,stream=True)
+        H=nx.read_graphml(fname,node_type=int,stream=True)
+        assert_equal(sorted(H.edges()),sorted(G.edges()))
+        os.close(fd)
+        os.unlink(fname)
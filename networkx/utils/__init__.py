@@ -3,3 +3,4 @@ from networkx.utils.decorators import *
 from networkx.utils.random_sequence import *
 from networkx.utils.union_find import *
 from networkx.utils.rcm import *
+from networkx.utils.parallel import *
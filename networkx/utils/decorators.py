@@ -2,6 +2,7 @@ import sys
 
 from collections import defaultdict
 from os.path import splitext
+from types import GeneratorType
 
 import networkx as nx
 from networkx.external.decorator import decorator
@@ -211,8 +212,13 @@ def open_file(path_arg, mode='r'):
             new_args[path_arg] = fobj
 
         # Finally, we call the original function, making sure to close the fobj.
+        # A generator only reads the file while it is iterated, so the fobj
+        # is then closed when the generator is exhausted or closed.
         try:
             result = func(*new_args, **kwargs)
+            if close_fobj and isinstance(result, GeneratorType):
+                result = _close_after(result, fobj)
+                close_fobj = False
         finally:
             if close_fobj:
                 fobj.close()
@@ -220,3 +226,12 @@ def open_file(path_arg, mode='r'):
         return result
 
     return _open_file
+
+
+def _close_after(generator, fobj):
+    # Yield the items of generator and close fobj at the end.
+    try:
+        for item in generator:
+            yield item
+    finally:
+        fobj.close()
@@ -14,6 +14,7 @@ True
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
+import numbers
 import sys
 import subprocess
 import uuid
@@ -166,3 +167,36 @@ def dict_to_numpy_array1(d,mapping=None):
         i = mapping[k1]
         a[i] = d[k1]
     return a
+
+def create_random_state(random_state=None):
+    """Return a NumPy random number generator for random_state.
+
+    Parameters
+    ----------
+    random_state : None, int, numpy.random.RandomState or numpy.random.Generator
+        If None, return the global NumPy random state.  If an int, return
+        a new RandomState seeded with it.  A RandomState or Generator is
+        returned unchanged, so that a caller can thread one generator
+        through several calls.
+
+    Raises
+    ------
+    ValueError
+        If random_state cannot be used as a NumPy random number generator.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+          "create_random_state requires numpy : http://scipy.org/ ")
+    if random_state is None or random_state is numpy.random:
+        return numpy.random.mtrand._rand
+    if isinstance(random_state, numpy.random.RandomState):
+        return random_state
+    Generator = getattr(numpy.random, 'Generator', None)
+    if Generator is not None and isinstance(random_state, Generator):
+        return random_state
+    if isinstance(random_state, numbers.Integral):
+        return numpy.random.RandomState(random_state)
+    raise ValueError('%r cannot be used to seed a NumPy random number '
+                     'generator' % (random_state,))
@@ -0,0 +1,101 @@
+"""
+Helpers for splitting independent work across a process pool.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+__all__ = ['effective_n_jobs', 'split_chunks', 'parallel_map']
+
+
+def effective_n_jobs(n_jobs=None, executor=None):
+    """Return the number of worker processes requested by n_jobs.
+
+    Parameters
+    ----------
+    n_jobs : int or None, optional (default=None)
+        None or 1 means no parallelism (unless an executor is given).
+        Negative values count back from the number of CPUs, so -1
+        uses all CPUs and -2 all but one.
+    executor : object with a map() method, optional
+        If given and n_jobs is None, the number of CPUs is returned.
+
+    Returns
+    -------
+    n : int
+        A number of workers, at least 1.
+
+    Examples
+    --------
+    >>> from networkx.utils import effective_n_jobs
+    >>> effective_n_jobs(None)
+    1
+    >>> effective_n_jobs(3)
+    3
+    """
+    if n_jobs is None:
+        if executor is None:
+            return 1
+        n_jobs = -1
+    if n_jobs == 0:
+        raise ValueError('n_jobs == 0 has no meaning.')
+    if n_jobs < 0:
+        import multiprocessing
+        n_jobs = max(multiprocessing.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def split_chunks(items, n):
+    """Split items into at most n lists of nearly equal length.
+
+    Items are dealt out in turn so that expensive and cheap items
+    that are next to each other end up in different chunks.
+
+    Examples
+    --------
+    >>> from networkx.utils import split_chunks
+    >>> split_chunks(range(7), 3)
+    [[0, 3, 6], [1, 4], [2, 5]]
+    """
+    items = list(items)
+    n = max(min(n, len(items)), 1)
+    return [items[i::n] for i in range(n)]
+
+
+def parallel_map(func, args, n_jobs=None, executor=None):
+    """Return the list [func(a) for a in args], possibly in parallel.
+
+    Parameters
+    ----------
+    func : function
+        A module level (picklable) function of one argument.
+    args : iterable
+        The arguments, which must be picklable.
+    n_jobs : int or None, optional (default=None)
+        Number of worker processes in a new multiprocessing.Pool.
+        See effective_n_jobs().  None or 1 runs func in this process.
+    executor : object with a map() method, optional
+        An existing pool, e.g. a multiprocessing.Pool or a
+        concurrent.futures executor, used instead of a new pool.
+
+    Returns
+    -------
+    results : list
+        The results in the order of args.
+    """
+    args = list(args)
+    if executor is not None:
+        return list(executor.map(func, args))
+    n_jobs = min(effective_n_jobs(n_jobs), len(args))
+    if n_jobs <= 1:
+        return list(map(func, args))
+    import multiprocessing
+    pool = multiprocessing.Pool(n_jobs)
+    try:
+        results = pool.map(func, args)
+    finally:
+        pool.terminate()
+        pool.join()
+    return results
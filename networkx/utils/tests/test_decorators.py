@@ -144,5 +144,27 @@ class TestOpenFileDecorator(object):
     def test_writer_kwarg_fobj(self):
         self.writer_kwarg(path=None)
 
+    @open_file(1, 'r')
+    def handles(self, path):
+        yield path
+        yield path
+
+    def test_generator_str(self):
+        # the file stays open while the generator runs
+        self.writer_arg1(self.name)
+        handles = self.handles(self.name)
+        fh = next(handles)
+        assert_equal(fh.read(), ''.join(self.text))
+        assert_equal(list(handles), [fh])
+        assert_true(fh.closed)
+        handles = self.handles(self.name)
+        fh = next(handles)
+        handles.close()
+        assert_true(fh.closed)
+
+    def test_generator_fobj(self):
+        assert_equal(list(self.handles(self.fobj)), [self.fobj, self.fobj])
+        assert_false(self.fobj.closed)
+
     def tearDown(self):
         self.fobj.close()
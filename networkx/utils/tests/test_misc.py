@@ -109,3 +109,30 @@ class TestNumpyArray(object):
         d = {'a':1,'b':2}
         a = dict_to_numpy_array(d)
         assert_equal(a, numpy.array(list(d.values())))
+
+    def test_create_random_state(self):
+        rs = numpy.random.RandomState(1)
+        assert_true(create_random_state(rs) is rs)
+        assert_true(create_random_state(None) is numpy.random.mtrand._rand)
+        assert_equal(create_random_state(3).uniform(size=4),
+                     numpy.random.RandomState(3).uniform(size=4))
+        if hasattr(numpy.random, 'default_rng'):
+            rng = numpy.random.default_rng(1)
+            assert_true(create_random_state(rng) is rng)
+        assert_raises(ValueError, create_random_state, 'a')
+
+def test_split_chunks():
+    assert_equal(split_chunks(range(7), 3), [[0, 3, 6], [1, 4], [2, 5]])
+    assert_equal(split_chunks([1, 2], 5), [[1], [2]])
+    assert_equal(split_chunks([], 2), [[]])
+
+def test_effective_n_jobs():
+    assert_equal(effective_n_jobs(), 1)
+    assert_equal(effective_n_jobs(4), 4)
+    assert_true(effective_n_jobs(-1) >= 1)
+    assert_true(effective_n_jobs(executor=map) >= 1)
+    assert_raises(ValueError, effective_n_jobs, 0)
+
+def test_parallel_map():
+    assert_equal(parallel_map(abs, [-1, 2, -3]), [1, 2, 3])
+    assert_equal(parallel_map(abs, [-1, 2, -3], n_jobs=2), [1, 2, 3])
@@ -0,0 +1,92 @@
+import random
+from nose.tools import *
+from nose import SkipTest
+import networkx as nx
+from networkx.utils import UnionFind, ArrayUnionFind
+
+
+def random_pairs(n, m, seed):
+    rng = random.Random(seed)
+    return [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+
+
+def sets(components):
+    return sorted(sorted(c) for c in components)
+
+
+def test_array_union_find():
+    X = ArrayUnionFind(100)
+    Y = UnionFind()
+    for i in range(100):
+        Y[i]
+    for u, v in random_pairs(100, 80, 1):
+        assert_equal(X.union(u, v), Y[u] != Y[v])
+        Y.union(u, v)
+        assert_equal(X.find(u), X.find(v))
+    groups = {}
+    for i in range(100):
+        groups.setdefault(Y[i], []).append(i)
+    components = X.components()
+    assert_equal(sets(components), sets(groups.values()))
+    assert_equal(components, sorted(components))
+    assert_equal(len(X), 100)
+
+
+def test_add():
+    X = ArrayUnionFind()
+    assert_equal(X.components(), [])
+    assert_equal([X.add(), X.add(), X.add()], [0, 1, 2])
+    X.union(2, 0)
+    assert_equal(X.components(), [[0, 2], [1]])
+
+
+class TestArrayUnionFindNumpy(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+             raise SkipTest('NumPy not available.')
+
+    def test_union_many(self):
+        for seed in range(5):
+            pairs = random_pairs(1000, 900, seed)
+            X = ArrayUnionFind(1000)
+            for u, v in pairs:
+                X.union(u, v)
+            Y = ArrayUnionFind(1000)
+            Y.union_many(numpy.array(pairs[:500]))
+            Y.union_many(pairs[500:])
+            assert_equal(Y.components(), X.components())
+            # scalar operations after bulk ones
+            Y.union(0, 1)
+            X.union(0, 1)
+            assert_equal(Y.components(), X.components())
+
+    def test_union_many_path(self):
+        X = ArrayUnionFind(10000)
+        X.union_many([(i, i + 1) for i in range(9999)])
+        assert_equal(X.components(), [list(range(10000))])
+        X.union_many([])
+        assert_equal(len(X.components()), 1)
+
+    def test_find_many(self):
+        X = ArrayUnionFind(6)
+        X.union(0, 5)
+        X.union(5, 3)
+        roots = X.find_many([3, 0, 1, 5])
+        assert_equal(roots.tolist(), [X.find(3), X.find(3), 1, X.find(3)])
+
+    def test_union_many_star(self):
+        # all the leaves share the root of the hub, which has the largest
+        # index; they must be hooked in one round, not one per round
+        n = 50000
+        X = ArrayUnionFind(n)
+        X.union_many([(i, n - 1) for i in range(n - 1)])
+        assert_equal(X.find_many([0, n // 2, n - 1]).tolist(), [0, 0, 0])
+        assert_equal(len(X.components()), 1)
+        G = nx.star_graph(n - 1)
+        G = nx.relabel_nodes(G, dict((v, n - 1 - v) for v in G))
+        assert_equal([len(c) for c in nx.connected_components(G)], [n])
@@ -72,4 +72,159 @@ class UnionFind:
                 self.parents[r] = heaviest
 
 
+class ArrayUnionFind(object):
+    """Union-find data structure over the integers 0 to n-1.
 
+    The parents and ranks are kept in lists indexed by the elements,
+    which makes ArrayUnionFind several times faster than UnionFind when
+    the objects are, or can be numbered as, consecutive integers.
+
+    - X.find(i) returns the root of the set containing i.
+
+    - X.union(i, j) merges the sets containing i and j and returns
+      True, or returns False if they are the same set.
+
+    - X.union_many(edges) and X.find_many(items) are the bulk versions of
+      union and find, computed with NumPy.
+
+    - X.components() returns the sets as lists of their elements.
+
+    Unions link the root with the larger index under the other one and
+    finds halve the paths, so that a sequence of m operations on n
+    elements takes O(m log n) time at worst, and almost linear time in
+    practice.
+
+    Parameters
+    ----------
+    n : int, optional (default=0)
+       The number of elements, each in a set of its own.  More elements
+       can be added with add().
+
+    Examples
+    --------
+    >>> from networkx.utils import ArrayUnionFind
+    >>> X = ArrayUnionFind(5)
+    >>> X.union(0, 1)
+    True
+    >>> X.union(1, 0)
+    False
+    >>> X.union_many([[2, 3], [3, 4]])
+    >>> X.components()
+    [[0, 1], [2, 3, 4]]
+    """
+
+    def __init__(self, n=0):
+        self.parents = list(range(n))
+
+    def __len__(self):
+        """Return the number of elements."""
+        return len(self.parents)
+
+    def add(self):
+        """Add a new element in a set of its own and return it."""
+        i = len(self.parents)
+        self.parents.append(i)
+        return i
+
+    def find(self, i):
+        """Return the root of the set containing the element i."""
+        parents = self.parents
+        while parents[i] != i:
+            # path halving: link every other node of the path to its
+            # grandparent
+            parents[i] = i = parents[parents[i]]
+        return i
+
+    def union(self, i, j):
+        """Merge the sets containing i and j.
+
+        Returns True if they were different sets, False otherwise.
+        """
+        i = self.find(i)
+        j = self.find(j)
+        if i == j:
+            return False
+        if i < j:
+            self.parents[j] = i
+        else:
+            self.parents[i] = j
+        return True
+
+    def find_many(self, items):
+        """Return a NumPy array of the roots of the sets containing items.
+
+        All paths are compressed on the way.
+        """
+        import numpy
+        parents = _compress(numpy.array(self.parents, dtype=numpy.intp))
+        self.parents = parents.tolist()
+        return parents[numpy.asarray(items, dtype=numpy.intp)]
+
+    def union_many(self, edges):
+        """Merge the sets containing the two elements of each edge.
+
+        Parameters
+        ----------
+        edges : array_like
+           Pairs of elements, as an array of shape (m, 2).
+
+        Notes
+        -----
+        The edges are merged in rounds: the roots of both ends of the
+        edges between different sets are found for all edges at once, and
+        every root is linked to the smallest of the smaller roots joined
+        to it by an edge, until no edge is left between different sets.
+        A root not linked in a round is joined by its edges to smaller
+        roots in the next one, so the number of sets with edges between
+        them shrinks geometrically and few rounds are needed.
+        """
+        import numpy
+        edges = numpy.asarray(edges, dtype=numpy.intp).reshape(-1, 2)
+        parents = numpy.array(self.parents, dtype=numpy.intp)
+        u = edges[:, 0]
+        v = edges[:, 1]
+        while True:
+            parents = _compress(parents)
+            u = parents[u]
+            v = parents[v]
+            between = u != v
+            if not between.any():
+                break
+            u = u[between]
+            v = v[between]
+            # hook each root to its smallest smaller neighboring root at
+            # once; a plain assignment would keep only one of them
+            numpy.minimum.at(parents, numpy.maximum(u, v),
+                             numpy.minimum(u, v))
+        self.parents = parents.tolist()
+
+    def components(self):
+        """Return the sets as lists of elements.
+
+        The sets are ordered by their smallest element and the elements
+        of each set are increasing.
+        """
+        find = self.find
+        parents = self.parents
+        components = {}
+        for i, parent in enumerate(parents):
+            root = parent if parents[parent] == parent else find(parent)
+            components.setdefault(root, []).append(i)
+        return sorted(components.values(), key=lambda c: c[0])
+
+
+def _compress(parents):
+    """Return the NumPy array of the roots of the elements by repeatedly
+    replacing each parent with the grandparent."""
+    while True:
+        grandparents = parents[parents]
+        if (grandparents == parents).all():
+            return parents
+        parents = grandparents
+
+
+def _is_index_labeled(G):
+    """Return True if the nodes of G are the integers 0 to len(G) - 1,
+    so that they can be used as elements of an ArrayUnionFind."""
+    n = len(G)
+    return all(isinstance(v, int) and 0 <= v < n for v in G)